@@ -75,6 +75,37 @@ def benchmark_multi_head_attention(
     )
 
 
+def benchmark_multi_head_attention_long_sequence(
+    num_samples,
+    batch_size,
+    jit_compile=True,
+):
+    # The attention scores of each sample are `4 * 4096 * 4096` floats, which
+    # `keras.ops.dot_product_attention` does not materialize when it can.
+    layer_name = "MultiHeadAttention"
+    init_args = {
+        "num_heads": 4,
+        "key_dim": 16,
+    }
+    benchmark = LayerBenchmark(
+        layer_name,
+        init_args,
+        input_shape=[[4096, 64], [4096, 64], [4096, 64]],
+        flat_call_inputs=True,
+        jit_compile=jit_compile,
+    )
+
+    benchmark.benchmark_predict(
+        num_samples=num_samples,
+        batch_size=batch_size,
+    )
+
+    benchmark.benchmark_train(
+        num_samples=num_samples,
+        batch_size=batch_size,
+    )
+
+
 def benchmark_additive_attention(
     num_samples,
     batch_size,
@@ -104,6 +135,9 @@ def benchmark_additive_attention(
 BENCHMARK_NAMES = {
     "benchmark_attention": benchmark_attention,
     "benchmark_multi_head_attention": benchmark_multi_head_attention,
+    "benchmark_multi_head_attention_long_sequence": (
+        benchmark_multi_head_attention_long_sequence
+    ),
     "benchmark_additive_attention": benchmark_additive_attention,
 }
 
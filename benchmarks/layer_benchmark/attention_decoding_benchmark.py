@@ -0,0 +1,145 @@
+"""Benchmark incremental decoding with the key/value cache of attention layers.
+
+This script generates `max_length` timesteps one at a time with a
+`MultiHeadAttention` or `GroupQueryAttention` layer, in two ways:
+
+- With a key/value cache (`cache` and `cache_update_index`): each step only
+  projects the keys and values of the new timestep.
+- Without a cache: each step recomputes the attention over the whole prefix.
+
+It reports the latency per timestep for windows of prefix lengths. With the
+cache, the latency stays flat as the prefix grows. With `--jit_compile`, the
+cached decoding step is compiled once with the JAX and TensorFlow backends,
+with the update index passed as a tensor.
+
+To run the benchmark, use the command below:
+
+```
+python3 -m benchmarks.layer_benchmark.attention_decoding_benchmark \
+    --layer=multi_head_attention \
+    --max_length=512
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+from absl import logging
+
+import keras
+
+flags.DEFINE_string(
+    "layer",
+    "multi_head_attention",
+    "One of 'multi_head_attention' and 'grouped_query_attention'.",
+)
+flags.DEFINE_integer("max_length", 512, "Number of timesteps to generate.")
+flags.DEFINE_integer("window", 128, "Number of timesteps per reported window.")
+flags.DEFINE_integer("batch_size", 1, "Batch size.")
+flags.DEFINE_integer("hidden_dim", 256, "Feature dimension of the inputs.")
+flags.DEFINE_bool(
+    "jit_compile", True, "Whether to compile the cached decoding step."
+)
+
+FLAGS = flags.FLAGS
+
+NUM_HEADS = 8
+NUM_KEY_VALUE_HEADS = 2
+
+
+def _layer():
+    head_dim = FLAGS.hidden_dim // NUM_HEADS
+    if FLAGS.layer == "multi_head_attention":
+        layer = keras.layers.MultiHeadAttention(NUM_HEADS, head_dim)
+        cache_shape = (FLAGS.max_length, NUM_HEADS, head_dim)
+    elif FLAGS.layer == "grouped_query_attention":
+        layer = keras.layers.GroupQueryAttention(
+            head_dim, NUM_HEADS, NUM_KEY_VALUE_HEADS
+        )
+        cache_shape = (FLAGS.max_length, NUM_KEY_VALUE_HEADS, head_dim)
+    else:
+        raise ValueError(f"Invalid layer: {FLAGS.layer}")
+    return layer, (FLAGS.batch_size, 2) + cache_shape
+
+
+def _compile(fn):
+    if not FLAGS.jit_compile:
+        return fn
+    if keras.backend.backend() == "jax":
+        import jax
+
+        return jax.jit(fn)
+    if keras.backend.backend() == "tensorflow":
+        import tensorflow as tf
+
+        return tf.function(fn, jit_compile=True)
+    return fn
+
+
+def _decode_with_cache(layer, cache_shape, inputs):
+    def step(x, cache, index):
+        return layer(
+            x,
+            x,
+            cache=cache,
+            cache_update_index=index,
+            use_causal_mask=True,
+        )
+
+    step = _compile(step)
+    cache = keras.ops.zeros(cache_shape)
+    # Compile the step before timing.
+    step(inputs[:, :1], cache, keras.ops.convert_to_tensor(0))
+    seconds = []
+    for index in range(FLAGS.max_length):
+        start = time.perf_counter()
+        outputs, cache = step(
+            inputs[:, index : index + 1],
+            cache,
+            keras.ops.convert_to_tensor(index),
+        )
+        keras.ops.convert_to_numpy(outputs)
+        seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+def _decode_without_cache(layer, inputs):
+    seconds = []
+    for index in range(FLAGS.max_length):
+        start = time.perf_counter()
+        prefix = inputs[:, : index + 1]
+        outputs = layer(prefix, prefix, use_causal_mask=True)
+        keras.ops.convert_to_numpy(outputs[:, -1])
+        seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+def main(_):
+    layer, cache_shape = _layer()
+    inputs = keras.ops.convert_to_tensor(
+        np.random.default_rng(0)
+        .normal(size=(FLAGS.batch_size, FLAGS.max_length, FLAGS.hidden_dim))
+        .astype("float32")
+    )
+    layer(inputs[:, :1], inputs[:, :1])
+    logging.info(
+        f"{FLAGS.layer}, hidden_dim {FLAGS.hidden_dim}, "
+        f"backend {keras.backend.backend()}"
+    )
+    results = {
+        "cache": _decode_with_cache(layer, cache_shape, inputs),
+        "no cache": _decode_without_cache(layer, inputs),
+    }
+    for start in range(0, FLAGS.max_length, FLAGS.window):
+        stop = min(start + FLAGS.window, FLAGS.max_length)
+        latencies = ", ".join(
+            f"{name} {np.mean(seconds[start:stop]) * 1e3:.2f} ms"
+            for name, seconds in results.items()
+        )
+        logging.info(f"Prefix lengths [{start}, {stop}): {latencies}/token")
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,92 @@
+"""Benchmark the adapt throughput of the `Discretization` layer.
+
+`Discretization` estimates the quantiles of the data with a mergeable KLL
+sketch, which is updated with each batch of data. This script streams
+`num_values` random values through `update_state()` one batch at a time, and
+reports:
+
+- The adapt throughput, in values per second.
+- The worst rank error of the bin boundaries, measured against the exact
+quantiles of the data.
+- The number of items held by the sketch.
+
+To run the benchmark, use the command below:
+
+```
+python3 -m benchmarks.layer_benchmark.discretization_adapt_benchmark \
+    --num_values=100000000 \
+    --batch_size=1000000 \
+    --num_columns=1
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+from absl import logging
+
+from keras import layers
+
+flags.DEFINE_integer("num_values", 100_000_000, "Number of adapted values.")
+flags.DEFINE_integer("batch_size", 1_000_000, "Number of values per batch.")
+flags.DEFINE_integer(
+    "num_columns",
+    1,
+    "Number of feature columns, adapted with separate bin boundaries when "
+    "greater than 1.",
+)
+flags.DEFINE_integer("num_bins", 100, "Number of bins.")
+flags.DEFINE_float("epsilon", 0.01, "Error tolerance of the layer.")
+
+FLAGS = flags.FLAGS
+
+
+def _make_data():
+    rng = np.random.default_rng(0)
+    num_rows = FLAGS.num_values // FLAGS.num_columns
+    # A skewed distribution, with a different scale for each column.
+    data = rng.standard_exponential((num_rows, FLAGS.num_columns), "float32")
+    return data * np.arange(1, FLAGS.num_columns + 1, dtype="float32")
+
+
+def _max_rank_error(column, bin_boundaries):
+    ranks = np.searchsorted(np.sort(column), bin_boundaries) / len(column)
+    expected = np.arange(1, len(bin_boundaries) + 1) / FLAGS.num_bins
+    return np.abs(ranks - expected).max()
+
+
+def main(_):
+    data = _make_data()
+    num_rows_per_batch = max(1, FLAGS.batch_size // FLAGS.num_columns)
+    layer = layers.Discretization(
+        num_bins=FLAGS.num_bins,
+        epsilon=FLAGS.epsilon,
+        axis=-1 if FLAGS.num_columns > 1 else None,
+    )
+
+    start = time.time()
+    layer.reset_state()
+    for i in range(0, len(data), num_rows_per_batch):
+        layer.update_state(data[i : i + num_rows_per_batch])
+    layer.finalize_state()
+    seconds = time.time() - start
+
+    bin_boundaries = layer.bin_boundaries
+    if FLAGS.num_columns == 1:
+        bin_boundaries = [bin_boundaries]
+    rank_error = max(
+        _max_rank_error(column, boundaries)
+        for column, boundaries in zip(data.T, bin_boundaries)
+    )
+    logging.info(
+        f"Adapted {data.size} values in {seconds:.2f} s "
+        f"({data.size / seconds / 1e6:.1f}M values/s), "
+        f"max rank error {rank_error:.4f} (epsilon {FLAGS.epsilon}), "
+        f"{sum(layer.summary._sizes)} sketch items per column"
+    )
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,87 @@
+"""Benchmark the framework overhead of eager `Layer.__call__()`.
+
+For small layers, the bookkeeping of `Layer.__call__()` (argument binding,
+training and mask resolution, name scopes, autocasting) can cost more than
+the computation itself. This script calls small layers eagerly on tiny
+inputs and reports, per call:
+
+- The time of `layer(x)`.
+- The time of `layer.call(x)`, the computation alone.
+- The difference, which is the framework overhead.
+
+To run the benchmark, use the command below:
+
+```
+python3 -m benchmarks.layer_benchmark.layer_call_benchmark \
+    --num_calls=2000
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+from absl import logging
+
+import keras
+
+flags.DEFINE_integer("num_calls", 2000, "Number of timed calls per layer.")
+
+FLAGS = flags.FLAGS
+
+
+class Identity(keras.layers.Layer):
+    def call(self, inputs):
+        return inputs
+
+
+class TrainingAndMask(keras.layers.Layer):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.supports_masking = True
+
+    def call(self, inputs, training=None, mask=None):
+        return inputs
+
+
+def _layers():
+    return {
+        "identity": (Identity(), {}),
+        "training_and_mask": (TrainingAndMask(), {}),
+        "dense": (keras.layers.Dense(8), {}),
+        "dropout_training": (keras.layers.Dropout(0.5), {"training": True}),
+        "layer_normalization": (keras.layers.LayerNormalization(), {}),
+    }
+
+
+def _time_per_call(fn, x, kwargs):
+    # Warm up.
+    for _ in range(10):
+        fn(x, **kwargs)
+    start = time.perf_counter()
+    for _ in range(FLAGS.num_calls):
+        outputs = fn(x, **kwargs)
+    # Wait for asynchronous backends.
+    keras.ops.convert_to_numpy(outputs)
+    return (time.perf_counter() - start) / FLAGS.num_calls
+
+
+def main(_):
+    x = keras.ops.convert_to_tensor(
+        np.random.default_rng(0).random((2, 8)).astype("float32")
+    )
+    logging.info(f"Backend {keras.backend.backend()}")
+    for name, (layer, kwargs) in _layers().items():
+        layer(x, **kwargs)
+        call_seconds = _time_per_call(layer.__call__, x, kwargs)
+        compute_seconds = _time_per_call(layer.call, x, kwargs)
+        logging.info(
+            f"{name}: layer(x) {call_seconds * 1e6:.1f} us, "
+            f"layer.call(x) {compute_seconds * 1e6:.1f} us, "
+            f"overhead {(call_seconds - compute_seconds) * 1e6:.1f} us/call"
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
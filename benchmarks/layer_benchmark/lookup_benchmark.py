@@ -0,0 +1,144 @@
+"""Benchmark the NumPy lookup engine of the lookup layers against `tf.lookup`.
+
+`StringLookup`, `IntegerLookup` and `TextVectorization` look up inputs with
+`tf.lookup` ops whenever TensorFlow is imported, and with NumPy otherwise, to
+avoid importing TensorFlow with the other backends. This script measures:
+
+- The time it takes a fresh process to import Keras, create a `StringLookup`
+layer and look up a first batch, for both paths.
+- The time per batch of both paths for a few layer configurations. The NumPy
+path is called directly, since TensorFlow is imported by this script.
+
+To run the benchmark, use the command below (requires TensorFlow):
+
+```
+python3 -m benchmarks.layer_benchmark.lookup_benchmark \
+    --vocabulary_size=20000 \
+    --batch_size=1024 \
+    --num_iterations=20
+```
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import tensorflow as tf
+from absl import app
+from absl import flags
+from absl import logging
+
+from keras import layers
+
+flags.DEFINE_integer("vocabulary_size", 20000, "Size of the vocabulary.")
+flags.DEFINE_integer("batch_size", 1024, "Number of examples per batch.")
+flags.DEFINE_integer("sequence_length", 32, "Number of tokens per example.")
+flags.DEFINE_integer("num_iterations", 20, "Number of timed batches.")
+flags.DEFINE_string(
+    "import_backend", "jax", "Keras backend of the import time benchmark."
+)
+
+FLAGS = flags.FLAGS
+
+IMPORT_SCRIPT = """
+import time
+start = time.time()
+import sys
+import numpy as np
+{tf_import}
+from keras import layers
+layer = layers.StringLookup(vocabulary=["token%d" % i for i in range(1000)])
+layer({inputs})
+print(time.time() - start, "tensorflow" in sys.modules)
+"""
+
+
+def _import_time(use_tf):
+    inputs = 'np.array(["token1", "token2"])'
+    script = IMPORT_SCRIPT.format(
+        tf_import="import tensorflow as tf" if use_tf else "",
+        inputs=f"tf.constant({inputs})" if use_tf else inputs,
+    )
+    env = dict(os.environ, KERAS_BACKEND=FLAGS.import_backend)
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return float(output[0]), output[1] == "True"
+
+
+def _make_benchmarks():
+    rng = np.random.default_rng(0)
+    vocabulary = [f"token{i}" for i in range(FLAGS.vocabulary_size)]
+    # A quarter of the tokens are out of vocabulary.
+    tokens = rng.integers(
+        0,
+        FLAGS.vocabulary_size * 5 // 4,
+        (FLAGS.batch_size, FLAGS.sequence_length),
+    )
+    strings = np.array([f"token{i}" for i in tokens.ravel()]).reshape(
+        tokens.shape
+    )
+    sentences = np.array([" ".join(row) for row in strings])
+    return {
+        "string_lookup": (layers.StringLookup(vocabulary=vocabulary), strings),
+        "string_lookup_multi_oov": (
+            layers.StringLookup(vocabulary=vocabulary, num_oov_indices=16),
+            strings,
+        ),
+        "string_lookup_multi_hot": (
+            layers.StringLookup(vocabulary=vocabulary, output_mode="multi_hot"),
+            strings,
+        ),
+        "string_lookup_invert": (
+            layers.StringLookup(vocabulary=vocabulary, invert=True),
+            tokens,
+        ),
+        "integer_lookup": (
+            layers.IntegerLookup(vocabulary=np.arange(FLAGS.vocabulary_size)),
+            tokens,
+        ),
+        "text_vectorization": (
+            layers.TextVectorization(
+                vocabulary=vocabulary,
+                output_sequence_length=FLAGS.sequence_length,
+            ),
+            sentences,
+        ),
+    }
+
+
+def _time(fn):
+    # The first call is excluded from the timing.
+    fn()
+    start = time.time()
+    for _ in range(FLAGS.num_iterations):
+        fn()
+    return (time.time() - start) / FLAGS.num_iterations
+
+
+def main(_):
+    for use_tf in (False, True):
+        seconds, tf_imported = _import_time(use_tf)
+        logging.info(
+            f"Import and first lookup with {'tf.lookup' if use_tf else 'NumPy'}"
+            f": {seconds:.2f} s (TensorFlow imported: {tf_imported})"
+        )
+
+    for name, (layer, inputs) in _make_benchmarks().items():
+        tf_inputs = tf.constant(inputs)
+        numpy_time = _time(lambda: layer._call_numpy(inputs))
+        tf_time = _time(lambda: layer(tf_inputs))
+        logging.info(
+            f"{name}: NumPy {numpy_time * 1000:.2f} ms/batch, "
+            f"tf.lookup {tf_time * 1000:.2f} ms/batch"
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
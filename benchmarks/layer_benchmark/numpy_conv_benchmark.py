@@ -0,0 +1,136 @@
+"""Benchmark the NumPy backend conv and pooling kernels against `jax.lax`.
+
+The NumPy backend implements convolutions with im2col and a GEMM, and
+pooling with reductions over strided views. This script times these kernels
+against the `jax.lax` ops that the NumPy backend used to delegate to (called
+eagerly and converted back to NumPy, as the backend did), on the shapes of
+`conv_benchmark.py` and `pooling_benchmark.py`.
+
+To run the benchmark, use the command below (requires JAX):
+
+```
+python3 -m benchmarks.layer_benchmark.numpy_conv_benchmark \
+    --benchmark_name=conv2D \
+    --batch_size=32 \
+    --num_iterations=10
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+from absl import logging
+
+from keras.src.backend.jax import nn as jax_nn
+from keras.src.backend.numpy import nn as numpy_nn
+
+flags.DEFINE_string(
+    "benchmark_name",
+    None,
+    "The name of benchmark to run. If None, all benchmarks will be run.",
+)
+flags.DEFINE_integer("batch_size", 32, "Batch size of the inputs.")
+flags.DEFINE_integer("num_iterations", 10, "Number of timed calls per op.")
+
+FLAGS = flags.FLAGS
+
+# Each benchmark is `(op name, input shape, argument shapes, kwargs)`, where
+# the shapes exclude the batch dimension of the input.
+BENCHMARKS = {
+    "conv1D": ("conv", [1024, 256], [[2, 256, 64]], {}),
+    "conv2D": ("conv", [128, 128, 4], [[2, 2, 4, 16]], {}),
+    "conv3D": ("conv", [32, 32, 32, 4], [[2, 2, 2, 4, 16]], {}),
+    "depthwise_conv1D": ("depthwise_conv", [256, 64], [[16, 64, 2]], {}),
+    "depthwise_conv2D": (
+        "depthwise_conv",
+        [128, 128, 4],
+        [[16, 16, 4, 2]],
+        {},
+    ),
+    "separable_conv1D": (
+        "separable_conv",
+        [256, 64],
+        [[16, 64, 2], [1, 128, 3]],
+        {},
+    ),
+    "separable_conv2D": (
+        "separable_conv",
+        [128, 128, 4],
+        [[16, 16, 4, 2], [1, 1, 8, 3]],
+        {},
+    ),
+    "conv1D_transpose": ("conv_transpose", [256, 256], [[4, 32, 256]], {}),
+    "conv2D_transpose": (
+        "conv_transpose",
+        [128, 128, 4],
+        [[2, 2, 16, 4]],
+        {},
+    ),
+    "conv3D_transpose": (
+        "conv_transpose",
+        [32, 32, 32, 4],
+        [[2, 2, 2, 16, 4]],
+        {},
+    ),
+    "max_pool2D": (
+        "max_pool",
+        [256, 256, 3],
+        [],
+        {"pool_size": 2, "strides": 2},
+    ),
+    "average_pool2D": (
+        "average_pool",
+        [256, 256, 3],
+        [],
+        {"pool_size": 2, "strides": 2, "padding": "valid"},
+    ),
+}
+
+
+def _time_op(fn, args, kwargs):
+    # The first call is excluded from the timing.
+    np.asarray(fn(*args, **kwargs))
+    start = time.time()
+    for _ in range(FLAGS.num_iterations):
+        np.asarray(fn(*args, **kwargs))
+    return (time.time() - start) / FLAGS.num_iterations
+
+
+def run_benchmark(name):
+    op_name, input_shape, arg_shapes, kwargs = BENCHMARKS[name]
+    args = [
+        np.random.normal(size=[FLAGS.batch_size] + input_shape).astype(
+            "float32"
+        )
+    ]
+    args += [
+        np.random.normal(size=shape).astype("float32") for shape in arg_shapes
+    ]
+    numpy_time = _time_op(getattr(numpy_nn, op_name), args, kwargs)
+    lax_time = _time_op(getattr(jax_nn, op_name), args, kwargs)
+    logging.info(
+        f"{name}: numpy {numpy_time * 1000:.2f} ms/call, "
+        f"lax {lax_time * 1000:.2f} ms/call "
+        f"({lax_time / numpy_time:.2f}x)."
+    )
+
+
+def main(_):
+    benchmark_name = FLAGS.benchmark_name
+    if benchmark_name is None:
+        for name in BENCHMARKS:
+            run_benchmark(name)
+        return
+
+    if benchmark_name not in BENCHMARKS:
+        raise ValueError(
+            f"Invalid benchmark name: {benchmark_name}, `benchmark_name` must "
+            f"be one of {BENCHMARKS.keys()}"
+        )
+    run_benchmark(benchmark_name)
+
+
+if __name__ == "__main__":
+    app.run(main)
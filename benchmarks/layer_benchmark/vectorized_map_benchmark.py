@@ -0,0 +1,100 @@
+"""Benchmark `vectorized_map` of the NumPy backend against `jax.vmap`.
+
+The NumPy backend evaluates the mapped function once on the whole batch when
+all the NumPy functions it calls can be batched, and calls it on each
+example otherwise. This script times both paths against `jax.vmap` (eager
+and jitted) on a few per-example functions.
+
+To run the benchmark, use the command below (requires JAX):
+
+```
+python3 -m benchmarks.layer_benchmark.vectorized_map_benchmark \
+    --batch_size=256 \
+    --num_iterations=20
+```
+"""
+
+import time
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+from absl import app
+from absl import flags
+from absl import logging
+
+from keras.src.backend.numpy import batching
+
+flags.DEFINE_integer("batch_size", 256, "Number of mapped examples.")
+flags.DEFINE_integer("num_iterations", 20, "Number of timed calls.")
+
+FLAGS = flags.FLAGS
+
+
+def standardize(xp, x):
+    return (x - xp.mean(x)) / (xp.std(x) + 1e-6)
+
+
+def dense(xp, x):
+    return xp.tanh(xp.matmul(x, xp.ones((64, 64), dtype=x.dtype)))
+
+
+def crop_and_flip(xp, x):
+    x = xp.pad(x, ((4, 4), (4, 4), (0, 0)))[2:34, 6:38]
+    return xp.flip(x, axis=1)
+
+
+def self_attention(xp, x):
+    scores = xp.matmul(x, xp.transpose(x)) / 8.0
+    scores = xp.exp(scores - xp.max(scores, axis=-1, keepdims=True))
+    weights = scores / xp.sum(scores, axis=-1, keepdims=True)
+    return xp.matmul(weights, x)
+
+
+BENCHMARKS = {
+    "standardize": (standardize, [32, 32, 3]),
+    "dense": (dense, [16, 64]),
+    "crop_and_flip": (crop_and_flip, [32, 32, 3]),
+    "self_attention": (self_attention, [32, 64]),
+}
+
+
+def _time(fn, x):
+    # The first call is excluded from the timing.
+    np.asarray(fn(x))
+    start = time.time()
+    for _ in range(FLAGS.num_iterations):
+        np.asarray(fn(x))
+    return (time.time() - start) / FLAGS.num_iterations
+
+
+def run_benchmark(name):
+    fn, shape = BENCHMARKS[name]
+    x = np.random.uniform(size=[FLAGS.batch_size] + shape).astype("float32")
+    numpy_fn = lambda e: fn(np, e)  # noqa: E731
+    timings = {
+        "numpy batched": _time(
+            lambda x: batching.vectorized_map(numpy_fn, x), x
+        ),
+        "numpy per example": _time(
+            lambda x: batching._map_examples(numpy_fn, x, len(x), False), x
+        ),
+        "jax.vmap": _time(jax.vmap(lambda e: fn(jnp, e)), x),
+        "jax.jit(jax.vmap)": _time(jax.jit(jax.vmap(lambda e: fn(jnp, e))), x),
+    }
+    logging.info(
+        f"{name}: "
+        + ", ".join(
+            f"{path} {seconds * 1000:.2f} ms"
+            for path, seconds in timings.items()
+        )
+    )
+
+
+def main(_):
+    for name in BENCHMARKS:
+        run_benchmark(name)
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -1,5 +1,8 @@
+import math
 import time
 
+import numpy as np
+
 import keras
 
 
@@ -22,3 +25,14 @@ class BenchmarkMetricsCallback(keras.callbacks.Callback):
                 epoch_end_time - self.state["epoch_begin_time"]
             )
             self.state["throughput"].append(throughput)
+
+
+def gradient_accumulators_bytes(optimizer):
+    """Returns the memory of the gradient accumulators of `optimizer`."""
+    if not optimizer.gradient_accumulation_steps:
+        return 0
+    return sum(
+        math.prod(v.shape)
+        * np.dtype(keras.backend.standardize_dtype(v.dtype)).itemsize
+        for v in optimizer._gradient_accumulators
+    )
@@ -8,6 +8,10 @@ python3 -m model_benchmark.bert_benchmark \
     --batch_size 32
 ```
 
+To benchmark gradient accumulation, pass `--gradient_accumulation_steps`, and
+optionally `--flat_gradient_accumulators` and `--gradient_accumulators_dtype`.
+The memory of the gradient accumulators is reported after training.
+
 """
 
 import time
@@ -20,6 +24,7 @@ from absl import app
 from absl import flags
 from absl import logging
 from model_benchmark.benchmark_utils import BenchmarkMetricsCallback
+from model_benchmark.benchmark_utils import gradient_accumulators_bytes
 
 import keras
 
@@ -31,6 +36,21 @@ flags.DEFINE_string(
 )
 flags.DEFINE_integer("epochs", 2, "The number of epochs.")
 flags.DEFINE_integer("batch_size", 8, "Batch Size.")
+flags.DEFINE_integer(
+    "gradient_accumulation_steps",
+    None,
+    "Number of steps per optimizer update, if accumulating gradients.",
+)
+flags.DEFINE_bool(
+    "flat_gradient_accumulators",
+    False,
+    "Whether to accumulate gradients in a flat buffer per dtype.",
+)
+flags.DEFINE_string(
+    "gradient_accumulators_dtype",
+    None,
+    "The dtype of the flat gradient accumulators, e.g. 'bfloat16'.",
+)
 
 
 FLAGS = flags.FLAGS
@@ -104,6 +124,9 @@ def main(_):
         f"TASK: glue/mrpc \n"
         f"BATCH_SIZE: {FLAGS.batch_size}\n"
         f"EPOCHS: {FLAGS.epochs}\n"
+        f"GRADIENT_ACCUMULATION_STEPS: {FLAGS.gradient_accumulation_steps}\n"
+        f"FLAT_GRADIENT_ACCUMULATORS: {FLAGS.flat_gradient_accumulators}\n"
+        f"GRADIENT_ACCUMULATORS_DTYPE: {FLAGS.gradient_accumulators_dtype}\n"
         "=========================\n"
     )
 
@@ -121,7 +144,13 @@ def main(_):
         decay_steps=train_ds.cardinality() * FLAGS.epochs,
         end_learning_rate=0.0,
     )
-    optimizer = keras.optimizers.AdamW(lr, weight_decay=0.01)
+    optimizer = keras.optimizers.AdamW(
+        lr,
+        weight_decay=0.01,
+        gradient_accumulation_steps=FLAGS.gradient_accumulation_steps,
+        flat_gradient_accumulators=FLAGS.flat_gradient_accumulators,
+        gradient_accumulators_dtype=FLAGS.gradient_accumulators_dtype,
+    )
     optimizer.exclude_from_weight_decay(
         var_names=["LayerNorm", "layer_norm", "bias"]
     )
@@ -155,6 +184,10 @@ def main(_):
     logging.info(f"Wall Time: {wall_time:.4f} seconds.")
     logging.info(f"Validation Accuracy: {validation_accuracy:.4f}")
     logging.info(f"examples_per_second: {examples_per_second:.4f}")
+    logging.info(
+        "Gradient accumulators: "
+        f"{gradient_accumulators_bytes(optimizer) / 2**20:.1f} MiB"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,191 @@
+"""Benchmark the gradient accumulators of the optimizers on BERT-sized models.
+
+With `gradient_accumulation_steps`, the optimizer keeps the sum of the
+gradients of each trainable variable between two updates. This script creates
+variables with the shapes of the BERT models of `bert_benchmark.py` (without
+loading the presets, which requires KerasNLP), applies random gradients with
+`AdamW`, and reports for each accumulator layout:
+
+- The memory of the gradient accumulators.
+- The time per accumulation step (without update) and per update step. With
+JAX, the steps are jitted with `optimizer.stateless_apply()`.
+
+The layouts are:
+
+- "per_variable": one accumulator per variable.
+- "flat": one flat accumulator per dtype (`flat_gradient_accumulators=True`).
+- "flat_bfloat16": flat accumulators in bfloat16, updated with stochastic
+rounding (`gradient_accumulators_dtype="bfloat16"`).
+
+To measure them in a full training run of BERT on GLUE/MRPC instead, pass
+`--gradient_accumulation_steps`, `--flat_gradient_accumulators` and
+`--gradient_accumulators_dtype` to `bert_benchmark.py`.
+
+To run the benchmark, make sure you are in benchmarks/ directory, and run
+the command below:
+
+python3 -m model_benchmark.gradient_accumulation_benchmark \
+    --model_size=small \
+    --gradient_accumulation_steps=4 \
+    --num_updates=5
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+from absl import logging
+from model_benchmark.benchmark_utils import gradient_accumulators_bytes
+
+import keras
+
+flags.DEFINE_string("model_size", "small", "The size of model to benchmark.")
+flags.DEFINE_integer(
+    "gradient_accumulation_steps", 4, "Number of steps per update."
+)
+flags.DEFINE_integer("num_updates", 5, "Number of timed update steps.")
+
+FLAGS = flags.FLAGS
+
+# Number of layers, hidden dim and intermediate dim of the BERT presets of
+# `bert_benchmark.py`.
+MODEL_SIZE_MAP = {
+    "tiny": (2, 128, 512),
+    "small": (4, 512, 2048),
+    "base": (12, 768, 3072),
+    "large": (24, 1024, 4096),
+}
+VOCABULARY_SIZE = 30522
+MAX_SEQUENCE_LENGTH = 512
+
+LAYOUTS = {
+    "per_variable": {},
+    "flat": {"flat_gradient_accumulators": True},
+    "flat_bfloat16": {
+        "flat_gradient_accumulators": True,
+        "gradient_accumulators_dtype": "bfloat16",
+    },
+}
+
+
+def bert_variable_shapes():
+    num_layers, hidden_dim, intermediate_dim = MODEL_SIZE_MAP[FLAGS.model_size]
+    shapes = [
+        (VOCABULARY_SIZE, hidden_dim),
+        (MAX_SEQUENCE_LENGTH, hidden_dim),
+        (2, hidden_dim),
+        (hidden_dim,),
+        (hidden_dim,),
+    ]
+    for _ in range(num_layers):
+        # Query, key, value and output projections.
+        shapes += [(hidden_dim, hidden_dim), (hidden_dim,)] * 4
+        # Feedforward network.
+        shapes += [
+            (hidden_dim, intermediate_dim),
+            (intermediate_dim,),
+            (intermediate_dim, hidden_dim),
+            (hidden_dim,),
+        ]
+        # Layer normalizations.
+        shapes += [(hidden_dim,)] * 4
+    # Pooler and classification head.
+    shapes += [(hidden_dim, hidden_dim), (hidden_dim,), (hidden_dim, 2), (2,)]
+    return shapes
+
+
+def make_apply_fn(optimizer, variables):
+    """Returns a function applying gradients, jitted with JAX.
+
+    The function returns the value of the last variable.
+    """
+    if keras.backend.backend() != "jax":
+
+        def apply(grads):
+            optimizer.apply(grads, variables)
+            return variables[-1].value
+
+        return apply
+
+    import jax
+
+    optimizer.build(variables)
+    stateless_apply = jax.jit(optimizer.stateless_apply, donate_argnums=(0, 2))
+    state = {
+        "trainable": [v.value for v in variables],
+        "optimizer": [v.value for v in optimizer.variables],
+    }
+
+    def apply(grads):
+        state["trainable"], state["optimizer"] = stateless_apply(
+            state["optimizer"], grads, state["trainable"]
+        )
+        return state["trainable"][-1]
+
+    return apply
+
+
+def time_layout(shapes, grads, optimizer_kwargs):
+    rng = np.random.default_rng(0)
+    variables = [
+        keras.Variable(rng.normal(size=shape).astype("float32") * 0.02)
+        for shape in shapes
+    ]
+    optimizer = keras.optimizers.AdamW(
+        gradient_accumulation_steps=FLAGS.gradient_accumulation_steps,
+        **optimizer_kwargs,
+    )
+    apply = make_apply_fn(optimizer, variables)
+    # Build the optimizer, and run a full accumulation cycle before timing.
+    for _ in range(FLAGS.gradient_accumulation_steps):
+        apply(grads)
+
+    accumulation_seconds = update_seconds = 0.0
+    for _ in range(FLAGS.num_updates):
+        for step in range(FLAGS.gradient_accumulation_steps):
+            start = time.perf_counter()
+            # Wait for asynchronous backends.
+            keras.ops.convert_to_numpy(apply(grads))
+            seconds = time.perf_counter() - start
+            if step == FLAGS.gradient_accumulation_steps - 1:
+                update_seconds += seconds
+            else:
+                accumulation_seconds += seconds
+    num_accumulations = FLAGS.num_updates * (
+        FLAGS.gradient_accumulation_steps - 1
+    )
+    return (
+        gradient_accumulators_bytes(optimizer),
+        accumulation_seconds / num_accumulations,
+        update_seconds / FLAGS.num_updates,
+    )
+
+
+def main(_):
+    shapes = bert_variable_shapes()
+    rng = np.random.default_rng(1)
+    grads = [
+        keras.ops.convert_to_tensor(
+            rng.normal(size=shape).astype("float32") * 1e-3
+        )
+        for shape in shapes
+    ]
+    logging.info(
+        f"BERT {FLAGS.model_size}: {len(shapes)} variables, "
+        f"{sum(np.prod(shape) for shape in shapes) / 1e6:.1f}M parameters, "
+        f"backend {keras.backend.backend()}"
+    )
+    for name, optimizer_kwargs in LAYOUTS.items():
+        num_bytes, accumulation_seconds, update_seconds = time_layout(
+            shapes, grads, optimizer_kwargs
+        )
+        logging.info(
+            f"{name}: accumulators {num_bytes / 2**20:.1f} MiB, "
+            f"accumulation step {accumulation_seconds * 1e3:.2f} ms, "
+            f"update step {update_seconds * 1e3:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
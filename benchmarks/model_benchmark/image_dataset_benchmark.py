@@ -0,0 +1,113 @@
+"""Benchmark the loading of images with `image_dataset_from_directory()`.
+
+This script writes a folder of synthetic JPEG images, then loads it with
+`keras.utils.image_dataset_from_directory()` in two formats:
+
+- `format="tf"`: a `tf.data.Dataset` decoding images with TensorFlow ops.
+- `format="py_dataset"`: a `PyDataset` decoding images with PIL in
+  `num_workers` processes, into shared memory batches.
+
+Both datasets are iterated with the `EpochIterator` used by `Model.fit()`,
+which converts the batches to tensors of the backend, and the script reports
+the number of images loaded per second.
+
+To run the benchmark, make sure you are in benchmarks/ directory, and run
+the command below:
+
+python3 -m model_benchmark.image_dataset_benchmark \
+    --num_images=2000 \
+    --image_size=224 \
+    --num_workers=8
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+from absl import logging
+from PIL import Image
+
+import keras
+from keras.src.trainers.epoch_iterator import EpochIterator
+
+flags.DEFINE_integer("num_images", 2000, "Number of images to write.")
+flags.DEFINE_integer("num_classes", 10, "Number of class subdirectories.")
+flags.DEFINE_integer("source_size", 400, "Size of the JPEG images.")
+flags.DEFINE_integer("image_size", 224, "Size of the loaded images.")
+flags.DEFINE_integer("batch_size", 64, "Batch size.")
+flags.DEFINE_integer("epochs", 2, "Number of timed epochs.")
+flags.DEFINE_integer(
+    "num_workers", None, "Processes of the py_dataset format (CPU count)."
+)
+
+FLAGS = flags.FLAGS
+
+
+def write_images(directory):
+    rng = np.random.default_rng(0)
+    size = FLAGS.source_size
+    # Smooth gradients with noise compress like photos, unlike pure noise.
+    gradient = np.linspace(0, 192, size, dtype="float32")
+    for i in range(FLAGS.num_images):
+        class_directory = os.path.join(
+            directory, f"class_{i % FLAGS.num_classes}"
+        )
+        os.makedirs(class_directory, exist_ok=True)
+        image = (
+            gradient[:, None, None]
+            + gradient[None, ::-1, None] * rng.random(3, dtype="float32")
+            + rng.normal(scale=16, size=(size, size, 3))
+        )
+        image = Image.fromarray(np.clip(image, 0, 255).astype("uint8"))
+        image.save(os.path.join(class_directory, f"{i}.jpg"), quality=90)
+
+
+def images_per_second(dataset):
+    epoch_iterator = EpochIterator(dataset)
+    # Start the workers and the TF runtime before timing.
+    for _ in epoch_iterator.enumerate_epoch():
+        break
+    num_images = 0
+    start = time.perf_counter()
+    for _ in range(FLAGS.epochs):
+        for _, batches in epoch_iterator.enumerate_epoch():
+            for images, _ in batches:
+                num_images += images.shape[0]
+    return num_images / (time.perf_counter() - start)
+
+
+def main(_):
+    directory = tempfile.mkdtemp()
+    write_images(directory)
+    logging.info(
+        f"{FLAGS.num_images} JPEG images of {FLAGS.source_size}x"
+        f"{FLAGS.source_size}, resized to {FLAGS.image_size}x"
+        f"{FLAGS.image_size}, {os.cpu_count()} CPUs, "
+        f"backend {keras.backend.backend()}"
+    )
+    for data_format in ("tf", "py_dataset"):
+        kwargs = {}
+        if data_format == "py_dataset":
+            kwargs["num_workers"] = FLAGS.num_workers
+        dataset = keras.utils.image_dataset_from_directory(
+            directory,
+            image_size=(FLAGS.image_size, FLAGS.image_size),
+            batch_size=FLAGS.batch_size,
+            seed=1337,
+            verbose=False,
+            format=data_format,
+            **kwargs,
+        )
+        logging.info(
+            f"format={data_format}: "
+            f"{images_per_second(dataset):.1f} images/sec"
+        )
+        if data_format == "py_dataset":
+            dataset.close()
+
+
+if __name__ == "__main__":
+    app.run(main)
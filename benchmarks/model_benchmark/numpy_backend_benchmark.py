@@ -0,0 +1,142 @@
+"""Benchmark `Model.fit()` with the NumPy backend against the torch backend.
+
+This script trains the 3-layer dense model of
+`torch_ctl_benchmark/dense_model_benchmark.py` with `model.fit()` on CPU,
+once with each backend. Since the backend is selected at import time, every
+backend runs in its own subprocess. For each backend, the script reports the
+time to `import keras`, the average time per training batch, and the peak
+resident memory of the process.
+
+To run the benchmark, make sure you are in benchmarks/ directory, and run
+the command below:
+
+python3 -m model_benchmark.numpy_backend_benchmark \
+    --input_dim=256 \
+    --batch_size=256 \
+    --num_batches=50
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+from absl import logging
+
+flags.DEFINE_integer("input_dim", 8192, "Number of input features.")
+flags.DEFINE_integer("num_classes", 2, "Number of classes.")
+flags.DEFINE_integer("batch_size", 4096, "Batch Size.")
+flags.DEFINE_integer("num_batches", 20, "Number of batches per epoch.")
+flags.DEFINE_integer("epochs", 1, "The number of epochs.")
+flags.DEFINE_list(
+    "backends", ["numpy", "torch"], "The Keras backends to compare."
+)
+flags.DEFINE_string(
+    "worker_backend",
+    None,
+    "Internal: run the benchmark in this process with the given backend.",
+)
+
+FLAGS = flags.FLAGS
+
+
+def run_worker():
+    start = time.time()
+    # Imported here to measure the import time of the selected backend.
+    import keras
+
+    import_time = time.time() - start
+
+    x = np.random.normal(
+        size=(FLAGS.num_batches * FLAGS.batch_size, FLAGS.input_dim)
+    ).astype("float32")
+    y = np.random.randint(
+        0, FLAGS.num_classes, size=(FLAGS.num_batches * FLAGS.batch_size,)
+    )
+    model = keras.Sequential(
+        [
+            keras.Input(shape=(FLAGS.input_dim,)),
+            keras.layers.Dense(64, activation="relu"),
+            keras.layers.Dense(8, activation="relu"),
+            keras.layers.Dense(FLAGS.num_classes),
+            keras.layers.Softmax(),
+        ]
+    )
+    model.compile(optimizer="adam", loss="sparse_categorical_crossentropy")
+
+    batch_times = []
+
+    class BatchTimer(keras.callbacks.Callback):
+        def on_train_batch_begin(self, batch, logs=None):
+            self._start = time.time()
+
+        def on_train_batch_end(self, batch, logs=None):
+            batch_times.append(time.time() - self._start)
+
+    model.fit(
+        x,
+        y,
+        batch_size=FLAGS.batch_size,
+        epochs=FLAGS.epochs,
+        callbacks=[BatchTimer()],
+        shuffle=False,
+        verbose=0,
+    )
+    # Skip the first batch, which includes one-time setup costs.
+    result = {
+        "import_time": import_time,
+        "time_per_batch": float(np.mean(batch_times[1:] or batch_times)),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        / 1024,
+    }
+    print(json.dumps(result))
+
+
+def main(_):
+    if FLAGS.worker_backend:
+        run_worker()
+        return
+
+    logging.info(
+        "Benchmarking configs...\n"
+        "=========================\n"
+        f"INPUT_DIM: {FLAGS.input_dim}\n"
+        f"BATCH_SIZE: {FLAGS.batch_size}\n"
+        f"NUM_BATCHES: {FLAGS.num_batches}\n"
+        f"EPOCHS: {FLAGS.epochs}\n"
+        "=========================\n"
+    )
+    for backend in FLAGS.backends:
+        env = dict(os.environ, KERAS_BACKEND=backend, CUDA_VISIBLE_DEVICES="")
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "model_benchmark.numpy_backend_benchmark",
+                f"--worker_backend={backend}",
+                f"--input_dim={FLAGS.input_dim}",
+                f"--num_classes={FLAGS.num_classes}",
+                f"--batch_size={FLAGS.batch_size}",
+                f"--num_batches={FLAGS.num_batches}",
+                f"--epochs={FLAGS.epochs}",
+            ],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        logging.info(
+            f"{backend}: import keras {result['import_time']:.2f} seconds, "
+            f"{result['time_per_batch'] * 1000:.2f} ms/batch, "
+            f"peak RSS {result['peak_rss_mb']:.0f} MB."
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,103 @@
+"""Benchmark the `prefetch` argument of `Model.fit()`.
+
+This script trains a small MLP on in-memory NumPy arrays, which go through
+`ArrayDataAdapter` slicing and conversion on every step, and reports the
+training throughput (steps/sec) with and without background prefetching.
+
+To run the benchmark, make sure you are in benchmarks/ directory, and run
+the command below:
+
+python3 -m model_benchmark.prefetch_benchmark \
+    --num_samples=200000 \
+    --batch_size=256 \
+    --prefetch=4
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+from absl import logging
+from model_benchmark.benchmark_utils import BenchmarkMetricsCallback
+
+import keras
+
+flags.DEFINE_integer("num_samples", 200000, "Number of training samples.")
+flags.DEFINE_integer("num_features", 256, "Number of input features.")
+flags.DEFINE_integer("batch_size", 256, "Batch Size.")
+flags.DEFINE_integer("epochs", 2, "The number of epochs.")
+flags.DEFINE_integer(
+    "prefetch", 4, "The prefetch depth to compare against no prefetching."
+)
+
+FLAGS = flags.FLAGS
+
+
+def load_model():
+    model = keras.Sequential(
+        [
+            keras.Input((FLAGS.num_features,)),
+            keras.layers.Dense(512, activation="relu"),
+            keras.layers.Dense(512, activation="relu"),
+            keras.layers.Dense(10),
+        ]
+    )
+    model.compile(
+        optimizer="adam",
+        loss=keras.losses.SparseCategoricalCrossentropy(from_logits=True),
+    )
+    return model
+
+
+def run(x, y, prefetch):
+    model = load_model()
+    num_steps = int(np.ceil(FLAGS.num_samples / FLAGS.batch_size))
+    benchmark_metrics_callback = BenchmarkMetricsCallback(
+        start_batch=1,
+        stop_batch=num_steps - 1,
+    )
+    st = time.time()
+    model.fit(
+        x,
+        y,
+        batch_size=FLAGS.batch_size,
+        epochs=FLAGS.epochs,
+        callbacks=[benchmark_metrics_callback],
+        prefetch=prefetch,
+        verbose=0,
+    )
+    wall_time = time.time() - st
+    steps_per_second = np.mean(
+        np.array(benchmark_metrics_callback.state["throughput"])
+    )
+    return wall_time, steps_per_second
+
+
+def main(_):
+    logging.info(
+        "Benchmarking configs...\n"
+        "=========================\n"
+        f"BACKEND: {keras.backend.backend()}\n"
+        f"NUM_SAMPLES: {FLAGS.num_samples}\n"
+        f"BATCH_SIZE: {FLAGS.batch_size}\n"
+        f"EPOCHS: {FLAGS.epochs}\n"
+        f"PREFETCH: {FLAGS.prefetch}\n"
+        "=========================\n"
+    )
+
+    x = np.random.random((FLAGS.num_samples, FLAGS.num_features)).astype(
+        "float32"
+    )
+    y = np.random.randint(0, 10, size=(FLAGS.num_samples,))
+
+    for prefetch in (0, FLAGS.prefetch):
+        wall_time, steps_per_second = run(x, y, prefetch)
+        logging.info(
+            f"prefetch={prefetch}: wall time {wall_time:.4f} seconds, "
+            f"{steps_per_second:.2f} steps/sec."
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
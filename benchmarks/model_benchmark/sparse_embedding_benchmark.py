@@ -0,0 +1,89 @@
+"""Benchmark sparse updates of large embedding tables.
+
+With `Embedding(sparse_updates=True)`, the optimizer only updates the rows of
+the embeddings that are looked up in each batch, along with the same rows of
+its slot variables, instead of the full table. This script trains a small
+recommendation-style model (an embedding table of `vocabulary_size` rows,
+averaged and followed by a dense layer) with `model.fit()`, with and without
+sparse updates, and reports the time per training step.
+
+The gradients of the embeddings are sparse with the TensorFlow and torch
+backends. JAX doesn't support sparse updates: both runs apply dense updates.
+
+To run the benchmark, make sure you are in benchmarks/ directory, and run
+the command below:
+
+python3 -m model_benchmark.sparse_embedding_benchmark \
+    --vocabulary_size=1000000 \
+    --optimizer=adam \
+    --num_steps=20
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+from absl import logging
+
+import keras
+
+flags.DEFINE_integer("vocabulary_size", 1000000, "Rows of the embeddings.")
+flags.DEFINE_integer("embedding_dim", 32, "Dimension of the embeddings.")
+flags.DEFINE_integer("sequence_length", 20, "Number of ids per sample.")
+flags.DEFINE_integer("batch_size", 256, "Batch size.")
+flags.DEFINE_integer("num_steps", 20, "Number of timed training steps.")
+flags.DEFINE_string(
+    "optimizer", "adam", "One of 'adam', 'adamw', 'adagrad' and 'sgd'."
+)
+
+FLAGS = flags.FLAGS
+
+
+def load_model(sparse_updates):
+    model = keras.Sequential(
+        [
+            keras.Input((FLAGS.sequence_length,), dtype="int32"),
+            keras.layers.Embedding(
+                FLAGS.vocabulary_size,
+                FLAGS.embedding_dim,
+                sparse_updates=sparse_updates,
+            ),
+            keras.layers.GlobalAveragePooling1D(),
+            keras.layers.Dense(1),
+        ]
+    )
+    model.compile(optimizer=FLAGS.optimizer, loss="mse")
+    return model
+
+
+def time_training(x, y, sparse_updates):
+    model = load_model(sparse_updates)
+    # Compile the train function and build the optimizer before timing.
+    model.fit(x, y, batch_size=FLAGS.batch_size, steps_per_epoch=1, verbose=0)
+    start = time.perf_counter()
+    model.fit(x, y, batch_size=FLAGS.batch_size, verbose=0)
+    return (time.perf_counter() - start) / FLAGS.num_steps
+
+
+def main(_):
+    rng = np.random.default_rng(0)
+    num_samples = FLAGS.num_steps * FLAGS.batch_size
+    x = rng.integers(
+        0, FLAGS.vocabulary_size, size=(num_samples, FLAGS.sequence_length)
+    ).astype("int32")
+    y = rng.normal(size=(num_samples, 1)).astype("float32")
+    logging.info(
+        f"Embeddings of {FLAGS.vocabulary_size} x {FLAGS.embedding_dim}, "
+        f"{FLAGS.batch_size * FLAGS.sequence_length} lookups per step, "
+        f"optimizer {FLAGS.optimizer}, backend {keras.backend.backend()}"
+    )
+    for sparse_updates in (False, True):
+        seconds = time_training(x, y, sparse_updates)
+        logging.info(
+            f"sparse_updates={sparse_updates}: {seconds * 1e3:.2f} ms/step"
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
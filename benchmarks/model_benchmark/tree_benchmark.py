@@ -0,0 +1,200 @@
+"""Measure the time spent in `keras.src.tree` utilities per step.
+
+The trainers and `Functional` models traverse the same nested structures at
+every step (model inputs and outputs, the arguments of each layer call, the
+`predict()` outputs). This script instruments the functions of
+`keras.src.tree` and the methods of the `StructureSpec` objects returned by
+`tree.structure_spec()`, then runs `fit()` and `predict()` on a functional
+model with dict inputs and outputs, and reports for each phase:
+
+- The wall time per step.
+- The time per step spent in tree utilities, in total and per function, with
+the number of calls per step.
+
+To run the benchmark, make sure you are in benchmarks/ directory, and run
+the command below:
+
+python3 -m model_benchmark.tree_benchmark \
+    --num_steps=200 \
+    --batch_size=32
+"""
+
+import collections
+import functools
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+from absl import logging
+
+import keras
+from keras.src import tree
+
+flags.DEFINE_integer("num_steps", 200, "Number of timed steps per phase.")
+flags.DEFINE_integer("batch_size", 32, "Batch Size.")
+flags.DEFINE_integer("num_blocks", 4, "Number of residual blocks.")
+flags.DEFINE_integer("num_features", 16, "Number of features per input.")
+
+FLAGS = flags.FLAGS
+
+# Functions and methods, with the index of their mapped function argument.
+TREE_FUNCTIONS = {
+    "assert_same_structure": None,
+    "flatten": None,
+    "is_nested": None,
+    "map_shape_structure": 0,
+    "map_structure": 0,
+    "map_structure_up_to": 1,
+    "pack_sequence_as": None,
+    "structure_spec": None,
+    "traverse": 0,
+}
+SPEC_METHODS = {"flatten": None, "unflatten": None, "map_structure": 1}
+
+
+class TreeProfiler:
+    """Accumulates the time spent in tree utilities, by function.
+
+    Nested calls (e.g. `map_structure()` calling `flatten()`) are only
+    counted in the outermost call, and the time spent in the functions
+    mapped over structures is not counted.
+    """
+
+    def __init__(self):
+        self.seconds = collections.Counter()
+        self.calls = collections.Counter()
+        self._depth = 0
+        self._excluded = 0.0
+        self._patches = []
+
+    def _exclude(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            depth, self._depth = self._depth, 0
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._excluded += time.perf_counter() - start
+                self._depth = depth
+
+        return wrapper
+
+    def _wrap(self, name, fn, func_index):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if self._depth:
+                return fn(*args, **kwargs)
+            if func_index is not None:
+                args = list(args)
+                args[func_index] = self._exclude(args[func_index])
+            self._depth += 1
+            excluded = self._excluded
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.seconds[name] += elapsed - (self._excluded - excluded)
+                self.calls[name] += 1
+                self._depth -= 1
+
+        return wrapper
+
+    def _patch(self, owner, attr, name, func_index):
+        original = getattr(owner, attr)
+        self._patches.append((owner, attr, original))
+        setattr(owner, attr, self._wrap(name, original, func_index))
+
+    def __enter__(self):
+        for name, func_index in TREE_FUNCTIONS.items():
+            # Callers use `tree.<name>`, re-exported from `tree_api`.
+            self._patch(tree, name, f"tree.{name}", func_index)
+        spec_class = type(tree.structure_spec([0]))
+        for name, func_index in SPEC_METHODS.items():
+            self._patch(spec_class, name, f"StructureSpec.{name}", func_index)
+        return self
+
+    def __exit__(self, *args):
+        for owner, attr, original in reversed(self._patches):
+            setattr(owner, attr, original)
+
+    def reset(self):
+        self.seconds.clear()
+        self.calls.clear()
+
+
+def load_model():
+    inputs = {
+        name: keras.Input((FLAGS.num_features,), name=name)
+        for name in ("a", "b", "c")
+    }
+    x = keras.layers.Concatenate()(list(inputs.values()))
+    x = keras.layers.Dense(64, activation="relu")(x)
+    for _ in range(FLAGS.num_blocks):
+        y = keras.layers.Dense(64, activation="relu")(x)
+        x = keras.layers.Add()([x, keras.layers.Dense(64)(y)])
+    outputs = {
+        "label": keras.layers.Dense(10, name="label")(x),
+        "score": keras.layers.Dense(1, name="score")(x),
+    }
+    model = keras.Model(inputs, outputs)
+    model.compile(
+        optimizer="adam",
+        loss={
+            "label": keras.losses.SparseCategoricalCrossentropy(
+                from_logits=True
+            ),
+            "score": "mse",
+        },
+        metrics={"label": ["accuracy"], "score": ["mae"]},
+    )
+    return model
+
+
+def report(phase, profiler, seconds, num_steps):
+    total = sum(profiler.seconds.values())
+    logging.info(
+        f"{phase}: {seconds / num_steps * 1e3:.3f} ms/step, of which "
+        f"{total / num_steps * 1e6:.1f} us/step in tree utilities "
+        f"({total / seconds:.1%})"
+    )
+    for name, value in profiler.seconds.most_common():
+        logging.info(
+            f"    {name}: {value / num_steps * 1e6:.1f} us/step, "
+            f"{profiler.calls[name] / num_steps:.1f} calls/step"
+        )
+
+
+def main(_):
+    num_samples = FLAGS.num_steps * FLAGS.batch_size
+    rng = np.random.default_rng(0)
+    x = {
+        name: rng.random((num_samples, FLAGS.num_features), "float32")
+        for name in ("a", "b", "c")
+    }
+    y = {
+        "label": rng.integers(0, 10, (num_samples,)),
+        "score": rng.random((num_samples, 1), "float32"),
+    }
+    model = load_model()
+    # Warm up, so that building and tracing are not measured.
+    model.fit(x, y, batch_size=FLAGS.batch_size, steps_per_epoch=2, verbose=0)
+    model.predict(x, batch_size=FLAGS.batch_size, steps=2, verbose=0)
+
+    with TreeProfiler() as profiler:
+        start = time.perf_counter()
+        model.fit(x, y, batch_size=FLAGS.batch_size, epochs=1, verbose=0)
+        report("fit", profiler, time.perf_counter() - start, FLAGS.num_steps)
+
+        profiler.reset()
+        start = time.perf_counter()
+        model.predict(x, batch_size=FLAGS.batch_size, verbose=0)
+        report(
+            "predict", profiler, time.perf_counter() - start, FLAGS.num_steps
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,122 @@
+"""Benchmark offloading the optimizer state to host memory on torch.
+
+With `offload_state="host"`, the slot variables of the optimizer (e.g. the
+momentums and velocities of `Adam`) live in host memory, and are copied to the
+device in chunks of `optimizer.offload_chunk_size` weights during each update
+step. This script trains a stack of dense layers with `model.fit()`, with and
+without offloading, and reports:
+
+- The size of the optimizer state on the device and on the host.
+- The peak device memory allocated during training, on CUDA.
+- The time per training step.
+
+To run the benchmark, use the command below:
+
+```
+KERAS_BACKEND=torch python3 -m benchmarks.torch_ctl_benchmark.optimizer_offload_benchmark \
+    --num_layers=8 \
+    --units=2048 \
+    --num_steps=20
+```
+"""  # noqa: E501
+
+import time
+
+import numpy as np
+import torch
+from absl import app
+from absl import flags
+from absl import logging
+
+import keras
+from keras import layers
+
+flags.DEFINE_integer("num_layers", 8, "Number of dense layers.")
+flags.DEFINE_integer("units", 2048, "Number of units of the dense layers.")
+flags.DEFINE_integer("batch_size", 64, "Batch size.")
+flags.DEFINE_integer("num_steps", 20, "Number of timed training steps.")
+flags.DEFINE_integer(
+    "offload_chunk_size",
+    2**24,
+    "Number of weights whose state is copied to the device at once.",
+)
+
+FLAGS = flags.FLAGS
+
+
+def _state_bytes(optimizer):
+    """Returns the bytes of optimizer state on the device and on the host."""
+    offloaded = {
+        id(slot)
+        for slots in optimizer._offloaded_slots.values()
+        for slot in slots
+    }
+    device_bytes = host_bytes = 0
+    for variable in optimizer.variables:
+        value = variable.value
+        num_bytes = value.numel() * value.element_size()
+        if id(variable) in offloaded:
+            host_bytes += num_bytes
+        else:
+            device_bytes += num_bytes
+    return device_bytes, host_bytes
+
+
+def _train(offload_state, x, y):
+    keras.utils.set_random_seed(0)
+    model = keras.Sequential(
+        [keras.Input((FLAGS.units,))]
+        + [
+            layers.Dense(FLAGS.units, activation="relu")
+            for _ in range(FLAGS.num_layers)
+        ]
+    )
+    optimizer = keras.optimizers.Adam(offload_state=offload_state)
+    optimizer.offload_chunk_size = FLAGS.offload_chunk_size
+    model.compile(optimizer=optimizer, loss="mse")
+    # Build the optimizer before timing.
+    model.fit(x, y, batch_size=FLAGS.batch_size, steps_per_epoch=1, verbose=0)
+
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+        torch.cuda.reset_peak_memory_stats()
+    start = time.perf_counter()
+    model.fit(x, y, batch_size=FLAGS.batch_size, verbose=0)
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+    seconds = (time.perf_counter() - start) / FLAGS.num_steps
+    peak_bytes = (
+        torch.cuda.max_memory_allocated() if torch.cuda.is_available() else None
+    )
+    return seconds, peak_bytes, _state_bytes(optimizer)
+
+
+def main(_):
+    if keras.backend.backend() != "torch":
+        raise ValueError("Run the benchmark with `KERAS_BACKEND=torch`.")
+    rng = np.random.default_rng(0)
+    num_samples = FLAGS.num_steps * FLAGS.batch_size
+    x = rng.normal(size=(num_samples, FLAGS.units)).astype("float32")
+    y = rng.normal(size=(num_samples, FLAGS.units)).astype("float32")
+    logging.info(
+        f"{FLAGS.num_layers} dense layers of {FLAGS.units} units, "
+        f"device {keras.src.backend.torch.core.get_device()}"
+    )
+    for offload_state in (None, "host"):
+        seconds, peak_bytes, (device_bytes, host_bytes) = _train(
+            offload_state, x, y
+        )
+        peak = (
+            f", peak device memory {peak_bytes / 2**20:.1f} MiB"
+            if peak_bytes is not None
+            else ""
+        )
+        logging.info(
+            f"offload_state={offload_state}: {seconds * 1e3:.2f} ms/step, "
+            f"optimizer state {device_bytes / 2**20:.1f} MiB on device and "
+            f"{host_bytes / 2**20:.1f} MiB on host{peak}"
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
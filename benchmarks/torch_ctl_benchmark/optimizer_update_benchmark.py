@@ -0,0 +1,119 @@
+"""Benchmark the update step of the Keras optimizers on the torch backend.
+
+The torch optimizers update all variables at once with multi-tensor
+(`torch._foreach_*`) ops, and can keep their slot variables in flat buffers
+(`optimizer.flat_buffers = True`), so that the variables of each dtype are
+updated with a few ops on flat tensors. This script applies random gradients
+to many small variables, as found in models with many layers, and reports the
+time per update step of each optimizer:
+
+- "per_variable": the backend-agnostic update, one `update_step()` call per
+variable.
+- "foreach": the multi-tensor update.
+- "flat": the multi-tensor update, with flat buffers.
+
+To run the benchmark, use the command below:
+
+```
+KERAS_BACKEND=torch python3 -m benchmarks.torch_ctl_benchmark.optimizer_update_benchmark \
+    --num_variables=2000 \
+    --num_steps=20
+```
+"""  # noqa: E501
+
+import time
+from unittest import mock
+
+import numpy as np
+import torch
+from absl import app
+from absl import flags
+from absl import logging
+
+import keras
+from keras import optimizers
+
+flags.DEFINE_integer("num_variables", 2000, "Number of variables.")
+flags.DEFINE_integer("num_steps", 20, "Number of timed update steps.")
+flags.DEFINE_list(
+    "optimizers",
+    [
+        "adadelta",
+        "adafactor",
+        "adagrad",
+        "adam",
+        "adamax",
+        "adamw",
+        "ftrl",
+        "lion",
+        "nadam",
+        "rmsprop",
+        "sgd",
+    ],
+    "Optimizers to benchmark.",
+)
+
+FLAGS = flags.FLAGS
+
+# Shapes of the variables, cycled: the kernels and biases of small dense and
+# conv layers, and normalization scales.
+SHAPES = [(32, 32), (32,), (3, 3, 8, 8), (8,), (32,)]
+
+
+def _make_variables_and_grads():
+    rng = np.random.default_rng(0)
+    shapes = [SHAPES[i % len(SHAPES)] for i in range(FLAGS.num_variables)]
+    variables = [
+        keras.Variable(rng.random(shape, dtype="float32")) for shape in shapes
+    ]
+    grads = [
+        torch.as_tensor(rng.normal(size=shape).astype("float32"))
+        for shape in shapes
+    ]
+    return variables, grads
+
+
+def _time_update_step(name, mode):
+    variables, grads = _make_variables_and_grads()
+    optimizer = optimizers.get(name)
+    optimizer.flat_buffers = mode == "flat"
+    # Build the optimizer, and the flat buffers, before timing.
+    optimizer.apply(grads, variables)
+    start = time.perf_counter()
+    for _ in range(FLAGS.num_steps):
+        optimizer.apply(grads, variables)
+    return (time.perf_counter() - start) / FLAGS.num_steps
+
+
+def main(_):
+    if keras.backend.backend() != "torch":
+        raise ValueError("Run the benchmark with `KERAS_BACKEND=torch`.")
+    num_weights = sum(
+        np.prod(SHAPES[i % len(SHAPES)]) for i in range(FLAGS.num_variables)
+    )
+    logging.info(
+        f"{FLAGS.num_variables} variables, {num_weights} weights, "
+        f"device {keras.src.backend.torch.core.get_device()}"
+    )
+    for name in FLAGS.optimizers:
+        cls = type(optimizers.get(name))
+        # The backend-agnostic `_backend_update_step()` of the Keras class.
+        keras_cls = next(
+            c for c in cls.__mro__ if c.__module__.startswith("keras.src.opt")
+        )
+        with mock.patch.object(
+            cls, "_backend_update_step", keras_cls._backend_update_step
+        ):
+            per_variable = _time_update_step(name, "per_variable")
+        foreach = _time_update_step(name, "foreach")
+        flat = _time_update_step(name, "flat")
+        logging.info(
+            f"{name}: per_variable {per_variable * 1e3:.2f} ms/step, "
+            f"foreach {foreach * 1e3:.2f} ms/step "
+            f"({per_variable / foreach:.1f}x), "
+            f"flat {flat * 1e3:.2f} ms/step ({per_variable / flat:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
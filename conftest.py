@@ -24,10 +24,25 @@ def pytest_configure(config):
     )
 
 
+def pytest_ignore_collect(collection_path, config):
+    # Importing the tests of the NumPy backend imports its package, which
+    # replaces the `numpy` module of the active backend in
+    # `keras.src.backend`.
+    if backend() != "numpy" and collection_path.match(
+        "*/keras/src/backend/numpy/*_test.py"
+    ):
+        return True
+    return None
+
+
 def pytest_collection_modifyitems(config, items):
     requires_trainable_backend = pytest.mark.skipif(
         backend() == "numpy",
-        reason="Trainer not implemented for NumPy backend.",
+        reason=(
+            "The NumPy backend can't differentiate through every op (e.g. "
+            "`einsum`, `norm`, `custom_gradient`) or update slices of "
+            "variables in place."
+        ),
     )
     for item in items:
         if "requires_trainable_backend" in item.keywords:
@@ -119,6 +119,7 @@ class KerasVariable:
         # whether this variable should be overwritten by the computed gradient.
         # Ref: https://github.com/google/flax/blob/main/flax/linen/fp8_ops.py
         self._overwrite_with_gradient = False
+        self._sparse_updates = False
         if isinstance(initializer, str):
             from keras.src import initializers
 
@@ -292,6 +293,26 @@ class KerasVariable:
             )
         self._overwrite_with_gradient = value
 
+    @property
+    def sparse_updates(self):
+        """Whether the optimizer only updates the rows with a gradient.
+
+        When set, optimizers implementing `sparse_update_step()` (e.g. `Adam`,
+        `Adagrad` and `SGD`) update the rows of this variable that have a
+        non-zero gradient, along with the same rows of their slot variables,
+        and leave the other rows untouched. This is meant for large embedding
+        tables, whose gradients are sparse.
+        """
+        return self._sparse_updates
+
+    @sparse_updates.setter
+    def sparse_updates(self, value):
+        if not isinstance(value, bool):
+            raise TypeError(
+                f"`sparse_updates` must be a boolean. Received: {value}"
+            )
+        self._sparse_updates = value
+
     @property
     def regularizer(self):
         return self._regularizer
@@ -251,6 +251,15 @@ class VariablePropertiesTest(test_case.TestCase, parameterized.TestCase):
         with self.assertRaisesRegex(TypeError, "must be a boolean."):
             v.overwrite_with_gradient = "true"
 
+    def test_sparse_updates_setter(self):
+        v = backend.Variable(initializer=np.ones((2, 2)))
+        self.assertFalse(v.sparse_updates)
+        v.sparse_updates = True
+        self.assertTrue(v.sparse_updates)
+
+        with self.assertRaisesRegex(TypeError, "must be a boolean."):
+            v.sparse_updates = "true"
+
 
 class VariableNumpyValueAndAssignmentTest(test_case.TestCase):
     """tests for KerasVariable.numpy(), KerasVariable.value()
@@ -940,3 +940,111 @@ def psnr(x1, x2, max_val):
     mse = jnp.mean(jnp.square(x1 - x2))
     psnr = 20 * jnp.log10(max_val) - 10 * jnp.log10(mse)
     return psnr
+
+
+def _large_negative_number(dtype):
+    if backend.standardize_dtype(dtype) == "float16":
+        return -3e4
+    return -1e9
+
+
+def dot_product_attention(
+    query, key, value, bias=None, mask=None, scale=None, is_causal=False
+):
+    query = convert_to_tensor(query)
+    key = convert_to_tensor(key)
+    value = convert_to_tensor(value)
+    if bias is not None:
+        bias = convert_to_tensor(bias)
+    if mask is not None:
+        mask = convert_to_tensor(mask, dtype="bool")
+    if hasattr(jnn, "dot_product_attention"):
+        # Available in `jax>=0.4.31`, with a cuDNN kernel on GPUs.
+        if bias is not None:
+            bias = jnp.reshape(bias, (1,) * (4 - bias.ndim) + bias.shape)
+        if mask is not None:
+            mask = jnp.reshape(mask, (1,) * (4 - mask.ndim) + mask.shape)
+        return jnn.dot_product_attention(
+            query,
+            key,
+            value,
+            bias=bias,
+            mask=mask,
+            scale=scale,
+            is_causal=is_causal,
+        )
+    return _dot_product_attention_blockwise(
+        query, key, value, bias, mask, scale, is_causal
+    )
+
+
+def _dot_product_attention_blockwise(
+    query, key, value, bias, mask, scale, is_causal, block_size=512
+):
+    """Computes the attention over blocks of `block_size` keys.
+
+    The softmax is computed online: the running maximum and sum of the
+    exponentials of the scores of each query are updated block by block, so
+    that the scores of only one block are materialized at a time.
+    """
+    output_dtype = query.dtype
+    compute_dtype = jnp.promote_types(output_dtype, jnp.float32)
+    # (B, T, N, H) -> (B, N, T, H)
+    query = jnp.transpose(query, (0, 2, 1, 3)).astype(compute_dtype)
+    key = jnp.transpose(key, (0, 2, 1, 3)).astype(compute_dtype)
+    value = jnp.transpose(value, (0, 2, 1, 3)).astype(compute_dtype)
+    num_groups = query.shape[1] // key.shape[1]
+    if num_groups > 1:
+        key = jnp.repeat(key, num_groups, axis=1)
+        value = jnp.repeat(value, num_groups, axis=1)
+    if scale is None:
+        scale = 1.0 / math.sqrt(query.shape[-1])
+    query = query * jnp.asarray(scale, compute_dtype)
+    if bias is not None:
+        bias = bias.astype(compute_dtype)
+    large_negative = jnp.asarray(
+        _large_negative_number(output_dtype), compute_dtype
+    )
+
+    query_length, key_length = query.shape[2], key.shape[2]
+    maximum = None
+    for start in range(0, key_length, block_size):
+        stop = min(start + block_size, key_length)
+        scores = jnp.matmul(query, jnp.swapaxes(key[:, :, start:stop], -1, -2))
+        if bias is not None:
+            scores = scores + _key_block(bias, start, stop)
+        if mask is not None:
+            scores = jnp.where(
+                _key_block(mask, start, stop), scores, large_negative
+            )
+        if is_causal:
+            causal_mask = jnp.arange(query_length)[:, None] >= jnp.arange(
+                start, stop
+            )
+            scores = jnp.where(causal_mask, scores, large_negative)
+        block_maximum = jnp.max(scores, axis=-1, keepdims=True)
+        if maximum is None:
+            probabilities = jnp.exp(scores - block_maximum)
+            denominator = jnp.sum(probabilities, axis=-1, keepdims=True)
+            output = jnp.matmul(probabilities, value[:, :, start:stop])
+            maximum = block_maximum
+            continue
+        new_maximum = jnp.maximum(maximum, block_maximum)
+        probabilities = jnp.exp(scores - new_maximum)
+        correction = jnp.exp(maximum - new_maximum)
+        denominator = denominator * correction + jnp.sum(
+            probabilities, axis=-1, keepdims=True
+        )
+        output = output * correction + jnp.matmul(
+            probabilities, value[:, :, start:stop]
+        )
+        maximum = new_maximum
+    output = output / denominator
+    return jnp.transpose(output, (0, 2, 1, 3)).astype(output_dtype)
+
+
+def _key_block(x, start, stop):
+    """Slices a mask or bias broadcastable to `(B, N, T, S)` along `S`."""
+    if x.shape[-1] == 1:
+        return x
+    return x[..., start:stop]
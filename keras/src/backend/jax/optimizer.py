@@ -1,7 +1,36 @@
+import contextlib
+import warnings
+
 import jax
+import numpy as np
 from jax import numpy as jnp
 
+from keras.src import ops
+from keras.src import random
+from keras.src.backend.common.stateless_scope import in_stateless_scope
+from keras.src.backend.common.variables import standardize_dtype
 from keras.src.optimizers import base_optimizer
+from keras.src.utils import tracking
+
+
+def _to_host(value):
+    """Returns a copy of `value` in host memory, as a NumPy array."""
+    return np.array(value)
+
+
+@contextlib.contextmanager
+def _on_device(variables):
+    """Moves the values of offloaded `variables` to the device.
+
+    The values are copied back to host memory on exit.
+    """
+    for variable in variables:
+        variable._direct_assign(jnp.asarray(variable._value))
+    try:
+        yield
+    finally:
+        for variable in variables:
+            variable._value = _to_host(variable._value)
 
 
 class JaxOptimizer(base_optimizer.BaseOptimizer):
@@ -11,8 +40,141 @@ class JaxOptimizer(base_optimizer.BaseOptimizer):
     requirements in cond ops used for EMA handling
     and gradient accumulation handling. We do this
     by skipping conditionals entirely.
+
+    With `offload_state="host"`, the slot variables created with
+    `add_variable_from_reference()` after `BaseOptimizer.build()`, and the EMA
+    averages, are NumPy arrays in host memory. `JAXTrainer` keeps them out of
+    its compiled train step, and applies the gradients eagerly. The update
+    step and the EMA update are then applied to chunks of
+    `offload_chunk_size` weights, with the state of each chunk copied to the
+    device and back.
     """
 
+    offload_chunk_size = 2**24
+
+    @tracking.no_automatic_dependency_tracking
+    def build(self, variables):
+        super().build(variables)
+        # Maps the index of each trainable variable to its offloaded slot
+        # variables.
+        self._offloaded_slots = {}
+        if self.offload_state == "host" and self.use_ema:
+            for average in self._model_variables_moving_average:
+                average._value = _to_host(average._value)
+        if any(getattr(v, "sparse_updates", False) for v in variables):
+            warnings.warn(
+                "`sparse_updates` is not supported with the JAX backend. "
+                "Variables with `sparse_updates=True` (e.g. the embeddings of "
+                "`Embedding(..., sparse_updates=True)`) get dense updates.",
+                stacklevel=2,
+            )
+
+    def _use_sparse_updates(self, variable):
+        # The gradients of embedding lookups are dense with JAX, and selecting
+        # the looked up rows from them is slower than a dense update.
+        return False
+
+    def add_variable_from_reference(
+        self, reference_variable, name=None, initializer="zeros"
+    ):
+        variable = super().add_variable_from_reference(
+            reference_variable, name=name, initializer=initializer
+        )
+        # Slot variables are created by subclasses once `BaseOptimizer.build()`
+        # is done.
+        if self.offload_state == "host" and self.built:
+            index = self._trainable_variables_indices.get(
+                self._var_key(reference_variable)
+            )
+            if index is not None:
+                variable._value = _to_host(variable._value)
+                self._offloaded_slots.setdefault(index, []).append(variable)
+        return variable
+
+    def set_weights(self, weights):
+        super().set_weights(weights)
+        self._offload_assigned_state()
+
+    def load_own_variables(self, store):
+        super().load_own_variables(store)
+        self._offload_assigned_state()
+
+    def _offload_assigned_state(self):
+        """Moves the offloaded state assigned on the device back to host."""
+        if self.offload_state != "host" or not self.built:
+            return
+        offloaded = [s for v in self._offloaded_slots.values() for s in v]
+        if self.use_ema:
+            offloaded += self._model_variables_moving_average
+        for variable in offloaded:
+            if not isinstance(variable._value, np.ndarray):
+                variable._value = _to_host(variable._value)
+
+    def _offload_chunks(self, trainable_variables):
+        """Yields lists of positions in `trainable_variables`.
+
+        Each chunk holds up to `offload_chunk_size` weights, or a single
+        variable.
+        """
+        chunk, size = [], 0
+        for position, variable in enumerate(trainable_variables):
+            variable_size = int(np.prod(variable.shape))
+            if chunk and size + variable_size > self.offload_chunk_size:
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(position)
+            size += variable_size
+        if chunk:
+            yield chunk
+
+    def _stream_offloaded_state(self, trainable_variables):
+        """Yields chunks of positions in `trainable_variables` to update.
+
+        With `offload_state="host"`, the offloaded slot variables of each
+        chunk are on the device until the next iteration.
+        """
+        if self.offload_state != "host" or in_stateless_scope():
+            yield list(range(len(trainable_variables)))
+            return
+        for chunk in self._offload_chunks(trainable_variables):
+            slots = [
+                slot
+                for p in chunk
+                for slot in self._offloaded_slots.get(
+                    self._get_variable_index(trainable_variables[p]), ()
+                )
+            ]
+            with _on_device(slots):
+                yield chunk
+
+    def _backend_update_step(self, grads, trainable_variables, learning_rate):
+        for chunk in self._stream_offloaded_state(trainable_variables):
+            super()._backend_update_step(
+                [grads[p] for p in chunk],
+                [trainable_variables[p] for p in chunk],
+                learning_rate,
+            )
+
+    def _update_model_variables_moving_average(self, trainable_variables):
+        if (
+            not self.use_ema
+            or self.offload_state != "host"
+            or in_stateless_scope()
+        ):
+            return super()._update_model_variables_moving_average(
+                trainable_variables
+            )
+        not_first_step = ops.not_equal(self.iterations, 0)
+        for chunk in self._offload_chunks(trainable_variables):
+            averages = [self._model_variables_moving_average[p] for p in chunk]
+            with _on_device(averages):
+                for p, average in zip(chunk, averages):
+                    var = trainable_variables[p]
+                    momentum = (
+                        ops.cast(not_first_step, var.dtype) * self.ema_momentum
+                    )
+                    average.assign(momentum * average + (1 - momentum) * var)
+
     def _backend_apply_gradients(self, grads, trainable_variables):
         if self.gradient_accumulation_steps:
             is_update_step = (
@@ -20,23 +182,33 @@ class JaxOptimizer(base_optimizer.BaseOptimizer):
             ) % self.gradient_accumulation_steps == 0
             steps = self.gradient_accumulation_steps
 
+            if self.flat_gradient_accumulators:
+                # Computed before reading the current optimizer variables, so
+                # that the seed generator of the stochastic rounding advances
+                # at every step.
+                accumulators = self._gradient_accumulator_buffers
+                incremented_g_accs = self._accumulate_flat_gradients(
+                    grads, trainable_variables
+                )
+
             current_trainable_vars_value = [
                 v.value for v in trainable_variables
             ]
             current_optimizer_vars_value = [v.value for v in self.variables]
 
-            # `trainable_variables` might have been filtered in previous
-            # processing steps, so we need to ensure the correct mapping between
-            # `self._accumulated_gradients` and `trainable_variables`
-            acc_grads = [
-                self._accumulated_gradients[self._get_variable_index(v)]
-                for v in trainable_variables
-            ]
+            acc_grads = self._get_accumulated_gradients(trainable_variables)
+            if not self.flat_gradient_accumulators:
+                accumulators = acc_grads
+                incremented_g_accs = [
+                    g + acc_g for g, acc_g in zip(grads, acc_grads)
+                ]
 
             new_g_accs = jax.lax.cond(
                 is_update_step,
-                lambda: [jnp.zeros(g.shape, dtype=g.dtype) for g in acc_grads],
-                lambda: [g + acc_g for g, acc_g in zip(grads, acc_grads)],
+                lambda: [
+                    jnp.zeros(g.shape, dtype=g.dtype) for g in accumulators
+                ],
+                lambda: incremented_g_accs,
             )
 
             grads = jax.lax.cond(
@@ -67,7 +239,7 @@ class JaxOptimizer(base_optimizer.BaseOptimizer):
             for value, v in zip(new_opt_vars, self.variables):
                 v.assign(value)
 
-            for n_g_acc, g_acc in zip(new_g_accs, acc_grads):
+            for n_g_acc, g_acc in zip(new_g_accs, accumulators):
                 g_acc.assign(n_g_acc)
 
         else:
@@ -102,3 +274,28 @@ class JaxOptimizer(base_optimizer.BaseOptimizer):
                     )
 
         self.iterations.assign_add(1)
+
+    def _backend_add_to_slices(self, value, slices, updates):
+        if len(slices) == 1 and slices[0] == (0, value.shape[0]):
+            return value + updates[0]
+        for (start, stop), update in zip(slices, updates):
+            value = jax.lax.dynamic_update_slice(
+                value, value[start:stop] + update, (start,)
+            )
+        return value
+
+    def _stochastic_round(self, x, dtype):
+        if standardize_dtype(dtype) != "bfloat16":
+            return super()._stochastic_round(x, dtype)
+        # `bfloat16` values are the upper 16 bits of `float32` values. Adding
+        # random lower bits before truncating them rounds up with a
+        # probability proportional to the truncated bits.
+        bits = jax.lax.bitcast_convert_type(x, jnp.int32) + random.randint(
+            x.shape,
+            0,
+            1 << 16,
+            dtype="int32",
+            seed=self._gradient_accumulator_seed_generator,
+        )
+        bits = jnp.bitwise_and(bits, -(1 << 16))
+        return jax.lax.bitcast_convert_type(bits, jnp.float32).astype(dtype)
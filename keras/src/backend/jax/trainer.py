@@ -11,6 +11,7 @@ from keras.src import optimizers as optimizers_module
 from keras.src import tree
 from keras.src.backend import distribution_lib as jax_distribution_lib
 from keras.src.distribution import distribution_lib
+from keras.src.trainers import predict_utils
 from keras.src.trainers import trainer as base_trainer
 from keras.src.trainers.data_adapters import array_slicing
 from keras.src.trainers.data_adapters import data_adapter_utils
@@ -74,7 +75,14 @@ class JAXTrainer(base_trainer.Trainer):
         unscaled_loss = loss
         if training and self.optimizer is not None:
             # Scale loss with a StatelessScope, to use an update scale variable.
-            mapping = list(zip(self.optimizer.variables, optimizer_variables))
+            # The state offloaded by the optimizer to host memory isn't passed.
+            mapping = [
+                (v, value)
+                for v, value in zip(
+                    self.optimizer.variables, optimizer_variables
+                )
+                if value is not None
+            ]
             with backend.StatelessScope(state_mapping=mapping):
                 loss = self.optimizer.scale_loss(loss)
         return loss, (
@@ -85,6 +93,36 @@ class JAXTrainer(base_trainer.Trainer):
         )
 
     def train_step(self, state, data):
+        (
+            trainable_variables,
+            non_trainable_variables,
+            optimizer_variables,
+            metrics_variables,
+        ) = state
+        logs, grads, non_trainable_variables, metrics_variables = (
+            self._compute_gradients_and_metrics(state, data)
+        )
+
+        (
+            trainable_variables,
+            optimizer_variables,
+        ) = self.optimizer.stateless_apply(
+            optimizer_variables, grads, trainable_variables
+        )
+
+        state = self._enforce_jax_state_sharding(
+            trainable_variables,
+            non_trainable_variables,
+            optimizer_variables,
+            metrics_variables,
+        )
+        return logs, state
+
+    def _compute_gradients_and_metrics(self, state, data):
+        """Returns `(logs, grads, non_trainable_variables, metrics_variables)`.
+
+        This method is stateless. `state` is the state of `train_step()`.
+        """
         (
             trainable_variables,
             non_trainable_variables,
@@ -109,13 +147,6 @@ class JAXTrainer(base_trainer.Trainer):
             aux
         )
 
-        (
-            trainable_variables,
-            optimizer_variables,
-        ) = self.optimizer.stateless_apply(
-            optimizer_variables, grads, trainable_variables
-        )
-
         with backend.StatelessScope(
             state_mapping=[
                 (ref_v, v)
@@ -133,15 +164,7 @@ class JAXTrainer(base_trainer.Trainer):
             if new_v is None:
                 new_v = ref_v.value
             new_metrics_variables.append(new_v)
-        metrics_variables = new_metrics_variables
-
-        state = self._enforce_jax_state_sharding(
-            trainable_variables,
-            non_trainable_variables,
-            optimizer_variables,
-            metrics_variables,
-        )
-        return logs, state
+        return logs, grads, non_trainable_variables, new_metrics_variables
 
     def test_step(self, state, data):
         (
@@ -226,6 +249,9 @@ class JAXTrainer(base_trainer.Trainer):
     def make_train_function(self, force=False):
         if self.train_function is not None and not force:
             return
+        if self.optimizer is not None and self.optimizer.offload_state:
+            self.train_function = self._make_offloaded_train_function()
+            return
 
         def one_train_step(state, data):
             data = data[0]
@@ -255,6 +281,84 @@ class JAXTrainer(base_trainer.Trainer):
         else:
             self.train_function = train_step
 
+    def _make_offloaded_train_function(self):
+        """Returns the train function for optimizers with offloaded state.
+
+        The state offloaded by the optimizer to host memory is not passed to
+        the compiled step, which returns the gradients. The optimizer then
+        applies them eagerly, and streams its state to the device in chunks.
+        """
+        if type(self).train_step is not JAXTrainer.train_step:
+            raise ValueError(
+                "`offload_state` is not supported with a custom "
+                "`train_step()` with the JAX backend. "
+                f"Received: offload_state={self.optimizer.offload_state}"
+            )
+
+        def gradient_step(state, data):
+            logs, grads, non_trainable_variables, metrics_variables = (
+                self._compute_gradients_and_metrics(state, data)
+            )
+            (_, non_trainable_variables, _, metrics_variables) = (
+                self._enforce_jax_state_sharding(
+                    non_trainable_variables=non_trainable_variables,
+                    metrics_variables=metrics_variables,
+                )
+            )
+            return logs, grads, non_trainable_variables, metrics_variables
+
+        if not self.run_eagerly and self.jit_compile:
+            gradient_step = jax.jit(gradient_step)
+
+        def train_step(state, data):
+            (
+                trainable_variables,
+                non_trainable_variables,
+                optimizer_variables,
+                metrics_variables,
+            ) = state
+            for single_step_data in data:
+                # The offloaded state is held in NumPy arrays.
+                device_optimizer_variables = [
+                    None if isinstance(v, np.ndarray) else v
+                    for v in optimizer_variables
+                ]
+                logs, grads, non_trainable_variables, metrics_variables = (
+                    gradient_step(
+                        (
+                            trainable_variables,
+                            non_trainable_variables,
+                            device_optimizer_variables,
+                            metrics_variables,
+                        ),
+                        single_step_data,
+                    )
+                )
+                for v, value in zip(
+                    self.trainable_variables, trainable_variables
+                ):
+                    v._value = value
+                for v, value in zip(
+                    self.optimizer.variables, optimizer_variables
+                ):
+                    v._value = value
+                self.optimizer.apply(grads, self.trainable_variables)
+                trainable_variables = [
+                    v.value for v in self.trainable_variables
+                ]
+                optimizer_variables = [
+                    v.value for v in self.optimizer.variables
+                ]
+            state = (
+                trainable_variables,
+                non_trainable_variables,
+                optimizer_variables,
+                metrics_variables,
+            )
+            return logs, state
+
+        return train_step
+
     def make_test_function(self, force=False):
         if self.test_function is not None and not force:
             return
@@ -345,6 +449,7 @@ class JAXTrainer(base_trainer.Trainer):
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        prefetch=0,
     ):
         self._assert_compile_called("fit")
         # TODO: respect compiled trainable state
@@ -377,6 +482,7 @@ class JAXTrainer(base_trainer.Trainer):
             shuffle=shuffle,
             class_weight=class_weight,
             steps_per_execution=self.steps_per_execution,
+            prefetch=prefetch,
         )
 
         self._symbolic_build(iterator=epoch_iterator)
@@ -468,6 +574,7 @@ class JAXTrainer(base_trainer.Trainer):
                         steps_per_execution=self.steps_per_execution,
                         steps_per_epoch=validation_steps,
                         shuffle=False,
+                        prefetch=prefetch,
                     )
                 val_logs = self.evaluate(
                     x=val_x,
@@ -607,7 +714,13 @@ class JAXTrainer(base_trainer.Trainer):
 
     @traceback_utils.filter_traceback
     def predict(
-        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+        self,
+        x,
+        batch_size=None,
+        verbose="auto",
+        steps=None,
+        callbacks=None,
+        output_path=None,
     ):
         # Create an iterator that yields batches of input data.
         epoch_iterator = JAXEpochIterator(
@@ -644,23 +757,13 @@ class JAXTrainer(base_trainer.Trainer):
         self.stop_predicting = False
         callbacks.on_predict_begin()
 
-        def append_to_outputs(batch_outputs, outputs):
-            if outputs is None:
-                outputs = tree.map_structure(
-                    lambda batch_output: [batch_output],
-                    batch_outputs,
-                )
-            else:
-                tree.map_structure_up_to(
-                    batch_outputs,
-                    lambda output, batch_output: output.append(batch_output),
-                    outputs,
-                    batch_outputs,
-                )
-            return outputs
-
         self._jax_state_synced = True
-        outputs = None
+        outputs = predict_utils.PredictOutputs(
+            num_batches=predict_utils.num_executions(
+                epoch_iterator.num_batches, self.steps_per_execution
+            ),
+            output_path=output_path,
+        )
         non_trainable_variables = None
         for step, x in epoch_iterator.enumerate_epoch():
             callbacks.on_predict_batch_begin(step)
@@ -677,7 +780,7 @@ class JAXTrainer(base_trainer.Trainer):
             batch_outputs, non_trainable_variables = self.predict_function(
                 state, x
             )
-            outputs = append_to_outputs(batch_outputs, outputs)
+            outputs.append(batch_outputs)
             callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
             if self.stop_predicting:
                 break
@@ -690,7 +793,76 @@ class JAXTrainer(base_trainer.Trainer):
         self.jax_state_sync()
         callbacks.on_predict_end()
         self._jax_state = None
-        return tree.map_structure_up_to(batch_outputs, np.concatenate, outputs)
+        return outputs.result()
+
+    def predict_iter(
+        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+    ):
+        # Create an iterator that yields batches of input data.
+        epoch_iterator = JAXEpochIterator(
+            x=x,
+            batch_size=batch_size,
+            steps_per_epoch=steps,
+            shuffle=False,
+            steps_per_execution=self.steps_per_execution,
+        )
+
+        if not all(layer.built for layer in self._flatten_layers()):
+            # Build the model on one batch of data.
+            for _, data in epoch_iterator.enumerate_epoch():
+                # Build model
+                x, _, _ = data_adapter_utils.unpack_x_y_sample_weight(data[0])
+                with backend.StatelessScope():
+                    self(x)
+                break
+
+        # Container that configures and calls callbacks.
+        if not isinstance(callbacks, callbacks_module.CallbackList):
+            callbacks = callbacks_module.CallbackList(
+                callbacks,
+                add_history=True,
+                add_progbar=verbose != 0,
+                verbose=verbose,
+                epochs=1,
+                steps=epoch_iterator.num_batches,
+                model=self,
+            )
+        self._record_training_state_sharding_spec()
+
+        self.make_predict_function()
+        return self._predict_iter(epoch_iterator, callbacks)
+
+    def _predict_iter(self, epoch_iterator, callbacks):
+        self.stop_predicting = False
+        callbacks.on_predict_begin()
+        # The model variables are not purged here, since the model can be
+        # used by the caller while the iterator is suspended.
+        state = self._get_jax_state(
+            trainable_variables=True,
+            non_trainable_variables=True,
+        )
+        outputs_spec = None
+        try:
+            for step, x in epoch_iterator.enumerate_epoch():
+                callbacks.on_predict_batch_begin(step)
+                batch_outputs, non_trainable_variables = self.predict_function(
+                    state, x
+                )
+                state = (state[0], non_trainable_variables)
+                self._jax_state = {
+                    "non_trainable_variables": non_trainable_variables,
+                }
+                self._jax_state_synced = False
+                callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
+                if outputs_spec is None:
+                    outputs_spec = tree.structure_spec(batch_outputs)
+                yield outputs_spec.map_structure(np.asarray, batch_outputs)
+                if self.stop_predicting:
+                    break
+        finally:
+            self.jax_state_sync()
+            self._jax_state = None
+            callbacks.on_predict_end()
 
     def train_on_batch(
         self,
@@ -838,7 +1010,11 @@ class JAXTrainer(base_trainer.Trainer):
                 ref_v.assign(v)
         if optimizer_variables:
             for ref_v, v in zip(self.optimizer.variables, optimizer_variables):
-                ref_v.assign(v)
+                if isinstance(v, np.ndarray):
+                    # Keep the state offloaded to host memory on the host.
+                    ref_v._value = v
+                else:
+                    ref_v.assign(v)
         if metrics_variables:
             for ref_v, v in zip(self.metrics_variables, metrics_variables):
                 ref_v.assign(v)
@@ -852,8 +1028,10 @@ class JAXTrainer(base_trainer.Trainer):
             v.value.sharding for v in self.non_trainable_variables
         ]
         if hasattr(self, "optimizer") and self.optimizer is not None:
+            # The state offloaded to host memory is held in NumPy arrays.
             self._optimizer_variable_shardings = [
-                v.value.sharding for v in self.optimizer.variables
+                getattr(v.value, "sharding", None)
+                for v in self.optimizer.variables
             ]
         else:
             self._optimizer_variable_shardings = []
@@ -0,0 +1,864 @@
+"""Reverse-mode automatic differentiation for the NumPy backend.
+
+The values to differentiate with respect to are wrapped in `Tracer` objects.
+Tracers implement the NumPy dispatch protocols (`__array_ufunc__` and
+`__array_function__`), so every NumPy function that the backend ops call on
+them is evaluated on the underlying arrays and recorded, together with the
+vector-Jacobian product (VJP) that propagates gradients back to its inputs.
+`value_and_grad()` then walks the recorded graph in reverse.
+
+Only the NumPy functions needed by the differentiable ops of the backend
+have a VJP. Calling any other function on a tracer raises an error rather
+than silently returning a zero gradient. Functions whose output does not
+depend continuously on their inputs (comparisons, `argmax`, `floor`, ...)
+simply return plain arrays.
+"""
+
+import itertools
+import math
+
+import numpy as np
+
+from keras.src import tree
+
+try:
+    from scipy import special as scipy_special
+except ImportError:
+    scipy_special = None
+
+_creation_order = itertools.count()
+
+
+class Tracer:
+    """Array recorded by the autodiff engine.
+
+    Attributes:
+        value: The NumPy array wrapped by the tracer.
+        parents: Tuple of `(tracer, vjp)` pairs, one for each traced input
+            of the function that produced `value`. `vjp` maps the gradient
+            with respect to `value` to the gradient with respect to
+            `tracer.value`.
+    """
+
+    __slots__ = ("value", "parents", "order")
+    # Makes NumPy defer binary operators with arrays to the tracer.
+    __array_priority__ = 100.0
+
+    def __init__(self, value, parents=()):
+        self.value = np.asarray(value)
+        self.parents = parents
+        self.order = next(_creation_order)
+
+    @property
+    def shape(self):
+        return self.value.shape
+
+    @property
+    def dtype(self):
+        return self.value.dtype
+
+    @property
+    def ndim(self):
+        return self.value.ndim
+
+    @property
+    def size(self):
+        return self.value.size
+
+    @property
+    def T(self):
+        return np.transpose(self)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __bool__(self):
+        return bool(self.value)
+
+    def __float__(self):
+        return float(self.value)
+
+    def __int__(self):
+        return int(self.value)
+
+    def __index__(self):
+        return self.value.__index__()
+
+    def __repr__(self):
+        return f"Tracer({self.value!r})"
+
+    def __array__(self, dtype=None):
+        raise TypeError(
+            "A value traced for gradient computation was converted to a "
+            "NumPy array, which would drop its gradient. This typically "
+            "happens when a function that is not differentiable with the "
+            "NumPy backend is called on a trainable value."
+        )
+
+    def item(self, *args):
+        return self.value.item(*args)
+
+    def tolist(self):
+        return self.value.tolist()
+
+    def astype(self, dtype, copy=True, **kwargs):
+        dtype = np.dtype(dtype)
+        if dtype == self.dtype and not copy:
+            return self
+        source_dtype = self.dtype
+        return _record(
+            self.value.astype(dtype, **kwargs),
+            [(self, lambda g: g.astype(source_dtype))],
+        )
+
+    def copy(self):
+        return np.copy(self)
+
+    def reshape(self, *shape, **kwargs):
+        if len(shape) == 1 and isinstance(shape[0], (list, tuple)):
+            shape = shape[0]
+        return np.reshape(self, shape, **kwargs)
+
+    def transpose(self, *axes):
+        if len(axes) == 1 and isinstance(axes[0], (list, tuple)):
+            axes = axes[0]
+        return np.transpose(self, axes or None)
+
+    def flatten(self):
+        return np.reshape(self, (-1,))
+
+    def ravel(self):
+        return np.reshape(self, (-1,))
+
+    def squeeze(self, axis=None):
+        return np.squeeze(self, axis=axis)
+
+    def sum(self, axis=None, dtype=None, keepdims=False):
+        return np.sum(self, axis=axis, dtype=dtype, keepdims=keepdims)
+
+    def mean(self, axis=None, dtype=None, keepdims=False):
+        return np.mean(self, axis=axis, dtype=dtype, keepdims=keepdims)
+
+    def max(self, axis=None, keepdims=False):
+        return np.max(self, axis=axis, keepdims=keepdims)
+
+    def min(self, axis=None, keepdims=False):
+        return np.min(self, axis=axis, keepdims=keepdims)
+
+    def argmax(self, axis=None):
+        return np.argmax(self.value, axis=axis)
+
+    def argmin(self, axis=None):
+        return np.argmin(self.value, axis=axis)
+
+    def __getitem__(self, key):
+        return _getitem(self, key)
+
+    def __setitem__(self, key, value):
+        raise TypeError(
+            "In-place updates of values traced for gradient computation "
+            "are not supported by the NumPy backend."
+        )
+
+    def __neg__(self):
+        return np.negative(self)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    def __add__(self, other):
+        return np.add(self, other)
+
+    def __radd__(self, other):
+        return np.add(other, self)
+
+    def __sub__(self, other):
+        return np.subtract(self, other)
+
+    def __rsub__(self, other):
+        return np.subtract(other, self)
+
+    def __mul__(self, other):
+        return np.multiply(self, other)
+
+    def __rmul__(self, other):
+        return np.multiply(other, self)
+
+    def __truediv__(self, other):
+        return np.true_divide(self, other)
+
+    def __rtruediv__(self, other):
+        return np.true_divide(other, self)
+
+    def __floordiv__(self, other):
+        return np.floor_divide(self, other)
+
+    def __rfloordiv__(self, other):
+        return np.floor_divide(other, self)
+
+    def __pow__(self, other):
+        return np.power(self, other)
+
+    def __rpow__(self, other):
+        return np.power(other, self)
+
+    def __matmul__(self, other):
+        return np.matmul(self, other)
+
+    def __rmatmul__(self, other):
+        return np.matmul(other, self)
+
+    def __lt__(self, other):
+        return np.less(self, other)
+
+    def __le__(self, other):
+        return np.less_equal(self, other)
+
+    def __gt__(self, other):
+        return np.greater(self, other)
+
+    def __ge__(self, other):
+        return np.greater_equal(self, other)
+
+    def __eq__(self, other):
+        return np.equal(self, other)
+
+    def __ne__(self, other):
+        return np.not_equal(self, other)
+
+    __hash__ = object.__hash__
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if any(_has_priority(type(x)) for x in inputs):
+            return NotImplemented
+        if kwargs.get("out") is not None:
+            raise TypeError(
+                "The `out` argument is not supported for values traced for "
+                "gradient computation."
+            )
+        values = [_value(x) for x in inputs]
+        if ufunc in _NON_DIFFERENTIABLE_UFUNCS:
+            return getattr(ufunc, method)(*values, **kwargs)
+        if method == "reduce" and ufunc in _REDUCTIONS:
+            kwargs.setdefault("axis", 0)
+            return _REDUCTIONS[ufunc](*inputs, **kwargs)
+        vjps = _UFUNC_VJPS.get(ufunc)
+        if method != "__call__" or vjps is None:
+            raise _unsupported(f"{ufunc.__name__}.{method}")
+        out = ufunc(*values, **kwargs)
+        parents = []
+        for x, value, vjp in zip(inputs, values, vjps):
+            if isinstance(x, Tracer):
+                parents.append(
+                    (x, _ufunc_vjp(vjp, out, values, np.shape(value)))
+                )
+        return _record(out, parents)
+
+    def __array_function__(self, func, types, args, kwargs):
+        if any(_has_priority(t) for t in types):
+            return NotImplemented
+        if func in _FUNCTION_VJPS:
+            return _FUNCTION_VJPS[func](*args, **kwargs)
+        if func in _NON_DIFFERENTIABLE_FUNCTIONS:
+            args, kwargs = tree.map_structure(_value, (args, kwargs))
+            return func(*args, **kwargs)
+        raise _unsupported(func.__name__)
+
+
+def stop_gradient(x):
+    """Returns the values of `x` without their gradient."""
+    return tree.map_structure(_value, x)
+
+
+def value_and_grad(fun, has_aux=False):
+    """Returns a function computing `fun` and its gradient.
+
+    The gradient is taken with respect to the first argument of `fun`, which
+    can be a nested structure of arrays. `fun` must return a scalar, or a
+    tuple `(scalar, aux)` when `has_aux=True`.
+
+    Returns:
+        A function with the same arguments as `fun`, returning
+        `(value, grads)`, where `value` is the output of `fun` (without
+        gradient information) and `grads` has the structure of the first
+        argument.
+    """
+
+    def wrapped(primals, *args, **kwargs):
+        flat_primals = tree.flatten(primals)
+        tracers = [Tracer(x) for x in flat_primals]
+        outputs = fun(tree.pack_sequence_as(primals, tracers), *args, **kwargs)
+        if has_aux:
+            output, aux = outputs
+        else:
+            output, aux = outputs, None
+        if np.ndim(_value(output)) != 0:
+            raise ValueError(
+                "The function to differentiate must return a scalar. "
+                f"Received a value of shape {np.shape(_value(output))}."
+            )
+        grads = backward(output, tracers)
+        value = _value(output)
+        if has_aux:
+            value = (value, stop_gradient(aux))
+        return value, tree.pack_sequence_as(primals, grads)
+
+    return wrapped
+
+
+def backward(output, tracers):
+    """Returns the gradients of the scalar `output` w.r.t. `tracers`."""
+    if not isinstance(output, Tracer):
+        return [np.zeros_like(t.value) for t in tracers]
+    # Collect the recorded graph. Inputs are always created before the values
+    # computed from them, so processing the nodes by decreasing creation
+    # order visits every node after all of its consumers.
+    nodes = {id(output): output}
+    stack = [output]
+    while stack:
+        node = stack.pop()
+        for parent, _ in node.parents:
+            if id(parent) not in nodes:
+                nodes[id(parent)] = parent
+                stack.append(parent)
+    grads = {id(output): np.ones_like(output.value)}
+    for node in sorted(nodes.values(), key=lambda n: n.order, reverse=True):
+        g = grads.pop(id(node), None)
+        if g is None or not node.parents:
+            if g is not None:
+                grads[id(node)] = g
+            continue
+        for parent, vjp in node.parents:
+            parent_g = np.asarray(vjp(g))
+            if parent_g.dtype != parent.dtype:
+                parent_g = parent_g.astype(parent.dtype)
+            key = id(parent)
+            if key in grads:
+                grads[key] = grads[key] + parent_g
+            else:
+                grads[key] = parent_g
+    return [
+        grads.get(id(t), np.zeros_like(t.value)).reshape(t.shape)
+        for t in tracers
+    ]
+
+
+def _value(x):
+    if isinstance(x, Tracer):
+        return x.value
+    return x
+
+
+def _has_priority(cls):
+    # Array types with a higher priority (such as the batch tracers of
+    # `vectorized_map`) handle the NumPy functions first and call them again
+    # on the values they wrap.
+    priority = getattr(cls, "__array_priority__", None)
+    return isinstance(priority, float) and priority > Tracer.__array_priority__
+
+
+def _record(value, parents):
+    parents = tuple((p, vjp) for p, vjp in parents if isinstance(p, Tracer))
+    if not parents:
+        return value
+    return Tracer(value, parents)
+
+
+def _unsupported(name):
+    return NotImplementedError(
+        f"Computing the gradient of `numpy.{name}` is not supported with "
+        "the NumPy backend."
+    )
+
+
+def _unbroadcast(g, shape):
+    """Sums `g` over the dimensions that were broadcast from `shape`."""
+    g = np.asarray(g)
+    if g.shape == tuple(shape):
+        return g
+    extra_dims = g.ndim - len(shape)
+    if extra_dims > 0:
+        g = g.sum(axis=tuple(range(extra_dims)))
+    axes = tuple(
+        i for i, dim in enumerate(shape) if dim == 1 and g.shape[i] != 1
+    )
+    if axes:
+        g = g.sum(axis=axes, keepdims=True)
+    return np.broadcast_to(g, shape)
+
+
+def _ufunc_vjp(vjp, out, values, shape):
+    return lambda g: _unbroadcast(vjp(g, out, *values), shape)
+
+
+def _expand_reduced(g, shape, axis, keepdims):
+    """Broadcasts the gradient of a reduction back to the input shape."""
+    if axis is not None and not keepdims:
+        g = np.expand_dims(g, axis)
+    return np.broadcast_to(g, shape)
+
+
+# Vector-Jacobian products of the differentiable ufuncs: one function per
+# input, mapping `(g, out, *inputs)` to the gradient w.r.t. that input.
+_UFUNC_VJPS = {
+    np.add: (lambda g, out, x, y: g, lambda g, out, x, y: g),
+    np.subtract: (lambda g, out, x, y: g, lambda g, out, x, y: -g),
+    np.multiply: (lambda g, out, x, y: g * y, lambda g, out, x, y: g * x),
+    np.true_divide: (
+        lambda g, out, x, y: g / y,
+        lambda g, out, x, y: -g * out / y,
+    ),
+    np.power: (
+        lambda g, out, x, y: g * y * np.power(x, y - 1),
+        lambda g, out, x, y: g
+        * out
+        * np.log(np.where(x > 0, x, np.ones_like(x))),
+    ),
+    np.maximum: (
+        lambda g, out, x, y: g * (x >= y),
+        lambda g, out, x, y: g * (x < y),
+    ),
+    np.minimum: (
+        lambda g, out, x, y: g * (x <= y),
+        lambda g, out, x, y: g * (x > y),
+    ),
+    np.logaddexp: (
+        lambda g, out, x, y: g * np.exp(x - out),
+        lambda g, out, x, y: g * np.exp(y - out),
+    ),
+    np.matmul: (
+        lambda g, out, x, y: _matmul_vjp(g, x, y, 0),
+        lambda g, out, x, y: _matmul_vjp(g, x, y, 1),
+    ),
+    np.negative: (lambda g, out, x: -g,),
+    np.positive: (lambda g, out, x: g,),
+    np.absolute: (lambda g, out, x: g * np.sign(x),),
+    np.exp: (lambda g, out, x: g * out,),
+    np.expm1: (lambda g, out, x: g * (out + 1),),
+    np.log: (lambda g, out, x: g / x,),
+    np.log1p: (lambda g, out, x: g / (x + 1),),
+    np.log2: (lambda g, out, x: g / (x * math.log(2)),),
+    np.log10: (lambda g, out, x: g / (x * math.log(10)),),
+    np.sqrt: (lambda g, out, x: g / (2 * out),),
+    np.square: (lambda g, out, x: g * 2 * x,),
+    np.reciprocal: (lambda g, out, x: -g * out * out,),
+    np.tanh: (lambda g, out, x: g * (1 - out * out),),
+    np.sin: (lambda g, out, x: g * np.cos(x),),
+    np.cos: (lambda g, out, x: -g * np.sin(x),),
+}
+if scipy_special is not None:
+    _UFUNC_VJPS[scipy_special.erf] = (
+        lambda g, out, x: g * (2 / math.sqrt(math.pi)) * np.exp(-x * x),
+    )
+    _UFUNC_VJPS[scipy_special.expit] = (lambda g, out, x: g * out * (1 - out),)
+
+_NON_DIFFERENTIABLE_UFUNCS = {
+    np.equal,
+    np.not_equal,
+    np.less,
+    np.less_equal,
+    np.greater,
+    np.greater_equal,
+    np.logical_and,
+    np.logical_or,
+    np.logical_xor,
+    np.logical_not,
+    np.isnan,
+    np.isinf,
+    np.isfinite,
+    np.sign,
+    np.floor,
+    np.ceil,
+    np.rint,
+    np.trunc,
+    np.floor_divide,
+}
+
+
+def _matmul_vjp(g, x, y, argnum):
+    x2 = x[None] if x.ndim == 1 else x
+    y2 = y[:, None] if y.ndim == 1 else y
+    if x.ndim == 1:
+        g = np.expand_dims(g, -2)
+    if y.ndim == 1:
+        g = np.expand_dims(g, -1)
+    if argnum == 0:
+        grad = np.matmul(g, np.swapaxes(y2, -1, -2))
+        return _unbroadcast(grad, x2.shape).reshape(x.shape)
+    grad = np.matmul(np.swapaxes(x2, -1, -2), g)
+    return _unbroadcast(grad, y2.shape).reshape(y.shape)
+
+
+_FUNCTION_VJPS = {}
+
+
+def _register(*funcs):
+    def decorator(rule):
+        for func in funcs:
+            _FUNCTION_VJPS[func] = rule
+        return rule
+
+    return decorator
+
+
+@_register(np.sum)
+def _sum(a, axis=None, dtype=None, out=None, keepdims=False, **kwargs):
+    x = _value(a)
+    result = np.sum(x, axis=axis, dtype=dtype, keepdims=keepdims, **kwargs)
+    return _record(
+        result, [(a, lambda g: _expand_reduced(g, x.shape, axis, keepdims))]
+    )
+
+
+@_register(np.mean)
+def _mean(a, axis=None, dtype=None, out=None, keepdims=False, **kwargs):
+    x = _value(a)
+    result = np.mean(x, axis=axis, dtype=dtype, keepdims=keepdims, **kwargs)
+    count = max(x.size, 1) // max(np.size(result), 1)
+    return _record(
+        result,
+        [(a, lambda g: _expand_reduced(g / count, x.shape, axis, keepdims))],
+    )
+
+
+def _extremum(func, a, axis=None, out=None, keepdims=False, **kwargs):
+    x = _value(a)
+    extremum = func(x, axis=axis, keepdims=True, **kwargs)
+
+    def vjp(g):
+        # Split the gradient evenly between ties.
+        mask = x == extremum
+        counts = np.sum(mask, axis=axis, keepdims=True)
+        g = _expand_reduced(g, extremum.shape, axis, keepdims)
+        return g * mask / counts
+
+    if keepdims:
+        result = extremum
+    else:
+        result = np.squeeze(extremum, axis=axis)
+    return _record(result, [(a, vjp)])
+
+
+@_register(np.max, np.amax)
+def _max(a, axis=None, out=None, keepdims=False, **kwargs):
+    return _extremum(np.max, a, axis=axis, keepdims=keepdims, **kwargs)
+
+
+@_register(np.min, np.amin)
+def _min(a, axis=None, out=None, keepdims=False, **kwargs):
+    return _extremum(np.min, a, axis=axis, keepdims=keepdims, **kwargs)
+
+
+_REDUCTIONS = {np.add: _sum, np.maximum: _max, np.minimum: _min}
+
+
+@_register(np.var)
+def _var(a, axis=None, dtype=None, out=None, ddof=0, keepdims=False):
+    mean = np.mean(a, axis=axis, dtype=dtype, keepdims=True)
+    squares = np.square(a - mean)
+    count = np.size(_value(a)) // np.size(_value(mean))
+    return np.sum(squares, axis=axis, keepdims=keepdims) / max(count - ddof, 0)
+
+
+@_register(np.std)
+def _std(a, axis=None, dtype=None, out=None, ddof=0, keepdims=False):
+    return np.sqrt(
+        _var(a, axis=axis, dtype=dtype, ddof=ddof, keepdims=keepdims)
+    )
+
+
+@_register(np.reshape)
+def _reshape(a, *args, **kwargs):
+    x = _value(a)
+    return _record(
+        np.reshape(x, *args, **kwargs), [(a, lambda g: g.reshape(x.shape))]
+    )
+
+
+@_register(np.ravel)
+def _ravel(a, order="C"):
+    return _reshape(a, (-1,))
+
+
+@_register(np.expand_dims)
+def _expand_dims(a, axis):
+    x = _value(a)
+    return _record(np.expand_dims(x, axis), [(a, lambda g: g.reshape(x.shape))])
+
+
+@_register(np.squeeze)
+def _squeeze(a, axis=None):
+    x = _value(a)
+    return _record(
+        np.squeeze(x, axis=axis), [(a, lambda g: g.reshape(x.shape))]
+    )
+
+
+@_register(np.transpose)
+def _transpose(a, axes=None):
+    x = _value(a)
+    if axes is None:
+        axes = tuple(reversed(range(x.ndim)))
+    inverse = tuple(np.argsort(axes))
+    return _record(
+        np.transpose(x, axes), [(a, lambda g: np.transpose(g, inverse))]
+    )
+
+
+@_register(np.swapaxes)
+def _swapaxes(a, axis1, axis2):
+    x = _value(a)
+    return _record(
+        np.swapaxes(x, axis1, axis2),
+        [(a, lambda g: np.swapaxes(g, axis1, axis2))],
+    )
+
+
+@_register(np.moveaxis)
+def _moveaxis(a, source, destination):
+    x = _value(a)
+    return _record(
+        np.moveaxis(x, source, destination),
+        [(a, lambda g: np.moveaxis(g, destination, source))],
+    )
+
+
+@_register(np.broadcast_to)
+def _broadcast_to(array, shape, subok=False):
+    x = _value(array)
+    return _record(
+        np.broadcast_to(x, shape), [(array, lambda g: _unbroadcast(g, x.shape))]
+    )
+
+
+@_register(np.flip)
+def _flip(m, axis=None):
+    return _record(
+        np.flip(_value(m), axis=axis), [(m, lambda g: np.flip(g, axis=axis))]
+    )
+
+
+@_register(np.copy)
+def _copy(a, **kwargs):
+    return _record(np.copy(_value(a), **kwargs), [(a, lambda g: g)])
+
+
+@_register(np.concatenate)
+def _concatenate(arrays, axis=0, **kwargs):
+    values = [_value(x) for x in arrays]
+    result = np.concatenate(values, axis=axis, **kwargs)
+    if axis is None:
+        values = [np.ravel(v) for v in values]
+        axis = 0
+    splits = np.cumsum([v.shape[axis] for v in values])[:-1]
+    parents = []
+    for i, (x, v) in enumerate(zip(arrays, values)):
+        parents.append(
+            (
+                x,
+                lambda g, i=i, shape=np.shape(_value(x)): np.split(
+                    g, splits, axis=axis
+                )[i].reshape(shape),
+            )
+        )
+    return _record(result, parents)
+
+
+@_register(np.stack)
+def _stack(arrays, axis=0, **kwargs):
+    values = [_value(x) for x in arrays]
+    result = np.stack(values, axis=axis, **kwargs)
+    parents = [
+        (x, lambda g, i=i: np.take(g, i, axis=axis))
+        for i, x in enumerate(arrays)
+    ]
+    return _record(result, parents)
+
+
+@_register(np.split, np.array_split)
+def _split(ary, indices_or_sections, axis=0):
+    x = _value(ary)
+    pieces = np.array_split(x, indices_or_sections, axis=axis)
+    slices = []
+    start = 0
+    for piece in pieces:
+        index = [slice(None)] * x.ndim
+        index[axis] = slice(start, start + piece.shape[axis])
+        slices.append(_getitem(ary, tuple(index)))
+        start += piece.shape[axis]
+    return slices
+
+
+@_register(np.where)
+def _where(condition, x=None, y=None):
+    if x is None and y is None:
+        return np.where(_value(condition))
+    cond = _value(condition)
+    xv, yv = _value(x), _value(y)
+    result = np.where(cond, xv, yv)
+    return _record(
+        result,
+        [
+            (x, lambda g: _unbroadcast(np.where(cond, g, 0), np.shape(xv))),
+            (y, lambda g: _unbroadcast(np.where(cond, 0, g), np.shape(yv))),
+        ],
+    )
+
+
+@_register(np.clip)
+def _clip(a, a_min=None, a_max=None, out=None, **kwargs):
+    x = _value(a)
+    lo, hi = _value(a_min), _value(a_max)
+    result = np.clip(x, lo, hi, **kwargs)
+
+    def vjp(g):
+        mask = np.ones(x.shape, dtype=bool)
+        if lo is not None:
+            mask &= x >= lo
+        if hi is not None:
+            mask &= x <= hi
+        return g * mask
+
+    if isinstance(a_min, Tracer) or isinstance(a_max, Tracer):
+        raise _unsupported("clip (with traced bounds)")
+    return _record(result, [(a, vjp)])
+
+
+@_register(np.dot)
+def _dot(a, b, out=None):
+    if np.ndim(_value(a)) == 0 or np.ndim(_value(b)) == 0:
+        return np.multiply(a, b)
+    if np.ndim(_value(a)) > 2 or np.ndim(_value(b)) > 2:
+        raise _unsupported("dot (with inputs of rank > 2)")
+    return np.matmul(a, b)
+
+
+@_register(np.take)
+def _take(a, indices, axis=None, out=None, mode="raise"):
+    x = _value(a)
+    indices = _value(indices)
+    result = np.take(x, indices, axis=axis, mode=mode)
+
+    def vjp(g):
+        grad = np.zeros(x.size if axis is None else x.shape, dtype=g.dtype)
+        if axis is None:
+            np.add.at(grad, indices, g)
+            return grad.reshape(x.shape)
+        grad = np.moveaxis(grad, axis, 0)
+        g = np.moveaxis(
+            g,
+            list(range(axis, axis + np.ndim(indices))),
+            list(range(np.ndim(indices))),
+        )
+        np.add.at(grad, indices, g)
+        return np.moveaxis(grad, 0, axis)
+
+    return _record(result, [(a, vjp)])
+
+
+@_register(np.take_along_axis)
+def _take_along_axis(arr, indices, axis):
+    x = _value(arr)
+    indices = _value(indices)
+    result = np.take_along_axis(x, indices, axis)
+
+    def vjp(g):
+        grad = np.zeros(x.shape, dtype=g.dtype)
+        if axis is None:
+            np.add.at(grad.reshape(-1), indices, g)
+            return grad
+        index = list(np.indices(indices.shape, sparse=True))
+        index[axis] = indices
+        np.add.at(grad, tuple(index), g)
+        return grad
+
+    return _record(result, [(arr, vjp)])
+
+
+@_register(np.pad)
+def _pad(array, pad_width, mode="constant", **kwargs):
+    if mode != "constant":
+        raise _unsupported(f"pad (with mode='{mode}')")
+    x = _value(array)
+    result = np.pad(x, pad_width, mode=mode, **kwargs)
+    pad_width = np.broadcast_to(np.asarray(pad_width), (x.ndim, 2))
+    index = tuple(
+        slice(before, before + dim)
+        for (before, _), dim in zip(pad_width, x.shape)
+    )
+    return _record(result, [(array, lambda g: g[index])])
+
+
+def _getitem(a, key):
+    x = a.value
+    key = tree.map_structure(_value, key) if isinstance(key, tuple) else key
+    key = _value(key)
+    result = x[key]
+
+    def vjp(g):
+        grad = np.zeros(x.shape, dtype=g.dtype)
+        if _is_basic_index(key):
+            # Basic indices select each entry at most once.
+            grad[key] = g
+        else:
+            np.add.at(grad, key, g)
+        return grad
+
+    return _record(result, [(a, vjp)])
+
+
+def _is_basic_index(key):
+    if not isinstance(key, tuple):
+        key = (key,)
+    return all(
+        (isinstance(k, (int, np.integer, slice)) and not isinstance(k, bool))
+        or k is None
+        or k is Ellipsis
+        for k in key
+    )
+
+
+_NON_DIFFERENTIABLE_FUNCTIONS = {
+    np.shape,
+    np.ndim,
+    np.size,
+    np.result_type,
+    np.zeros_like,
+    np.ones_like,
+    np.empty_like,
+    np.full_like,
+    np.argmax,
+    np.argmin,
+    np.argsort,
+    np.sign,
+    np.round,
+    np.around,
+    np.floor,
+    np.ceil,
+    np.isclose,
+    np.allclose,
+    np.array_equal,
+    np.all,
+    np.any,
+    np.count_nonzero,
+    np.nonzero,
+    np.equal,
+    np.not_equal,
+    np.greater,
+    np.greater_equal,
+    np.less,
+    np.less_equal,
+    np.logical_and,
+    np.logical_or,
+    np.logical_not,
+    np.isnan,
+    np.isinf,
+    np.isfinite,
+}
@@ -0,0 +1,291 @@
+"""Tests for the autodiff engine of the NumPy backend."""
+
+import numpy as np
+import pytest
+from absl.testing import parameterized
+
+from keras.src import backend
+from keras.src import layers
+from keras.src import losses
+from keras.src import models
+from keras.src import ops
+from keras.src import testing
+
+if backend.backend() == "numpy":
+    # Importing the NumPy backend package with another backend would replace
+    # the `numpy` module of the active backend in `keras.src.backend`.
+    from keras.src.backend.numpy import autodiff
+
+
+def numerical_grad(fn, x, eps=1e-6):
+    grad = np.zeros_like(x)
+    for index in np.ndindex(*x.shape):
+        x_plus = x.copy()
+        x_plus[index] += eps
+        x_minus = x.copy()
+        x_minus[index] -= eps
+        grad[index] = (fn(x_plus) - fn(x_minus)) / (2 * eps)
+    return grad
+
+
+@pytest.mark.skipif(
+    backend.backend() != "numpy",
+    reason="The autodiff engine is only used by the NumPy backend.",
+)
+class AutodiffTest(testing.TestCase, parameterized.TestCase):
+    def assertGradientsMatch(self, fn, x):
+        x = np.asarray(x, dtype="float64")
+        value, grad = autodiff.value_and_grad(lambda t: fn(t))(x)
+        self.assertAllClose(value, fn(x))
+        self.assertAllClose(grad, numerical_grad(fn, x), atol=1e-5, rtol=1e-5)
+
+    @parameterized.named_parameters(
+        ("relu", lambda x: ops.sum(ops.relu(x))),
+        ("sigmoid", lambda x: ops.sum(ops.sigmoid(x))),
+        ("tanh", lambda x: ops.sum(ops.tanh(x))),
+        ("softplus", lambda x: ops.sum(ops.softplus(x))),
+        ("silu", lambda x: ops.sum(ops.silu(x))),
+        ("elu", lambda x: ops.sum(ops.elu(x))),
+        ("gelu", lambda x: ops.sum(ops.gelu(x))),
+        ("gelu_exact", lambda x: ops.sum(ops.gelu(x, approximate=False))),
+        ("leaky_relu", lambda x: ops.sum(ops.leaky_relu(x))),
+        (
+            "softmax",
+            lambda x: ops.sum(ops.softmax(x) * np.arange(x.shape[-1])),
+        ),
+        (
+            "log_softmax",
+            lambda x: ops.sum(ops.log_softmax(x) * np.arange(x.shape[-1])),
+        ),
+        ("square_sqrt", lambda x: ops.sum(ops.sqrt(ops.square(x) + 1.0))),
+        ("exp_log", lambda x: ops.mean(ops.log(ops.exp(x) + 2.0))),
+        ("abs", lambda x: ops.sum(ops.abs(x))),
+        ("power", lambda x: ops.sum(x**3)),
+        ("max", lambda x: ops.max(x, axis=1).sum()),
+        ("min", lambda x: ops.sum(ops.min(x, axis=0))),
+        ("mean", lambda x: ops.sum(ops.mean(x, axis=-1) ** 2)),
+        ("var", lambda x: ops.sum(ops.var(x, axis=0))),
+        ("clip", lambda x: ops.sum(ops.clip(x, -0.5, 0.5) ** 2)),
+        ("where", lambda x: ops.sum(ops.where(x > 0, x * 2, -x))),
+        ("maximum", lambda x: ops.sum(ops.maximum(x, x[:1] * 0.5))),
+        ("transpose", lambda x: ops.sum(ops.transpose(x) * np.arange(3))),
+        ("reshape", lambda x: ops.sum(ops.reshape(x, (-1,)) ** 2)),
+        (
+            "concatenate",
+            lambda x: ops.sum(ops.concatenate([x, x**2], axis=1) ** 2),
+        ),
+        ("stack", lambda x: ops.sum(ops.stack([x, x * 3], axis=1) ** 2)),
+        ("getitem", lambda x: ops.sum(x[1:, ::2] ** 2 + x[[0, 0]] ** 2)),
+        ("take", lambda x: ops.sum(ops.take(x, [0, 2, 2], axis=0) ** 2)),
+        (
+            "take_along_axis",
+            lambda x: ops.sum(
+                ops.take_along_axis(x, np.array([[0], [1], [1]]), axis=1) ** 2
+            ),
+        ),
+    )
+    def test_gradients(self, fn):
+        x = np.random.uniform(-1, 1, (3, 2))
+        self.assertGradientsMatch(fn, x)
+
+    def test_matmul_broadcasting(self):
+        y = np.random.uniform(-1, 1, (4, 2, 5))
+        v = np.random.uniform(-1, 1, (3,))
+
+        self.assertGradientsMatch(
+            lambda x: ops.sum(ops.matmul(x, y)), y[0, :, 0]
+        )
+        self.assertGradientsMatch(
+            lambda x: ops.sum(ops.matmul(x, y) ** 2),
+            np.random.uniform(-1, 1, (3, 2)),
+        )
+        self.assertGradientsMatch(
+            lambda x: ops.sum(ops.matmul(v, x) ** 2),
+            np.random.uniform(-1, 1, (3, 2)),
+        )
+
+    @parameterized.named_parameters(
+        ("conv", lambda x: ops.sum(ops.conv(x, np.ones((2, 2, 2, 3))) ** 2)),
+        (
+            "conv_strided_same",
+            lambda x: ops.sum(
+                ops.conv(x, np.ones((3, 3, 2, 1)), strides=2, padding="same")
+                ** 2
+            ),
+        ),
+        (
+            "depthwise_conv",
+            lambda x: ops.sum(
+                ops.depthwise_conv(x, np.ones((2, 2, 2, 2)), dilation_rate=2)
+                ** 2
+            ),
+        ),
+        (
+            "conv_transpose",
+            lambda x: ops.sum(
+                ops.conv_transpose(x, np.ones((2, 2, 3, 2)), strides=2) ** 2
+            ),
+        ),
+        ("max_pool", lambda x: ops.sum(ops.max_pool(x, 2) * np.arange(2))),
+        (
+            "average_pool",
+            lambda x: ops.sum(ops.average_pool(x, 3, 2, "same") ** 2),
+        ),
+    )
+    def test_conv_gradients(self, fn):
+        x = np.random.uniform(-1, 1, (2, 5, 5, 2))
+        self.assertGradientsMatch(fn, x)
+
+    def test_fit_conv_model(self):
+        x = np.random.uniform(-1, 1, (32, 8, 8, 3)).astype("float32")
+        y = np.eye(2)[(x.mean(axis=(1, 2, 3)) > 0).astype("int32")]
+        model = models.Sequential(
+            [
+                layers.Input((8, 8, 3)),
+                layers.Conv2D(8, 3, padding="same", activation="relu"),
+                layers.MaxPooling2D(2),
+                layers.Conv2D(8, 3, strides=2),
+                layers.AveragePooling2D(1),
+                layers.GlobalAveragePooling2D(),
+                layers.Dense(2, activation="softmax"),
+            ]
+        )
+        model.compile(optimizer="adam", loss="categorical_crossentropy")
+        kernel = model.layers[0].kernel.numpy()
+        history = model.fit(x, y, batch_size=8, epochs=5, verbose=0)
+        self.assertLess(history.history["loss"][-1], history.history["loss"][0])
+        self.assertNotAllClose(model.layers[0].kernel, kernel)
+
+    @parameterized.named_parameters(
+        (
+            "categorical",
+            lambda x: ops.mean(
+                losses.categorical_crossentropy(
+                    np.eye(3)[[0, 2, 1, 1]], x, from_logits=True
+                )
+            ),
+        ),
+        (
+            "sparse_categorical",
+            lambda x: ops.mean(
+                losses.sparse_categorical_crossentropy(
+                    np.array([0, 2, 1, 1]), ops.softmax(x)
+                )
+            ),
+        ),
+        (
+            "binary",
+            lambda x: ops.mean(
+                losses.binary_crossentropy(
+                    np.array([[0, 1, 1]] * 4, dtype="float64"),
+                    x,
+                    from_logits=True,
+                )
+            ),
+        ),
+        (
+            "huber",
+            lambda x: ops.mean(losses.huber(np.zeros((4, 3)), x)),
+        ),
+    )
+    def test_loss_gradients(self, fn):
+        x = np.random.uniform(-1, 1, (4, 3))
+        self.assertGradientsMatch(fn, x)
+
+    def test_nested_inputs_and_aux(self):
+        def fn(params, x):
+            y = ops.matmul(x, params["w"]) + params["b"]
+            return ops.sum(y**2), y
+
+        params = {"w": np.ones((2, 3)), "b": np.zeros((3,))}
+        x = np.array([[1.0, 2.0]])
+        (value, aux), grads = autodiff.value_and_grad(fn, has_aux=True)(
+            params, x
+        )
+        self.assertAllClose(value, 27.0)
+        self.assertIsInstance(aux, np.ndarray)
+        self.assertAllClose(aux, [[3.0, 3.0, 3.0]])
+        self.assertAllClose(grads["w"], [[6.0, 6.0, 6.0], [12.0, 12.0, 12.0]])
+        self.assertAllClose(grads["b"], [6.0, 6.0, 6.0])
+
+    def test_unused_input(self):
+        _, grads = autodiff.value_and_grad(lambda p: ops.sum(p[0] * 2))(
+            [np.ones((2,)), np.ones((3,))]
+        )
+        self.assertAllClose(grads[0], [2.0, 2.0])
+        self.assertAllClose(grads[1], [0.0, 0.0, 0.0])
+
+    def test_stop_gradient(self):
+        _, grad = autodiff.value_and_grad(
+            lambda x: ops.sum(x * ops.stop_gradient(x))
+        )(np.array([1.0, 2.0]))
+        self.assertAllClose(grad, [1.0, 2.0])
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "must return a scalar"):
+            autodiff.value_and_grad(lambda x: x * 2)(np.ones((2,)))
+        with self.assertRaisesRegex(NotImplementedError, "cumprod"):
+            autodiff.value_and_grad(lambda x: np.cumprod(x).sum())(
+                np.ones((2,))
+            )
+        with self.assertRaisesRegex(TypeError, "drop its gradient"):
+            autodiff.value_and_grad(lambda x: np.array(x).sum())(np.ones((2,)))
+
+    def test_fit(self):
+        x = np.random.uniform(-1, 1, (64, 4)).astype("float32")
+        y = (x @ np.array([[1.0], [-2.0], [0.5], [3.0]])).astype("float32")
+        model = models.Sequential(
+            [
+                layers.Input((4,)),
+                layers.Dense(16, activation="relu"),
+                layers.BatchNormalization(),
+                layers.Dropout(0.1),
+                layers.Dense(1),
+            ]
+        )
+        model.compile(optimizer="adam", loss="mse", metrics=["mae"])
+        moving_mean = model.layers[1].moving_mean.numpy()
+        history = model.fit(x, y, batch_size=16, epochs=10, verbose=0)
+        self.assertLess(history.history["loss"][-1], history.history["loss"][0])
+        # Non-trainable variables are updated by the forward pass.
+        self.assertNotAllClose(model.layers[1].moving_mean, moving_mean)
+        logs = model.train_on_batch(x, y, return_dict=True)
+        self.assertIn("mae", logs)
+
+    @parameterized.named_parameters(
+        ("conv1d_same", (8, 3), lambda: layers.Conv1D(4, 3, padding="same")),
+        ("conv1d_valid", (8, 3), lambda: layers.Conv1D(4, 3)),
+        ("conv2d_same", (6, 6, 3), lambda: layers.Conv2D(4, 3, padding="same")),
+        ("conv2d_valid", (6, 6, 3), lambda: layers.Conv2D(4, 3)),
+        ("depthwise_conv2d", (6, 6, 3), lambda: layers.DepthwiseConv2D(3)),
+        ("separable_conv2d", (6, 6, 3), lambda: layers.SeparableConv2D(4, 3)),
+        (
+            "conv2d_transpose",
+            (4, 4, 3),
+            lambda: layers.Conv2DTranspose(4, 3, strides=2),
+        ),
+        ("embedding", (5,), lambda: layers.Embedding(10, 4)),
+        ("layer_normalization", (8,), lambda: layers.LayerNormalization()),
+        ("group_normalization", (8,), lambda: layers.GroupNormalization(2)),
+    )
+    def test_fit_layer(self, input_shape, layer_fn):
+        layer = layer_fn()
+        if isinstance(layer, layers.Embedding):
+            x = np.random.randint(0, 10, (32,) + input_shape)
+        else:
+            x = np.random.uniform(-1, 1, (32,) + input_shape)
+        y = np.random.uniform(-1, 1, (32, 1))
+        model = models.Sequential(
+            [
+                layers.Input(input_shape, dtype=x.dtype),
+                layer,
+                layers.Flatten(),
+                layers.Dense(1),
+            ]
+        )
+        model.compile(optimizer="adam", loss="mse")
+        weights = [w.numpy() for w in layer.trainable_weights]
+        history = model.fit(x, y, batch_size=8, epochs=3, verbose=0)
+        self.assertLess(history.history["loss"][-1], history.history["loss"][0])
+        for weight, initial_weight in zip(layer.trainable_weights, weights):
+            self.assertNotAllClose(weight, initial_weight)
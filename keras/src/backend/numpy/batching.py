@@ -0,0 +1,906 @@
+"""Vectorization of per-example functions for the NumPy backend.
+
+`vectorized_map()` first tries to run the mapped function once on the whole
+batch. Each input is wrapped in a `BatchTracer`, which presents the
+per-example shape to the function but holds the values of all the examples.
+Tracers implement the NumPy dispatch protocols (`__array_ufunc__` and
+`__array_function__`), so every NumPy function that the backend ops call on
+them is evaluated on the batched arrays with a rule that accounts for the
+leading batch axis.
+
+Only the NumPy functions with a batching rule can be traced. When the
+function calls any other NumPy function on a tracer, or converts it to a
+Python value (e.g. for control flow), the tracer raises an
+`UnbatchableError`. The trace is then abandoned and the function is called
+on each example in turn instead (see `_map_examples()` for why it is not
+called on chunks of examples). Other errors are raised as is. As with
+`jax.vmap`, the mapped function should therefore be free of side effects.
+"""
+
+import string
+import weakref
+
+import numpy as np
+
+from keras.src import tree
+from keras.src.backend.numpy import autodiff
+
+# Functions that could not be traced, to skip the trace on later calls. The
+# set does not keep the functions alive.
+_unbatchable_functions = weakref.WeakSet()
+
+
+class UnbatchableError(Exception):
+    """Raised when a function cannot be evaluated on a whole batch."""
+
+
+class BatchTracer:
+    """Batch of values, seen by the mapped function as a single example.
+
+    Attributes:
+        value: The batched array (or autodiff tracer). Its leading axis is
+            the batch axis, the other axes are those of an example.
+    """
+
+    __slots__ = ("value",)
+    # Makes NumPy defer binary operators with arrays to the tracer. This is
+    # higher than the priority of the autodiff tracers, which defer to batch
+    # tracers so that values are batched first and then differentiated.
+    __array_priority__ = 200.0
+
+    def __init__(self, value):
+        self.value = value
+
+    @property
+    def batch_size(self):
+        return self.value.shape[0]
+
+    @property
+    def shape(self):
+        return tuple(self.value.shape[1:])
+
+    @property
+    def dtype(self):
+        return self.value.dtype
+
+    @property
+    def ndim(self):
+        return self.value.ndim - 1
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def T(self):
+        return np.transpose(self)
+
+    def __len__(self):
+        if not self.shape:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __bool__(self):
+        raise UnbatchableError(
+            "The truth value of a batched value cannot be used."
+        )
+
+    def __float__(self):
+        raise UnbatchableError("A batched value cannot be converted to float.")
+
+    def __int__(self):
+        raise UnbatchableError("A batched value cannot be converted to int.")
+
+    def __index__(self):
+        raise UnbatchableError("A batched value cannot be used as an index.")
+
+    def __repr__(self):
+        return f"BatchTracer(shape={self.shape}, dtype={self.dtype})"
+
+    def __array__(self, dtype=None):
+        raise UnbatchableError(
+            "A batched value cannot be converted to a NumPy array."
+        )
+
+    def item(self, *args):
+        raise UnbatchableError("A batched value cannot be converted to item.")
+
+    def tolist(self):
+        raise UnbatchableError("A batched value cannot be converted to list.")
+
+    def astype(self, dtype, *args, **kwargs):
+        return BatchTracer(self.value.astype(dtype, *args, **kwargs))
+
+    def copy(self):
+        return np.copy(self)
+
+    def reshape(self, *shape, **kwargs):
+        if len(shape) == 1 and isinstance(shape[0], (tuple, list)):
+            shape = shape[0]
+        return np.reshape(self, shape, **kwargs)
+
+    def transpose(self, *axes):
+        if len(axes) == 1 and isinstance(axes[0], (tuple, list)):
+            axes = axes[0]
+        return np.transpose(self, axes or None)
+
+    def flatten(self):
+        return np.reshape(self, (-1,))
+
+    def ravel(self):
+        return np.reshape(self, (-1,))
+
+    def squeeze(self, axis=None):
+        return np.squeeze(self, axis=axis)
+
+    def sum(self, axis=None, dtype=None, keepdims=False):
+        return np.sum(self, axis=axis, dtype=dtype, keepdims=keepdims)
+
+    def mean(self, axis=None, dtype=None, keepdims=False):
+        return np.mean(self, axis=axis, dtype=dtype, keepdims=keepdims)
+
+    def max(self, axis=None, keepdims=False):
+        return np.max(self, axis=axis, keepdims=keepdims)
+
+    def min(self, axis=None, keepdims=False):
+        return np.min(self, axis=axis, keepdims=keepdims)
+
+    def prod(self, axis=None, dtype=None, keepdims=False):
+        return np.prod(self, axis=axis, dtype=dtype, keepdims=keepdims)
+
+    def any(self, axis=None, keepdims=False):
+        return np.any(self, axis=axis, keepdims=keepdims)
+
+    def all(self, axis=None, keepdims=False):
+        return np.all(self, axis=axis, keepdims=keepdims)
+
+    def argmax(self, axis=None):
+        return np.argmax(self, axis=axis)
+
+    def argmin(self, axis=None):
+        return np.argmin(self, axis=axis)
+
+    def __getitem__(self, key):
+        return _getitem(self, key)
+
+    def __setitem__(self, key, value):
+        raise UnbatchableError("Batched values cannot be modified in place.")
+
+    def __neg__(self):
+        return np.negative(self)
+
+    def __pos__(self):
+        return np.positive(self)
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    def __invert__(self):
+        return np.invert(self)
+
+    def __add__(self, other):
+        return np.add(self, other)
+
+    def __radd__(self, other):
+        return np.add(other, self)
+
+    def __sub__(self, other):
+        return np.subtract(self, other)
+
+    def __rsub__(self, other):
+        return np.subtract(other, self)
+
+    def __mul__(self, other):
+        return np.multiply(self, other)
+
+    def __rmul__(self, other):
+        return np.multiply(other, self)
+
+    def __truediv__(self, other):
+        return np.true_divide(self, other)
+
+    def __rtruediv__(self, other):
+        return np.true_divide(other, self)
+
+    def __floordiv__(self, other):
+        return np.floor_divide(self, other)
+
+    def __rfloordiv__(self, other):
+        return np.floor_divide(other, self)
+
+    def __mod__(self, other):
+        return np.remainder(self, other)
+
+    def __rmod__(self, other):
+        return np.remainder(other, self)
+
+    def __pow__(self, other):
+        return np.power(self, other)
+
+    def __rpow__(self, other):
+        return np.power(other, self)
+
+    def __matmul__(self, other):
+        return np.matmul(self, other)
+
+    def __rmatmul__(self, other):
+        return np.matmul(other, self)
+
+    def __and__(self, other):
+        return np.bitwise_and(self, other)
+
+    def __rand__(self, other):
+        return np.bitwise_and(other, self)
+
+    def __or__(self, other):
+        return np.bitwise_or(self, other)
+
+    def __ror__(self, other):
+        return np.bitwise_or(other, self)
+
+    def __xor__(self, other):
+        return np.bitwise_xor(self, other)
+
+    def __rxor__(self, other):
+        return np.bitwise_xor(other, self)
+
+    def __lt__(self, other):
+        return np.less(self, other)
+
+    def __le__(self, other):
+        return np.less_equal(self, other)
+
+    def __gt__(self, other):
+        return np.greater(self, other)
+
+    def __ge__(self, other):
+        return np.greater_equal(self, other)
+
+    def __eq__(self, other):
+        return np.equal(self, other)
+
+    def __ne__(self, other):
+        return np.not_equal(self, other)
+
+    __hash__ = object.__hash__
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if kwargs.get("out") is not None:
+            raise UnbatchableError(
+                "The `out` argument is not supported for batched values."
+            )
+        if method == "__call__":
+            return _elementwise(ufunc, inputs, kwargs)
+        if method in ("reduce", "accumulate") and len(inputs) == 1:
+            (x,) = inputs
+            _check_unbatched(kwargs)
+            axis = _batch_axis(kwargs.pop("axis", 0), x.ndim)
+            return BatchTracer(
+                getattr(ufunc, method)(x.value, axis=axis, **kwargs)
+            )
+        raise UnbatchableError(
+            f"`numpy.{ufunc.__name__}.{method}` cannot be batched."
+        )
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func in _BATCHING_RULES:
+            return _BATCHING_RULES[func](*args, **kwargs)
+        raise UnbatchableError(f"`numpy.{func.__name__}` cannot be batched.")
+
+
+def vectorized_map(function, elements):
+    """Maps `function` over the leading axis of `elements`.
+
+    Args:
+        function: The function to map. It takes a single example of
+            `elements`, or a list with one example of each element when
+            `elements` is a list or tuple.
+        elements: An array, or a list or tuple of arrays with the same
+            leading dimension.
+
+    Returns:
+        The outputs of `function` for all the examples, stacked along a new
+        leading axis.
+    """
+    is_list = isinstance(elements, (list, tuple))
+    batch_size = (elements[0] if is_list else elements).shape[0]
+    # Nested maps are evaluated example by example: the tracers of the outer
+    # map would be indistinguishable from those of the inner one.
+    nested = any(isinstance(x, BatchTracer) for x in tree.flatten(elements))
+    if not nested and function not in _unbatchable_functions:
+        if is_list:
+            inputs = [BatchTracer(x) for x in elements]
+        else:
+            inputs = BatchTracer(elements)
+        try:
+            outputs = function(inputs)
+            return tree.map_structure(
+                lambda x: _unbatch(x, batch_size), outputs
+            )
+        except UnbatchableError:
+            try:
+                _unbatchable_functions.add(function)
+            except TypeError:
+                # The function cannot be weakly referenced.
+                pass
+    return _map_examples(function, elements, batch_size, is_list)
+
+
+def _map_examples(function, elements, batch_size, is_list):
+    """Calls `function` on each example and writes the outputs in place.
+
+    The examples cannot be evaluated in chunks instead: `function` takes a
+    single example, and evaluating it on several examples at once requires
+    the same batched trace that just failed. The trace fails for any number
+    of examples, since it fails on control flow or data-dependent shapes
+    rather than on the size of the batch. Only the outputs are batched, by
+    writing them into preallocated arrays.
+    """
+    structure = None
+    buffers = None
+    for i in range(batch_size):
+        if is_list:
+            example = [x[i] for x in elements]
+        else:
+            example = elements[i]
+        outputs = function(example)
+        flat_outputs = tree.flatten(outputs)
+        if buffers is None:
+            structure = outputs
+            buffers = [_allocate(x, batch_size) for x in flat_outputs]
+        for j, x in enumerate(flat_outputs):
+            if isinstance(buffers[j], list):
+                buffers[j].append(x)
+            elif np.result_type(x) != buffers[j].dtype:
+                # Keep the batches seen so far and merge them at the end.
+                buffers[j] = list(buffers[j][:i]) + [x]
+            else:
+                buffers[j][i] = x
+    if buffers is None:
+        raise ValueError(
+            "`vectorized_map` requires at least one example when the mapped "
+            "function cannot be evaluated on the whole batch."
+        )
+    return tree.pack_sequence_as(
+        structure,
+        [np.stack(x) if isinstance(x, list) else x for x in buffers],
+    )
+
+
+def _allocate(x, batch_size):
+    if isinstance(x, (autodiff.Tracer, BatchTracer)):
+        # These cannot be written into an array (for autodiff tracers, this
+        # would drop the gradient).
+        return []
+    return np.empty((batch_size,) + np.shape(x), dtype=np.result_type(x))
+
+
+def _unbatch(x, batch_size):
+    if isinstance(x, BatchTracer):
+        return x.value
+    # The output does not depend on the inputs.
+    x = x if isinstance(x, autodiff.Tracer) else np.asarray(x)
+    return np.copy(np.broadcast_to(x, (batch_size,) + np.shape(x)))
+
+
+def _check_unbatched(*args):
+    for x in tree.flatten(args):
+        if isinstance(x, BatchTracer):
+            raise UnbatchableError(
+                "This argument of the function cannot be batched."
+            )
+
+
+def _batch_size(args):
+    for x in tree.flatten(args):
+        if isinstance(x, BatchTracer):
+            return x.batch_size
+
+
+def _ndim(x):
+    if isinstance(x, BatchTracer):
+        return x.ndim
+    return np.ndim(x)
+
+
+def _batched_value(x, ndim, batch_size=None):
+    """Returns the value of `x` with a batch axis, broadcastable to `ndim`.
+
+    Per-example dimensions are right-aligned, as in NumPy broadcasting. When
+    `batch_size` is given, unbatched values are broadcast to the batch.
+    """
+    if isinstance(x, BatchTracer):
+        value = x.value
+        return np.reshape(
+            value, value.shape[:1] + (1,) * (ndim - x.ndim) + value.shape[1:]
+        )
+    if batch_size is None:
+        return x
+    x = x if isinstance(x, autodiff.Tracer) else np.asarray(x)
+    return np.broadcast_to(x, (batch_size,) + np.shape(x))
+
+
+def _normalize_axis(axis, ndim):
+    if not -ndim <= axis < max(ndim, 1):
+        raise np.AxisError(axis, ndim)
+    return axis % max(ndim, 1)
+
+
+def _batch_axis(axis, ndim):
+    """Converts an axis of an example into an axis of the batch."""
+    if axis is None:
+        return tuple(range(1, ndim + 1))
+    if isinstance(axis, (tuple, list)):
+        return tuple(_normalize_axis(a, ndim) + 1 for a in axis)
+    return _normalize_axis(axis, ndim) + 1
+
+
+def _elementwise(func, args, kwargs):
+    _check_unbatched(kwargs)
+    ndim = max(_ndim(x) for x in args)
+    result = func(*[_batched_value(x, ndim) for x in args], **kwargs)
+    if isinstance(result, tuple):
+        return tuple(BatchTracer(x) for x in result)
+    return BatchTracer(result)
+
+
+def _getitem(x, key):
+    if not isinstance(key, tuple):
+        key = (key,)
+    key = tuple(
+        np.asarray(k) if isinstance(k, list) else _to_index(k) for k in key
+    )
+    if any(isinstance(k, BatchTracer) for k in key):
+        raise UnbatchableError("Batched indices cannot be used in `[]`.")
+    expanded = []
+    for k in key:
+        if isinstance(k, (bool, np.bool_)):
+            raise UnbatchableError("Boolean scalar indices cannot be batched.")
+        if isinstance(k, np.ndarray) and k.dtype == bool:
+            expanded.extend(np.nonzero(k))
+        else:
+            expanded.append(k)
+    key = tuple(expanded)
+    advanced = [
+        i for i, k in enumerate(key) if isinstance(k, np.ndarray) and k.ndim
+    ]
+    if advanced:
+        # Integers are advanced indices when combined with arrays.
+        advanced = [
+            i
+            for i, k in enumerate(key)
+            if isinstance(k, (int, np.integer, np.ndarray))
+        ]
+    result = x.value[(slice(None),) + key]
+    if advanced and advanced[-1] - advanced[0] + 1 != len(advanced):
+        # Non-adjacent advanced indices move their dimensions first, before
+        # the batch axis.
+        num_dims = np.broadcast(*[key[i] for i in advanced]).ndim
+        result = np.moveaxis(result, num_dims, 0)
+    return BatchTracer(result)
+
+
+def _to_index(k):
+    if isinstance(k, autodiff.Tracer):
+        return autodiff.stop_gradient(k)
+    return k
+
+
+_BATCHING_RULES = {}
+
+
+def _register(*funcs):
+    def decorator(rule):
+        for func in funcs:
+            _BATCHING_RULES[func] = rule
+        return rule
+
+    return decorator
+
+
+@_register(np.shape)
+def _shape(a):
+    return a.shape
+
+
+@_register(np.ndim)
+def _ndim_rule(a):
+    return a.ndim
+
+
+@_register(np.size)
+def _size(a, axis=None):
+    return a.size if axis is None else a.shape[axis]
+
+
+@_register(np.result_type)
+def _result_type(*arrays_and_dtypes):
+    return np.result_type(
+        *[
+            x.dtype if isinstance(x, BatchTracer) else x
+            for x in arrays_and_dtypes
+        ]
+    )
+
+
+@_register(np.where)
+def _where(condition, x=None, y=None):
+    if x is None and y is None:
+        raise UnbatchableError("`numpy.where(condition)` cannot be batched.")
+    return _elementwise(np.where, (condition, x, y), {})
+
+
+@_register(np.clip)
+def _clip(a, a_min=None, a_max=None, **kwargs):
+    return _elementwise(np.clip, (a, a_min, a_max), kwargs)
+
+
+@_register(np.isclose)
+def _isclose(a, b, **kwargs):
+    return _elementwise(np.isclose, (a, b), kwargs)
+
+
+def _make_elementwise_rule(func):
+    def rule(a, *args, **kwargs):
+        _check_unbatched(args, kwargs)
+        return BatchTracer(func(a.value, *args, **kwargs))
+
+    return rule
+
+
+def _make_reduction_rule(func):
+    def rule(a, axis=None, *args, **kwargs):
+        _check_unbatched(args, kwargs)
+        return BatchTracer(
+            func(a.value, _batch_axis(axis, a.ndim), *args, **kwargs)
+        )
+
+    return rule
+
+
+def _make_flattening_axis_rule(func, default_axis=None):
+    # For functions that operate on the flattened array when `axis=None`.
+    def rule(a, *args, **kwargs):
+        _check_unbatched(args, kwargs)
+        args = list(args)
+        axis = args.pop(0) if args else kwargs.pop("axis", default_axis)
+        value = a.value
+        if axis is None:
+            value = np.reshape(value, (value.shape[0], -1))
+            axis = 1
+        else:
+            axis = _batch_axis(axis, a.ndim)
+        return BatchTracer(func(value, *args, axis=axis, **kwargs))
+
+    return rule
+
+
+for _func in (
+    np.copy,
+    np.round,
+    np.around,
+    np.nan_to_num,
+    np.zeros_like,
+    np.ones_like,
+    np.empty_like,
+    np.full_like,
+):
+    _BATCHING_RULES[_func] = _make_elementwise_rule(_func)
+
+for _func in (
+    np.sum,
+    np.prod,
+    np.mean,
+    np.max,
+    np.amax,
+    np.min,
+    np.amin,
+    np.any,
+    np.all,
+    np.var,
+    np.std,
+    np.nansum,
+    np.nanmean,
+    np.nanmax,
+    np.nanmin,
+    np.median,
+    np.count_nonzero,
+    np.flip,
+):
+    _BATCHING_RULES[_func] = _make_reduction_rule(_func)
+
+for _func in (np.argmax, np.argmin, np.cumsum, np.cumprod):
+    _BATCHING_RULES[_func] = _make_flattening_axis_rule(_func)
+
+for _func in (np.sort, np.argsort, np.diff):
+    _BATCHING_RULES[_func] = _make_flattening_axis_rule(_func, -1)
+
+
+@_register(np.reshape)
+def _reshape(a, *args, **kwargs):
+    args = list(args)
+    if args:
+        shape = args.pop(0)
+    else:
+        shape = kwargs.pop("newshape", kwargs.pop("shape", None))
+    if isinstance(shape, int):
+        shape = (shape,)
+    return BatchTracer(
+        np.reshape(a.value, (a.batch_size,) + tuple(shape), *args, **kwargs)
+    )
+
+
+@_register(np.ravel)
+def _ravel(a, order="C"):
+    return _reshape(a, (-1,), order=order)
+
+
+@_register(np.expand_dims)
+def _expand_dims(a, axis):
+    axes = axis if isinstance(axis, (tuple, list)) else (axis,)
+    ndim = a.ndim + len(axes)
+    axes = tuple(_normalize_axis(ax, ndim) + 1 for ax in axes)
+    return BatchTracer(np.expand_dims(a.value, axes))
+
+
+@_register(np.squeeze)
+def _squeeze(a, axis=None):
+    if axis is None:
+        axis = tuple(i for i, dim in enumerate(a.shape) if dim == 1)
+    return BatchTracer(np.squeeze(a.value, axis=_batch_axis(axis, a.ndim)))
+
+
+@_register(np.transpose)
+def _transpose(a, axes=None):
+    if axes is None:
+        axes = tuple(reversed(range(a.ndim)))
+    axes = (0,) + _batch_axis(tuple(axes), a.ndim)
+    return BatchTracer(np.transpose(a.value, axes))
+
+
+@_register(np.swapaxes)
+def _swapaxes(a, axis1, axis2):
+    return BatchTracer(
+        np.swapaxes(
+            a.value, _batch_axis(axis1, a.ndim), _batch_axis(axis2, a.ndim)
+        )
+    )
+
+
+@_register(np.moveaxis)
+def _moveaxis(a, source, destination):
+    return BatchTracer(
+        np.moveaxis(
+            a.value,
+            _batch_axis(source, a.ndim),
+            _batch_axis(destination, a.ndim),
+        )
+    )
+
+
+@_register(np.broadcast_to)
+def _broadcast_to(array, shape, subok=False):
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    value = _batched_value(array, len(shape))
+    return BatchTracer(np.broadcast_to(value, (array.batch_size,) + shape))
+
+
+@_register(np.tile)
+def _tile(A, reps):
+    reps = (reps,) if isinstance(reps, int) else tuple(reps)
+    ndim = max(A.ndim, len(reps))
+    reps = (1,) * (ndim - len(reps)) + reps
+    return BatchTracer(np.tile(_batched_value(A, ndim), (1,) + reps))
+
+
+@_register(np.repeat)
+def _repeat(a, repeats, axis=None):
+    _check_unbatched(repeats)
+    value = a.value
+    if axis is None:
+        value = np.reshape(value, (value.shape[0], -1))
+        axis = 1
+    else:
+        axis = _batch_axis(axis, a.ndim)
+    return BatchTracer(np.repeat(value, repeats, axis=axis))
+
+
+@_register(np.concatenate)
+def _concatenate(arrays, axis=0, **kwargs):
+    _check_unbatched(kwargs)
+    batch_size = _batch_size(arrays)
+    if axis is None:
+        values = [
+            np.reshape(
+                _batched_value(x, _ndim(x), batch_size), (batch_size, -1)
+            )
+            for x in arrays
+        ]
+        return BatchTracer(np.concatenate(values, axis=1, **kwargs))
+    ndim = _ndim(arrays[0])
+    values = [_batched_value(x, _ndim(x), batch_size) for x in arrays]
+    return BatchTracer(
+        np.concatenate(values, axis=_batch_axis(axis, ndim), **kwargs)
+    )
+
+
+@_register(np.stack)
+def _stack(arrays, axis=0, **kwargs):
+    _check_unbatched(kwargs)
+    batch_size = _batch_size(arrays)
+    ndim = _ndim(arrays[0]) + 1
+    values = [_batched_value(x, _ndim(x), batch_size) for x in arrays]
+    return BatchTracer(
+        np.stack(values, axis=_normalize_axis(axis, ndim) + 1, **kwargs)
+    )
+
+
+def _make_split_rule(func):
+    def rule(ary, indices_or_sections, axis=0):
+        _check_unbatched(indices_or_sections)
+        outputs = func(
+            ary.value, indices_or_sections, axis=_batch_axis(axis, ary.ndim)
+        )
+        return [BatchTracer(x) for x in outputs]
+
+    return rule
+
+
+_BATCHING_RULES[np.split] = _make_split_rule(np.split)
+_BATCHING_RULES[np.array_split] = _make_split_rule(np.array_split)
+
+
+@_register(np.pad)
+def _pad(array, pad_width, mode="constant", **kwargs):
+    _check_unbatched(pad_width, kwargs)
+    pad_width = np.broadcast_to(
+        np.asarray(pad_width, dtype="int64"), (array.ndim, 2)
+    )
+    pad_width = [(0, 0)] + [tuple(p) for p in pad_width.tolist()]
+    return BatchTracer(np.pad(array.value, pad_width, mode=mode, **kwargs))
+
+
+def _make_triangle_rule(func):
+    def rule(m, k=0):
+        _check_unbatched(k)
+        if m.ndim < 2:
+            raise UnbatchableError(
+                f"`numpy.{func.__name__}` of a vector cannot be batched."
+            )
+        return BatchTracer(func(m.value, k))
+
+    return rule
+
+
+_BATCHING_RULES[np.triu] = _make_triangle_rule(np.triu)
+_BATCHING_RULES[np.tril] = _make_triangle_rule(np.tril)
+
+
+@_register(np.searchsorted)
+def _searchsorted(a, v, side="left", sorter=None):
+    _check_unbatched(a, sorter)
+    return BatchTracer(np.searchsorted(a, v.value, side=side, sorter=sorter))
+
+
+@_register(np.digitize)
+def _digitize(x, bins, right=False):
+    _check_unbatched(bins)
+    return BatchTracer(np.digitize(x.value, bins, right=right))
+
+
+@_register(np.take)
+def _take(a, indices, axis=None, out=None, mode="raise"):
+    if out is not None:
+        raise UnbatchableError("The `out` argument cannot be batched.")
+    if not isinstance(indices, BatchTracer):
+        value = a.value
+        if axis is None:
+            value = np.reshape(value, (value.shape[0], -1))
+            axis = 1
+        else:
+            axis = _batch_axis(axis, a.ndim)
+        return BatchTracer(np.take(value, indices, axis=axis, mode=mode))
+    # NumPy only dispatches `take` on `a`, so both are batched here.
+    if mode != "raise":
+        raise UnbatchableError(f"`numpy.take` with mode='{mode}'.")
+    value = a.value
+    if axis is None:
+        value = np.reshape(value, (value.shape[0], -1))
+        axis = 0
+    else:
+        axis = _normalize_axis(axis, a.ndim)
+    index = indices.value
+    batch_index = np.reshape(
+        np.arange(value.shape[0]), (-1,) + (1,) * (index.ndim - 1)
+    )
+    key = (batch_index,) + (slice(None),) * axis + (index,)
+    result = value[key]
+    if axis > 0:
+        # The advanced indices are not adjacent, so their dimensions come
+        # first. Move the dimensions of `indices` back to `axis`.
+        num_dims = index.ndim - 1
+        result = np.moveaxis(
+            result,
+            list(range(1, 1 + num_dims)),
+            list(range(1 + axis, 1 + axis + num_dims)),
+        )
+    return BatchTracer(result)
+
+
+@_register(np.take_along_axis)
+def _take_along_axis(arr, indices, axis):
+    batch_size = _batch_size((arr, indices))
+    ndim = _ndim(arr)
+    arr = _batched_value(arr, ndim, batch_size)
+    indices = _batched_value(indices, ndim, batch_size)
+    if axis is None:
+        arr = np.reshape(arr, (batch_size, -1))
+        indices = np.reshape(indices, (batch_size, -1))
+        axis = 1
+    else:
+        axis = _batch_axis(axis, ndim)
+    return BatchTracer(np.take_along_axis(arr, indices, axis))
+
+
+@_register(np.matmul)
+def _matmul(x1, x2, **kwargs):
+    _check_unbatched(kwargs)
+    shape1, shape2 = np.shape(x1), np.shape(x2)
+    if not shape1 or not shape2:
+        raise ValueError("matmul: Input operand does not have enough dims.")
+    # Promote vectors to matrices, as `matmul` does.
+    matrix_shape1 = (1,) + shape1 if len(shape1) == 1 else shape1
+    matrix_shape2 = shape2 + (1,) if len(shape2) == 1 else shape2
+    ndim = max(len(matrix_shape1), len(matrix_shape2))
+
+    def to_matrix(x, shape):
+        if isinstance(x, BatchTracer):
+            value = x.value
+            return np.reshape(
+                value, value.shape[:1] + (1,) * (ndim - len(shape)) + shape
+            )
+        return np.reshape(x, shape)
+
+    result = np.matmul(
+        to_matrix(x1, matrix_shape1), to_matrix(x2, matrix_shape2), **kwargs
+    )
+    if len(shape2) == 1:
+        result = np.squeeze(result, -1)
+    if len(shape1) == 1:
+        result = np.squeeze(result, -2 if len(shape2) > 1 else -1)
+    return BatchTracer(result)
+
+
+@_register(np.dot)
+def _dot(a, b, out=None):
+    if out is not None:
+        raise UnbatchableError("The `out` argument cannot be batched.")
+    if _ndim(a) == 0 or _ndim(b) == 0:
+        return np.multiply(a, b)
+    if _ndim(a) > 2 or _ndim(b) > 2:
+        raise UnbatchableError("`numpy.dot` of arrays of rank > 2.")
+    return _matmul(a, b)
+
+
+@_register(np.einsum)
+def _einsum(subscripts, *operands, **kwargs):
+    _check_unbatched(kwargs)
+    if not isinstance(subscripts, str) or "->" not in subscripts:
+        raise UnbatchableError(
+            "`numpy.einsum` can only be batched with explicit output "
+            "subscripts."
+        )
+    inputs, output = subscripts.replace(" ", "").split("->")
+    inputs = inputs.split(",")
+    letter = next(c for c in string.ascii_letters if c not in subscripts)
+    inputs = [
+        letter + s if isinstance(x, BatchTracer) else s
+        for s, x in zip(inputs, operands)
+    ]
+    values = [x.value if isinstance(x, BatchTracer) else x for x in operands]
+    subscripts = ",".join(inputs) + "->" + letter + output
+    return BatchTracer(np.einsum(subscripts, *values, **kwargs))
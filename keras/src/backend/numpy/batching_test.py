@@ -0,0 +1,170 @@
+"""Tests for the batched evaluation of `vectorized_map` in the NumPy backend."""
+
+import numpy as np
+import pytest
+from absl.testing import parameterized
+
+from keras.src import backend
+from keras.src import ops
+from keras.src import testing
+
+if backend.backend() == "numpy":
+    # Importing the NumPy backend package with another backend would replace
+    # the `numpy` module of the active backend in `keras.src.backend`.
+    from keras.src.backend.numpy import autodiff
+    from keras.src.backend.numpy import batching
+
+
+def map_examples(fn, x):
+    return np.stack([fn(e) for e in x])
+
+
+@pytest.mark.skipif(
+    backend.backend() != "numpy",
+    reason="Batch tracers are only used by the NumPy backend.",
+)
+class BatchingTest(testing.TestCase, parameterized.TestCase):
+    def assertBatched(self, fn, x):
+        calls = []
+
+        def wrapped(e):
+            calls.append(e)
+            return fn(e)
+
+        output = batching.vectorized_map(wrapped, x)
+        self.assertLen(calls, 1)
+        self.assertIsInstance(calls[0], batching.BatchTracer)
+        self.assertAllClose(output, map_examples(fn, x))
+        self.assertEqual(output.dtype, np.asarray(fn(x[0])).dtype)
+
+    @parameterized.named_parameters(
+        ("add", lambda x: x + np.arange(4)),
+        ("broadcast", lambda x: x * np.ones((2, 3, 4))),
+        ("activations", lambda x: ops.softmax(ops.relu(x) + ops.tanh(x))),
+        ("sum", lambda x: ops.sum(x)),
+        ("mean_axis", lambda x: ops.mean(x, axis=-1, keepdims=True)),
+        ("max_axis", lambda x: ops.max(x, axis=0)),
+        ("argmax", lambda x: ops.argmax(x)),
+        ("argsort", lambda x: ops.argsort(x)),
+        ("cumsum", lambda x: ops.cumsum(x, axis=1)),
+        ("reshape", lambda x: ops.reshape(x, (-1, 2))),
+        ("transpose", lambda x: ops.transpose(x)),
+        ("expand_squeeze", lambda x: ops.squeeze(ops.expand_dims(x, -1))),
+        ("flip", lambda x: ops.flip(x, axis=0)),
+        ("concatenate", lambda x: ops.concatenate([x, np.zeros((3, 1))], 1)),
+        ("stack", lambda x: ops.stack([x, np.ones((3, 4))], axis=-1)),
+        ("split", lambda x: ops.split(x, 2, axis=1)[1]),
+        ("pad", lambda x: ops.pad(x, ((1, 0), (0, 2)))),
+        ("tile", lambda x: ops.tile(x, (2, 1))),
+        ("where", lambda x: ops.where(x > 0.5, x, np.zeros((4,)))),
+        ("clip", lambda x: ops.clip(x, 0.2, 0.8)),
+        ("matmul", lambda x: ops.matmul(x, np.ones((4, 5)))),
+        ("matmul_vector", lambda x: ops.matmul(np.ones((3,)), x)),
+        ("matmul_self", lambda x: ops.matmul(x, ops.transpose(x))),
+        ("einsum", lambda x: ops.einsum("ij,kj->ik", x, x)),
+        ("take", lambda x: ops.take(x, [2, 0], axis=1)),
+        (
+            "take_along_axis",
+            lambda x: ops.take_along_axis(x, ops.argsort(x), 1),
+        ),
+        ("getitem", lambda x: x[1:, ::2]),
+        ("getitem_advanced", lambda x: x[[0, 2], 1:]),
+        ("getitem_non_adjacent", lambda x: x[[0, 2], :][:, None, [1, 3]]),
+        ("getitem_mask", lambda x: x[:, np.array([True, False, True, False])]),
+        ("iterate", lambda x: ops.stack([row * i for i, row in enumerate(x)])),
+    )
+    def test_batched(self, fn):
+        x = np.random.uniform(size=(5, 3, 4)).astype("float32")
+        self.assertBatched(fn, x)
+
+    def test_take_with_batched_indices(self):
+        indices = np.array([[0, 1], [3, 3], [2, 0]])
+        values = np.random.uniform(size=(3, 5, 4))
+        output = batching.vectorized_map(
+            lambda e: ops.take(e[0], e[1], axis=1), [values, indices]
+        )
+        self.assertAllClose(
+            output,
+            np.stack([np.take(v, i, axis=1) for v, i in zip(values, indices)]),
+        )
+        output = batching.vectorized_map(
+            lambda e: ops.take(e[0], e[1]), [values, indices]
+        )
+        self.assertAllClose(
+            output, np.stack([np.take(v, i) for v, i in zip(values, indices)])
+        )
+
+    def test_multiple_elements_and_nested_outputs(self):
+        x = np.random.uniform(size=(4, 3))
+        y = np.random.uniform(size=(4, 3))
+
+        def fn(elements):
+            a, b = elements
+            return {"sum": a + b, "constant": np.ones((2,))}
+
+        output = batching.vectorized_map(fn, [x, y])
+        self.assertAllClose(output["sum"], x + y)
+        self.assertAllClose(output["constant"], np.ones((4, 2)))
+
+    def test_fallback(self):
+        def fn(x):
+            # Data-dependent shape.
+            return ops.sum(x[x > 0.5]) + len(np.nonzero(np.asarray(x))[0])
+
+        x = np.random.uniform(size=(6, 4))
+        output = batching.vectorized_map(fn, x)
+        self.assertAllClose(output, map_examples(fn, x))
+        self.assertIn(fn, batching._unbatchable_functions)
+
+        # Outputs with changing dtypes are merged.
+        output = batching.vectorized_map(
+            lambda e: e.astype("int32") if e[0] > 0 else e * 0.5,
+            np.array([[1.0], [-1.0]]),
+        )
+        self.assertEqual(output.dtype, np.float64)
+        self.assertAllClose(output, [[1.0], [-0.5]])
+
+    def test_errors_are_raised(self):
+        def fn(x):
+            raise KeyError("error in the mapped function")
+
+        with self.assertRaisesRegex(KeyError, "error in the mapped function"):
+            batching.vectorized_map(fn, np.ones((3, 2)))
+        self.assertNotIn(fn, batching._unbatchable_functions)
+
+    def test_fallback_is_per_function(self):
+        def make_fn(batchable):
+            def fn(x):
+                if not batchable:
+                    x = x[x > 0.5]
+                return ops.sum(x)
+
+            return fn
+
+        x = np.random.uniform(size=(6, 4))
+        unbatchable_fn = make_fn(False)
+        batchable_fn = make_fn(True)
+        batching.vectorized_map(unbatchable_fn, x)
+        batching.vectorized_map(batchable_fn, x)
+        self.assertIn(unbatchable_fn, batching._unbatchable_functions)
+        self.assertNotIn(batchable_fn, batching._unbatchable_functions)
+
+    def test_nested_maps(self):
+        x = np.random.uniform(size=(3, 4, 5))
+        output = batching.vectorized_map(
+            lambda a: batching.vectorized_map(lambda b: b * 2 + ops.sum(b), a),
+            x,
+        )
+        self.assertAllClose(output, x * 2 + x.sum(-1, keepdims=True))
+
+    def test_gradients(self):
+        x = np.random.uniform(size=(4, 3))
+
+        def loss(w):
+            y = batching.vectorized_map(
+                lambda e: ops.sum(ops.matmul(e, w) ** 2), x
+            )
+            return ops.sum(y)
+
+        _, grad = autodiff.value_and_grad(loss)(np.ones((3, 2)))
+        self.assertAllClose(grad, 2 * x.T @ x @ np.ones((3, 2)))
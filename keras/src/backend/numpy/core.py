@@ -6,6 +6,8 @@ from keras.src.backend.common import standardize_dtype
 from keras.src.backend.common.dtypes import result_type
 from keras.src.backend.common.keras_tensor import KerasTensor
 from keras.src.backend.common.stateless_scope import StatelessScope
+from keras.src.backend.numpy import autodiff
+from keras.src.backend.numpy import batching
 
 SUPPORTS_SPARSE_TENSORS = False
 
@@ -24,6 +26,22 @@ class Variable(KerasVariable):
     def __array__(self):
         return self.value
 
+    # Overload NumPy dispatch, so that NumPy functions run on the value of the
+    # variable, which is a tracer when computing gradients.
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs, kwargs = tree.map_structure(_variable_value, (inputs, kwargs))
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        args, kwargs = tree.map_structure(_variable_value, (args, kwargs))
+        return func(*args, **kwargs)
+
+
+def _variable_value(x):
+    if isinstance(x, Variable):
+        return x.value
+    return x
+
 
 def convert_to_tensor(x, dtype=None, sparse=None):
     if sparse:
@@ -34,6 +52,16 @@ def convert_to_tensor(x, dtype=None, sparse=None):
         if dtype and dtype != x.dtype:
             return x.value.astype(dtype)
         return x.value
+    if isinstance(x, (autodiff.Tracer, batching.BatchTracer)):
+        if dtype and dtype != standardize_dtype(x.dtype):
+            return x.astype(dtype)
+        return x
+    if isinstance(x, (list, tuple)) and any(
+        isinstance(e, (autodiff.Tracer, batching.BatchTracer))
+        for e in tree.flatten(x)
+    ):
+        # Keep track of the traced elements.
+        return np.stack([convert_to_tensor(e, dtype=dtype) for e in x])
     if not is_tensor(x) and standardize_dtype(dtype) == "bfloat16":
         # Can't create bfloat16 arrays on the fly (e.g. from a h5 Dataset).
         # Instead we convert "as is" (to stored dtype) and cast.
@@ -46,11 +74,13 @@ def convert_to_tensor(x, dtype=None, sparse=None):
 
 
 def convert_to_numpy(x):
-    return np.array(x)
+    return np.array(autodiff.stop_gradient(x))
 
 
 def is_tensor(x):
-    if isinstance(x, (np.generic, np.ndarray)):
+    if isinstance(
+        x, (np.generic, np.ndarray, autodiff.Tracer, batching.BatchTracer)
+    ):
         return True
     return False
 
@@ -70,14 +100,11 @@ def cond(pred, true_fn, false_fn):
 
 
 def vectorized_map(function, elements):
-    if not isinstance(elements, (list, tuple)):
-        return np.stack([function(x) for x in elements])
+    if isinstance(elements, (list, tuple)):
+        elements = [convert_to_tensor(x) for x in elements]
     else:
-        batch_size = elements[0].shape[0]
-        output_store = []
-        for index in range(batch_size):
-            output_store.append(function([x[index] for x in elements]))
-        return np.stack(output_store)
+        elements = convert_to_tensor(elements)
+    return batching.vectorized_map(function, elements)
 
 
 # Shape / dtype inference util
@@ -222,7 +249,7 @@ def fori_loop(lower, upper, body_fun, init_val):
 
 
 def stop_gradient(x):
-    return x
+    return autodiff.stop_gradient(x)
 
 
 def unstack(x, num=None, axis=0):
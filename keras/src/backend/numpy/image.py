@@ -1,7 +1,7 @@
-import jax
 import numpy as np
 
 from keras.src.backend.numpy.core import convert_to_tensor
+from keras.src.utils.module_utils import jax
 from keras.src.utils.module_utils import scipy
 
 RESIZE_INTERPOLATIONS = (
@@ -2,8 +2,6 @@ import numpy as np
 
 from keras.src.backend import standardize_dtype
 from keras.src.backend.common import dtypes
-from keras.src.backend.jax.math import fft as jax_fft
-from keras.src.backend.jax.math import fft2 as jax_fft2
 from keras.src.backend.numpy.core import convert_to_tensor
 from keras.src.utils.module_utils import scipy
 
@@ -154,13 +152,23 @@ def _get_complex_tensor_from_tuple(x):
 
 
 def fft(x):
-    real, imag = jax_fft(x)
-    return np.array(real), np.array(imag)
+    real, _ = x
+    complex_output = np.fft.fft(_get_complex_tensor_from_tuple(x))
+    # numpy always outputs complex128, so we need to recast the dtype
+    return (
+        np.real(complex_output).astype(real.dtype),
+        np.imag(complex_output).astype(real.dtype),
+    )
 
 
 def fft2(x):
-    real, imag = jax_fft2(x)
-    return np.array(real), np.array(imag)
+    real, _ = x
+    complex_output = np.fft.fft2(_get_complex_tensor_from_tuple(x))
+    # numpy always outputs complex128, so we need to recast the dtype
+    return (
+        np.real(complex_output).astype(real.dtype),
+        np.imag(complex_output).astype(real.dtype),
+    )
 
 
 def rfft(x, fft_length=None):
@@ -1,6 +1,6 @@
-import jax
+import math
+
 import numpy as np
-from jax import lax
 
 from keras.src import backend
 from keras.src.backend.common.backend_utils import (
@@ -8,7 +8,6 @@ from keras.src.backend.common.backend_utils import (
 )
 from keras.src.backend.numpy.core import cast
 from keras.src.backend.numpy.core import convert_to_tensor
-from keras.src.backend.numpy.core import is_tensor
 from keras.src.utils.module_utils import scipy
 
 
@@ -124,63 +123,156 @@ def log_softmax(x, axis=None):
     return x - max_x - logsumexp
 
 
-def _convert_to_spatial_operand(
-    x,
-    num_spatial_dims,
-    data_format="channels_last",
-    include_batch_and_channels=True,
-):
+def _convert_to_spatial_operand(x, num_spatial_dims):
     # Helper function that converts an operand to a spatial operand.
-    x = (x,) * num_spatial_dims if isinstance(x, int) else x
-    if not include_batch_and_channels:
+    return (x,) * num_spatial_dims if isinstance(x, int) else tuple(x)
+
+
+def _to_channels_first(x, data_format):
+    # The kernels below work on channels-first inputs, so that the innermost
+    # (contiguous) axis of every window view is a spatial axis.
+    if data_format == "channels_first":
         return x
-    if data_format == "channels_last":
-        x = (1,) + x + (1,)
-    else:
-        x = (1,) + (1,) + x
-    return x
+    return np.moveaxis(x, -1, 1)
 
 
-def _pool(
-    inputs,
-    initial_value,
-    reduce_fn,
-    pool_size,
-    strides=None,
-    padding="valid",
-):
-    """Helper function to define pooling functions.
-
-    Args:
-        inputs: input data of shape `N+2`.
-        initial_value: the initial value for the reduction.
-        reduce_fn: a reduce function of the form `(T, T) -> T`.
-        pool_size: a sequence of `N` integers, representing the window size to
-            reduce over.
-        strides: a sequence of `N` integers, representing the inter-window
-            strides (default: `(1, ..., 1)`).
-        padding: either the string `same` or `valid`.
-
-    Returns:
-        The output of the reduction for each window slice.
+def _from_channels_first(x, data_format):
+    if data_format == "channels_first":
+        return x
+    return np.moveaxis(x, 1, -1)
+
+
+def _compute_padding(spatial_shape, window_shape, strides, padding):
+    """Returns the `(before, after)` padding of each spatial dimension.
+
+    `window_shape` is the effective (dilated) size of the window. `"same"`
+    padding follows the XLA convention: the output has `ceil(size / stride)`
+    entries and the extra padding, if any, goes after the input.
     """
     if padding not in ("same", "valid"):
         raise ValueError(
             f"Invalid padding '{padding}', must be 'same' or 'valid'."
         )
-    padding = padding.upper()
-    return np.array(
-        lax.reduce_window(
-            inputs,
-            initial_value,
-            reduce_fn,
-            pool_size,
-            strides,
-            padding,
+    if padding == "valid":
+        return [(0, 0)] * len(spatial_shape)
+    pads = []
+    for size, window, stride in zip(spatial_shape, window_shape, strides):
+        output_size = -(-size // stride)
+        total = max((output_size - 1) * stride + window - size, 0)
+        pads.append((total // 2, total - total // 2))
+    return pads
+
+
+def _pad_spatial(x, pads, constant_value=0):
+    """Pads (or crops, for negative values) the spatial dims of `x`."""
+    if all(before == 0 and after == 0 for before, after in pads):
+        return x
+    if any(before < 0 or after < 0 for before, after in pads):
+        crop = tuple(
+            slice(max(-before, 0), dim - max(-after, 0))
+            for (before, after), dim in zip(pads, x.shape[2:])
         )
+        x = x[(slice(None), slice(None)) + crop]
+        pads = [(max(before, 0), max(after, 0)) for before, after in pads]
+    return np.pad(
+        x, [(0, 0), (0, 0)] + list(pads), constant_values=constant_value
     )
 
 
+def _dilate_spatial(x, rates):
+    """Inserts `rate - 1` zeros between the entries of the spatial dims."""
+    for axis, rate in enumerate(rates, start=2):
+        if rate == 1 or x.shape[axis] == 0:
+            continue
+        size = x.shape[axis]
+        x = np.expand_dims(x, axis + 1)
+        pad_width = [(0, 0)] * x.ndim
+        pad_width[axis + 1] = (0, rate - 1)
+        x = np.pad(x, pad_width)
+        x = np.reshape(x, x.shape[:axis] + (size * rate,) + x.shape[axis + 2 :])
+        index = [slice(None)] * x.ndim
+        index[axis] = slice(0, (size - 1) * rate + 1)
+        x = x[tuple(index)]
+    return x
+
+
+def _windows(x, window_shape, strides, dilation_rate):
+    """Yields the strided view of `x` at every offset within the window.
+
+    `x` is a padded channels-first input. For each position in the window
+    (in row-major order, matching the layout of the kernel), this yields the
+    offset and the slice of `x` that is multiplied with that kernel entry.
+    Window ops are then a short sequence of vectorized ops over whole views
+    instead of a loop over the output positions.
+    """
+    output_shape = []
+    for size, window, stride, rate in zip(
+        x.shape[2:], window_shape, strides, dilation_rate
+    ):
+        effective_window = (window - 1) * rate + 1
+        output_shape.append(max((size - effective_window) // stride + 1, 0))
+    for offset in np.ndindex(*window_shape):
+        index = tuple(
+            slice(o * rate, o * rate + (n - 1) * stride + 1, stride)
+            for o, n, stride, rate in zip(
+                offset, output_shape, strides, dilation_rate
+            )
+        )
+        yield offset, x[(slice(None), slice(None)) + index]
+
+
+def _conv(inputs, kernel, strides, pads, dilation_rate):
+    """Grouped N-D convolution of a channels-first input with explicit pads.
+
+    The input patches are gathered into an im2col array of shape
+    `(batch, groups, in_channels * window_size, output_size)`, so that the
+    whole convolution runs as a single (batched) GEMM.
+    """
+    window_shape = kernel.shape[:-2]
+    in_channels, out_channels = kernel.shape[-2:]
+    batch_size, channels = inputs.shape[:2]
+    groups = channels // in_channels
+    inputs = _pad_spatial(inputs, pads)
+    patches = [
+        window
+        for _, window in _windows(inputs, window_shape, strides, dilation_rate)
+    ]
+    output_shape = patches[0].shape[2:]
+    window_size = len(patches)
+    patches = np.reshape(
+        np.stack(patches, axis=2),
+        (
+            batch_size,
+            groups,
+            in_channels * window_size,
+            int(np.prod(output_shape)),
+        ),
+    )
+    # Shape `(groups, out_channels // groups, in_channels * window_size)`.
+    kernel = np.reshape(
+        np.transpose(np.reshape(kernel, (window_size, in_channels, -1))),
+        (groups, out_channels // groups, in_channels * window_size),
+    )
+    outputs = np.matmul(kernel, patches)
+    return np.reshape(outputs, (batch_size, out_channels) + tuple(output_shape))
+
+
+def _pool(inputs, reduce_fn, pool_size, strides, padding, constant_value):
+    """Reduces each window of a channels-first input with `reduce_fn`.
+
+    The reduction is accumulated over the strided views of the input at
+    each window offset, which only needs memory for the output.
+    """
+    pads = _compute_padding(inputs.shape[2:], pool_size, strides, padding)
+    inputs = _pad_spatial(inputs, pads, constant_value)
+    outputs = None
+    for _, window in _windows(
+        inputs, pool_size, strides, (1,) * len(pool_size)
+    ):
+        outputs = window if outputs is None else reduce_fn(outputs, window)
+    return outputs
+
+
 def max_pool(
     inputs,
     pool_size,
@@ -189,15 +281,20 @@ def max_pool(
     data_format=None,
 ):
     data_format = backend.standardize_data_format(data_format)
+    inputs = convert_to_tensor(inputs)
     num_spatial_dims = inputs.ndim - 2
-    pool_size = _convert_to_spatial_operand(
-        pool_size, num_spatial_dims, data_format
-    )
+    pool_size = _convert_to_spatial_operand(pool_size, num_spatial_dims)
     strides = pool_size if strides is None else strides
-    strides = _convert_to_spatial_operand(
-        strides, num_spatial_dims, data_format
+    strides = _convert_to_spatial_operand(strides, num_spatial_dims)
+    outputs = _pool(
+        _to_channels_first(inputs, data_format),
+        np.maximum,
+        pool_size,
+        strides,
+        padding,
+        -np.inf,
     )
-    return _pool(inputs, -np.inf, lax.max, pool_size, strides, padding)
+    return _from_channels_first(outputs, data_format)
 
 
 def average_pool(
@@ -208,61 +305,29 @@ def average_pool(
     data_format=None,
 ):
     data_format = backend.standardize_data_format(data_format)
+    inputs = convert_to_tensor(inputs)
     num_spatial_dims = inputs.ndim - 2
-    pool_size = _convert_to_spatial_operand(
-        pool_size, num_spatial_dims, data_format
-    )
+    pool_size = _convert_to_spatial_operand(pool_size, num_spatial_dims)
     strides = pool_size if strides is None else strides
-    strides = _convert_to_spatial_operand(
-        strides, num_spatial_dims, data_format
-    )
+    strides = _convert_to_spatial_operand(strides, num_spatial_dims)
+    inputs = _to_channels_first(inputs, data_format)
 
-    pooled = _pool(inputs, 0.0, lax.add, pool_size, strides, padding)
+    pooled = _pool(inputs, np.add, pool_size, strides, padding, 0)
     if padding == "valid":
-        # Avoid the extra reduce_window.
-        return pooled / np.prod(pool_size)
+        outputs = pooled / np.prod(pool_size)
     else:
-        # Count the number of valid entries at each input point, then use that
-        # for computing average. Assumes that any two arrays of same shape will
-        # be padded the same. Avoid broadcasting on axis where pooling is
-        # skipped.
-        shape = [
-            (a if b != 1 else 1) for (a, b) in zip(inputs.shape, pool_size)
-        ]
+        # Count the number of valid entries in each window, which only
+        # depends on the spatial shape.
         window_counts = _pool(
-            np.ones(shape, inputs.dtype),
-            0.0,
-            lax.add,
+            np.ones((1, 1) + inputs.shape[2:], inputs.dtype),
+            np.add,
             pool_size,
             strides,
             padding,
+            0,
         )
-        return pooled / window_counts
-
-
-def _convert_to_lax_conv_dimension_numbers(
-    num_spatial_dims,
-    data_format="channels_last",
-    transpose=False,
-):
-    """Create a `lax.ConvDimensionNumbers` for the given inputs."""
-    num_dims = num_spatial_dims + 2
-
-    if data_format == "channels_last":
-        spatial_dims = tuple(range(1, num_dims - 1))
-        inputs_dn = (0, num_dims - 1) + spatial_dims
-    else:
-        spatial_dims = tuple(range(2, num_dims))
-        inputs_dn = (0, 1) + spatial_dims
-
-    if transpose:
-        kernel_dn = (num_dims - 2, num_dims - 1) + tuple(range(num_dims - 2))
-    else:
-        kernel_dn = (num_dims - 1, num_dims - 2) + tuple(range(num_dims - 2))
-
-    return lax.ConvDimensionNumbers(
-        lhs_spec=inputs_dn, rhs_spec=kernel_dn, out_spec=inputs_dn
-    )
+        outputs = pooled / window_counts
+    return _from_channels_first(outputs.astype(inputs.dtype), data_format)
 
 
 def conv(
@@ -274,24 +339,11 @@ def conv(
     dilation_rate=1,
 ):
     data_format = backend.standardize_data_format(data_format)
+    inputs = convert_to_tensor(inputs)
+    kernel = convert_to_tensor(kernel)
     num_spatial_dims = inputs.ndim - 2
-    dimension_numbers = _convert_to_lax_conv_dimension_numbers(
-        num_spatial_dims,
-        data_format,
-        transpose=False,
-    )
-    strides = _convert_to_spatial_operand(
-        strides,
-        num_spatial_dims,
-        data_format,
-        include_batch_and_channels=False,
-    )
-    dilation_rate = _convert_to_spatial_operand(
-        dilation_rate,
-        num_spatial_dims,
-        data_format,
-        include_batch_and_channels=False,
-    )
+    strides = _convert_to_spatial_operand(strides, num_spatial_dims)
+    dilation_rate = _convert_to_spatial_operand(dilation_rate, num_spatial_dims)
     if data_format == "channels_last":
         channels = inputs.shape[-1]
     else:
@@ -303,18 +355,21 @@ def conv(
             f"kernel's in_channels. Received input channels {channels} and "
             f"kernel in_channels {kernel_in_channels}. "
         )
-    feature_group_count = channels // kernel_in_channels
-    return np.array(
-        jax.lax.conv_general_dilated(
-            inputs,
-            kernel if is_tensor(kernel) else kernel.numpy(),
-            strides,
-            padding,
-            rhs_dilation=dilation_rate,
-            dimension_numbers=dimension_numbers,
-            feature_group_count=feature_group_count,
-        )
+    inputs = _to_channels_first(inputs, data_format)
+    window_shape = [
+        (size - 1) * rate + 1
+        for size, rate in zip(kernel.shape[:-2], dilation_rate)
+    ]
+    pads = _compute_padding(inputs.shape[2:], window_shape, strides, padding)
+    dtype = np.result_type(inputs.dtype, kernel.dtype)
+    outputs = _conv(
+        inputs.astype(dtype),
+        kernel.astype(dtype),
+        strides,
+        pads,
+        dilation_rate,
     )
+    return _from_channels_first(outputs, data_format)
 
 
 def depthwise_conv(
@@ -326,42 +381,48 @@ def depthwise_conv(
     dilation_rate=1,
 ):
     data_format = backend.standardize_data_format(data_format)
+    inputs = convert_to_tensor(inputs)
+    kernel = convert_to_tensor(kernel)
     num_spatial_dims = inputs.ndim - 2
-    dimension_numbers = _convert_to_lax_conv_dimension_numbers(
-        num_spatial_dims,
-        data_format,
-        transpose=False,
-    )
-    strides = _convert_to_spatial_operand(
+    strides = _convert_to_spatial_operand(strides, num_spatial_dims)
+    dilation_rate = _convert_to_spatial_operand(dilation_rate, num_spatial_dims)
+    inputs = _to_channels_first(inputs, data_format)
+    window_shape = kernel.shape[:-2]
+    channels, multiplier = kernel.shape[-2:]
+    pads = _compute_padding(
+        inputs.shape[2:],
+        [
+            (size - 1) * rate + 1
+            for size, rate in zip(window_shape, dilation_rate)
+        ],
         strides,
-        num_spatial_dims,
-        data_format,
-        include_batch_and_channels=False,
-    )
-    dilation_rate = _convert_to_spatial_operand(
-        dilation_rate,
-        num_spatial_dims,
-        data_format,
-        include_batch_and_channels=False,
-    )
-    feature_group_count = (
-        inputs.shape[-1] if data_format == "channels_last" else inputs.shape[1]
+        padding,
     )
+    dtype = np.result_type(inputs.dtype, kernel.dtype)
+    inputs = _pad_spatial(inputs.astype(dtype), pads)
+    # Shape `(*window_shape, channels, multiplier, 1, ..., 1)`, to broadcast
+    # against the `(batch, channels, 1, *output_shape)` windows.
     kernel = np.reshape(
-        kernel if is_tensor(kernel) else kernel.numpy(),
-        kernel.shape[:-2] + (1, feature_group_count * kernel.shape[-1]),
+        kernel.astype(dtype),
+        kernel.shape + (1,) * num_spatial_dims,
     )
-    return np.array(
-        jax.lax.conv_general_dilated(
-            inputs,
-            kernel,
-            strides,
-            padding,
-            rhs_dilation=dilation_rate,
-            dimension_numbers=dimension_numbers,
-            feature_group_count=feature_group_count,
-        )
+    # Each channel is convolved with its own filters, so the output is
+    # accumulated over the window offsets with broadcasted products rather
+    # than computed with a GEMM against a block-diagonal kernel.
+    outputs = None
+    for offset, window in _windows(
+        inputs, window_shape, strides, dilation_rate
+    ):
+        product = np.expand_dims(window, 2) * kernel[offset]
+        if outputs is None:
+            outputs = product
+        else:
+            outputs += product
+    outputs = np.reshape(
+        outputs,
+        outputs.shape[:1] + (channels * multiplier,) + outputs.shape[3:],
     )
+    return _from_channels_first(outputs, data_format)
 
 
 def separable_conv(
@@ -402,6 +463,8 @@ def conv_transpose(
     dilation_rate=1,
 ):
     data_format = backend.standardize_data_format(data_format)
+    inputs = convert_to_tensor(inputs)
+    kernel = convert_to_tensor(kernel)
     num_spatial_dims = inputs.ndim - 2
     padding_values = compute_conv_transpose_padding_args_for_jax(
         input_shape=inputs.shape,
@@ -411,35 +474,25 @@ def conv_transpose(
         output_padding=output_padding,
         dilation_rate=dilation_rate,
     )
-    dimension_numbers = _convert_to_lax_conv_dimension_numbers(
-        num_spatial_dims,
-        data_format,
-        transpose=False,
-    )
-    strides = _convert_to_spatial_operand(
-        strides,
-        num_spatial_dims,
-        data_format,
-        include_batch_and_channels=False,
+    strides = _convert_to_spatial_operand(strides, num_spatial_dims)
+    dilation_rate = _convert_to_spatial_operand(dilation_rate, num_spatial_dims)
+    # The transposed convolution is the convolution of the input, dilated
+    # by `strides`, with the spatially flipped kernel whose input and output
+    # channels are swapped.
+    dtype = np.result_type(inputs.dtype, kernel.dtype)
+    inputs = _dilate_spatial(
+        _to_channels_first(inputs, data_format).astype(dtype), strides
     )
-    dilation_rate = _convert_to_spatial_operand(
+    kernel = np.flip(kernel.astype(dtype), axis=tuple(range(num_spatial_dims)))
+    kernel = np.swapaxes(kernel, -1, -2)
+    outputs = _conv(
+        inputs,
+        kernel,
+        (1,) * num_spatial_dims,
+        padding_values,
         dilation_rate,
-        num_spatial_dims,
-        data_format,
-        include_batch_and_channels=False,
-    )
-
-    return np.array(
-        jax.lax.conv_transpose(
-            inputs,
-            kernel if is_tensor(kernel) else kernel.numpy(),
-            strides,
-            padding=padding_values,
-            rhs_dilation=dilation_rate,
-            dimension_numbers=dimension_numbers,
-            transpose_kernel=True,
-        )
     )
+    return _from_channels_first(outputs, data_format)
 
 
 def one_hot(x, num_classes, axis=-1, dtype="float32", sparse=False):
@@ -485,8 +538,8 @@ def multi_hot(x, num_classes, axis=-1, dtype="float32", sparse=False):
 
 
 def categorical_crossentropy(target, output, from_logits=False, axis=-1):
-    target = np.array(target)
-    output = np.array(output)
+    target = convert_to_tensor(target)
+    output = convert_to_tensor(output)
 
     if target.shape != output.shape:
         raise ValueError(
@@ -512,7 +565,7 @@ def categorical_crossentropy(target, output, from_logits=False, axis=-1):
 
 def sparse_categorical_crossentropy(target, output, from_logits=False, axis=-1):
     target = np.array(target, dtype="int32")
-    output = np.array(output)
+    output = convert_to_tensor(output)
     if len(target.shape) == len(output.shape) and target.shape[-1] == 1:
         target = np.squeeze(target, axis=-1)
 
@@ -539,8 +592,8 @@ def sparse_categorical_crossentropy(target, output, from_logits=False, axis=-1):
 
 
 def binary_crossentropy(target, output, from_logits=False):
-    target = np.array(target)
-    output = np.array(output)
+    target = convert_to_tensor(target)
+    output = convert_to_tensor(output)
 
     if target.shape != output.shape:
         raise ValueError(
@@ -981,3 +1034,96 @@ def psnr(x1, x2, max_val):
     mse = np.mean(np.square(x1 - x2))
     psnr = 20 * np.log10(max_val) - 10 * np.log10(mse)
     return psnr
+
+
+def _large_negative_number(dtype):
+    if backend.standardize_dtype(dtype) == "float16":
+        return -3e4
+    return -1e9
+
+
+def dot_product_attention(
+    query, key, value, bias=None, mask=None, scale=None, is_causal=False
+):
+    query = convert_to_tensor(query)
+    key = convert_to_tensor(key)
+    value = convert_to_tensor(value)
+    if bias is not None:
+        bias = convert_to_tensor(bias)
+    if mask is not None:
+        mask = convert_to_tensor(mask, dtype="bool")
+    return _dot_product_attention_blockwise(
+        query, key, value, bias, mask, scale, is_causal
+    )
+
+
+def _dot_product_attention_blockwise(
+    query, key, value, bias, mask, scale, is_causal, block_size=512
+):
+    """Computes the attention over blocks of `block_size` keys.
+
+    The softmax is computed online: the running maximum and sum of the
+    exponentials of the scores of each query are updated block by block, so
+    that the scores of only one block are materialized at a time.
+    """
+    output_dtype = query.dtype
+    compute_dtype = np.result_type(query.dtype, np.float32)
+    # (B, T, N, H) -> (B, N, T, H)
+    query = np.transpose(query, (0, 2, 1, 3)).astype(compute_dtype)
+    key = np.transpose(key, (0, 2, 1, 3)).astype(compute_dtype)
+    value = np.transpose(value, (0, 2, 1, 3)).astype(compute_dtype)
+    num_groups = query.shape[1] // key.shape[1]
+    if num_groups > 1:
+        key = np.repeat(key, num_groups, axis=1)
+        value = np.repeat(value, num_groups, axis=1)
+    if scale is None:
+        scale = 1.0 / math.sqrt(query.shape[-1])
+    query = query * np.array(scale, compute_dtype)
+    if bias is not None:
+        bias = bias.astype(compute_dtype)
+    large_negative = np.array(
+        _large_negative_number(output_dtype), compute_dtype
+    )
+
+    query_length, key_length = query.shape[2], key.shape[2]
+    maximum = None
+    for start in range(0, key_length, block_size):
+        stop = min(start + block_size, key_length)
+        scores = np.matmul(query, np.swapaxes(key[:, :, start:stop], -1, -2))
+        if bias is not None:
+            scores = scores + _key_block(bias, start, stop)
+        if mask is not None:
+            scores = np.where(
+                _key_block(mask, start, stop), scores, large_negative
+            )
+        if is_causal:
+            causal_mask = np.arange(query_length)[:, None] >= np.arange(
+                start, stop
+            )
+            scores = np.where(causal_mask, scores, large_negative)
+        block_maximum = np.max(scores, axis=-1, keepdims=True)
+        if maximum is None:
+            probabilities = np.exp(scores - block_maximum)
+            denominator = np.sum(probabilities, axis=-1, keepdims=True)
+            output = np.matmul(probabilities, value[:, :, start:stop])
+            maximum = block_maximum
+            continue
+        new_maximum = np.maximum(maximum, block_maximum)
+        probabilities = np.exp(scores - new_maximum)
+        correction = np.exp(maximum - new_maximum)
+        denominator = denominator * correction + np.sum(
+            probabilities, axis=-1, keepdims=True
+        )
+        output = output * correction + np.matmul(
+            probabilities, value[:, :, start:stop]
+        )
+        maximum = new_maximum
+    output = output / denominator
+    return np.transpose(output, (0, 2, 1, 3)).astype(output_dtype)
+
+
+def _key_block(x, start, stop):
+    """Slices a mask or bias broadcastable to `(B, N, T, S)` along `S`."""
+    if x.shape[-1] == 1:
+        return x
+    return x[..., start:stop]
@@ -1,12 +1,18 @@
+import warnings
+
 import numpy as np
 
 from keras.src import backend
 from keras.src import callbacks as callbacks_module
+from keras.src import optimizers as optimizers_module
 from keras.src import tree
 from keras.src.backend.common import standardize_dtype
 from keras.src.backend.common.keras_tensor import KerasTensor
+from keras.src.backend.numpy import autodiff
 from keras.src.backend.numpy.core import is_tensor
+from keras.src.trainers import predict_utils
 from keras.src.trainers import trainer as base_trainer
+from keras.src.trainers.data_adapters import array_slicing
 from keras.src.trainers.data_adapters import data_adapter_utils
 from keras.src.trainers.epoch_iterator import EpochIterator
 from keras.src.utils import traceback_utils
@@ -15,9 +21,67 @@ from keras.src.utils import traceback_utils
 class NumpyTrainer(base_trainer.Trainer):
     def __init__(self):
         super().__init__()
+        self.train_function = None
         self.test_function = None
         self.predict_function = None
 
+    def compute_loss_and_updates(
+        self, trainable_values, x, y, sample_weight, training=False
+    ):
+        """Computes the loss with the given values of the trainable weights.
+
+        The forward pass runs in a `StatelessScope`, so that it reads the
+        (traced) `trainable_values` instead of the variables. The scope also
+        collects the losses added by the forward pass for `compute_loss()`,
+        and is returned to apply the updates of non-trainable and metrics
+        variables afterwards.
+        """
+        state_mapping = list(zip(self.trainable_variables, trainable_values))
+        with backend.StatelessScope(
+            state_mapping=state_mapping, collect_losses=True
+        ) as scope:
+            if self._call_has_training_arg:
+                y_pred = self(x, training=training)
+            else:
+                y_pred = self(x)
+            loss = self.compute_loss(
+                x=x, y=y, y_pred=y_pred, sample_weight=sample_weight
+            )
+        unscaled_loss = loss
+        if training and self.optimizer is not None:
+            loss = self.optimizer.scale_loss(loss)
+        return loss, (unscaled_loss, y_pred, scope)
+
+    def train_step(self, data):
+        x, y, sample_weight = data_adapter_utils.unpack_x_y_sample_weight(data)
+        trainable_variables = self.trainable_variables
+        grad_fn = autodiff.value_and_grad(
+            self.compute_loss_and_updates, has_aux=True
+        )
+        (_, (loss, y_pred, scope)), grads = grad_fn(
+            [v.value for v in trainable_variables],
+            x,
+            y,
+            sample_weight,
+            training=True,
+        )
+
+        # Apply the updates made by the forward pass (e.g. moving statistics
+        # or seed generator states) and by `compute_loss()` to metrics.
+        for v in self.non_trainable_variables + self.metrics_variables:
+            new_v = scope.get_current_value(v)
+            if new_v is not None:
+                v.assign(autodiff.stop_gradient(new_v))
+
+        self._loss_tracker.update_state(
+            loss, sample_weight=tree.flatten(x)[0].shape[0]
+        )
+        if trainable_variables:
+            self.optimizer.apply(grads, trainable_variables)
+        else:
+            warnings.warn("The model does not have any trainable weights.")
+        return self.compute_metrics(x, y, y_pred, sample_weight=sample_weight)
+
     def test_step(self, data):
         (
             x,
@@ -44,6 +108,26 @@ class NumpyTrainer(base_trainer.Trainer):
             y_pred = self(x)
         return y_pred
 
+    def make_train_function(self, force=False):
+        if self.train_function is not None and not force:
+            return self.train_function
+
+        def one_train_step(data):
+            data = data[0]
+            return self.train_step(data)
+
+        def multi_train_steps(data):
+            for single_step_data in data:
+                logs = one_train_step([single_step_data])
+            return logs
+
+        if self.steps_per_execution > 1:
+            train_step = multi_train_steps
+        else:
+            train_step = one_train_step
+
+        self.train_function = train_step
+
     def make_test_function(self, force=False):
         if self.test_function is not None and not force:
             return self.test_function
@@ -74,10 +158,11 @@ class NumpyTrainer(base_trainer.Trainer):
 
         def multi_predict_steps(data):
             outputs = one_predict_step(data[:1])
+            outputs_spec = tree.structure_spec(outputs)
 
             for single_step_data in data[1:]:
                 step_outputs = one_predict_step([single_step_data])
-                outputs = tree.map_structure(
+                outputs = outputs_spec.map_structure(
                     lambda t1, t2: np.concatenate([t1, t2]),
                     outputs,
                     step_outputs,
@@ -153,12 +238,147 @@ class NumpyTrainer(base_trainer.Trainer):
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        prefetch=0,
     ):
-        raise NotImplementedError("fit not implemented for NumPy backend.")
+        self._assert_compile_called("fit")
+        # TODO: respect compiled trainable state
+        self._eval_epoch_iterator = None
+        if validation_split and validation_data is None:
+            # Create the validation data using the training data. Only supported
+            # for TF/numpy/jax arrays.
+            (
+                x,
+                y,
+                sample_weight,
+            ), validation_data = array_slicing.train_validation_split(
+                (x, y, sample_weight), validation_split=validation_split
+            )
+
+        if validation_data is not None:
+            (
+                val_x,
+                val_y,
+                val_sample_weight,
+            ) = data_adapter_utils.unpack_x_y_sample_weight(validation_data)
+
+        # Create an iterator that yields batches for one epoch.
+        epoch_iterator = EpochIterator(
+            x=x,
+            y=y,
+            sample_weight=sample_weight,
+            batch_size=batch_size,
+            steps_per_epoch=steps_per_epoch,
+            shuffle=shuffle,
+            class_weight=class_weight,
+            steps_per_execution=self.steps_per_execution,
+            prefetch=prefetch,
+        )
+
+        if not all(layer.built for layer in self._flatten_layers()) or (
+            self._compile_metrics is not None
+            and not self._compile_metrics.built
+        ):
+            # Build the model on one batch of data.
+            for _, data in epoch_iterator.enumerate_epoch():
+                data_batch = data[0]
+                self._symbolic_build(data_batch)
+                break
+        if self.optimizer is not None and not self.optimizer.built:
+            self.optimizer.build(self.trainable_variables)
+
+        # Container that configures and calls callbacks.
+        if not isinstance(callbacks, callbacks_module.CallbackList):
+            callbacks = callbacks_module.CallbackList(
+                callbacks,
+                add_history=True,
+                add_progbar=verbose != 0,
+                verbose=verbose,
+                epochs=epochs,
+                steps=epoch_iterator.num_batches,
+                model=self,
+            )
+
+        self.stop_training = False
+        self.make_train_function()
+        callbacks.on_train_begin()
+        training_logs = None
+        logs = None
+        initial_epoch = self._initial_epoch or initial_epoch
+        for epoch in range(initial_epoch, epochs):
+            self.reset_metrics()
+            callbacks.on_epoch_begin(epoch)
+            for step, data in epoch_iterator.enumerate_epoch():
+                # Callbacks
+                callbacks.on_train_batch_begin(step)
+
+                logs = self.train_function(data)
+                logs = self._pythonify_logs(logs)
+
+                # Callbacks
+                callbacks.on_train_batch_end(step, logs)
+                if self.stop_training:
+                    break
+
+            # Override with model metrics instead of last step logs if needed.
+            epoch_logs = dict(self._get_metrics_result_or_logs(logs))
+
+            # Run validation.
+            if validation_data is not None and self._should_eval(
+                epoch, validation_freq
+            ):
+                # Create EpochIterator for evaluation and cache it.
+                if getattr(self, "_eval_epoch_iterator", None) is None:
+                    self._eval_epoch_iterator = EpochIterator(
+                        x=val_x,
+                        y=val_y,
+                        sample_weight=val_sample_weight,
+                        batch_size=validation_batch_size or batch_size,
+                        steps_per_execution=self.steps_per_execution,
+                        steps_per_epoch=validation_steps,
+                        shuffle=False,
+                        prefetch=prefetch,
+                    )
+                val_logs = self.evaluate(
+                    x=val_x,
+                    y=val_y,
+                    sample_weight=val_sample_weight,
+                    batch_size=validation_batch_size or batch_size,
+                    steps=validation_steps,
+                    callbacks=callbacks,
+                    return_dict=True,
+                    _use_cached_eval_dataset=True,
+                )
+                val_logs = {
+                    "val_" + name: val for name, val in val_logs.items()
+                }
+                epoch_logs.update(val_logs)
+
+            callbacks.on_epoch_end(epoch, epoch_logs)
+            training_logs = epoch_logs
+            if self.stop_training:
+                break
+
+        if (
+            isinstance(self.optimizer, optimizers_module.Optimizer)
+            and epochs > 0
+        ):
+            self.optimizer.finalize_variable_values(self.trainable_weights)
+
+        # If _eval_epoch_iterator exists, delete it after all epochs are done.
+        if getattr(self, "_eval_epoch_iterator", None) is not None:
+            del self._eval_epoch_iterator
+        callbacks.on_train_end(logs=training_logs)
+        return self.history
 
     @traceback_utils.filter_traceback
     def predict(
-        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+        self,
+        x,
+        batch_size=None,
+        verbose="auto",
+        steps=None,
+        callbacks=None,
+        output_path=None,
     ):
         # Create an iterator that yields batches of input data.
         epoch_iterator = EpochIterator(
@@ -181,34 +401,24 @@ class NumpyTrainer(base_trainer.Trainer):
                 model=self,
             )
 
-        def append_to_outputs(batch_outputs, outputs):
-            if outputs is None:
-                outputs = tree.map_structure(
-                    lambda batch_output: [batch_output],
-                    batch_outputs,
-                )
-            else:
-                tree.map_structure_up_to(
-                    batch_outputs,
-                    lambda output, batch_output: output.append(batch_output),
-                    outputs,
-                    batch_outputs,
-                )
-            return outputs
-
         self.make_predict_function()
         self.stop_predicting = False
         callbacks.on_predict_begin()
-        outputs = None
+        outputs = predict_utils.PredictOutputs(
+            num_batches=predict_utils.num_executions(
+                epoch_iterator.num_batches, self.steps_per_execution
+            ),
+            output_path=output_path,
+        )
         for step, data in epoch_iterator.enumerate_epoch():
             callbacks.on_predict_batch_begin(step)
             batch_outputs = self.predict_function(data)
-            outputs = append_to_outputs(batch_outputs, outputs)
+            outputs.append(batch_outputs)
             callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
             if self.stop_predicting:
                 break
         callbacks.on_predict_end()
-        return tree.map_structure_up_to(batch_outputs, np.concatenate, outputs)
+        return outputs.result()
 
     @traceback_utils.filter_traceback
     def evaluate(
@@ -280,6 +490,47 @@ class NumpyTrainer(base_trainer.Trainer):
             return logs
         return self._flatten_metrics_in_order(logs)
 
+    def predict_iter(
+        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+    ):
+        # Create an iterator that yields batches of input data.
+        epoch_iterator = EpochIterator(
+            x=x,
+            batch_size=batch_size,
+            steps_per_epoch=steps,
+            shuffle=False,
+            steps_per_execution=self.steps_per_execution,
+        )
+
+        # Container that configures and calls callbacks.
+        if not isinstance(callbacks, callbacks_module.CallbackList):
+            callbacks = callbacks_module.CallbackList(
+                callbacks,
+                add_history=True,
+                add_progbar=verbose != 0,
+                verbose=verbose,
+                epochs=1,
+                steps=epoch_iterator.num_batches,
+                model=self,
+            )
+
+        self.make_predict_function()
+        return self._predict_iter(epoch_iterator, callbacks)
+
+    def _predict_iter(self, epoch_iterator, callbacks):
+        self.stop_predicting = False
+        callbacks.on_predict_begin()
+        try:
+            for step, data in epoch_iterator.enumerate_epoch():
+                callbacks.on_predict_batch_begin(step)
+                batch_outputs = self.predict_function(data)
+                callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
+                yield batch_outputs
+                if self.stop_predicting:
+                    break
+        finally:
+            callbacks.on_predict_end()
+
     def train_on_batch(
         self,
         x,
@@ -288,9 +539,32 @@ class NumpyTrainer(base_trainer.Trainer):
         class_weight=None,
         return_dict=False,
     ):
-        raise NotImplementedError(
-            "train_on_batch not implemented for NumPy backend."
-        )
+        self._assert_compile_called("train_on_batch")
+        if class_weight is not None:
+            if sample_weight is not None:
+                raise ValueError(
+                    "Arguments `sample_weight` and `class_weight` "
+                    "cannot be specified at the same time. "
+                    f"Received: sample_weight={sample_weight}, "
+                    f"class_weight={class_weight}"
+                )
+            sample_weight = data_adapter_utils.class_weight_to_sample_weights(
+                y, class_weight
+            )
+
+        data = (x, y, sample_weight)
+
+        # Maybe build model
+        self._symbolic_build(data)
+        if self.optimizer is not None and not self.optimizer.built:
+            self.optimizer.build(self.trainable_variables)
+        self.make_train_function()
+
+        logs = self.train_function([data])
+        logs = tree.map_structure(lambda x: np.array(x), logs)
+        if return_dict:
+            return logs
+        return self._flatten_metrics_in_order(logs)
 
     def test_on_batch(
         self,
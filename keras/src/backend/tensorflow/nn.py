@@ -884,3 +884,108 @@ def psnr(x1, x2, max_val):
     mse = tf.reduce_mean(tf.square(x1 - x2))
     psnr = 20 * log10(max_val) - 10 * log10(mse)
     return psnr
+
+
+def _large_negative_number(dtype):
+    if backend.standardize_dtype(dtype) == "float16":
+        return -3e4
+    return -1e9
+
+
+def dot_product_attention(
+    query, key, value, bias=None, mask=None, scale=None, is_causal=False
+):
+    query = convert_to_tensor(query)
+    key = convert_to_tensor(key)
+    value = convert_to_tensor(value)
+    if bias is not None:
+        bias = convert_to_tensor(bias)
+    if mask is not None:
+        mask = convert_to_tensor(mask, dtype="bool")
+    return _dot_product_attention_blockwise(
+        query, key, value, bias, mask, scale, is_causal
+    )
+
+
+def _dot_product_attention_blockwise(
+    query, key, value, bias, mask, scale, is_causal, block_size=512
+):
+    """Computes the attention over blocks of `block_size` keys.
+
+    The softmax is computed online: the running maximum and sum of the
+    exponentials of the scores of each query are updated block by block, so
+    that the scores of only one block are materialized at a time. The keys
+    are processed in a single block when their length is not static.
+    """
+    output_dtype = query.dtype
+    compute_dtype = (
+        tf.float32
+        if output_dtype in (tf.float16, tf.bfloat16)
+        else output_dtype
+    )
+    # (B, T, N, H) -> (B, N, T, H)
+    query = tf.cast(tf.transpose(query, (0, 2, 1, 3)), compute_dtype)
+    key = tf.cast(tf.transpose(key, (0, 2, 1, 3)), compute_dtype)
+    value = tf.cast(tf.transpose(value, (0, 2, 1, 3)), compute_dtype)
+    num_groups = query.shape[1] // key.shape[1]
+    if num_groups > 1:
+        key = tf.repeat(key, num_groups, axis=1)
+        value = tf.repeat(value, num_groups, axis=1)
+    if scale is None:
+        scale = 1.0 / math.sqrt(query.shape[-1])
+    query = query * tf.cast(scale, compute_dtype)
+    if bias is not None:
+        bias = tf.cast(bias, compute_dtype)
+    large_negative = tf.constant(
+        _large_negative_number(output_dtype), compute_dtype
+    )
+
+    key_length = key.shape[2]
+    if key_length is None:
+        key_length = tf.shape(key)[2]
+        block_size = key_length
+        starts = [0]
+    else:
+        starts = range(0, key_length, block_size)
+    maximum = None
+    for start in starts:
+        stop = tf.minimum(start + block_size, key_length)
+        scores = tf.matmul(query, key[:, :, start:stop], transpose_b=True)
+        if bias is not None:
+            scores = scores + _key_block(bias, start, stop)
+        if mask is not None:
+            scores = tf.where(
+                _key_block(mask, start, stop), scores, large_negative
+            )
+        if is_causal:
+            query_positions = tf.range(tf.shape(query)[2])[:, None]
+            key_positions = tf.range(start, stop)[None, :]
+            scores = tf.where(
+                query_positions >= key_positions, scores, large_negative
+            )
+        block_maximum = tf.reduce_max(scores, axis=-1, keepdims=True)
+        if maximum is None:
+            probabilities = tf.exp(scores - block_maximum)
+            denominator = tf.reduce_sum(probabilities, axis=-1, keepdims=True)
+            output = tf.matmul(probabilities, value[:, :, start:stop])
+            maximum = block_maximum
+            continue
+        new_maximum = tf.maximum(maximum, block_maximum)
+        probabilities = tf.exp(scores - new_maximum)
+        correction = tf.exp(maximum - new_maximum)
+        denominator = denominator * correction + tf.reduce_sum(
+            probabilities, axis=-1, keepdims=True
+        )
+        output = output * correction + tf.matmul(
+            probabilities, value[:, :, start:stop]
+        )
+        maximum = new_maximum
+    output = output / denominator
+    return tf.cast(tf.transpose(output, (0, 2, 1, 3)), output_dtype)
+
+
+def _key_block(x, start, stop):
+    """Slices a mask or bias broadcastable to `(B, N, T, S)` along `S`."""
+    if x.shape[-1] == 1:
+        return x
+    return x[..., start:stop]
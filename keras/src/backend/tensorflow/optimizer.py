@@ -3,6 +3,7 @@ import warnings
 import tensorflow as tf
 
 from keras.src import backend
+from keras.src import random
 from keras.src.backend.common import KerasVariable
 from keras.src.backend.tensorflow.trackable import KerasAutoTrackable
 from keras.src.optimizers import base_optimizer
@@ -139,6 +140,62 @@ class TFOptimizer(KerasAutoTrackable, base_optimizer.BaseOptimizer):
                 group=False,
             )
 
+    def _backend_sparse_update_step(
+        self, grads, indices, trainable_variables, learning_rate
+    ):
+        trainable_variables = [
+            v.value if isinstance(v, backend.Variable) else v
+            for v in trainable_variables
+        ]
+        grads = [
+            tf.IndexedSlices(grad, var_indices, tf.shape(var, tf.int64))
+            for grad, var_indices, var in zip(
+                grads, indices, trainable_variables
+            )
+        ]
+        tf.__internal__.distribute.interim.maybe_merge_call(
+            self._distributed_tf_sparse_update_step,
+            self._distribution_strategy,
+            list(zip(grads, trainable_variables)),
+            learning_rate,
+        )
+
+    def _distributed_tf_sparse_update_step(
+        self, distribution, grads_and_vars, learning_rate
+    ):
+        grads_and_vars = self._all_reduce_sum_gradients(grads_and_vars)
+
+        def apply_grad_to_update_var(var, grad, learning_rate):
+            # The all-reduced rows of the replicas may overlap.
+            indices, grad = self._row_sparse_gradient(grad)
+            return self.sparse_update_step(grad, indices, var, learning_rate)
+
+        for grad, var in grads_and_vars:
+            distribution.extended.update(
+                var,
+                apply_grad_to_update_var,
+                args=(grad, learning_rate),
+                group=False,
+            )
+
+    def _row_sparse_gradient(self, gradient):
+        if not isinstance(gradient, tf.IndexedSlices):
+            return super()._row_sparse_gradient(gradient)
+        # Sum the values of duplicate indices.
+        indices, positions = tf.unique(gradient.indices)
+        values = tf.math.unsorted_segment_sum(
+            gradient.values, positions, tf.shape(indices)[0]
+        )
+        return indices, values
+
+    def _gather_rows(self, variable, indices):
+        if isinstance(variable, KerasVariable):
+            variable = variable.value
+        return tf.gather(variable, indices)
+
+    def _scatter_rows(self, variable, indices, values):
+        self.assign(variable, tf.IndexedSlices(values, indices))
+
     def _all_reduce_sum_gradients(self, grads_and_vars):
         """Returns all-reduced gradients aggregated via summation.
 
@@ -217,6 +274,44 @@ class TFOptimizer(KerasAutoTrackable, base_optimizer.BaseOptimizer):
             accumulators,
         )
 
+    def _backend_increment_flat_gradient_accumulators(
+        self, grads, trainable_variables
+    ):
+        def assign_accumulator(var, value):
+            var.assign(value)
+
+        values = self._accumulate_flat_gradients(grads, trainable_variables)
+        accumulators = [v.value for v in self._gradient_accumulator_buffers]
+
+        def _distributed_tf_assign_grad_acc(distribution, values, accumulators):
+            for value, var in zip(values, accumulators):
+                distribution.extended.update(
+                    var, assign_accumulator, args=(value,), group=False
+                )
+
+        tf.__internal__.distribute.interim.maybe_merge_call(
+            _distributed_tf_assign_grad_acc,
+            self._distribution_strategy,
+            values,
+            accumulators,
+        )
+
+    def _stochastic_round(self, x, dtype):
+        if backend.standardize_dtype(dtype) != "bfloat16":
+            return super()._stochastic_round(x, dtype)
+        # `bfloat16` values are the upper 16 bits of `float32` values. Adding
+        # random lower bits before truncating them rounds up with a
+        # probability proportional to the truncated bits.
+        bits = tf.bitcast(x, tf.int32) + random.randint(
+            tf.shape(x),
+            0,
+            1 << 16,
+            dtype="int32",
+            seed=self._gradient_accumulator_seed_generator,
+        )
+        bits = tf.bitwise.bitwise_and(bits, -(1 << 16))
+        return tf.cast(tf.bitcast(bits, tf.float32), dtype)
+
     def _clip_by_norm(self, values, axes=None):
         # We need to use TF-specific OP to support the case,
         # when `values` are `tf.IndexedSlices`.
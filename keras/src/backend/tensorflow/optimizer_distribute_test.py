@@ -193,3 +193,26 @@ class OptimizerDistributeTest(testing.TestCase):
                 optimizer._accumulated_gradients[0], [[0.0, 0.0], [0.0, 0.0]]
             )
             self.assertAllClose(optimizer.iterations, 3)
+
+    def test_flat_gradient_accumulation(self):
+        with self.strategy.scope():
+            v = backend.Variable([[1.0, 2.0], [3.0, 4.0]])
+            grads = backend.convert_to_tensor([[1.0, 1.0], [2.0, 2.0]])
+            optimizer = SGD(
+                learning_rate=1.0,
+                gradient_accumulation_steps=2,
+                flat_gradient_accumulators=True,
+                gradient_accumulators_dtype="bfloat16",
+            )
+            self.strategy.run(lambda: optimizer.apply_gradients([(grads, v)]))
+            self.assertAllClose(v, [[1.0, 2.0], [3.0, 4.0]])
+            self.assertAllClose(
+                optimizer._gradient_accumulator_buffers[0],
+                [1.0, 1.0, 2.0, 2.0],
+            )
+            self.strategy.run(lambda: optimizer.apply_gradients([(grads, v)]))
+            self.assertAllClose(v, [[0.0, 1.0], [1.0, 2.0]])
+            self.assertAllClose(
+                optimizer._gradient_accumulator_buffers[0],
+                [0.0, 0.0, 0.0, 0.0],
+            )
@@ -9,6 +9,7 @@ from keras.src import callbacks as callbacks_module
 from keras.src import metrics as metrics_module
 from keras.src import optimizers as optimizers_module
 from keras.src import tree
+from keras.src.trainers import predict_utils
 from keras.src.trainers import trainer as base_trainer
 from keras.src.trainers.data_adapters import array_slicing
 from keras.src.trainers.data_adapters import data_adapter_utils
@@ -252,6 +253,7 @@ class TensorFlowTrainer(base_trainer.Trainer):
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        prefetch=0,
     ):
         self._assert_compile_called("fit")
         # TODO: respect compiled trainable state
@@ -285,6 +287,7 @@ class TensorFlowTrainer(base_trainer.Trainer):
             class_weight=class_weight,
             distribute_strategy=self.distribute_strategy,
             steps_per_execution=self.steps_per_execution,
+            prefetch=prefetch,
         )
 
         # Container that configures and calls callbacks.
@@ -335,6 +338,7 @@ class TensorFlowTrainer(base_trainer.Trainer):
                         steps_per_execution=self.steps_per_execution,
                         steps_per_epoch=validation_steps,
                         shuffle=False,
+                        prefetch=prefetch,
                     )
                 val_logs = self.evaluate(
                     x=val_x,
@@ -436,7 +440,13 @@ class TensorFlowTrainer(base_trainer.Trainer):
 
     @traceback_utils.filter_traceback
     def predict(
-        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+        self,
+        x,
+        batch_size=None,
+        verbose="auto",
+        steps=None,
+        callbacks=None,
+        output_path=None,
     ):
         # Create an iterator that yields batches of input data.
         epoch_iterator = TFEpochIterator(
@@ -460,21 +470,6 @@ class TensorFlowTrainer(base_trainer.Trainer):
                 model=self,
             )
 
-        def append_to_outputs(batch_outputs, outputs):
-            if outputs is None:
-                outputs = tree.map_structure(
-                    lambda batch_output: [batch_output],
-                    batch_outputs,
-                )
-            else:
-                tree.map_structure_up_to(
-                    batch_outputs,
-                    lambda output, batch_output: output.append(batch_output),
-                    outputs,
-                    batch_outputs,
-                )
-            return outputs
-
         def get_data(iterator):
             """Returns data for the next execution."""
             data = []
@@ -496,21 +491,93 @@ class TensorFlowTrainer(base_trainer.Trainer):
         self.make_predict_function()
         self.stop_predicting = False
         callbacks.on_predict_begin()
-        outputs = None
+        outputs = predict_utils.PredictOutputs(
+            num_batches=predict_utils.num_executions(
+                epoch_iterator.num_batches, self.steps_per_execution
+            ),
+            output_path=output_path,
+            convert_fn=_convert_output,
+            concat_fn=_concat_outputs,
+        )
         with epoch_iterator.catch_stop_iteration():
             for step, iterator in epoch_iterator.enumerate_epoch():
                 callbacks.on_predict_batch_begin(step)
                 data = get_data(iterator)
                 batch_outputs = self.predict_function(data)
-                outputs = append_to_outputs(batch_outputs, outputs)
+                outputs.append(batch_outputs)
                 callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
                 if self.stop_predicting:
                     break
         callbacks.on_predict_end()
-        outputs = tree.map_structure_up_to(
-            batch_outputs, potentially_ragged_concat, outputs
+        return outputs.result()
+
+    def predict_iter(
+        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+    ):
+        # Create an iterator that yields batches of input data.
+        epoch_iterator = TFEpochIterator(
+            x=x,
+            batch_size=batch_size,
+            steps_per_epoch=steps,
+            shuffle=False,
+            distribute_strategy=self.distribute_strategy,
+            steps_per_execution=self.steps_per_execution,
         )
-        return tree.map_structure(convert_to_np_if_not_ragged, outputs)
+
+        # Container that configures and calls callbacks.
+        if not isinstance(callbacks, callbacks_module.CallbackList):
+            callbacks = callbacks_module.CallbackList(
+                callbacks,
+                add_history=True,
+                add_progbar=verbose != 0,
+                verbose=verbose,
+                epochs=1,
+                steps=epoch_iterator.num_batches,
+                model=self,
+            )
+
+        self.make_predict_function()
+        return self._predict_iter(epoch_iterator, callbacks)
+
+    def _predict_iter(self, epoch_iterator, callbacks):
+        def get_data(iterator):
+            """Returns data for the next execution."""
+            data = []
+            for _ in range(self.steps_per_execution):
+                try:
+                    single_step_data = next(iterator)
+                except (StopIteration, tf.errors.OutOfRangeError) as e:
+                    if len(data) > 0:
+                        # Suppress the error when still have remaining data.
+                        return data
+                    # Re-raise the error for
+                    # TFEpochIterator.catch_stop_iteration() to catch when
+                    # no data left.
+                    raise e
+                data.append(single_step_data)
+            return data
+
+        self.stop_predicting = False
+        callbacks.on_predict_begin()
+        outputs_spec = None
+        try:
+            with epoch_iterator.catch_stop_iteration():
+                for step, iterator in epoch_iterator.enumerate_epoch():
+                    callbacks.on_predict_batch_begin(step)
+                    data = get_data(iterator)
+                    batch_outputs = self.predict_function(data)
+                    callbacks.on_predict_batch_end(
+                        step, {"outputs": batch_outputs}
+                    )
+                    if outputs_spec is None:
+                        outputs_spec = tree.structure_spec(batch_outputs)
+                    yield outputs_spec.map_structure(
+                        _convert_output, batch_outputs
+                    )
+                    if self.stop_predicting:
+                        break
+        finally:
+            callbacks.on_predict_end()
 
     def train_on_batch(
         self,
@@ -623,6 +690,8 @@ class TFEpochIterator(EpochIterator):
         super().__init__(*args, **kwargs)
         self._distribute_strategy = distribute_strategy
         dataset = self._get_iterator()
+        if self.prefetch and isinstance(dataset, tf.data.Dataset):
+            dataset = dataset.prefetch(self.prefetch)
         if not isinstance(dataset, tf.distribute.DistributedDataset):
             dataset = self._distribute_strategy.experimental_distribute_dataset(
                 dataset
@@ -864,6 +933,20 @@ def convert_to_np_if_not_ragged(x):
     return x.numpy()
 
 
+def _convert_output(x):
+    if isinstance(x, (tf.RaggedTensor, tf.SparseTensor)):
+        return x
+    return x.numpy()
+
+
+def _concat_outputs(outputs):
+    outputs = [
+        tf.convert_to_tensor(x) if isinstance(x, np.ndarray) else x
+        for x in outputs
+    ]
+    return convert_to_np_if_not_ragged(potentially_ragged_concat(outputs))
+
+
 def potentially_ragged_concat(tensors):
     """Concats `Tensor`s along their first dimension.
 
@@ -866,3 +866,67 @@ def psnr(x1, x2, max_val):
     mse = torch.mean((x1 - x2) ** 2)
     psnr = 20 * torch.log10(max_val) - 10 * torch.log10(mse)
     return psnr
+
+
+def _large_negative_number(dtype):
+    if dtype == torch.float16:
+        return -3e4
+    return -1e9
+
+
+def dot_product_attention(
+    query, key, value, bias=None, mask=None, scale=None, is_causal=False
+):
+    query = convert_to_tensor(query)
+    key = convert_to_tensor(key)
+    value = convert_to_tensor(value)
+    # (B, T, N, H) -> (B, N, T, H)
+    query = torch.transpose(query, 1, 2)
+    key = torch.transpose(key, 1, 2)
+    value = torch.transpose(value, 1, 2)
+    num_groups = query.shape[1] // key.shape[1]
+    if num_groups > 1:
+        key = torch.repeat_interleave(key, num_groups, dim=1)
+        value = torch.repeat_interleave(value, num_groups, dim=1)
+
+    # The mask, the bias and the causal mask are merged into an additive mask.
+    # Masked scores get a large negative value rather than `-inf`, so that
+    # fully masked rows do not produce NaNs.
+    attn_mask = None
+    if bias is not None:
+        attn_mask = convert_to_tensor(bias, dtype=query.dtype)
+    if mask is not None or (is_causal and attn_mask is not None):
+        if mask is None:
+            mask = torch.ones((), dtype=torch.bool, device=query.device)
+        else:
+            mask = convert_to_tensor(mask, dtype="bool")
+        if is_causal:
+            causal_mask = torch.ones(
+                (query.shape[2], key.shape[2]),
+                dtype=torch.bool,
+                device=query.device,
+            ).tril()
+            mask = torch.logical_and(mask, causal_mask)
+            is_causal = False
+        large_negative = torch.tensor(
+            _large_negative_number(query.dtype),
+            dtype=query.dtype,
+            device=query.device,
+        )
+        if attn_mask is None:
+            attn_mask = torch.where(mask, 0.0, large_negative)
+        else:
+            attn_mask = torch.where(mask, attn_mask, large_negative)
+    if attn_mask is not None:
+        attn_mask = attn_mask.reshape(
+            (1,) * (4 - attn_mask.ndim) + attn_mask.shape
+        )
+    output = tnn.scaled_dot_product_attention(
+        query,
+        key,
+        value,
+        attn_mask=attn_mask,
+        is_causal=is_causal,
+        scale=scale,
+    )
+    return torch.transpose(output, 1, 2)
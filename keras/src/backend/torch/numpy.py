@@ -708,6 +708,9 @@ def isclose(x1, x2):
 
 def isfinite(x):
     x = convert_to_tensor(x)
+    if x.is_sparse:
+        # E.g. the sparse gradients of variables with `sparse_updates`.
+        x = x.to_dense()
     return torch.isfinite(x)
 
 
@@ -1275,6 +1278,12 @@ def swapaxes(x, axis1, axis2):
 
 
 def take(x, indices, axis=None):
+    # The gradient of variables with `sparse_updates` is a sparse tensor
+    # holding the rows that are looked up. Inductor can't compile sparse
+    # embedding lookups, so they are dense in compiled functions.
+    sparse = (
+        getattr(x, "sparse_updates", False) and not torch._dynamo.is_compiling()
+    )
     x = convert_to_tensor(x)
     indices = convert_to_tensor(indices).long()
     # Correct the indices using "fill" mode which is the same as in jax
@@ -1286,7 +1295,7 @@ def take(x, indices, axis=None):
     )
     if x.ndim == 2 and axis == 0:
         # This case is equivalent to embedding lookup.
-        return torch.nn.functional.embedding(indices, x)
+        return torch.nn.functional.embedding(indices, x, sparse=sparse)
     if axis is None:
         x = torch.reshape(x, (-1,))
         axis = 0
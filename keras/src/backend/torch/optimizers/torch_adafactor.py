@@ -0,0 +1,95 @@
+import torch
+
+from keras.src import ops
+from keras.src import optimizers
+from keras.src.backend.torch.optimizers import torch_parallel_optimizer
+
+
+class Adafactor(
+    torch_parallel_optimizer.TorchParallelOptimizer, optimizers.Adafactor
+):
+    def _parallel_update_step(
+        self,
+        grads,
+        variables,
+        learning_rate,
+    ):
+        keras_variables = variables
+        variables = torch_parallel_optimizer._values(variables)
+        grads = [ops.cast(g, v.dtype) for g, v in zip(grads, variables)]
+
+        dtype = variables[0].dtype
+        lr = ops.cast(learning_rate, dtype)
+        epsilon_2 = ops.cast(self.epsilon_2, dtype)
+        local_step = ops.cast(self.iterations + 1, dtype)
+        if not callable(self._learning_rate) and self.relative_step:
+            lr = ops.minimum(lr, 1 / ops.sqrt(local_step))
+
+        rho_t = ops.minimum(lr, 1 / ops.sqrt(local_step))
+        beta_2_t = 1 - ops.power(local_step, self.beta_2_decay)
+
+        indices = [self._get_variable_index(v) for v in keras_variables]
+        v_list = torch_parallel_optimizer._values([self._v[i] for i in indices])
+        regulated_grads_square = torch._foreach_mul(grads, grads)
+        torch._foreach_add_(regulated_grads_square, self.epsilon_1)
+
+        # The second moments of variables with 2 dimensions or more are
+        # factored into `r` (rows) and `c` (columns), which are reduced per
+        # variable. The other variables use the full second moment `v`.
+        factored = [i for i, v in enumerate(variables) if len(v.shape) >= 2]
+        if factored:
+            r_list = torch_parallel_optimizer._values(
+                [self._r[indices[i]] for i in factored]
+            )
+            c_list = torch_parallel_optimizer._values(
+                [self._c[indices[i]] for i in factored]
+            )
+            squares = [regulated_grads_square[i] for i in factored]
+            torch._foreach_mul_(r_list, beta_2_t)
+            torch._foreach_add_(
+                r_list,
+                torch._foreach_mul(
+                    [square.mean(dim=-1) for square in squares], 1 - beta_2_t
+                ),
+            )
+            torch._foreach_mul_(c_list, beta_2_t)
+            torch._foreach_add_(
+                c_list,
+                torch._foreach_mul(
+                    [square.mean(dim=-2) for square in squares], 1 - beta_2_t
+                ),
+            )
+            torch._foreach_copy_(
+                [v_list[i] for i in factored],
+                [
+                    torch.unsqueeze(r / r.mean(dim=-1, keepdim=True), -1)
+                    * torch.unsqueeze(c, -2)
+                    for r, c in zip(r_list, c_list)
+                ],
+            )
+        not_factored = [i for i, v in enumerate(variables) if len(v.shape) < 2]
+        if not_factored:
+            vs = [v_list[i] for i in not_factored]
+            torch._foreach_mul_(vs, beta_2_t)
+            torch._foreach_add_(
+                vs,
+                torch._foreach_mul(
+                    [regulated_grads_square[i] for i in not_factored],
+                    1 - beta_2_t,
+                ),
+            )
+
+        u_list = torch._foreach_div(grads, torch._foreach_sqrt(v_list))
+        # Root mean squares of the variables and updates, as norms scaled by
+        # the square roots of the sizes.
+        sqrt_sizes = torch.sqrt(
+            torch.tensor(
+                [v.numel() for v in variables], dtype=dtype, device=lr.device
+            )
+        )
+        variables_rms = torch.stack(torch._foreach_norm(variables)) / sqrt_sizes
+        u_rms = torch.stack(torch._foreach_norm(u_list)) / sqrt_sizes
+        alpha_t = torch.maximum(epsilon_2, variables_rms) * rho_t
+        scales = alpha_t / torch.clamp_min(u_rms / self.clip_threshold, 1.0)
+        torch._foreach_mul_(u_list, scales.unbind())
+        torch._foreach_sub_(variables, u_list)
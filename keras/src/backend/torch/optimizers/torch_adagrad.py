@@ -14,24 +14,20 @@ class Adagrad(
         variables,
         learning_rate,
     ):
-        keras_variables = variables
-        variables = [v.value for v in variables]
-
         dtype = variables[0].dtype
         lr = ops.cast(learning_rate, dtype)
 
-        accumulators = [
-            self._accumulators[self._get_variable_index(variable)].value
-            for variable in keras_variables
-        ]
-        torch._foreach_add_(accumulators, torch._foreach_mul(grads, grads))
-        torch._foreach_add_(
-            variables,
-            torch._foreach_div(
-                torch._foreach_mul(grads, lr),
-                torch._foreach_sqrt(
-                    torch._foreach_add(accumulators, self.epsilon)
+        for variables, grads, accumulators in self._update_groups(
+            grads, variables, self._accumulators
+        ):
+            torch._foreach_add_(accumulators, torch._foreach_mul(grads, grads))
+            torch._foreach_add_(
+                variables,
+                torch._foreach_div(
+                    torch._foreach_mul(grads, lr),
+                    torch._foreach_sqrt(
+                        torch._foreach_add(accumulators, self.epsilon)
+                    ),
                 ),
-            ),
-            alpha=-1,
-        )
+                alpha=-1,
+            )
@@ -12,9 +12,6 @@ class Adam(torch_parallel_optimizer.TorchParallelOptimizer, optimizers.Adam):
         variables,
         learning_rate,
     ):
-        keras_variables = variables
-        variables = [v.value for v in variables]
-
         dtype = variables[0].dtype
         lr = ops.cast(learning_rate, dtype)
         local_step = ops.cast(self.iterations + 1, dtype)
@@ -23,36 +20,31 @@ class Adam(torch_parallel_optimizer.TorchParallelOptimizer, optimizers.Adam):
         beta_2_power = ops.power(ops.cast(self.beta_2, dtype), local_step)
         alpha = lr * ops.sqrt(1 - beta_2_power) / (1 - beta_1_power)
 
-        m_list = [
-            self._momentums[self._get_variable_index(variable)].value
-            for variable in keras_variables
-        ]
-        v_list = [
-            self._velocities[self._get_variable_index(variable)].value
-            for variable in keras_variables
-        ]
-
-        torch._foreach_mul_(m_list, self.beta_1)
-        torch._foreach_add_(m_list, grads, alpha=1 - self.beta_1)
-
-        torch._foreach_mul_(v_list, self.beta_2)
-        torch._foreach_add_(
-            v_list, torch._foreach_mul(grads, grads), alpha=1 - self.beta_2
-        )
-
+        slots = [self._momentums, self._velocities]
         if self.amsgrad:
-            v_hat_list = [
-                self._velocity_hats[self._get_variable_index(variable)].value
-                for variable in keras_variables
-            ]
-            torch._foreach_maximum_(v_hat_list, v_list)
-            v_list = v_hat_list
-
-        torch._foreach_add_(
-            variables,
-            torch._foreach_div(
-                torch._foreach_mul(m_list, alpha),
-                torch._foreach_add(torch._foreach_sqrt(v_list), self.epsilon),
-            ),
-            alpha=-1,
-        )
+            slots.append(self._velocity_hats)
+        groups = self._update_groups(grads, variables, *slots)
+        for variables, grads, m_list, v_list, *v_hat_lists in groups:
+            torch._foreach_mul_(m_list, self.beta_1)
+            torch._foreach_add_(m_list, grads, alpha=1 - self.beta_1)
+
+            torch._foreach_mul_(v_list, self.beta_2)
+            torch._foreach_add_(
+                v_list, torch._foreach_mul(grads, grads), alpha=1 - self.beta_2
+            )
+
+            if self.amsgrad:
+                (v_hat_list,) = v_hat_lists
+                torch._foreach_maximum_(v_hat_list, v_list)
+                v_list = v_hat_list
+
+            torch._foreach_add_(
+                variables,
+                torch._foreach_div(
+                    torch._foreach_mul(m_list, alpha),
+                    torch._foreach_add(
+                        torch._foreach_sqrt(v_list), self.epsilon
+                    ),
+                ),
+                alpha=-1,
+            )
@@ -14,9 +14,6 @@ class Adamax(
         variables,
         learning_rate,
     ):
-        keras_variables = variables
-        variables = [v.value for v in variables]
-
         dtype = variables[0].dtype
         lr = ops.cast(learning_rate, dtype)
 
@@ -24,29 +21,23 @@ class Adamax(
 
         beta_1_power = ops.power(ops.cast(self.beta_1, dtype), local_step)
 
-        m_list = [
-            self._m[self._get_variable_index(variable)].value
-            for variable in keras_variables
-        ]
-        u_list = [
-            self._u[self._get_variable_index(variable)].value
-            for variable in keras_variables
-        ]
-
-        torch._foreach_mul_(m_list, self.beta_1)
-        torch._foreach_add_(m_list, grads, alpha=1 - self.beta_1)
-
-        torch._foreach_mul_(u_list, self.beta_2)
-        torch._foreach_maximum_(u_list, torch._foreach_abs(grads))
-
-        torch._foreach_add_(
-            variables,
-            torch._foreach_div(
-                torch._foreach_mul(m_list, lr),
-                torch._foreach_mul(
-                    torch._foreach_add(u_list, self.epsilon),
-                    1 - beta_1_power,
+        for variables, grads, m_list, u_list in self._update_groups(
+            grads, variables, self._m, self._u
+        ):
+            torch._foreach_mul_(m_list, self.beta_1)
+            torch._foreach_add_(m_list, grads, alpha=1 - self.beta_1)
+
+            torch._foreach_mul_(u_list, self.beta_2)
+            torch._foreach_maximum_(u_list, torch._foreach_abs(grads))
+
+            torch._foreach_add_(
+                variables,
+                torch._foreach_div(
+                    torch._foreach_mul(m_list, lr),
+                    torch._foreach_mul(
+                        torch._foreach_add(u_list, self.epsilon),
+                        1 - beta_1_power,
+                    ),
                 ),
-            ),
-            alpha=-1,
-        )
+                alpha=-1,
+            )
@@ -0,0 +1,53 @@
+import torch
+
+from keras.src import ops
+from keras.src import optimizers
+from keras.src.backend.torch.optimizers import torch_parallel_optimizer
+
+
+class Ftrl(torch_parallel_optimizer.TorchParallelOptimizer, optimizers.Ftrl):
+    def _parallel_update_step(
+        self,
+        grads,
+        variables,
+        learning_rate,
+    ):
+        dtype = variables[0].dtype
+        lr = ops.cast(learning_rate, dtype)
+        grads = [ops.cast(g, v.dtype) for g, v in zip(grads, variables)]
+
+        lr_power = self.learning_rate_power
+        l1_reg = self.l1_regularization_strength
+        l2_reg = self.l2_regularization_strength
+        l2_reg = l2_reg + self.beta / (2.0 * lr)
+        l2_shrinkage_reg = self.l2_shrinkage_regularization_strength
+
+        for variables, grads, accumulators, linears in self._update_groups(
+            grads, variables, self._accumulators, self._linears
+        ):
+            grads_to_use = torch._foreach_add(
+                grads, variables, alpha=2 * l2_shrinkage_reg
+            )
+            new_accumulators = torch._foreach_addcmul(
+                accumulators, grads, grads
+            )
+            new_accumulator_powers = torch._foreach_pow(
+                new_accumulators, -lr_power
+            )
+            sigmas = torch._foreach_sub(
+                new_accumulator_powers,
+                torch._foreach_pow(accumulators, -lr_power),
+            )
+            torch._foreach_div_(sigmas, lr)
+            torch._foreach_add_(linears, grads_to_use)
+            torch._foreach_sub_(linears, torch._foreach_mul(sigmas, variables))
+
+            quadratics = torch._foreach_div(new_accumulator_powers, lr)
+            torch._foreach_add_(quadratics, 2 * l2_reg)
+            linears_clipped = torch._foreach_clamp_max(
+                torch._foreach_clamp_min(linears, -l1_reg), l1_reg
+            )
+            torch._foreach_sub_(linears_clipped, linears)
+            torch._foreach_div_(linears_clipped, quadratics)
+            torch._foreach_copy_(variables, linears_clipped)
+            torch._foreach_copy_(accumulators, new_accumulators)
@@ -13,9 +13,6 @@ class Nadam(torch_parallel_optimizer.TorchParallelOptimizer, optimizers.Nadam):
         variables,
         learning_rate,
     ):
-        keras_variables = variables
-        variables = [v.value for v in variables]
-
         dtype = variables[0].dtype
         lr = ops.cast(learning_rate, dtype)
 
@@ -32,43 +29,37 @@ class Nadam(torch_parallel_optimizer.TorchParallelOptimizer, optimizers.Nadam):
 
         self._u_product.assign(u_product_t)
 
-        m_list = [
-            self._momentums[self._get_variable_index(variable)].value
-            for variable in keras_variables
-        ]
-        v_list = [
-            self._velocities[self._get_variable_index(variable)].value
-            for variable in keras_variables
-        ]
-
-        torch._foreach_mul_(m_list, self.beta_1)
-        torch._foreach_add_(m_list, grads, alpha=1 - self.beta_1)
+        for variables, grads, m_list, v_list in self._update_groups(
+            grads, variables, self._momentums, self._velocities
+        ):
+            torch._foreach_mul_(m_list, self.beta_1)
+            torch._foreach_add_(m_list, grads, alpha=1 - self.beta_1)
 
-        torch._foreach_mul_(v_list, self.beta_2)
-        torch._foreach_add_(
-            v_list, torch._foreach_mul(grads, grads), alpha=1 - self.beta_2
-        )
+            torch._foreach_mul_(v_list, self.beta_2)
+            torch._foreach_add_(
+                v_list, torch._foreach_mul(grads, grads), alpha=1 - self.beta_2
+            )
 
-        m_hat_list = torch._foreach_add(
-            torch._foreach_div(
-                torch._foreach_mul(m_list, u_t_1),
-                1 - core.convert_to_numpy(u_product_t_1),
-            ),
-            torch._foreach_div(
-                torch._foreach_mul(grads, 1 - u_t),
-                1 - core.convert_to_numpy(u_product_t),
-            ),
-        )
+            m_hat_list = torch._foreach_add(
+                torch._foreach_div(
+                    torch._foreach_mul(m_list, u_t_1),
+                    1 - core.convert_to_numpy(u_product_t_1),
+                ),
+                torch._foreach_div(
+                    torch._foreach_mul(grads, 1 - u_t),
+                    1 - core.convert_to_numpy(u_product_t),
+                ),
+            )
 
-        v_hat_list = torch._foreach_div(v_list, 1 - beta_2_power)
+            v_hat_list = torch._foreach_div(v_list, 1 - beta_2_power)
 
-        torch._foreach_add_(
-            variables,
-            torch._foreach_div(
-                torch._foreach_mul(m_hat_list, lr),
-                torch._foreach_add(
-                    torch._foreach_sqrt(v_hat_list), self.epsilon
+            torch._foreach_add_(
+                variables,
+                torch._foreach_div(
+                    torch._foreach_mul(m_hat_list, lr),
+                    torch._foreach_add(
+                        torch._foreach_sqrt(v_hat_list), self.epsilon
+                    ),
                 ),
-            ),
-            alpha=-1,
-        )
+                alpha=-1,
+            )
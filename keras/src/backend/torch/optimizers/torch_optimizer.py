@@ -1,18 +1,67 @@
+import contextlib
+
 import torch
 
+from keras.src import ops
 from keras.src import optimizers
+from keras.src.backend.common.stateless_scope import in_stateless_scope
+from keras.src.backend.torch.core import get_device
+from keras.src.backend.torch.optimizers import torch_parallel_optimizer
 from keras.src.optimizers.base_optimizer import BaseOptimizer
 from keras.src.utils import torch_utils
+from keras.src.utils import tracking
+
+
+def _to_host(value):
+    """Returns a copy of `value` in host memory, pinned if CUDA is used."""
+    value = value.detach().to("cpu", copy=True)
+    if torch.cuda.is_available():
+        value = value.pin_memory()
+    return torch.nn.Parameter(value, requires_grad=False)
+
+
+@contextlib.contextmanager
+def _on_device(variables):
+    """Moves the values of offloaded `variables` to the device.
+
+    The values are copied back to host memory on exit.
+    """
+    device = get_device()
+    host_values = [v._value for v in variables]
+    for variable, host_value in zip(variables, host_values):
+        variable._value = torch.nn.Parameter(
+            host_value.to(device, non_blocking=True, copy=True),
+            requires_grad=False,
+        )
+    try:
+        yield
+    finally:
+        for variable, host_value in zip(variables, host_values):
+            host_value.copy_(variable._value, non_blocking=True)
+            variable._value = host_value
 
 
 class TorchOptimizer(BaseOptimizer):
+    """Torch specific optimizer logic.
+
+    With `offload_state="host"`, the slot variables created with
+    `add_variable_from_reference()` after `BaseOptimizer.build()`, and the EMA
+    averages, are moved to host memory. The update step and the EMA update
+    are applied to chunks of `offload_chunk_size` weights, with the state of
+    each chunk copied to the device and back.
+    """
+
+    offload_chunk_size = 2**24
+
     def __new__(cls, *args, **kwargs):
         # Import locally to avoid circular imports.
         from keras.src.backend.torch.optimizers import torch_adadelta
+        from keras.src.backend.torch.optimizers import torch_adafactor
         from keras.src.backend.torch.optimizers import torch_adagrad
         from keras.src.backend.torch.optimizers import torch_adam
         from keras.src.backend.torch.optimizers import torch_adamax
         from keras.src.backend.torch.optimizers import torch_adamw
+        from keras.src.backend.torch.optimizers import torch_ftrl
         from keras.src.backend.torch.optimizers import torch_lion
         from keras.src.backend.torch.optimizers import torch_nadam
         from keras.src.backend.torch.optimizers import torch_rmsprop
@@ -20,10 +69,12 @@ class TorchOptimizer(BaseOptimizer):
 
         OPTIMIZERS = {
             optimizers.Adadelta: torch_adadelta.Adadelta,
+            optimizers.Adafactor: torch_adafactor.Adafactor,
             optimizers.Adagrad: torch_adagrad.Adagrad,
             optimizers.Adam: torch_adam.Adam,
             optimizers.Adamax: torch_adamax.Adamax,
             optimizers.AdamW: torch_adamw.AdamW,
+            optimizers.Ftrl: torch_ftrl.Ftrl,
             optimizers.Lion: torch_lion.Lion,
             optimizers.Nadam: torch_nadam.Nadam,
             optimizers.RMSprop: torch_rmsprop.RMSprop,
@@ -34,12 +85,153 @@ class TorchOptimizer(BaseOptimizer):
             return OPTIMIZERS[cls](*args, **kwargs)
         return super().__new__(cls)
 
+    @tracking.no_automatic_dependency_tracking
+    def build(self, variables):
+        super().build(variables)
+        # Maps the index of each trainable variable to its offloaded slot
+        # variables.
+        self._offloaded_slots = {}
+        if self.offload_state == "host" and self.use_ema:
+            for average in self._model_variables_moving_average:
+                average._value = _to_host(average._value)
+
+    def add_variable_from_reference(
+        self, reference_variable, name=None, initializer="zeros"
+    ):
+        variable = super().add_variable_from_reference(
+            reference_variable, name=name, initializer=initializer
+        )
+        # Slot variables are created by subclasses once `BaseOptimizer.build()`
+        # is done. The gradient accumulators it creates, updated at every
+        # step, stay on the device.
+        if self.offload_state == "host" and self.built:
+            index = self._trainable_variables_indices.get(
+                self._var_key(reference_variable)
+            )
+            if index is not None:
+                variable._value = _to_host(variable._value)
+                self._offloaded_slots.setdefault(index, []).append(variable)
+        return variable
+
+    def _offload_chunks(self, trainable_variables):
+        """Yields lists of positions in `trainable_variables`.
+
+        Each chunk holds up to `offload_chunk_size` weights, or a single
+        variable.
+        """
+        chunk, size = [], 0
+        for position, variable in enumerate(trainable_variables):
+            variable_size = variable._value.numel()
+            if chunk and size + variable_size > self.offload_chunk_size:
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(position)
+            size += variable_size
+        if chunk:
+            yield chunk
+
+    def _stream_offloaded_state(self, grads, trainable_variables):
+        """Yields chunks `(grads, trainable_variables)` to update.
+
+        With `offload_state="host"`, the offloaded slot variables of each
+        chunk are on the device until the next iteration.
+        """
+        if self.offload_state != "host" or in_stateless_scope():
+            yield grads, trainable_variables
+            return
+        for chunk in self._offload_chunks(trainable_variables):
+            variables = [trainable_variables[p] for p in chunk]
+            slots = [
+                slot
+                for v in variables
+                for slot in self._offloaded_slots.get(
+                    self._get_variable_index(v), ()
+                )
+            ]
+            with _on_device(slots):
+                yield [grads[p] for p in chunk], variables
+        if torch.cuda.is_available():
+            # Wait for the copies to host memory.
+            torch.cuda.synchronize()
+
+    def _backend_update_step(self, grads, trainable_variables, learning_rate):
+        for chunk_grads, chunk_variables in self._stream_offloaded_state(
+            grads, trainable_variables
+        ):
+            super()._backend_update_step(
+                chunk_grads, chunk_variables, learning_rate
+            )
+
+    def _backend_apply_gradients(self, grads, trainable_variables):
+        # The sparse gradients of the variables that are not updated by
+        # `sparse_update_step()` are densified.
+        grads = [
+            g.to_dense() if isinstance(g, torch.Tensor) and g.is_sparse else g
+            for g in grads
+        ]
+        super()._backend_apply_gradients(grads, trainable_variables)
+
+    @torch_utils.no_grad
+    def _backend_sparse_update_step(
+        self, grads, indices, trainable_variables, learning_rate
+    ):
+        super()._backend_sparse_update_step(
+            grads, indices, trainable_variables, learning_rate
+        )
+
+    def _row_sparse_gradient(self, gradient):
+        if not (isinstance(gradient, torch.Tensor) and gradient.is_sparse):
+            return super()._row_sparse_gradient(gradient)
+        # Sum the values of duplicate indices.
+        gradient = gradient.coalesce()
+        return gradient.indices()[0], gradient.values()
+
+    def _gather_rows(self, variable, indices):
+        # The slot variables may be offloaded to host memory.
+        value = variable.value
+        rows = value.index_select(0, indices.to(value.device).long())
+        return rows.to(indices.device)
+
+    def _scatter_rows(self, variable, indices, values):
+        if in_stateless_scope():
+            return super()._scatter_rows(variable, indices, values)
+        value = variable.value
+        value.index_copy_(
+            0,
+            indices.to(value.device).long(),
+            values.to(device=value.device, dtype=value.dtype),
+        )
+
+    def _update_model_variables_moving_average(self, trainable_variables):
+        if (
+            not self.use_ema
+            or self.offload_state != "host"
+            or in_stateless_scope()
+        ):
+            return super()._update_model_variables_moving_average(
+                trainable_variables
+            )
+        not_first_step = ops.not_equal(self.iterations, 0)
+        for chunk in self._offload_chunks(trainable_variables):
+            averages = [self._model_variables_moving_average[p] for p in chunk]
+            with _on_device(averages):
+                for p, average in zip(chunk, averages):
+                    var = trainable_variables[p]
+                    momentum = (
+                        ops.cast(not_first_step, var.dtype) * self.ema_momentum
+                    )
+                    average.assign(momentum * average + (1 - momentum) * var)
+        if torch.cuda.is_available():
+            torch.cuda.synchronize()
+
     @torch_utils.no_grad
     def _apply_weight_decay(self, variables):
         if self.weight_decay is None:
             return
 
         torch._foreach_mul_(
-            [v.value for v in variables if self._use_weight_decay(v)],
+            torch_parallel_optimizer._values(
+                [v for v in variables if self._use_weight_decay(v)]
+            ),
             1 - self.weight_decay * self._get_current_learning_rate(),
         )
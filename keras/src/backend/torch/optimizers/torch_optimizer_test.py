@@ -0,0 +1,180 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+from absl.testing import parameterized
+
+from keras.src import backend
+from keras.src import optimizers
+from keras.src import testing
+
+OPTIMIZERS = [
+    ("adadelta", optimizers.Adadelta, {"learning_rate": 0.5}),
+    ("adafactor", optimizers.Adafactor, {}),
+    ("adagrad", optimizers.Adagrad, {}),
+    ("adam", optimizers.Adam, {}),
+    ("adam_amsgrad", optimizers.Adam, {"amsgrad": True}),
+    ("adamax", optimizers.Adamax, {}),
+    ("adamw", optimizers.AdamW, {"weight_decay": 0.1}),
+    (
+        "ftrl",
+        optimizers.Ftrl,
+        {
+            "l1_regularization_strength": 0.01,
+            "l2_regularization_strength": 0.02,
+            "l2_shrinkage_regularization_strength": 0.03,
+            "beta": 0.1,
+        },
+    ),
+    ("lion", optimizers.Lion, {}),
+    ("nadam", optimizers.Nadam, {}),
+    ("rmsprop", optimizers.RMSprop, {}),
+    (
+        "rmsprop_centered",
+        optimizers.RMSprop,
+        {"centered": True, "momentum": 0.9},
+    ),
+    ("sgd", optimizers.SGD, {}),
+    ("sgd_nesterov", optimizers.SGD, {"momentum": 0.9, "nesterov": True}),
+]
+SHAPES = [(), (3,), (4, 5), (2, 3, 4), (5,), (6, 2)]
+
+
+class HeavyBall(optimizers.Optimizer):
+    def __init__(self, learning_rate=0.01, **kwargs):
+        super().__init__(learning_rate=learning_rate, **kwargs)
+
+    def build(self, variables):
+        if self.built:
+            return
+        super().build(variables)
+        self.momentums = [
+            self.add_variable_from_reference(v, name="momentum")
+            for v in variables
+        ]
+
+    def update_step(self, gradient, variable, learning_rate):
+        momentum = self.momentums[self._get_variable_index(variable)]
+        self.assign(momentum, 0.9 * momentum + gradient)
+        self.assign_sub(variable, learning_rate * momentum)
+
+
+def _make_variables_and_grads(num_steps):
+    rng = np.random.default_rng(0)
+    values, grads = [], []
+    for i, shape in enumerate(SHAPES):
+        dtype = "float32" if i % 3 else "float64"
+        values.append(rng.random(shape).astype(dtype) + 0.5)
+        grads.append(
+            [rng.normal(size=shape).astype(dtype) for _ in range(num_steps)]
+        )
+    return values, grads
+
+
+@pytest.mark.skipif(
+    backend.backend() != "torch",
+    reason="Only the torch backend has multi-tensor optimizers.",
+)
+class TorchParallelOptimizerTest(testing.TestCase, parameterized.TestCase):
+    def _run(self, optimizer, values, grads, num_steps):
+        variables = [backend.Variable(v, dtype=v.dtype) for v in values]
+        for step in range(num_steps):
+            # The last step updates a subset of the variables.
+            indices = range(len(variables))
+            if step == num_steps - 1:
+                indices = indices[1:]
+            optimizer.apply(
+                [backend.convert_to_tensor(grads[i][step]) for i in indices],
+                [variables[i] for i in indices],
+            )
+        return [backend.convert_to_numpy(v) for v in variables]
+
+    @parameterized.named_parameters(OPTIMIZERS)
+    def test_parallel_update_matches_update_step(self, cls, kwargs):
+        num_steps = 3
+        values, grads = _make_variables_and_grads(num_steps)
+
+        # The backend-agnostic update, which calls `update_step()` for each
+        # variable.
+        optimizer = cls(**kwargs)
+        with mock.patch.object(
+            type(optimizer), "_backend_update_step", cls._backend_update_step
+        ):
+            expected = self._run(optimizer, values, grads, num_steps)
+        for flat_buffers in (False, True):
+            optimizer = cls(**kwargs)
+            optimizer.flat_buffers = flat_buffers
+            outputs = self._run(optimizer, values, grads, num_steps)
+            for output, expected_output in zip(outputs, expected):
+                self.assertAllClose(
+                    output, expected_output, rtol=1e-5, atol=1e-5
+                )
+
+    def test_flat_buffers(self):
+        values, grads = _make_variables_and_grads(1)
+        variables = [backend.Variable(v, dtype=v.dtype) for v in values]
+        optimizer = optimizers.Adam()
+        optimizer.flat_buffers = True
+        optimizer.apply(
+            [backend.convert_to_tensor(g[0]) for g in grads], variables
+        )
+
+        # One buffer per dtype, holding the momentums and velocities.
+        self.assertLen(optimizer._flat_groups, 2)
+        for group in optimizer._flat_groups:
+            momentums, velocities = group.slot_buffers
+            for index, momentum in zip(
+                group.indices, momentums.split(group.sizes)
+            ):
+                slot_value = optimizer._momentums[index].value
+                self.assertEqual(slot_value.data_ptr(), momentum.data_ptr())
+            self.assertEqual(
+                momentums.untyped_storage().data_ptr(),
+                velocities.untyped_storage().data_ptr(),
+            )
+
+        # Slot variables can still be assigned.
+        optimizer._velocities[0].assign(np.ones(SHAPES[0]))
+        self.assertAllClose(optimizer._velocities[0], np.ones(SHAPES[0]))
+
+    @parameterized.named_parameters(OPTIMIZERS)
+    def test_offload_state(self, cls, kwargs):
+        num_steps = 3
+        values, grads = _make_variables_and_grads(num_steps)
+        expected = self._run(cls(**kwargs), values, grads, num_steps)
+
+        optimizer = cls(offload_state="host", **kwargs)
+        # Stream a few variables at a time.
+        optimizer.offload_chunk_size = 10
+        outputs = self._run(optimizer, values, grads, num_steps)
+        for output, expected_output in zip(outputs, expected):
+            self.assertAllClose(output, expected_output, rtol=1e-5, atol=1e-5)
+
+        slots = [s for v in optimizer._offloaded_slots.values() for s in v]
+        if cls is not optimizers.SGD or kwargs:
+            self.assertNotEmpty(slots)
+        for slot in slots:
+            self.assertEqual(slot.value.device.type, "cpu")
+
+    def test_offload_state_with_ema_and_generic_optimizer(self):
+        num_steps = 3
+        values, grads = _make_variables_and_grads(num_steps)
+        kwargs = {"learning_rate": 0.1, "use_ema": True, "ema_momentum": 0.5}
+        # `HeavyBall` has no multi-tensor implementation.
+        optimizer = HeavyBall(**kwargs)
+        expected = self._run(optimizer, values, grads, num_steps)
+        expected_averages = [
+            backend.convert_to_numpy(v)
+            for v in optimizer._model_variables_moving_average
+        ]
+
+        optimizer = HeavyBall(offload_state="host", **kwargs)
+        optimizer.offload_chunk_size = 10
+        outputs = self._run(optimizer, values, grads, num_steps)
+        for output, expected_output in zip(outputs, expected):
+            self.assertAllClose(output, expected_output, rtol=1e-5, atol=1e-5)
+        averages = optimizer._model_variables_moving_average
+        for average, expected_average in zip(averages, expected_averages):
+            self.assertEqual(average.value.device.type, "cpu")
+            self.assertAllClose(average, expected_average, rtol=1e-5, atol=1e-5)
+        self.assertLen(optimizer._offloaded_slots, len(values))
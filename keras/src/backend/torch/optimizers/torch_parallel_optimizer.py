@@ -1,24 +1,247 @@
+import collections
+
 import torch
+from torch._utils import _flatten_dense_tensors
 
+from keras.src import random
+from keras.src.backend.common.stateless_scope import in_stateless_scope
+from keras.src.backend.common.variables import get_autocast_scope
+from keras.src.backend.common.variables import standardize_dtype
 from keras.src.optimizers.base_optimizer import BaseOptimizer
 from keras.src.utils import torch_utils
+from keras.src.utils import tracking
+
+
+class _FlatGroup:
+    """The variables of a flat buffer, with the flat views of their slots."""
+
+    def __init__(self, indices, sizes, slot_buffers):
+        self.indices = indices
+        self.sizes = sizes
+        self.slot_buffers = slot_buffers
+        self._params = []
+        self._param_views = []
+
+    def param_views(self, params):
+        """Returns the flat views of `params`, cached across steps."""
+        if len(params) != len(self._params) or any(
+            p is not cached for p, cached in zip(params, self._params)
+        ):
+            self._params = params
+            self._param_views = [p.view(-1) for p in params]
+        return self._param_views
+
+
+def _values(variables):
+    """Returns `[v.value for v in variables]`."""
+    if in_stateless_scope() or get_autocast_scope() is not None:
+        return [v.value for v in variables]
+    # Outside of scopes, skip the checks of `Variable.value`, which dominate
+    # the update time of small variables.
+    return [v._value for v in variables]
 
 
 class TorchParallelOptimizer(BaseOptimizer):
+    """Base class of the torch optimizers with multi-tensor updates.
+
+    Subclasses implement `_parallel_update_step()`, which updates all the
+    variables at once with `torch._foreach_*` ops, on the lists of tensors
+    returned by `_update_groups()`.
+
+    When `flat_buffers` is set to `True` before the first update, the slot
+    variables passed to `_update_groups()` are moved to one contiguous buffer
+    per dtype and device, and the variables of each buffer are updated with a
+    few ops on flat tensors instead of one op per variable. The variables and
+    gradients are copied to flat tensors at each step, which takes additional
+    memory of the size of the variables. Flat buffers are not used with
+    `offload_state="host"`.
+    """
+
+    flat_buffers = False
+    _flat_groups = None
+    _flat_group_ids = None
+
     @torch_utils.no_grad
     def _backend_update_step(self, grads, trainable_variables, learning_rate):
+        if not trainable_variables:
+            # All the variables are updated by `sparse_update_step()`.
+            return
         self._parallel_update_step(
             grads,
             trainable_variables,
             learning_rate,
         )
 
+    def _update_groups(self, grads, variables, *slots):
+        """Yields the tensors of the variables to update, with their slots.
+
+        Args:
+            grads: The gradients of `variables`.
+            variables: The Keras variables to update.
+            *slots: Lists of slot variables with the shape and dtype of the
+                variables they are created for, indexed like the trainable
+                variables of the optimizer (e.g. `self._momentums`).
+
+        Yields:
+            Tuples `(params, grads, *slot_values)` of lists of tensors with
+            matching shapes. The updates applied in place to the tensors of
+            each tuple before the next iteration are applied to the variables
+            and their slots. With `flat_buffers`, each list holds a single
+            flat tensor for each buffer that is updated in full. With
+            `offload_state="host"`, each tuple holds a chunk of the variables,
+            with their offloaded slots copied to the device.
+        """
+        if self.offload_state == "host":
+            # `_stream_offloaded_state()` is implemented by `TorchOptimizer`,
+            # a base class of the Keras optimizers.
+            for chunk_grads, chunk_variables in self._stream_offloaded_state(
+                grads, variables
+            ):
+                indices = [self._get_variable_index(v) for v in chunk_variables]
+                yield (
+                    _values(chunk_variables),
+                    list(chunk_grads),
+                    *(_values([slot[i] for i in indices]) for slot in slots),
+                )
+            return
+
+        indices = [self._get_variable_index(v) for v in variables]
+        if not self.flat_buffers or not slots:
+            yield (
+                _values(variables),
+                list(grads),
+                *(_values([slot[i] for i in indices]) for slot in slots),
+            )
+            return
+
+        if self._flat_groups is None:
+            self._build_flat_groups(slots)
+        positions = collections.defaultdict(list)
+        for position, index in enumerate(indices):
+            positions[self._flat_group_ids.get(index)].append(position)
+        others = positions.pop(None, [])
+        for group_id, group_positions in positions.items():
+            group = self._flat_groups[group_id]
+            if tuple(indices[p] for p in group_positions) != group.indices:
+                # Only a subset of the buffer is updated.
+                others.extend(group_positions)
+                continue
+            params = _values([variables[p] for p in group_positions])
+            flat_params = _flatten_dense_tensors(params)
+            flat_grads = _flatten_dense_tensors(
+                [grads[p] for p in group_positions]
+            )
+            yield (
+                [flat_params],
+                [flat_grads],
+                *([buffer] for buffer in group.slot_buffers),
+            )
+            torch._foreach_copy_(
+                group.param_views(params), flat_params.split(group.sizes)
+            )
+        if others:
+            others.sort()
+            yield (
+                _values([variables[p] for p in others]),
+                [grads[p] for p in others],
+                *(
+                    _values([slot[indices[p]] for p in others])
+                    for slot in slots
+                ),
+            )
+
+    @tracking.no_automatic_dependency_tracking
+    @torch_utils.no_grad
+    def _build_flat_groups(self, slots):
+        """Moves the slot variables to flat buffers.
+
+        Sets `self._flat_groups` to the list of `_FlatGroup`s, and
+        `self._flat_group_ids` to a dict mapping the index of each trainable
+        variable to the position of its group.
+        """
+        variables_by_key = collections.defaultdict(list)
+        for index, variable in enumerate(self._trainable_variables):
+            if self._use_sparse_updates(variable):
+                # Only some rows are updated at each step.
+                continue
+            value = variable.value
+            if not all(
+                slot[index].value.shape == value.shape
+                and slot[index].value.dtype == value.dtype
+                for slot in slots
+            ):
+                continue
+            variables_by_key[(value.dtype, value.device)].append(index)
+
+        self._flat_groups = []
+        self._flat_group_ids = {}
+        for (dtype, device), indices in variables_by_key.items():
+            sizes = tuple(
+                self._trainable_variables[i].value.numel() for i in indices
+            )
+            size = sum(sizes)
+            buffer = torch.empty(size * len(slots), dtype=dtype, device=device)
+            slot_buffers = buffer.split(size) if slots else ()
+            for slot, slot_buffer in zip(slots, slot_buffers):
+                chunks = slot_buffer.split(sizes)
+                for index, chunk in zip(indices, chunks):
+                    slot_variable = slot[index]
+                    value = chunk.view(slot_variable.shape)
+                    value.copy_(slot_variable.value)
+                    slot_variable._value = torch.nn.Parameter(
+                        value, requires_grad=False
+                    )
+            for index in indices:
+                self._flat_group_ids[index] = len(self._flat_groups)
+            self._flat_groups.append(
+                _FlatGroup(tuple(indices), sizes, tuple(slot_buffers))
+            )
+
     @torch_utils.no_grad
     def _backend_reset_gradient_accumulators(self):
-        acc_list = [v.value for v in self._accumulated_gradients]
+        acc_list = [v.value for v in self._gradient_accumulators]
         torch._foreach_mul_(acc_list, 0.0)
 
     @torch_utils.no_grad
     def _backend_increment_gradient_accumulators(self, grads, acc_grads):
         acc_list = [v.value for v in acc_grads]
         torch._foreach_add_(acc_list, grads, alpha=1.0)
+
+    @torch_utils.no_grad
+    def _backend_increment_flat_gradient_accumulators(
+        self, grads, trainable_variables
+    ):
+        # Add the gradients to the slices of the buffers in place, rather than
+        # concatenating them and copying the sums back.
+        layout = self._get_flat_gradient_layout(trainable_variables)
+        for buffer, runs in zip(self._gradient_accumulator_buffers, layout):
+            value = buffer.value
+            stochastic_rounding = value.dtype in (torch.float16, torch.bfloat16)
+            acc = value.float() if stochastic_rounding else value
+            acc_slices, flat_grads = [], []
+            for start, _, positions in runs:
+                for p in positions:
+                    flat_grad = grads[p].reshape(-1)
+                    stop = start + flat_grad.numel()
+                    acc_slices.append(acc[start:stop])
+                    flat_grads.append(flat_grad)
+                    start = stop
+            torch._foreach_add_(acc_slices, flat_grads)
+            if stochastic_rounding:
+                value.copy_(self._stochastic_round(acc, value.dtype))
+
+    def _stochastic_round(self, x, dtype):
+        if standardize_dtype(dtype) != "bfloat16":
+            return super()._stochastic_round(x, dtype)
+        # `bfloat16` values are the upper 16 bits of `float32` values. Adding
+        # random lower bits before truncating them rounds up with a
+        # probability proportional to the truncated bits.
+        bits = random.randint(
+            x.shape,
+            0,
+            1 << 16,
+            dtype="int32",
+            seed=self._gradient_accumulator_seed_generator,
+        )
+        bits.add_(x.view(torch.int32)).bitwise_and_(-(1 << 16))
+        return bits.view(torch.float32).to(dtype)
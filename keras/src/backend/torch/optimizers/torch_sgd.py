@@ -11,18 +11,14 @@ class SGD(torch_parallel_optimizer.TorchParallelOptimizer, optimizers.SGD):
         variables,
         learning_rate,
     ):
-        keras_variables = variables
-        variables = [v.value for v in variables]
-        if self.momentum != 0:
-            bufs = [
-                self.momentums[self._get_variable_index(variable)].value
-                for variable in keras_variables
-            ]
-
-            for i in range(len(bufs)):
-                if bufs[i] is None:
-                    bufs[i] = torch.clone(grads[i]).detach()
+        if self.momentum == 0:
+            for variables, grads in self._update_groups(grads, variables):
+                torch._foreach_add_(variables, grads, alpha=-learning_rate)
+            return
 
+        for variables, grads, bufs in self._update_groups(
+            grads, variables, self.momentums
+        ):
             torch._foreach_mul_(bufs, self.momentum)
             torch._foreach_add_(bufs, grads, alpha=-learning_rate)
 
@@ -31,6 +27,3 @@ class SGD(torch_parallel_optimizer.TorchParallelOptimizer, optimizers.SGD):
                 torch._foreach_add_(variables, bufs, alpha=self.momentum)
             else:
                 torch._foreach_add_(variables, bufs)
-
-        else:
-            torch._foreach_add_(variables, grads, alpha=-learning_rate)
@@ -8,6 +8,7 @@ from keras.src import backend
 from keras.src import callbacks as callbacks_module
 from keras.src import optimizers as optimizers_module
 from keras.src import tree
+from keras.src.trainers import predict_utils
 from keras.src.trainers import trainer as base_trainer
 from keras.src.trainers.data_adapters import array_slicing
 from keras.src.trainers.data_adapters import data_adapter_utils
@@ -182,6 +183,7 @@ class TorchTrainer(base_trainer.Trainer):
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        prefetch=0,
     ):
         if not self.compiled:
             raise ValueError(
@@ -219,6 +221,7 @@ class TorchTrainer(base_trainer.Trainer):
             shuffle=shuffle,
             class_weight=class_weight,
             steps_per_execution=self.steps_per_execution,
+            prefetch=prefetch,
         )
 
         self._symbolic_build(iterator=epoch_iterator)
@@ -279,6 +282,7 @@ class TorchTrainer(base_trainer.Trainer):
                         steps_per_execution=self.steps_per_execution,
                         steps_per_epoch=validation_steps,
                         shuffle=False,
+                        prefetch=prefetch,
                     )
                 val_logs = self.evaluate(
                     x=val_x,
@@ -382,7 +386,13 @@ class TorchTrainer(base_trainer.Trainer):
 
     @traceback_utils.filter_traceback
     def predict(
-        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+        self,
+        x,
+        batch_size=None,
+        verbose="auto",
+        steps=None,
+        callbacks=None,
+        output_path=None,
     ):
         # Create an iterator that yields batches of input data.
         epoch_iterator = TorchEpochIterator(
@@ -405,38 +415,77 @@ class TorchTrainer(base_trainer.Trainer):
                 model=self,
             )
 
-        def append_to_outputs(batch_outputs, outputs):
-            if outputs is None:
-                outputs = tree.map_structure(
-                    lambda batch_output: [batch_output],
-                    batch_outputs,
-                )
-            else:
-                tree.map_structure_up_to(
-                    batch_outputs,
-                    lambda output, batch_output: output.append(batch_output),
-                    outputs,
-                    batch_outputs,
-                )
-            return outputs
-
         # Switch the torch Module back to testing mode.
         self.eval()
 
         self.make_predict_function()
         self.stop_predicting = False
         callbacks.on_predict_begin()
-        outputs = None
+        outputs = predict_utils.PredictOutputs(
+            num_batches=predict_utils.num_executions(
+                epoch_iterator.num_batches, self.steps_per_execution
+            ),
+            output_path=output_path,
+            convert_fn=backend.convert_to_numpy,
+        )
         for step, data in epoch_iterator.enumerate_epoch():
             callbacks.on_predict_batch_begin(step)
             batch_outputs = self.predict_function(data)
-            outputs = append_to_outputs(batch_outputs, outputs)
+            outputs.append(batch_outputs)
             callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
             if self.stop_predicting:
                 break
         callbacks.on_predict_end()
-        outputs = tree.map_structure(backend.convert_to_numpy, outputs)
-        return tree.map_structure_up_to(batch_outputs, np.concatenate, outputs)
+        return outputs.result()
+
+    def predict_iter(
+        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+    ):
+        # Create an iterator that yields batches of input data.
+        epoch_iterator = TorchEpochIterator(
+            x=x,
+            batch_size=batch_size,
+            steps_per_epoch=steps,
+            shuffle=False,
+            steps_per_execution=self.steps_per_execution,
+        )
+
+        # Container that configures and calls callbacks.
+        if not isinstance(callbacks, callbacks_module.CallbackList):
+            callbacks = callbacks_module.CallbackList(
+                callbacks,
+                add_history=True,
+                add_progbar=verbose != 0,
+                verbose=verbose,
+                epochs=1,
+                steps=epoch_iterator.num_batches,
+                model=self,
+            )
+
+        self.make_predict_function()
+        return self._predict_iter(epoch_iterator, callbacks)
+
+    def _predict_iter(self, epoch_iterator, callbacks):
+        # Switch the torch Module back to testing mode.
+        self.eval()
+
+        self.stop_predicting = False
+        callbacks.on_predict_begin()
+        outputs_spec = None
+        try:
+            for step, data in epoch_iterator.enumerate_epoch():
+                callbacks.on_predict_batch_begin(step)
+                batch_outputs = self.predict_function(data)
+                callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
+                if outputs_spec is None:
+                    outputs_spec = tree.structure_spec(batch_outputs)
+                yield outputs_spec.map_structure(
+                    backend.convert_to_numpy, batch_outputs
+                )
+                if self.stop_predicting:
+                    break
+        finally:
+            callbacks.on_predict_end()
 
     def train_on_batch(
         self,
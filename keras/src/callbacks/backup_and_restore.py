@@ -1,7 +1,9 @@
 import json
+from concurrent import futures
 
 from keras.src.api_export import keras_export
 from keras.src.callbacks.callback import Callback
+from keras.src.saving import saving_lib
 from keras.src.utils import file_utils
 
 
@@ -68,6 +70,12 @@ class BackupAndRestore(Callback):
           If `delete_checkpoint=True`, the checkpoint will be deleted after
           training is finished. Use `False` if you'd like to keep the checkpoint
           for future usage.
+        async_save: Boolean, defaults to `False`. If `True`, the training
+          state is copied to host memory on the training thread, and written
+          to `backup_dir` by a background thread, so that training can resume
+          while the checkpoint is being written. At most one save is in
+          flight at any time, and pending saves are completed at the end of
+          training.
     """
 
     def __init__(
@@ -75,10 +83,14 @@ class BackupAndRestore(Callback):
         backup_dir,
         save_freq="epoch",
         delete_checkpoint=True,
+        async_save=False,
     ):
         super().__init__()
         self.save_freq = save_freq
         self.delete_checkpoint = delete_checkpoint
+        self.async_save = async_save
+        self._executor = None
+        self._pending_save = None
         self._batches_seen_since_last_saving = 0
         self._last_batch_seen = 0
         self._current_epoch = 0
@@ -99,6 +111,8 @@ class BackupAndRestore(Callback):
 
     def on_train_begin(self, logs=None):
         """Get training state from temporary file and restore it."""
+        # A save of an interrupted run may still be in progress.
+        self._wait_for_pending_save()
         if not self.model.built:
             raise ValueError(
                 "To use the BackupAndRestore callback, "
@@ -143,14 +157,37 @@ class BackupAndRestore(Callback):
         # Create host directory if it doesn't exist.
         if not file_utils.exists(self.backup_dir):
             file_utils.makedirs(self.backup_dir)
-        self.model.save_weights(filepath=self._weights_path, overwrite=True)
+        training_metadata = {
+            "epoch": self._current_epoch,
+            "batch": self._last_batch_seen,
+        }
+        if not self.async_save:
+            self.model.save_weights(filepath=self._weights_path, overwrite=True)
+            self._save_training_metadata(training_metadata)
+            return
+        # Only keep one save in flight, so that at most one snapshot of the
+        # model is held in memory.
+        self._wait_for_pending_save()
+        snapshot = saving_lib.ModelSnapshot(self.model, weights_only=True)
+        if self._executor is None:
+            self._executor = futures.ThreadPoolExecutor(max_workers=1)
+        self._pending_save = self._executor.submit(
+            self._save_snapshot, snapshot, training_metadata
+        )
+
+    def _save_snapshot(self, snapshot, training_metadata):
+        snapshot.save(self._weights_path)
+        self._save_training_metadata(training_metadata)
+
+    def _save_training_metadata(self, training_metadata):
         with file_utils.File(self._training_metadata_path, "w") as f:
-            training_metadata = {
-                "epoch": self._current_epoch,
-                "batch": self._last_batch_seen,
-            }
             f.write(json.dumps(training_metadata))
 
+    def _wait_for_pending_save(self):
+        if self._pending_save is not None:
+            pending_save, self._pending_save = self._pending_save, None
+            pending_save.result()
+
     def _should_save_on_batch(self, batch):
         """Handles batch-level saving logic, supports steps_per_execution."""
         if self.save_freq == "epoch":
@@ -168,5 +205,11 @@ class BackupAndRestore(Callback):
         return False
 
     def on_train_end(self, logs=None):
+        try:
+            self._wait_for_pending_save()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
         if self.delete_checkpoint and file_utils.exists(self.backup_dir):
             file_utils.rmtree(self.backup_dir)
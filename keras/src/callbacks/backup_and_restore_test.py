@@ -147,6 +147,43 @@ class BackupAndRestoreCallbackTest(testing.TestCase):
             self.assertEqual(hist.epoch[-1], 4)
             self.assertEqual(int(model.layers[0].counter.value), 5 * 3)
 
+    @pytest.mark.requires_trainable_backend
+    def test_async_save(self):
+        temp_dir = self.get_temp_dir()
+        backup_dir = file_utils.join(temp_dir, "subdir")
+
+        model = self.make_model()
+        cbk = callbacks.BackupAndRestore(
+            backup_dir, save_freq=1, async_save=True
+        )
+
+        x_train = np.random.random((10, 3))
+        y_train = np.random.random((10, 1))
+
+        try:
+            model.fit(
+                x_train,
+                y_train,
+                batch_size=4,
+                callbacks=[
+                    cbk,
+                    InterruptingCallback(steps_int=2, epoch_int=None),
+                ],
+                epochs=2,
+                verbose=0,
+            )
+        except RuntimeError:
+            self.assertEqual(int(model.layers[0].counter.value), 2)
+
+            hist = model.fit(
+                x_train, y_train, batch_size=4, callbacks=[cbk], epochs=5
+            )
+            self.assertEqual(cbk._current_epoch, 5)
+            self.assertEqual(hist.epoch[-1], 4)
+            self.assertEqual(int(model.layers[0].counter.value), 17)
+            self.assertIsNone(cbk._pending_save)
+            self.assertFalse(file_utils.exists(backup_dir))
+
     # Checking if after interruption, when model is deleted
     @pytest.mark.requires_trainable_backend
     def test_model_deleted_case_epoch(self):
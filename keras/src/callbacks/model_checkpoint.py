@@ -1,12 +1,14 @@
 import os
 import re
 import warnings
+from concurrent import futures
 
 import numpy as np
 
 from keras.src import backend
 from keras.src.api_export import keras_export
 from keras.src.callbacks.callback import Callback
+from keras.src.saving import saving_lib
 from keras.src.utils import file_utils
 from keras.src.utils import io_utils
 
@@ -122,6 +124,12 @@ class ModelCheckpoint(Callback):
             metric to be monitored. Only applies if `save_best_value=True`. Only
             overwrites the model weights already saved if the performance of
             current model is better than this value.
+        async_save: Boolean, defaults to `False`. If `True`, the model state
+            is copied to host memory on the training thread, and written to
+            `filepath` by a background thread, so that training can resume
+            while the file is being written. At most one save is in flight
+            at any time: a new save waits for the previous one to complete.
+            All pending saves are completed at the end of training.
     """
 
     def __init__(
@@ -134,6 +142,7 @@ class ModelCheckpoint(Callback):
         mode="auto",
         save_freq="epoch",
         initial_value_threshold=None,
+        async_save=False,
     ):
         super().__init__()
         self.monitor = monitor
@@ -145,6 +154,9 @@ class ModelCheckpoint(Callback):
         self._batches_seen_since_last_saving = 0
         self._last_batch_seen = 0
         self.best = initial_value_threshold
+        self.async_save = async_save
+        self._executor = None
+        self._pending_save = None
 
         if mode not in ["auto", "min", "max"]:
             warnings.warn(
@@ -256,7 +268,7 @@ class ModelCheckpoint(Callback):
                         f"a scalar value. Received: {current}. "
                         "Falling back to `save_best_only=False`."
                     )
-                    self.model.save(filepath, overwrite=True)
+                    self._save(filepath)
                 else:
                     if self.monitor_op(current, self.best):
                         if self.verbose > 0:
@@ -267,10 +279,7 @@ class ModelCheckpoint(Callback):
                                 f"saving model to {filepath}"
                             )
                         self.best = current
-                        if self.save_weights_only:
-                            self.model.save_weights(filepath, overwrite=True)
-                        else:
-                            self.model.save(filepath, overwrite=True)
+                        self._save(filepath)
                     else:
                         if self.verbose > 0:
                             io_utils.print_msg(
@@ -283,10 +292,7 @@ class ModelCheckpoint(Callback):
                     io_utils.print_msg(
                         f"\nEpoch {epoch + 1}: saving model to {filepath}"
                     )
-                if self.save_weights_only:
-                    self.model.save_weights(filepath, overwrite=True)
-                else:
-                    self.model.save(filepath, overwrite=True)
+                self._save(filepath)
         except IsADirectoryError:  # h5py 3.x
             raise IOError(
                 "Please specify a non-directory filepath for "
@@ -305,6 +311,36 @@ class ModelCheckpoint(Callback):
             # Re-throw the error for any other causes.
             raise e
 
+    def _save(self, filepath):
+        if not self.async_save:
+            if self.save_weights_only:
+                self.model.save_weights(filepath, overwrite=True)
+            else:
+                self.model.save(filepath, overwrite=True)
+            return
+        # Only keep one save in flight, so that at most one snapshot of the
+        # model is held in memory.
+        self._wait_for_pending_save()
+        snapshot = saving_lib.ModelSnapshot(
+            self.model, weights_only=self.save_weights_only
+        )
+        if self._executor is None:
+            self._executor = futures.ThreadPoolExecutor(max_workers=1)
+        self._pending_save = self._executor.submit(snapshot.save, filepath)
+
+    def _wait_for_pending_save(self):
+        if self._pending_save is not None:
+            pending_save, self._pending_save = self._pending_save, None
+            pending_save.result()
+
+    def on_train_end(self, logs=None):
+        try:
+            self._wait_for_pending_save()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
     def _get_file_path(self, epoch, batch, logs):
         """Returns the file path for checkpoint."""
 
@@ -545,3 +545,81 @@ class ModelCheckpointTest(testing.TestCase):
         self.assertEqual(len(ref_weights), len(new_weights))
         for ref_w, w in zip(ref_weights, new_weights):
             self.assertAllClose(ref_w, w)
+
+    @pytest.mark.skipif(
+        h5py is None,
+        reason="`h5py` is a required dependency for `ModelCheckpoint` tests.",
+    )
+    @pytest.mark.requires_trainable_backend
+    def test_model_checkpoint_async_save(self):
+        def get_model():
+            model = Sequential(
+                [
+                    layers.Input(shape=(INPUT_DIM,)),
+                    layers.Dense(NUM_HIDDEN, activation="relu"),
+                    layers.Dense(NUM_CLASSES, activation="softmax"),
+                ]
+            )
+            model.compile(loss="categorical_crossentropy", optimizer="adam")
+            return model
+
+        (x_train, y_train), _ = test_utils.get_test_data(
+            random_seed=42,
+            train_samples=TRAIN_SAMPLES,
+            test_samples=TEST_SAMPLES,
+            input_shape=(INPUT_DIM,),
+            num_classes=NUM_CLASSES,
+        )
+        y_train = numerical_utils.to_categorical(
+            y_train, num_classes=NUM_CLASSES
+        )
+        temp_dir = self.get_temp_dir()
+
+        # Whole model, saved every other batch.
+        model = get_model()
+        filepath = os.path.join(temp_dir, "checkpoint.{batch:02d}.keras")
+        cbk = callbacks.ModelCheckpoint(filepath, save_freq=2, async_save=True)
+        model.fit(
+            x_train,
+            y_train,
+            batch_size=BATCH_SIZE,
+            callbacks=[cbk],
+            epochs=1,
+            verbose=0,
+        )
+        self.assertIsNone(cbk._pending_save)
+        self.assertIsNone(cbk._executor)
+        for batch in (2, 4, 6):
+            self.assertTrue(
+                os.path.exists(
+                    os.path.join(temp_dir, f"checkpoint.{batch:02d}.keras")
+                )
+            )
+        new_model = saving.load_model(
+            os.path.join(temp_dir, "checkpoint.06.keras")
+        )
+        for ref_w, w in zip(model.get_weights(), new_model.get_weights()):
+            self.assertAllClose(ref_w, w)
+        for ref_v, v in zip(
+            model.optimizer.variables, new_model.optimizer.variables
+        ):
+            self.assertAllClose(ref_v, v)
+
+        # Weights only.
+        model = get_model()
+        filepath = os.path.join(temp_dir, "checkpoint.weights.h5")
+        cbk = callbacks.ModelCheckpoint(
+            filepath, save_weights_only=True, async_save=True
+        )
+        model.fit(
+            x_train,
+            y_train,
+            batch_size=BATCH_SIZE,
+            callbacks=[cbk],
+            epochs=2,
+            verbose=0,
+        )
+        new_model = get_model()
+        new_model.load_weights(filepath)
+        for ref_w, w in zip(model.get_weights(), new_model.get_weights()):
+            self.assertAllClose(ref_w, w)
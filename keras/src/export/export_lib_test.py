@@ -464,6 +464,30 @@ class ExportArchiveTest(testing.TestCase, parameterized.TestCase):
         revived_layer = tf.saved_model.load(temp_filepath)
         self.assertAllClose(ref_output, revived_layer.call(ref_input))
 
+    @parameterized.named_parameters(
+        ("string_lookup", "string"), ("integer_lookup", "int64")
+    )
+    @pytest.mark.skipif(
+        backend.backend() != "tensorflow",
+        reason="Lookup tables can only be exported with TensorFlow ops.",
+    )
+    def test_model_with_lookup_table_export(self, dtype):
+        temp_filepath = os.path.join(self.get_temp_dir(), "exported_model")
+        if dtype == "string":
+            lookup = layers.StringLookup(vocabulary=["a", "b", "c"])
+            ref_input = tf.constant([["a", "c"], ["d", "b"]])
+        else:
+            lookup = layers.IntegerLookup(vocabulary=[12, 36, 1138])
+            ref_input = tf.constant([[12, 1138], [42, 36]], dtype="int64")
+        inputs = layers.Input((2,), dtype=dtype)
+        model = models.Model(inputs, lookup(inputs))
+        ref_output = model(ref_input)
+
+        export_lib.export_model(model, temp_filepath)
+        revived_model = tf.saved_model.load(temp_filepath)
+        self.assertAllClose(ref_output, revived_model.serve(ref_input))
+        self.assertAllClose(ref_output, [[1, 3], [0, 2]])
+
     def test_multi_input_output_functional_model(self):
         temp_filepath = os.path.join(self.get_temp_dir(), "exported_model")
         x1 = layers.Input((2,))
@@ -1,3 +1,4 @@
+from keras.src import backend
 from keras.src import constraints
 from keras.src import initializers
 from keras.src import ops
@@ -28,6 +29,11 @@ class GroupedQueryAttention(Layer):
     interpolated by these probabilities and concatenated back to a single
     tensor.
 
+    When the attention scores are not returned and no dropout is applied, the
+    attention is computed with `keras.ops.dot_product_attention`, which does
+    not repeat `key` and `value`, and does not materialize the attention
+    scores when the backend allows.
+
     Args:
         head_dim: Size of each attention head.
         num_query_heads: Number of query attention heads.
@@ -68,6 +74,20 @@ class GroupedQueryAttention(Layer):
         use_causal_mask: A boolean to indicate whether to apply a causal mask to
             prevent tokens from attending to future tokens (e.g., used in a
             decoder Transformer).
+        cache: Optional key/value cache of shape
+            `(batch_dim, 2, cache_seq_len, num_key_value_heads, head_dim)`,
+            for incremental decoding, where `cache[:, 0]` holds the projected
+            keys and `cache[:, 1]` the projected values of the
+            `cache_seq_len` positions that can be attended to. When given, the
+            query attends to the keys and values of the cache, instead of the
+            projections of `key` and `value`, and the Keras masks of `key` and
+            `value` are not used.
+        cache_update_index: Optional integer or integer tensor, the position
+            in the cache of the first timestep of `key` and `value`. When
+            given with `cache`, the projections of `key` and `value` are
+            written to the cache at this position with `ops.slice_update`
+            before computing the attention, and the causal mask is shifted
+            by this position. When `None`, the cache is used as is.
 
     Returns:
         attention_output: Result of the computation, of shape
@@ -76,6 +96,8 @@ class GroupedQueryAttention(Layer):
             last dim.
         attention_scores: (Optional) attention coefficients of shape
             `(batch_dim, num_query_heads, target_seq_len, source_seq_len)`.
+        cache: (Optional) the updated key/value cache, returned last when
+            `cache` is given.
     """
 
     def __init__(
@@ -114,6 +136,7 @@ class GroupedQueryAttention(Layer):
         self.activity_regularizer = regularizers.get(activity_regularizer)
         self.kernel_constraint = constraints.get(kernel_constraint)
         self.bias_constraint = constraints.get(bias_constraint)
+        self._return_attention_scores = False
 
     def build(
         self,
@@ -212,30 +235,43 @@ class GroupedQueryAttention(Layer):
         return_attention_scores=False,
         training=None,
         use_causal_mask=False,
+        cache=None,
+        cache_update_index=None,
     ):
         if key is None:
             key = value
-
-        attention_mask = self._compute_attention_mask(
-            query,
-            value,
-            query_mask=query_mask,
-            value_mask=value_mask,
-            key_mask=key_mask,
-            attention_mask=attention_mask,
-            use_causal_mask=use_causal_mask,
-        )
+        self._return_attention_scores = return_attention_scores
+
+        if cache is not None:
+            # The keys and values are the ones of the cache, whose length
+            # differs from the one of `key` and `value`.
+            attention_mask = self._compute_attention_mask(
+                query,
+                cache[:, 0, ...],
+                query_mask=query_mask,
+                attention_mask=attention_mask,
+                use_causal_mask=use_causal_mask,
+                cache_update_index=cache_update_index,
+            )
+        else:
+            attention_mask = self._compute_attention_mask(
+                query,
+                value,
+                query_mask=query_mask,
+                value_mask=value_mask,
+                key_mask=key_mask,
+                attention_mask=attention_mask,
+                use_causal_mask=use_causal_mask,
+            )
 
         query = self._query_dense(query)
-        key = self._key_dense(key)
-        value = self._value_dense(value)
-
-        key = ops.repeat(
-            key, self.num_repeats, axis=2
-        )  # (batch_dim, source_seq_len, query_heads, head_dim)
-        value = ops.repeat(
-            value, self.num_repeats, axis=2
-        )  # (batch_dim, source_seq_len, query_heads, head_dim)
+        if cache is not None:
+            key, value, cache = self._update_cache(
+                key, value, cache, cache_update_index
+            )
+        else:
+            key = self._key_dense(key)
+            value = self._value_dense(value)
 
         output, scores = self._compute_attention(
             query,
@@ -249,10 +285,45 @@ class GroupedQueryAttention(Layer):
             output
         )  # (batch_dim, target_seq_len, feature_dim)
 
+        if cache is not None:
+            if return_attention_scores:
+                return output, scores, cache
+            return output, cache
         if return_attention_scores:
             return output, scores
         return output
 
+    def _update_cache(self, key, value, cache, cache_update_index):
+        """Returns the keys and values of the cache, and the updated cache.
+
+        Args:
+            key: Key tensor of shape `(batch_dim, source_seq_len, feature_dim)`.
+            value: Value tensor of shape
+                `(batch_dim, source_seq_len, feature_dim)`.
+            cache: Key/value cache of shape
+                `(batch_dim, 2, cache_seq_len, num_key_value_heads, head_dim)`.
+            cache_update_index: The position in the cache of the first
+                timestep of `key` and `value`, or `None` to use the cache as
+                is.
+
+        Returns:
+            A tuple `(key, value, cache)`, where `key` and `value` are the
+            keys and values of the updated cache, of shape
+            `(batch_dim, cache_seq_len, num_key_value_heads, head_dim)`.
+        """
+        key_cache = cache[:, 0, ...]
+        value_cache = cache[:, 1, ...]
+        if cache_update_index is None:
+            return key_cache, value_cache, cache
+
+        key = ops.cast(self._key_dense(key), cache.dtype)
+        value = ops.cast(self._value_dense(value), cache.dtype)
+        start = [0, cache_update_index, 0, 0]
+        key_cache = ops.slice_update(key_cache, start, key)
+        value_cache = ops.slice_update(value_cache, start, value)
+        cache = ops.stack((key_cache, value_cache), axis=1)
+        return key_cache, value_cache, cache
+
     def _compute_attention_mask(
         self,
         query,
@@ -262,6 +333,7 @@ class GroupedQueryAttention(Layer):
         key_mask=None,
         attention_mask=None,
         use_causal_mask=False,
+        cache_update_index=None,
     ):
         """Computes the attention mask, using the Keras masks of the inputs.
 
@@ -286,6 +358,9 @@ class GroupedQueryAttention(Layer):
             use_causal_mask: A boolean to indicate whether to apply a causal
                 mask to prevent tokens from attending to future tokens (e.g.,
                 used in a decoder Transformer).
+            cache_update_index: The position of the first query timestep in
+                the keys, which shifts the causal mask. Defaults to `None`,
+                for no shift.
 
         Returns:
             attention_mask: a boolean mask of shape `(B, T, S)`, that prevents
@@ -310,7 +385,9 @@ class GroupedQueryAttention(Layer):
             auto_mask = mask if auto_mask is None else auto_mask & mask
         if use_causal_mask:
             # the shape of the causal mask is [1, T, S]
-            mask = self._compute_causal_mask(query, value)
+            mask = self._compute_causal_mask(
+                query, value, cache_update_index=cache_update_index
+            )
             auto_mask = mask if auto_mask is None else auto_mask & mask
         if auto_mask is not None:
             # merge attention_mask & automatic mask, to shape [B, T, S]
@@ -321,7 +398,7 @@ class GroupedQueryAttention(Layer):
             )
         return attention_mask
 
-    def _compute_causal_mask(self, query, value=None):
+    def _compute_causal_mask(self, query, value=None, cache_update_index=None):
         """Computes a causal mask (e.g., for masked self-attention layers).
 
         For example, if query and value both contain sequences of length 4,
@@ -338,6 +415,9 @@ class GroupedQueryAttention(Layer):
             query: query tensor of shape `(B, T, ...)`.
             value: value tensor of shape `(B, S, ...)` (optional, defaults to
                 query).
+            cache_update_index: The position of the first query timestep in
+                `value` (optional, defaults to 0). Query timestep `i` attends
+                to the value timesteps up to `cache_update_index + i`.
 
         Returns:
             mask: a boolean tensor of shape `(1, T, S)` containing a lower
@@ -348,11 +428,31 @@ class GroupedQueryAttention(Layer):
         ones_mask = ops.ones((1, q_seq_length, v_seq_length), dtype="int32")
         row_index = ops.cumsum(ones_mask, axis=-2)
         col_index = ops.cumsum(ones_mask, axis=-1)
+        if cache_update_index is not None:
+            row_index = row_index + ops.cast(cache_update_index, "int32")
         return ops.greater_equal(row_index, col_index)
 
     def _compute_attention(
         self, query, key, value, attention_mask=None, training=None
     ):
+        if not self._return_attention_scores and not (
+            self.dropout and training
+        ):
+            if attention_mask is not None:
+                # Expand the heads dimension, e.g. `(B, T, S)` -> `(B, 1, T, S)`
+                for _ in range(4 - len(attention_mask.shape)):
+                    attention_mask = ops.expand_dims(attention_mask, axis=-3)
+            output = ops.dot_product_attention(
+                query, key, value, mask=attention_mask
+            )
+            return output, None
+
+        key = ops.repeat(
+            key, self.num_repeats, axis=2
+        )  # (batch_dim, source_seq_len, query_heads, head_dim)
+        value = ops.repeat(
+            value, self.num_repeats, axis=2
+        )  # (batch_dim, source_seq_len, query_heads, head_dim)
         query = ops.multiply(
             query,
             1.0 / ops.sqrt(ops.cast(self.head_dim, query.dtype)),
@@ -408,6 +508,46 @@ class GroupedQueryAttention(Layer):
 
         return query_shape
 
+    def compute_output_spec(
+        self,
+        query,
+        value,
+        key=None,
+        query_mask=None,
+        value_mask=None,
+        key_mask=None,
+        attention_mask=None,
+        return_attention_scores=False,
+        training=None,
+        use_causal_mask=False,
+        cache=None,
+        cache_update_index=None,
+    ):
+        key_shape = None if key is None else key.shape
+        output_shape = self.compute_output_shape(
+            query.shape, value.shape, key_shape
+        )
+        output_spec = backend.KerasTensor(
+            output_shape, dtype=self.compute_dtype
+        )
+        outputs = (output_spec,)
+        if return_attention_scores:
+            source_length = value.shape[1] if cache is None else cache.shape[2]
+            attention_shape = (
+                query.shape[0],
+                self.num_query_heads,
+                query.shape[1],
+                source_length,
+            )
+            outputs += (
+                backend.KerasTensor(attention_shape, dtype=self.compute_dtype),
+            )
+        if cache is not None:
+            outputs += (backend.KerasTensor(cache.shape, dtype=cache.dtype),)
+        if len(outputs) == 1:
+            return output_spec
+        return outputs
+
     def get_config(self):
         config = {
             "head_dim": self.head_dim,
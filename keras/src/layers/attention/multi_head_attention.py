@@ -41,6 +41,11 @@ class MultiHeadAttention(Layer):
     Finally, the result tensor with the last dimension as `value_dim` can take
     a linear projection and return.
 
+    When the attention is over a single axis, the attention scores are not
+    returned and no dropout is applied, the attention is computed with
+    `keras.ops.dot_product_attention`, which does not materialize the
+    attention scores when the backend allows.
+
     Args:
         num_heads: Number of attention heads.
         key_dim: Size of each attention head for query and key.
@@ -83,6 +88,19 @@ class MultiHeadAttention(Layer):
         use_causal_mask: A boolean to indicate whether to apply a causal mask to
             prevent tokens from attending to future tokens (e.g., used in a
             decoder Transformer).
+        cache: Optional key/value cache of shape `(B, 2, S, N, key_dim)`, for
+            incremental decoding, where `cache[:, 0]` holds the projected keys
+            and `cache[:, 1]` the projected values of the `S` positions that
+            can be attended to. When given, the query attends to the keys and
+            values of the cache, instead of the projections of `key` and
+            `value`, and the Keras masks of `key` and `value` are not used.
+            Requires `value_dim == key_dim` and a single attention axis.
+        cache_update_index: Optional integer or integer tensor, the position
+            in the cache of the first timestep of `key` and `value`. When
+            given with `cache`, the projections of `key` and `value` are
+            written to the cache at this position with `ops.slice_update`
+            before computing the attention, and the causal mask is shifted
+            by this position. When `None`, the cache is used as is.
 
     Returns:
         attention_output: The result of the computation, of shape `(B, T, E)`,
@@ -92,6 +110,26 @@ class MultiHeadAttention(Layer):
             `output_shape`.
         attention_scores: (Optional) multi-head attention coefficients over
             attention axes.
+        cache: (Optional) the updated key/value cache, returned last when
+            `cache` is given.
+
+    Example of greedy decoding with a cache of 16 positions:
+
+    ```python
+    layer = keras.layers.MultiHeadAttention(num_heads=2, key_dim=8)
+    cache = keras.ops.zeros((batch_size, 2, 16, 2, 8))
+    x = first_token_embeddings  # (batch_size, 1, dim)
+    for index in range(16):
+        # Attends to the positions up to `index` of the cache.
+        outputs, cache = layer(
+            x,
+            x,
+            cache=cache,
+            cache_update_index=index,
+            use_causal_mask=True,
+        )
+        x = next_token_embeddings(outputs)
+    ```
     """
 
     def __init__(
@@ -137,6 +175,7 @@ class MultiHeadAttention(Layer):
                 f"Received: attention_axes={attention_axes}"
             )
         self._attention_axes = attention_axes
+        self._return_attention_scores = False
 
     @property
     def num_heads(self):
@@ -401,8 +440,28 @@ class MultiHeadAttention(Layer):
 
         Returns:
           attention_output: Multi-headed outputs of attention computation.
-          attention_scores: Multi-headed attention weights.
+          attention_scores: Multi-headed attention weights, or `None` when they
+            are not computed.
         """
+        if (
+            not self._return_attention_scores
+            and not (self.dropout and training)
+            and len(self._attention_axes) == 1
+            and len(query.shape) == 4
+        ):
+            if attention_mask is not None:
+                # Expand the heads dimension, e.g. `(B, T, S)` -> `(B, 1, T, S)`
+                for _ in range(4 - len(attention_mask.shape)):
+                    attention_mask = ops.expand_dims(attention_mask, axis=-3)
+            attention_output = ops.dot_product_attention(
+                query,
+                key,
+                value,
+                mask=attention_mask,
+                scale=self._inverse_sqrt_key_dim,
+            )
+            return attention_output, None
+
         # Note: Applying scalar multiply at the smaller end of einsum improves
         # XLA performance, but may introduce slight numeric differences in
         # the Transformer attention head.
@@ -445,40 +504,98 @@ class MultiHeadAttention(Layer):
         return_attention_scores=False,
         training=None,
         use_causal_mask=False,
+        cache=None,
+        cache_update_index=None,
     ):
         if key is None:
             key = value
-
-        attention_mask = self._compute_attention_mask(
-            query,
-            value,
-            query_mask=query_mask,
-            value_mask=value_mask,
-            key_mask=key_mask,
-            attention_mask=attention_mask,
-            use_causal_mask=use_causal_mask,
-        )
+        self._return_attention_scores = return_attention_scores
+
+        if cache is not None:
+            if self._value_dim != self._key_dim:
+                raise ValueError(
+                    "`cache` requires `value_dim` to be equal to `key_dim`. "
+                    f"Received: key_dim={self._key_dim}, "
+                    f"value_dim={self._value_dim}"
+                )
+            # The keys and values are the ones of the cache, whose length
+            # differs from the one of `key` and `value`.
+            attention_mask = self._compute_attention_mask(
+                query,
+                cache[:, 0, ...],
+                query_mask=query_mask,
+                attention_mask=attention_mask,
+                use_causal_mask=use_causal_mask,
+                cache_update_index=cache_update_index,
+            )
+        else:
+            attention_mask = self._compute_attention_mask(
+                query,
+                value,
+                query_mask=query_mask,
+                value_mask=value_mask,
+                key_mask=key_mask,
+                attention_mask=attention_mask,
+                use_causal_mask=use_causal_mask,
+            )
 
         #   N = `num_attention_heads`
         #   H = `size_per_head`
         # `query` = [B, T, N ,H]
         query = self._query_dense(query)
 
-        # `key` = [B, S, N, H]
-        key = self._key_dense(key)
+        if cache is not None:
+            key, value, cache = self._update_cache(
+                key, value, cache, cache_update_index
+            )
+        else:
+            # `key` = [B, S, N, H]
+            key = self._key_dense(key)
 
-        # `value` = [B, S, N, H]
-        value = self._value_dense(value)
+            # `value` = [B, S, N, H]
+            value = self._value_dense(value)
 
         attention_output, attention_scores = self._compute_attention(
             query, key, value, attention_mask, training
         )
         attention_output = self._output_dense(attention_output)
 
+        if cache is not None:
+            if return_attention_scores:
+                return attention_output, attention_scores, cache
+            return attention_output, cache
         if return_attention_scores:
             return attention_output, attention_scores
         return attention_output
 
+    def _update_cache(self, key, value, cache, cache_update_index):
+        """Returns the keys and values of the cache, and the updated cache.
+
+        Args:
+            key: Key tensor of shape `(B, T, dim)`.
+            value: Value tensor of shape `(B, T, dim)`.
+            cache: Key/value cache of shape `(B, 2, S, N, key_dim)`.
+            cache_update_index: The position in the cache of the first
+                timestep of `key` and `value`, or `None` to use the cache as
+                is.
+
+        Returns:
+            A tuple `(key, value, cache)`, where `key` and `value` are the
+            keys and values of the updated cache, of shape `(B, S, N, key_dim)`.
+        """
+        key_cache = cache[:, 0, ...]
+        value_cache = cache[:, 1, ...]
+        if cache_update_index is None:
+            return key_cache, value_cache, cache
+
+        key = ops.cast(self._key_dense(key), cache.dtype)
+        value = ops.cast(self._value_dense(value), cache.dtype)
+        start = [0, cache_update_index, 0, 0]
+        key_cache = ops.slice_update(key_cache, start, key)
+        value_cache = ops.slice_update(value_cache, start, value)
+        cache = ops.stack((key_cache, value_cache), axis=1)
+        return key_cache, value_cache, cache
+
     def _compute_attention_mask(
         self,
         query,
@@ -488,6 +605,7 @@ class MultiHeadAttention(Layer):
         key_mask=None,
         attention_mask=None,
         use_causal_mask=False,
+        cache_update_index=None,
     ):
         """Computes the attention mask, using the Keras masks of the inputs.
 
@@ -512,6 +630,9 @@ class MultiHeadAttention(Layer):
             use_causal_mask: A boolean to indicate whether to apply a causal
                 mask to prevent tokens from attending to future tokens (e.g.,
                 used in a decoder Transformer).
+            cache_update_index: The position of the first query timestep in
+                the keys, which shifts the causal mask. Defaults to `None`,
+                for no shift.
 
         Returns:
             attention_mask: a boolean mask of shape `(B, T, S)`, that prevents
@@ -536,7 +657,9 @@ class MultiHeadAttention(Layer):
             auto_mask = mask if auto_mask is None else auto_mask & mask
         if use_causal_mask:
             # the shape of the causal mask is [1, T, S]
-            mask = self._compute_causal_mask(query, value)
+            mask = self._compute_causal_mask(
+                query, value, cache_update_index=cache_update_index
+            )
             auto_mask = mask if auto_mask is None else auto_mask & mask
         if auto_mask is not None:
             # merge attention_mask & automatic mask, to shape [B, T, S]
@@ -547,7 +670,7 @@ class MultiHeadAttention(Layer):
             )
         return attention_mask
 
-    def _compute_causal_mask(self, query, value=None):
+    def _compute_causal_mask(self, query, value=None, cache_update_index=None):
         """Computes a causal mask (e.g., for masked self-attention layers).
 
         For example, if query and value both contain sequences of length 4,
@@ -564,6 +687,9 @@ class MultiHeadAttention(Layer):
             query: query tensor of shape `(B, T, ...)`.
             value: value tensor of shape `(B, S, ...)` (optional, defaults to
                 query).
+            cache_update_index: The position of the first query timestep in
+                `value` (optional, defaults to 0). Query timestep `i` attends
+                to the value timesteps up to `cache_update_index + i`.
 
         Returns:
             mask: a boolean tensor of shape `(1, T, S)` containing a lower
@@ -574,6 +700,8 @@ class MultiHeadAttention(Layer):
         ones_mask = ops.ones((1, q_seq_length, v_seq_length), dtype="int32")
         row_index = ops.cumsum(ones_mask, axis=-2)
         col_index = ops.cumsum(ones_mask, axis=-1)
+        if cache_update_index is not None:
+            row_index = row_index + ops.cast(cache_update_index, "int32")
         return ops.greater_equal(row_index, col_index)
 
     def compute_output_shape(
@@ -616,6 +744,8 @@ class MultiHeadAttention(Layer):
         return_attention_scores=False,
         training=None,
         use_causal_mask=False,
+        cache=None,
+        cache_update_index=None,
     ):
         if key is not None:
             key_shape = key.shape
@@ -627,13 +757,20 @@ class MultiHeadAttention(Layer):
         output_spec = backend.KerasTensor(
             output_shape, dtype=self.compute_dtype
         )
+        outputs = (output_spec,)
         if return_attention_scores:
             length = query.shape[1]
             attention_shape = (query.shape[0], self.num_heads, length, length)
-            return output_spec, backend.KerasTensor(
-                attention_shape, dtype=self.compute_dtype
+            if cache is not None:
+                attention_shape = attention_shape[:-1] + (cache.shape[2],)
+            outputs += (
+                backend.KerasTensor(attention_shape, dtype=self.compute_dtype),
             )
-        return output_spec
+        if cache is not None:
+            outputs += (backend.KerasTensor(cache.shape, dtype=cache.dtype),)
+        if len(outputs) == 1:
+            return output_spec
+        return outputs
 
 
 def _index_to_einsum_variable(i):
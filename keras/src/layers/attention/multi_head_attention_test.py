@@ -218,6 +218,78 @@ class MultiHeadAttentionTest(testing.TestCase, parameterized.TestCase):
         )
         self.assertAllClose(output, output_with_manual_mask)
 
+    @parameterized.named_parameters(("causal", True), ("not_causal", False))
+    def test_dot_product_attention(self, use_causal_mask):
+        """Test that the fused attention matches the attention scores path."""
+        layer = layers.MultiHeadAttention(num_heads=2, key_dim=4)
+        rng = np.random.default_rng(0)
+        query = rng.normal(size=(2, 5, 8)).astype("float32")
+        value = rng.normal(size=(2, 7, 8)).astype("float32")
+        attention_mask = rng.random((2, 5, 7)) > 0.3
+        # `return_attention_scores=True` computes the attention scores.
+        expected, _ = layer(
+            query,
+            value,
+            attention_mask=attention_mask,
+            use_causal_mask=use_causal_mask,
+            return_attention_scores=True,
+        )
+        output = layer(
+            query,
+            value,
+            attention_mask=attention_mask,
+            use_causal_mask=use_causal_mask,
+        )
+        self.assertAllClose(output, expected, atol=1e-5, rtol=1e-5)
+
+    def test_cache(self):
+        """Test that decoding with a cache matches the full attention."""
+        layer = layers.MultiHeadAttention(num_heads=2, key_dim=4)
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=(2, 5, 8)).astype("float32")
+        expected = layer(x, x, use_causal_mask=True)
+
+        # Fill the cache with the first 3 timesteps, then decode one timestep
+        # at a time.
+        cache = np.zeros((2, 2, 5, 2, 4), "float32")
+        outputs, cache = layer(
+            x[:, :3],
+            x[:, :3],
+            cache=cache,
+            cache_update_index=0,
+            use_causal_mask=True,
+        )
+        self.assertAllClose(outputs, expected[:, :3], atol=1e-5, rtol=1e-5)
+        for index in (3, 4):
+            inputs = x[:, index : index + 1]
+            outputs, scores, cache = layer(
+                inputs,
+                inputs,
+                cache=cache,
+                cache_update_index=index,
+                use_causal_mask=True,
+                return_attention_scores=True,
+            )
+            self.assertAllClose(
+                outputs, expected[:, index : index + 1], atol=1e-5, rtol=1e-5
+            )
+            self.assertEqual(scores.shape[-2:], (1, 5))
+
+        # Without `cache_update_index`, the cache is used as is.
+        outputs, new_cache = layer(x[:, 4:], x[:, :1], cache=cache)
+        self.assertAllClose(outputs, expected[:, 4:], atol=1e-5, rtol=1e-5)
+        self.assertAllClose(new_cache, cache)
+
+        # Symbolic call.
+        outputs, cache = layer(
+            layers.Input((1, 8)),
+            layers.Input((1, 8)),
+            cache=layers.Input((2, 2, 5, 2, 4)[1:]),
+            cache_update_index=2,
+        )
+        self.assertEqual(outputs.shape, (None, 1, 8))
+        self.assertEqual(cache.shape, (None,) + (2, 2, 5, 2, 4)[1:])
+
     def test_correctness(self):
         query = np.array([[[1.0, 0.0], [0.0, 1.0]]])
         key = np.array([[[0.0, 1.0], [1.0, 0.0]]])
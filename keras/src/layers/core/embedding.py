@@ -65,6 +65,20 @@ class Embedding(Layer):
             computation cost of fine-tuning large embedding layers.
             You can also enable LoRA on an existing
             `Embedding` layer by calling `layer.enable_lora(rank)`.
+        sparse_updates: Boolean. If `True`, the optimizer only updates the
+            rows of the embeddings matrix that are looked up in each batch,
+            along with the same rows of its slot variables (e.g. the
+            momentums of `Adam`), which is much faster for large
+            vocabularies. Rows that are not looked up keep their slot
+            values, so that for instance `Adam` does not decay their
+            moments ("lazy" Adam). Only supported by optimizers that
+            implement `sparse_update_step()`: `Adam`, `AdamW`, `Adagrad` and
+            `SGD`; other optimizers apply dense updates. With the torch
+            backend, the gradients of the embeddings are sparse tensors,
+            except in compiled functions (`jit_compile=True`), where they
+            are dense. Not supported with the JAX backend, where the
+            embeddings get dense updates, with a warning. Defaults to
+            `False`.
 
     Input shape:
         2D tensor with shape: `(batch_size, input_length)`.
@@ -83,6 +97,7 @@ class Embedding(Layer):
         mask_zero=False,
         weights=None,
         lora_rank=None,
+        sparse_updates=False,
         **kwargs,
     ):
         input_length = kwargs.pop("input_length", None)
@@ -101,6 +116,7 @@ class Embedding(Layer):
         self.autocast = False
         self.lora_rank = lora_rank
         self.lora_enabled = False
+        self.sparse_updates = sparse_updates
 
         if weights is not None:
             self.build()
@@ -128,6 +144,7 @@ class Embedding(Layer):
                 constraint=self.embeddings_constraint,
                 trainable=True,
             )
+            self._embeddings.sparse_updates = self.sparse_updates
         self.built = True
         if self.lora_rank:
             self.enable_lora(self.lora_rank)
@@ -259,6 +276,8 @@ class Embedding(Layer):
         }
         if self.lora_rank:
             config["lora_rank"] = self.lora_rank
+        if self.sparse_updates:
+            config["sparse_updates"] = self.sparse_updates
         return {**base_config, **config}
 
     def _check_load_own_variables(self, store):
@@ -115,6 +115,64 @@ class EmbeddingTest(test_case.TestCase, parameterized.TestCase):
         layer.build((None, 2))
         self.assertIsInstance(layer.embeddings.constraint, constraints.NonNeg)
 
+    @pytest.mark.requires_trainable_backend
+    @pytest.mark.skipif(
+        backend.backend() == "jax",
+        reason="JAX ignores `sparse_updates`.",
+    )
+    def test_sparse_updates(self):
+        layer = layers.Embedding(10, 4, sparse_updates=True)
+        model = models.Sequential(
+            [layers.Input((3,), dtype="int32"), layer, layers.Dense(1)]
+        )
+        self.assertTrue(layer.embeddings.sparse_updates)
+        initial_embeddings = ops.convert_to_numpy(layer.embeddings)
+        model.compile(optimizer="adam", loss="mse")
+        x = np.random.randint(0, 5, size=(8, 3))
+        model.fit(x, np.ones((8, 3, 1)), batch_size=4, epochs=2, verbose=0)
+
+        # Only the rows that are looked up are updated, with their moments.
+        embeddings = ops.convert_to_numpy(layer.embeddings)
+        self.assertNotAllClose(embeddings[:5], initial_embeddings[:5])
+        self.assertAllClose(embeddings[5:], initial_embeddings[5:])
+        momentums = model.optimizer._momentums[0]
+        self.assertAllClose(ops.take(momentums, [5, 6, 7, 8, 9], axis=0), 0)
+
+        config = layer.get_config()
+        self.assertTrue(config["sparse_updates"])
+        self.assertTrue(layers.Embedding.from_config(config).sparse_updates)
+
+    @pytest.mark.skipif(
+        backend.backend() != "torch",
+        reason="Only torch computes sparse gradients of variables.",
+    )
+    def test_sparse_updates_torch_gradient(self):
+        layer = layers.Embedding(10, 4, sparse_updates=True)
+        ops.sum(layer(np.array([[1, 2], [2, 3]]))).backward()
+        grad = layer.embeddings.value.grad
+        self.assertTrue(grad.is_sparse)
+        self.assertAllClose(grad.to_dense()[:5, 0], [0, 1, 2, 1, 0])
+
+    @pytest.mark.skipif(
+        backend.backend() != "torch",
+        reason="Only torch computes sparse gradients of variables.",
+    )
+    def test_sparse_updates_torch_jit_compile(self):
+        # Inductor can't compile sparse embedding lookups, which are dense in
+        # compiled functions.
+        layer = layers.Embedding(10, 4, sparse_updates=True)
+        model = models.Sequential(
+            [layers.Input((3,), dtype="int32"), layer, layers.Dense(1)]
+        )
+        initial_embeddings = ops.convert_to_numpy(layer.embeddings)
+        model.compile(optimizer="adam", loss="mse", jit_compile=True)
+        x = np.random.randint(0, 5, size=(8, 3))
+        model.fit(x, np.ones((8, 3, 1)), batch_size=4, epochs=2, verbose=0)
+
+        embeddings = ops.convert_to_numpy(layer.embeddings)
+        self.assertNotAllClose(embeddings[:5], initial_embeddings[:5])
+        self.assertAllClose(embeddings[5:], initial_embeddings[5:])
+
     @pytest.mark.requires_trainable_backend
     def test_enable_lora(self):
         layer = layers.Embedding(10, 16)
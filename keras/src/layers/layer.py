@@ -341,6 +341,8 @@ class Layer(BackendLayer, Operation, KerasSaveable):
         self._layers = layers
         self._metrics = metrics
         self._seed_generators = seed_generators
+        # `CallPlan`s of the eager calls of the layer, by argument structure.
+        self._call_plans = {}
 
         if backend.backend() == "tensorflow":
             # Reset attribute tracking (TF-specific)
@@ -724,7 +726,8 @@ class Layer(BackendLayer, Operation, KerasSaveable):
     @traceback_utils.filter_traceback
     def __call__(self, *args, **kwargs):
         self._check_super_called()
-        self._called = True
+        if not self._called:
+            self._called = True
 
         #####################################
         # 1. Convert any array arguments to tensors of correct dtype.
@@ -733,42 +736,62 @@ class Layer(BackendLayer, Operation, KerasSaveable):
                 x, self.autocast, self.input_dtype
             )
 
-        # Used to avoid expensive `tree` operations in the most common case.
-        if (
-            kwargs
-            or len(args) != 1
-            or not backend.is_tensor(args[0])
-            or backend.standardize_dtype(args[0].dtype) != self.input_dtype
-        ) and self._convert_input_args:
-            args = tree.map_structure(maybe_convert, args)
-            kwargs = tree.map_structure(maybe_convert, kwargs)
-
-        ##########################################################
-        # 2. Enforce that only tensors can be passed positionally.
-        if not self._allow_non_tensor_positional_args:
-            for arg in tree.flatten(args):
-                if not isinstance(arg, KerasTensor) and not backend.is_tensor(
-                    arg
-                ):
-                    raise ValueError(
-                        "Only input tensors may be passed as "
-                        "positional arguments. The following argument value "
-                        f"should be passed as a keyword argument: {arg} "
-                        f"(of type {type(arg)})"
-                    )
+        # Eager calls of built layers with flat tensor arguments use a cached
+        # `CallPlan`, which replaces the binding of the arguments to the
+        # signature of `call()` in steps 1 to 4 and 6.
+        call_plan = self._get_call_plan(args, kwargs) if self.built else None
+        if call_plan is not None:
+            if self._convert_input_args:
+                args, kwargs = self._convert_flat_input_args(
+                    maybe_convert, args, kwargs
+                )
+            first_arg, training, default_training = call_plan.apply(
+                args, kwargs
+            )
+            self._assert_input_compatibility(first_arg)
+        else:
+            # Used to avoid expensive `tree` operations in the most common case.
+            if (
+                kwargs
+                or len(args) != 1
+                or not backend.is_tensor(args[0])
+                or backend.standardize_dtype(args[0].dtype) != self.input_dtype
+            ) and self._convert_input_args:
+                args = tree.map_structure(maybe_convert, args)
+                kwargs = tree.map_structure(maybe_convert, kwargs)
+
+            ##########################################################
+            # 2. Enforce that only tensors can be passed positionally.
+            if not self._allow_non_tensor_positional_args:
+                for arg in tree.flatten(args):
+                    if not isinstance(
+                        arg, KerasTensor
+                    ) and not backend.is_tensor(arg):
+                        raise ValueError(
+                            "Only input tensors may be passed as "
+                            "positional arguments. The following argument "
+                            "value should be passed as a keyword argument: "
+                            f"{arg} "
+                            f"(of type {type(arg)})"
+                        )
 
-        # Caches info about `call()` signature, args, kwargs.
-        call_spec = CallSpec(self._call_signature, args, kwargs)
+            # Caches info about `call()` signature, args, kwargs.
+            call_spec = CallSpec(self._call_signature, args, kwargs)
 
-        ############################################
-        # 3. Check input spec for 1st positional arg.
-        # TODO: consider extending this to all args and kwargs.
-        self._assert_input_compatibility(call_spec.first_arg)
+            ############################################
+            # 3. Check input spec for 1st positional arg.
+            # TODO: consider extending this to all args and kwargs.
+            self._assert_input_compatibility(call_spec.first_arg)
 
-        ################
-        # 4. Call build
-        with self._open_name_scope():
-            self._maybe_build(call_spec)
+            ################
+            # 4. Call build
+            with self._open_name_scope():
+                self._maybe_build(call_spec)
+
+            first_arg = call_spec.first_arg
+            # This is the value explicitly passed by the user
+            training = call_spec.user_arguments_dict.get("training", None)
+            default_training = call_spec.arguments_dict.get("training", None)
 
         ##########################
         # 5. Infer training value
@@ -782,14 +805,12 @@ class Layer(BackendLayer, Operation, KerasSaveable):
         # across nested calls.
         call_context = self._get_call_context()
 
-        # This is the value explicitly passed by the user
-        training = call_spec.user_arguments_dict.get("training", None)
         if training is None:
             # Wasn't passed explicitly: use context value
             training = call_context.training
             if training is None:
                 # Get signature default value
-                training = call_spec.arguments_dict.get("training", None)
+                training = default_training
         call_context.training = training
         if self._call_has_training_arg and training is not None:
             # Only populate arg if it has a concrete value
@@ -797,23 +818,28 @@ class Layer(BackendLayer, Operation, KerasSaveable):
 
         ##############################
         # 6. Populate mask argument(s)
-        if len(call_spec.tensor_arguments_dict) == 1:
-            if (
-                "mask" in call_spec.argument_names
-                and call_spec.arguments_dict["mask"] is None
-            ):
-                arg_name = list(call_spec.tensor_arguments_dict.keys())[0]
-                only_tensor_arg = call_spec.tensor_arguments_dict[arg_name]
-                mask = tree.map_structure(
-                    lambda x: getattr(x, "_keras_mask", None),
-                    only_tensor_arg,
-                )
-                kwargs["mask"] = mask
-        elif len(call_spec.tensor_arguments_dict) > 1:
-            for k, v in call_spec.tensor_arguments_dict.items():
-                expected_mask_arg_name = f"{k}_mask"
-                if expected_mask_arg_name in call_spec.argument_names:
-                    if call_spec.arguments_dict[expected_mask_arg_name] is None:
+        # (`CallPlan.apply()` populates them in eager calls.)
+        if call_plan is None:
+            if len(call_spec.tensor_arguments_dict) == 1:
+                if (
+                    "mask" in call_spec.argument_names
+                    and call_spec.arguments_dict["mask"] is None
+                ):
+                    arg_name = list(call_spec.tensor_arguments_dict.keys())[0]
+                    only_tensor_arg = call_spec.tensor_arguments_dict[arg_name]
+                    mask = tree.map_structure(
+                        lambda x: getattr(x, "_keras_mask", None),
+                        only_tensor_arg,
+                    )
+                    kwargs["mask"] = mask
+            elif len(call_spec.tensor_arguments_dict) > 1:
+                for k, v in call_spec.tensor_arguments_dict.items():
+                    expected_mask_arg_name = f"{k}_mask"
+                    if (
+                        expected_mask_arg_name in call_spec.argument_names
+                        and call_spec.arguments_dict[expected_mask_arg_name]
+                        is None
+                    ):
                         mask = tree.map_structure(
                             lambda x: getattr(x, "_keras_mask", None), v
                         )
@@ -868,11 +894,9 @@ class Layer(BackendLayer, Operation, KerasSaveable):
             # Set masks on outputs,
             # provided only the first positional input arg and its mask.
             # TODO: consider extending this to all args and kwargs.
-            previous_mask = getattr(call_spec.first_arg, "_keras_mask", None)
+            previous_mask = getattr(first_arg, "_keras_mask", None)
             if self.supports_masking:
-                self._set_mask_metadata(
-                    call_spec.first_arg, outputs, previous_mask
-                )
+                self._set_mask_metadata(first_arg, outputs, previous_mask)
             elif previous_mask is not None:
                 warnings.warn(
                     f"Layer '{self.name}' (of type {self.__class__.__name__}) "
@@ -886,6 +910,46 @@ class Layer(BackendLayer, Operation, KerasSaveable):
             self._maybe_reset_call_context()
         return outputs
 
+    def _get_call_plan(self, args, kwargs):
+        """Returns the cached `CallPlan` of a call, or `None`.
+
+        Plans are only used when all the positional arguments are backend
+        tensors, and all the keyword arguments are backend tensors, `None` or
+        Python scalars.
+        """
+        for arg in args:
+            if not backend.is_tensor(arg):
+                return None
+        key = [len(args)]
+        for name, value in kwargs.items():
+            if value is None:
+                key.append((name, _NONE_ARG))
+            elif backend.is_tensor(value):
+                key.append((name, _TENSOR_ARG))
+            elif isinstance(value, (bool, int, float, str)):
+                key.append((name, _OTHER_ARG))
+            else:
+                return None
+        key = tuple(key)
+        call_plan = self._call_plans.get(key, None)
+        if call_plan is None:
+            call_plan = CallPlan(self._call_signature, key[0], key[1:])
+            self._call_plans[key] = call_plan
+        return call_plan if call_plan.supported else None
+
+    def _convert_flat_input_args(self, maybe_convert, args, kwargs):
+        """Step 1 of `__call__()`, for arguments that are not nested."""
+        input_dtype = self.input_dtype
+        if any(backend.standardize_dtype(x.dtype) != input_dtype for x in args):
+            args = tuple(maybe_convert(x) for x in args)
+        for name, value in kwargs.items():
+            if (
+                backend.is_tensor(value)
+                and backend.standardize_dtype(value.dtype) != input_dtype
+            ):
+                kwargs[name] = maybe_convert(value)
+        return args, kwargs
+
     def call(self, *args, **kwargs):
         raise NotImplementedError(
             f"Layer {self.__class__.__name__} does not have a `call()` "
@@ -1509,6 +1573,153 @@ class CallSpec:
             self.eager = False
 
 
+# Kinds of the values of keyword arguments, in the keys of `CallPlan`s.
+_TENSOR_ARG = "tensor"
+_NONE_ARG = "none"
+_OTHER_ARG = "other"
+
+
+class CallPlan:
+    """The binding of a structure of arguments to the signature of `call()`.
+
+    A `CallPlan` holds what `CallSpec` computes at each call and only depends
+    on the structure of the arguments: which argument is the first one,
+    where the `training` argument comes from, and which mask arguments to
+    populate with the masks of which tensors. It is built once for the eager
+    calls with the same number of positional arguments (all backend tensors),
+    and the same keyword arguments, each a backend tensor, `None` or another
+    value.
+
+    `supported` is `False` when the binding needs the full `CallSpec`, e.g.
+    to raise an error for invalid arguments, or for `*args` or unknown
+    `**kwargs` in the signature.
+
+    Args:
+        signature: The signature of `call()`.
+        num_args: The number of positional arguments.
+        kwarg_kinds: A tuple of `(name, kind)` for each keyword argument, where
+            `kind` is one of `_TENSOR_ARG`, `_NONE_ARG` and `_OTHER_ARG`.
+    """
+
+    def __init__(self, signature, num_args, kwarg_kinds):
+        self.supported = False
+        self.pop_training = False
+        # Sources of values, as `("arg", index)`, `("kwarg", name)` or
+        # `("default", value)`.
+        self.first_arg_source = None
+        self.training_source = None
+        self.default_training = None
+        # `(mask_name, tensor_source)` pairs.
+        self.mask_sources = []
+
+        parameters = signature.parameters
+        positional_names = []
+        for name, parameter in parameters.items():
+            if parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+                return
+            if parameter.kind in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            ):
+                positional_names.append(name)
+        if num_args > len(positional_names):
+            return
+
+        sources = {}
+        kinds = {}
+        for index, name in enumerate(positional_names[:num_args]):
+            sources[name] = ("arg", index)
+            kinds[name] = _TENSOR_ARG
+        for name, kind in kwarg_kinds:
+            parameter = parameters.get(name, None)
+            if parameter is None:
+                if name == "training":
+                    # Like `CallSpec`, ignore a `training` argument that is
+                    # not in the signature.
+                    self.pop_training = True
+                    continue
+                # Goes to `**kwargs`, or is invalid.
+                return
+            if name in sources or parameter.kind in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.VAR_KEYWORD,
+            ):
+                return
+            sources[name] = ("kwarg", name)
+            kinds[name] = kind
+
+        tensor_names = []
+        for name, parameter in parameters.items():
+            if name not in sources:
+                if parameter.kind == inspect.Parameter.VAR_KEYWORD:
+                    continue
+                if parameter.default is inspect.Parameter.empty:
+                    # Missing argument.
+                    return
+                default = parameter.default
+                if backend.is_tensor(default) or (
+                    tree.is_nested(default) and len(default) > 0
+                ):
+                    return
+                sources[name] = ("default", default)
+                kinds[name] = _NONE_ARG if default is None else _OTHER_ARG
+            if kinds[name] == _TENSOR_ARG:
+                tensor_names.append(name)
+
+        first_name = next(iter(parameters), None)
+        if first_name not in sources:
+            return
+        self.first_arg_source = sources[first_name]
+        if "training" in sources and sources["training"][0] != "default":
+            self.training_source = sources["training"]
+        if "training" in parameters:
+            training_default = parameters["training"].default
+            if training_default is not inspect.Parameter.empty:
+                self.default_training = training_default
+
+        if len(tensor_names) == 1:
+            if "mask" in kinds and kinds["mask"] == _NONE_ARG:
+                self.mask_sources.append(("mask", sources[tensor_names[0]]))
+        elif len(tensor_names) > 1:
+            for name in tensor_names:
+                mask_name = f"{name}_mask"
+                if mask_name in kinds and kinds[mask_name] == _NONE_ARG:
+                    self.mask_sources.append((mask_name, sources[name]))
+        self.supported = True
+
+    def apply(self, args, kwargs):
+        """Applies the plan to the arguments of a call.
+
+        Removes an unused `training` argument from `kwargs` and populates
+        the mask arguments.
+
+        Returns:
+            A tuple `(first_arg, training, default_training)`, where `training`
+            is the value passed by the user and `default_training` the default
+            value in the signature.
+        """
+        if self.pop_training:
+            kwargs.pop("training")
+        for mask_name, source in self.mask_sources:
+            kwargs[mask_name] = getattr(
+                self._get(source, args, kwargs), "_keras_mask", None
+            )
+        training = None
+        if self.training_source is not None:
+            training = self._get(self.training_source, args, kwargs)
+        first_arg = self._get(self.first_arg_source, args, kwargs)
+        return first_arg, training, self.default_training
+
+    @staticmethod
+    def _get(source, args, kwargs):
+        kind, key = source
+        if kind == "arg":
+            return args[key]
+        if kind == "kwarg":
+            return kwargs[key]
+        return key
+
+
 def get_arguments_dict(fn, args, kwargs):
     """Return a dict mapping argument names to their values."""
     sig = inspect.signature(fn)
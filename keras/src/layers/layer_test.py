@@ -857,6 +857,87 @@ class LayerTest(testing.TestCase):
         inputs = ops.random.uniform(shape=(1, 100, 100, 3))
         layer(inputs, training=True)
 
+    @pytest.mark.skipif(
+        backend.backend() == "numpy",
+        reason="The NumPy backend does not support masking.",
+    )
+    def test_call_plan(self):
+        class RecordingLayer(layers.Layer):
+            def __init__(self):
+                super().__init__()
+                self.supports_masking = True
+                self.records = []
+
+            def call(
+                self, x1, x2=None, x1_mask=None, x2_mask=None, training=True
+            ):
+                self.records.append((x1_mask, x2_mask, training))
+                return x1
+
+        layer = RecordingLayer()
+        x1 = backend.numpy.ones((2, 3))
+        x1._keras_mask = backend.numpy.ones((2,))
+        x2 = backend.numpy.zeros((2, 3))
+        # The first call builds the layer, the next ones use call plans.
+        layer(x1)
+        for _ in range(2):
+            layer(x1)
+            layer(x1, x2)
+            layer(x1, x2=x2, training=False)
+            layer(x1, x2, x2_mask=x1)
+            layer(x1, training=None)
+        self.assertLen(layer._call_plans, 5)
+        first_call, *records = layer.records
+        self.assertEqual(first_call, (None, None, True))
+        for _ in range(2):
+            self.assertEqual(records.pop(0), (None, None, True))
+            x1_mask, x2_mask, training = records.pop(0)
+            self.assertIs(x1_mask, x1._keras_mask)
+            self.assertIsNone(x2_mask)
+            self.assertTrue(training)
+            x1_mask, x2_mask, training = records.pop(0)
+            self.assertIs(x1_mask, x1._keras_mask)
+            self.assertFalse(training)
+            x1_mask, x2_mask, training = records.pop(0)
+            self.assertIs(x1_mask, x1._keras_mask)
+            self.assertIs(x2_mask, x1)
+            self.assertEqual(records.pop(0), (None, None, True))
+
+        # The training value of the outer layer is propagated.
+        class OuterLayer(layers.Layer):
+            def __init__(self):
+                super().__init__()
+                self.inner = RecordingLayer()
+
+            def call(self, x, training=None):
+                return self.inner(x)
+
+        layer = OuterLayer()
+        x = backend.numpy.ones((2, 3))
+        layer(x)
+        layer(x, training=False)
+        layer(x)
+        self.assertEqual(
+            [record[2] for record in layer.inner.records[-3:]],
+            [True, False, True],
+        )
+
+        # `training` is ignored when not in the signature.
+        class NoTrainingLayer(layers.Layer):
+            def call(self, x):
+                return x
+
+        layer = NoTrainingLayer()
+        layer(x)
+        layer(x, training=True)
+        layer(x, training=True)
+
+        # Invalid arguments raise the same errors.
+        with self.assertRaises(TypeError):
+            layer(x, foo=1)
+        with self.assertRaises(TypeError):
+            layer(x, x)
+
     def test_tracker_locking(self):
         class BadLayer(layers.Layer):
             def call(self, x):
@@ -66,6 +66,12 @@ class Discretization(TFDataLayer):
             and `"count"` output modes. Only supported with TensorFlow
             backend. If `True`, returns a `SparseTensor` instead of
             a dense `Tensor`. Defaults to `False`.
+        axis: Integer or `None`. The axis along which to compute separate
+            bin boundaries, e.g. the feature axis of `(batch, features)`
+            inputs. If `None`, all the input values share the same bin
+            boundaries, and `bin_boundaries` is a list of bin boundaries.
+            Otherwise `bin_boundaries` is a list with one list of bin
+            boundaries per index along `axis`. Defaults to `None`.
 
     Examples:
 
@@ -83,6 +89,14 @@ class Discretization(TFDataLayer):
     >>> layer(input)
     array([[0, 2, 3, 2],
            [1, 3, 3, 1]])
+
+    Discretize each feature based on its own bin boundaries.
+    >>> input = np.array([[0.0, 10.0], [1.0, 20.0], [2.0, 30.0]])
+    >>> layer = Discretization(bin_boundaries=[[1.0], [25.0]], axis=-1)
+    >>> layer(input)
+    array([[0, 0],
+           [1, 0],
+           [1, 1]])
     """
 
     def __init__(
@@ -94,6 +108,7 @@ class Discretization(TFDataLayer):
         sparse=False,
         dtype=None,
         name=None,
+        axis=None,
     ):
         if dtype is None:
             dtype = "int64" if output_mode == "int" else backend.floatx()
@@ -130,7 +145,10 @@ class Discretization(TFDataLayer):
                 f"Received: `num_bins={num_bins}`"
             )
         if num_bins is not None and bin_boundaries is not None:
-            if len(bin_boundaries) != num_bins - 1:
+            column_boundaries = (
+                bin_boundaries if axis is not None else [bin_boundaries]
+            )
+            if any(len(b) != num_bins - 1 for b in column_boundaries):
                 raise ValueError(
                     "Both `num_bins` and `bin_boundaries` should not be "
                     f"set. Received: `num_bins={num_bins}` and "
@@ -145,11 +163,8 @@ class Discretization(TFDataLayer):
         self.epsilon = epsilon
         self.output_mode = output_mode
         self.sparse = sparse
-
-        if self.bin_boundaries:
-            self.summary = None
-        else:
-            self.summary = np.array([[], []], dtype="float32")
+        self.axis = axis
+        self.summary = None
 
     def build(self, input_shape=None):
         self.built = True
@@ -199,21 +214,44 @@ class Discretization(TFDataLayer):
         self.finalize_state()
 
     def update_state(self, data):
-        data = np.array(data).astype("float32")
-        summary = summarize(data, self.epsilon)
-        self.summary = merge_summaries(summary, self.summary, self.epsilon)
+        data = np.asarray(data, dtype="float32")
+        shape = data.shape
+        if self.axis is None:
+            data = np.reshape(data, (-1, 1))
+        else:
+            num_columns = data.shape[self.axis]
+            data = np.reshape(
+                np.moveaxis(data, self.axis, -1), (-1, num_columns)
+            )
+        if self.summary is None:
+            # A fixed seed keeps `adapt()` deterministic.
+            self.summary = QuantileSketch(data.shape[1], self.epsilon, seed=0)
+        elif data.shape[1] != self.summary.num_columns:
+            raise ValueError(
+                f"Expected inputs with {self.summary.num_columns} values along "
+                f"axis {self.axis}, as in previous batches. "
+                f"Received: inputs.shape={shape}"
+            )
+        self.summary.update(data)
 
     def finalize_state(self):
         if self.input_bin_boundaries is not None:
             return
-        self.bin_boundaries = get_bin_boundaries(
-            self.summary, self.num_bins
-        ).tolist()
+        if self.summary is None:
+            self.bin_boundaries = []
+            return
+        bin_boundaries = [
+            get_bin_boundaries(summary, self.num_bins).tolist()
+            for summary in self.summary.summaries()
+        ]
+        if self.axis is None:
+            bin_boundaries = bin_boundaries[0]
+        self.bin_boundaries = bin_boundaries
 
     def reset_state(self):
         if self.input_bin_boundaries is not None:
             return
-        self.summary = np.array([[], []], dtype="float32")
+        self.summary = None
 
     def compute_output_spec(self, inputs):
         return backend.KerasTensor(shape=inputs.shape, dtype=self.compute_dtype)
@@ -225,11 +263,16 @@ class Discretization(TFDataLayer):
         return
 
     def call(self, inputs):
-        indices = self.backend.numpy.digitize(inputs, self.bin_boundaries)
+        if self.axis is None:
+            indices = self.backend.numpy.digitize(inputs, self.bin_boundaries)
+            depth = len(self.bin_boundaries) + 1
+        else:
+            indices = self._digitize_along_axis(inputs)
+            depth = len(self.bin_boundaries[0]) + 1
         outputs = numerical_utils.encode_categorical_inputs(
             indices,
             output_mode=self.output_mode,
-            depth=len(self.bin_boundaries) + 1,
+            depth=depth,
             dtype=self.compute_dtype,
             backend_module=self.backend,
         )
@@ -237,6 +280,32 @@ class Discretization(TFDataLayer):
             return tf.sparse.from_dense(outputs)
         return outputs
 
+    def _digitize_along_axis(self, inputs):
+        inputs = self.backend.convert_to_tensor(inputs)
+        # Compare in floating point, so that integer inputs don't truncate the
+        # boundaries.
+        dtype = backend.result_type(inputs.dtype, "float32")
+        inputs = self.backend.cast(inputs, dtype)
+        ndim = len(inputs.shape)
+        # Broadcast the `(num_columns, num_boundaries)` boundaries against the
+        # inputs along `axis`, with the boundaries in a new last axis.
+        shape = [1] * ndim + [-1]
+        shape[self.axis % ndim] = len(self.bin_boundaries)
+        bin_boundaries = self.backend.numpy.reshape(
+            self.backend.convert_to_tensor(
+                np.array(self.bin_boundaries, dtype="float32"), dtype=dtype
+            ),
+            shape,
+        )
+        inputs = self.backend.numpy.expand_dims(inputs, -1)
+        return self.backend.numpy.sum(
+            self.backend.cast(
+                self.backend.numpy.greater_equal(inputs, bin_boundaries),
+                "int32",
+            ),
+            axis=-1,
+        )
+
     def get_config(self):
         return {
             "bin_boundaries": self.bin_boundaries,
@@ -246,60 +315,112 @@ class Discretization(TFDataLayer):
             "sparse": self.sparse,
             "name": self.name,
             "dtype": self.dtype,
+            "axis": self.axis,
         }
 
 
-def summarize(values, epsilon):
-    """Reduce a 1D sequence of values to a summary.
+class QuantileSketch:
+    """A mergeable sketch of the quantiles of one or more columns of values.
 
-    This algorithm is based on numpy.quantiles but modified to allow for
-    intermediate steps between multiple data sets. It first finds the target
-    number of bins as the reciprocal of epsilon and then takes the individual
-    values spaced at appropriate intervals to arrive at that target.
-    The final step is to return the corresponding counts between those values
-    If the target num_bins is larger than the size of values, the whole array is
-    returned (with weights of 1).
+    This is a KLL sketch: values are kept in a hierarchy of compactors, where
+    each item of level `h` stands for `2**h` values. Once a level holds
+    `capacity` items, they are sorted and every other item, starting at a
+    random offset, is promoted to the next level. Every column receives the
+    same number of values, so the compactors of all the columns are stored in
+    the same fixed-size arrays and compacted together.
 
-    Args:
-        values: 1D `np.ndarray` to be summarized.
-        epsilon: A `'float32'` that determines the approximate desired
-        precision.
+    A batch of `n` values is sorted once and subsampled straight into the
+    lowest level where it holds fewer than `2 * capacity` items. The cost of
+    an update is dominated by sorting the batch, and the sketch holds
+    `O(capacity * log(n / capacity))` items per column.
 
-    Returns:
-        A 2D `np.ndarray` that is a summary of the inputs. First column is the
-        interpolated partition values, the second is the weights (counts).
+    Args:
+        num_columns: Number of columns of the values.
+        epsilon: The approximate desired rank error, as a fraction of the
+            number of values.
+        seed: Optional seed of the random offsets.
     """
-    values = np.reshape(values, [-1])
-    values = np.sort(values)
-    elements = np.size(values)
-    num_buckets = 1.0 / epsilon
-    increment = elements / num_buckets
-    start = increment
-    step = max(increment, 1)
-    boundaries = values[int(start) :: int(step)]
-    weights = np.ones_like(boundaries)
-    weights = weights * step
-    return np.stack([boundaries, weights])
-
 
-def merge_summaries(prev_summary, next_summary, epsilon):
-    """Weighted merge sort of summaries.
-
-    Given two summaries of distinct data, this function merges (and compresses)
-    them to stay within `epsilon` error tolerance.
+    def __init__(self, num_columns=1, epsilon=0.01, seed=None):
+        self.num_columns = num_columns
+        self.capacity = 2 * max(1, int(np.ceil(1.0 / epsilon)))
+        self.count = 0
+        self._levels = []
+        self._sizes = []
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """Adds a 2D array of values of shape `(n, num_columns)`."""
+        values = np.asarray(values, dtype="float32")
+        if values.ndim != 2 or values.shape[1] != self.num_columns:
+            raise ValueError(
+                f"Expected values of shape (n, {self.num_columns}). "
+                f"Received: values.shape={values.shape}"
+            )
+        if not len(values):
+            return
+        self.count += len(values)
+        level = max(0, (len(values) // self.capacity).bit_length() - 1)
+        if level:
+            offset = self._rng.integers(2**level)
+            values = np.sort(values, axis=0)[offset :: 2**level]
+        self._add(level, values.T)
+
+    def merge(self, other):
+        """Merges the values of another sketch into this sketch."""
+        if other.num_columns != self.num_columns:
+            raise ValueError(
+                "Cannot merge sketches with different numbers of columns. "
+                f"Received: {self.num_columns} and {other.num_columns}"
+            )
+        self.count += other.count
+        for level, (items, size) in enumerate(zip(other._levels, other._sizes)):
+            self._add(level, items[:, :size])
 
-    Args:
-        prev_summary: 2D `np.ndarray` summary to be merged with `next_summary`.
-        next_summary: 2D `np.ndarray` summary to be merged with `prev_summary`.
-        epsilon: A float that determines the approximate desired precision.
+    def summaries(self):
+        """Returns a 2D `np.ndarray` summary of the values of each column.
 
-    Returns:
-        A 2-D `np.ndarray` that is a merged summary. First column is the
-        interpolated partition values, the second is the weights (counts).
-    """
-    merged = np.concatenate((prev_summary, next_summary), axis=1)
-    merged = np.take(merged, np.argsort(merged[0]), axis=1)
-    return compress_summary(merged, epsilon)
+        The first row of a summary are the values in sorted order, the second
+        their weights (counts).
+        """
+        values = [
+            items[:, :size] for items, size in zip(self._levels, self._sizes)
+        ]
+        if not values:
+            return [np.zeros((2, 0), "float32")] * self.num_columns
+        weights = np.concatenate(
+            [
+                np.full(size, 2.0**level)
+                for level, size in enumerate(self._sizes)
+            ]
+        )
+        values = np.concatenate(values, axis=1)
+        order = np.argsort(values, axis=1, kind="stable")
+        return [
+            np.stack([column[indices], weights[indices]])
+            for column, indices in zip(values, order)
+        ]
+
+    def _add(self, level, items):
+        while items.shape[1]:
+            while level >= len(self._levels):
+                self._levels.append(
+                    np.empty((self.num_columns, 3 * self.capacity), "float32")
+                )
+                self._sizes.append(0)
+            buffer = self._levels[level]
+            size = self._sizes[level] + items.shape[1]
+            buffer[:, self._sizes[level] : size] = items
+            if size < self.capacity:
+                self._sizes[level] = size
+                return
+            buffer[:, :size].sort(axis=1)
+            # With an odd number of items, the largest one stays at this level.
+            offset = self._rng.integers(2)
+            items = buffer[:, offset : size - size % 2 : 2].copy()
+            buffer[:, 0] = buffer[:, size - 1]
+            self._sizes[level] = size % 2
+            level += 1
 
 
 def get_bin_boundaries(summary, num_bins):
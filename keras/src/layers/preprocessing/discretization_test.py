@@ -9,6 +9,7 @@ from keras.src import backend
 from keras.src import layers
 from keras.src import models
 from keras.src import testing
+from keras.src.layers.preprocessing import discretization
 from keras.src.saving import saving_api
 
 
@@ -37,6 +38,62 @@ class DiscretizationTest(testing.TestCase, parameterized.TestCase):
         output = layer(np.array([[0.0, 0.1, 0.3]]))
         self.assertTrue(output.dtype, "int32")
 
+    def test_adapt_is_deterministic(self):
+        x = np.random.random((10000, 1))
+        boundaries = []
+        for _ in range(2):
+            layer = layers.Discretization(num_bins=10)
+            layer.adapt(tf_data.Dataset.from_tensor_slices(x).batch(100))
+            boundaries.append(layer.bin_boundaries)
+        self.assertEqual(boundaries[0], boundaries[1])
+
+    def test_adapt_along_axis(self):
+        x = np.stack([np.arange(100.0), -np.arange(100.0) * 10], axis=-1)
+        layer = layers.Discretization(num_bins=4, axis=-1)
+        layer.adapt(tf_data.Dataset.from_tensor_slices(x).batch(16))
+        self.assertAllClose(
+            layer.bin_boundaries,
+            [[24.0, 49.0, 74.0], [-750.0, -500.0, -250.0]],
+        )
+        output = layer(np.array([[10.0, -10.0], [60.0, -600.0]]))
+        self.assertAllClose(output, [[0, 3], [2, 1]])
+
+        layer = layers.Discretization(
+            bin_boundaries=[[0.0, 1.0], [10.0, 20.0]], axis=1
+        )
+        self.run_class_serialization_test(layer)
+        output = layer(np.array([[[0.5, 0.5, 2.0], [5.0, 15.0, 25.0]]]))
+        self.assertAllClose(output, [[[1, 1, 2], [0, 1, 2]]])
+
+    def test_along_axis_integer_inputs(self):
+        layer = layers.Discretization(bin_boundaries=[[1.5], [2.5]], axis=-1)
+        output = layer(np.array([[1, 2], [2, 3]], dtype="int32"))
+        self.assertAllClose(output, [[0, 0], [1, 1]])
+        # Inside a tf.data pipeline.
+        ds = tf_data.Dataset.from_tensor_slices(
+            np.array([[1, 2], [2, 3]], dtype="int64")
+        ).batch(2)
+        for output in ds.map(layer).take(1):
+            self.assertAllClose(output, [[0, 0], [1, 1]])
+
+    def test_quantile_sketch(self):
+        epsilon = 0.01
+        x = np.random.default_rng(0).exponential(size=(200_000, 2))
+        sketch = discretization.QuantileSketch(2, epsilon, seed=0)
+        other = discretization.QuantileSketch(2, epsilon, seed=1)
+        for batch in np.array_split(x[:100_000], 1000):
+            sketch.update(batch)
+        other.update(x[100_000:])
+        sketch.merge(other)
+        self.assertEqual(sketch.count, len(x))
+        # The sketch holds a small number of items per column.
+        self.assertLess(sum(sketch._sizes), 20 / epsilon)
+        quantiles = np.arange(1, 10) / 10
+        for column, summary in zip(x.T, sketch.summaries()):
+            boundaries = discretization.get_bin_boundaries(summary, 10)
+            ranks = np.searchsorted(np.sort(column), boundaries) / len(column)
+            self.assertAllClose(ranks, quantiles, atol=epsilon)
+
     @parameterized.parameters(
         [
             ("int", [[-1.0, 0.0, 0.1, 0.8, 1.2]], [[0, 1, 1, 2, 3]]),
@@ -1,10 +1,15 @@
 import collections
+import multiprocessing
+import queue
 
 import numpy as np
 
 from keras.src import backend
 from keras.src.layers.layer import Layer
 from keras.src.utils import argument_validation
+from keras.src.utils import backend_utils
+from keras.src.utils import file_utils
+from keras.src.utils import lookup_utils
 from keras.src.utils import tf_utils
 from keras.src.utils.module_utils import tensorflow as tf
 
@@ -174,7 +179,7 @@ class IndexLookup(Layer):
         self.output_mode = output_mode
         self.sparse = sparse
         self.pad_to_max_tokens = pad_to_max_tokens
-        self.vocabulary_dtype = tf.as_dtype(vocabulary_dtype).name
+        self.vocabulary_dtype = backend.standardize_dtype(vocabulary_dtype)
         self._frozen_vocab_size = kwargs.pop("vocabulary_size", None)
 
         self.input_vocabulary = vocabulary
@@ -206,7 +211,7 @@ class IndexLookup(Layer):
             mask_value = (
                 0
                 if self.output_mode == "int"
-                else tf.as_dtype(self._value_dtype).max
+                else np.iinfo(self._value_dtype).max
             )
             if self.num_oov_indices == 0:
                 # If there are no OOV indices, we map OOV tokens to -1 and error
@@ -223,10 +228,8 @@ class IndexLookup(Layer):
                 # determine locations where we need to do extra hashing.)
                 self._default_value = -1
         if self.mask_token is not None:
-            self._mask_key = tf.convert_to_tensor(mask_key, self._key_dtype)
-            self._mask_value = tf.convert_to_tensor(
-                mask_value, self._value_dtype
-            )
+            self._mask_key = mask_key
+            self._mask_value = mask_value
 
         if self.output_mode == "tf_idf":
             if self._has_input_vocabulary and idf_weights is None:
@@ -236,41 +239,33 @@ class IndexLookup(Layer):
                     "must also be provided."
                 )
             if idf_weights is not None:
-                self.idf_weights = tf.Variable(
-                    idf_weights,
-                    dtype=backend.floatx(),
-                    trainable=False,
-                )
-                self.idf_weights_const = self.idf_weights.value()
+                self.idf_weights = np.array(idf_weights, dtype=backend.floatx())
 
+        # The vocabulary is held in a NumPy lookup table. A `tf.lookup` table
+        # is created from it for the lookups with TensorFlow, which are used
+        # whenever TensorFlow is imported (see `_use_tf_lookup()`).
+        self._tf_lookup_table = None
+        self._tf_lookup_table_source = None
         if vocabulary is not None:
             self.set_vocabulary(vocabulary, idf_weights)
         else:
-            # When restoring from a keras SavedModel, the loading code will
-            # expect to find and restore a lookup_table attribute on the layer.
-            # This table needs to be uninitialized as a StaticHashTable cannot
-            # be initialized twice.
-            self.lookup_table = self._uninitialized_lookup_table()
+            self.lookup_table = self._lookup_table_from_tokens(
+                np.array(
+                    [],
+                    dtype=(
+                        "str" if self.vocabulary_dtype == "string" else "int64"
+                    ),
+                )
+            )
+        if tf_utils.is_tf_imported():
+            # Create the tracked `tf.lookup` table right away, so that the
+            # layer has the same attributes whether it was called or not.
+            self._get_tf_lookup_table()
 
         # Only set up adapt state if we did not receive a vocab on construction.
+        self._max_counted_tokens = None
         if not self._has_input_vocabulary:
-            # Set adapt state.
-            self.token_counts = tf.lookup.experimental.MutableHashTable(
-                key_dtype=vocabulary_dtype,
-                value_dtype="int64",
-                default_value=0,
-            )
-            if self.output_mode == "tf_idf":
-                self.token_document_counts = (
-                    tf.lookup.experimental.MutableHashTable(
-                        key_dtype=vocabulary_dtype,
-                        value_dtype="int64",
-                        default_value=0,
-                    )
-                )
-                self.num_documents = tf.Variable(
-                    0, dtype="int64", trainable=False
-                )
+            self._initialize_adapt_state()
 
     def get_vocabulary(self, include_special_tokens=True):
         """Returns the current vocabulary of the layer.
@@ -286,17 +281,10 @@ class IndexLookup(Layer):
         # The lookup table data will not be sorted, so we will create a inverted
         # lookup here, and use that to lookup a range of indices
         # [0, vocab_size).
-        if self.lookup_table.size() == 0:
-            vocab, indices = [], []
-        else:
-            keys, values = self.lookup_table.export()
-            vocab, indices = (values, keys) if self.invert else (keys, values)
-            vocab, indices = (
-                self._tensor_vocab_to_numpy(vocab),
-                indices.numpy(),
-            )
+        keys, values = self.lookup_table.export()
+        vocab, indices = (values, keys) if self.invert else (keys, values)
         lookup = collections.defaultdict(
-            lambda: self.oov_token, zip(indices, vocab)
+            lambda: self.oov_token, zip(indices.tolist(), vocab.tolist())
         )
         vocab = [lookup[x] for x in range(self.vocabulary_size())]
         if self.mask_token is not None and self.output_mode == "int":
@@ -317,13 +305,7 @@ class IndexLookup(Layer):
           The integer size of the vocabulary, including optional mask and oov
           indices.
         """
-        if tf.executing_eagerly():
-            return (
-                int(self.lookup_table.size().numpy())
-                + self._token_start_index()
-            )
-        else:
-            return self.lookup_table.size() + self._token_start_index()
+        return self.lookup_table.size() + self._token_start_index()
 
     def get_config(self):
         config = {
@@ -345,8 +327,7 @@ class IndexLookup(Layer):
 
     def _record_vocabulary_size(self):
         self._ensure_vocab_size_unchanged()
-        with tf.init_scope():
-            self._frozen_vocab_size = self.vocabulary_size()
+        self._frozen_vocab_size = self.vocabulary_size()
 
     def set_vocabulary(self, vocabulary, idf_weights=None):
         """Sets vocabulary (and optionally document frequency) for this layer.
@@ -381,7 +362,7 @@ class IndexLookup(Layer):
             )
 
         if isinstance(vocabulary, str):
-            if not tf.io.gfile.exists(vocabulary):
+            if not file_utils.exists(vocabulary):
                 raise ValueError(
                     f"Vocabulary file {vocabulary} does not exist."
                 )
@@ -394,9 +375,10 @@ class IndexLookup(Layer):
             self._record_vocabulary_size()
             return
 
-        if not tf.executing_eagerly() and (
-            tf.is_tensor(vocabulary) or tf.is_tensor(idf_weights)
-        ):
+        if (
+            tf_utils.is_tf_tensor(vocabulary)
+            or tf_utils.is_tf_tensor(idf_weights)
+        ) and not tf.executing_eagerly():
             raise RuntimeError(
                 f"Cannot set a tensor vocabulary on layer {self.name} "
                 "when not executing eagerly. "
@@ -407,11 +389,11 @@ class IndexLookup(Layer):
         # TODO(mattdangerw): for better performance we should rewrite this
         # entire function to operate on tensors and convert vocabulary to a
         # tensor here.
-        if tf.is_tensor(vocabulary):
+        if tf_utils.is_tf_tensor(vocabulary):
             vocabulary = self._tensor_vocab_to_numpy(vocabulary)
         elif isinstance(vocabulary, (list, tuple)):
             vocabulary = np.array(vocabulary)
-        if tf.is_tensor(idf_weights):
+        if tf_utils.is_tf_tensor(idf_weights):
             idf_weights = idf_weights.numpy()
         elif isinstance(idf_weights, (list, tuple)):
             idf_weights = np.array(idf_weights)
@@ -522,12 +504,7 @@ class IndexLookup(Layer):
                 "constant",
                 constant_values=(front_padding_value, back_padding_value),
             )
-            weights = tf.convert_to_tensor(weights, dtype=backend.floatx())
-            self.idf_weights = tf.Variable(
-                weights,
-                trainable=False,
-            )
-            self.idf_weights_const = self.idf_weights.value()
+            self.idf_weights = weights.astype(backend.floatx())
 
     def build(self):
         self.built = True
@@ -564,142 +541,110 @@ class IndexLookup(Layer):
         output_shape = self.compute_output_shape(inputs.shape)
         return backend.KerasTensor(output_shape, dtype=output_dtype)
 
-    def adapt(self, data, steps=None):
-        self.reset_state()
-        if isinstance(data, tf.data.Dataset):
-            if steps is not None:
-                data = data.take(steps)
-            for batch in data:
-                self.update_state(batch)
-        else:
-            data = tf_utils.ensure_tensor(data, dtype=self.vocabulary_dtype)
-            if data.shape.rank == 1:
-                # A plain list of strings
-                # is treated as as many documents
-                data = tf.expand_dims(data, -1)
-            self.update_state(data)
-        self.finalize_state()
+    def adapt(
+        self, data, steps=None, num_workers=None, max_counted_tokens=None
+    ):
+        self._adapt_vocabulary(
+            self._adapt_batches(data, steps), num_workers, max_counted_tokens
+        )
 
     def update_state(self, data):
-        if self._has_input_vocabulary:
-            raise ValueError(
-                f"Cannot adapt layer '{self.name}' after setting a static "
-                "vocabulary via `vocabulary` argument or "
-                "`set_vocabulary()` method."
+        self._ensure_adaptable()
+        values, row_ids, num_rows = self._flatten_adapt_batch(data)
+        if self.output_mode == "tf_idf":
+            self.num_documents += num_rows
+        if self._pending_token_counts is None:
+            lookup_utils.count_tokens(
+                self.token_counts,
+                values.numpy(),
+                row_ids,
+                document_counts=getattr(self, "token_document_counts", None),
+                encoding=self._adapt_encoding,
             )
+            return
 
-        data = tf_utils.ensure_tensor(data, dtype=self.vocabulary_dtype)
-        if data.shape.rank == 0:
-            data = tf.expand_dims(data, 0)
-        if data.shape.rank == 1:
-            # Expand dims on axis 0 for tf-idf. A 1-d tensor
-            # is a single document.
-            data = tf.expand_dims(data, 0)
-
-        tokens, counts = self._num_tokens(data)
-        self.token_counts.insert(
-            tokens, counts + self.token_counts.lookup(tokens)
-        )
-
+        tokens, inverse, counts = tf.unique_with_counts(values, out_idx="int64")
+        self._add_to_table_counts(self._pending_token_counts, tokens, counts)
         if self.output_mode == "tf_idf":
-            # Dedupe each row of our dataset.
-            if isinstance(data, tf.RaggedTensor):
-                deduped_doc_data = tf.map_fn(lambda x: tf.unique(x)[0], data)
-            else:
-                deduped_doc_data = [tf.unique(x)[0] for x in data]
-                deduped_doc_data = tf.concat(deduped_doc_data, axis=0)
-            # Flatten and count tokens.
-            tokens, counts = self._num_tokens(deduped_doc_data)
-
-            self.token_document_counts.insert(
-                tokens, counts + self.token_document_counts.lookup(tokens)
+            # Each (row, token) pair is only counted once.
+            num_tokens = int(tokens.shape[0])
+            pairs = np.unique(row_ids * num_tokens + inverse.numpy())
+            self._add_to_table_counts(
+                self._pending_document_counts,
+                tokens,
+                np.bincount(pairs % num_tokens, minlength=num_tokens),
             )
-            if isinstance(data, tf.RaggedTensor):
-                self.num_documents.assign_add(data.nrows())
-            else:
-                self.num_documents.assign_add(
-                    tf.shape(data, out_type="int64")[0]
-                )
 
     def finalize_state(self):
-        if self._has_input_vocabulary or tf.equal(self.token_counts.size(), 0):
-            # Finalize idf_weights to a const for call even if we don't need to
-            # compute a new vocabulary.
+        if self._pending_token_counts is not None:
+            self._move_table_counts(
+                self._pending_token_counts, self.token_counts
+            )
             if self.output_mode == "tf_idf":
-                self.idf_weights_const = self.idf_weights.value()
+                self._move_table_counts(
+                    self._pending_document_counts, self.token_document_counts
+                )
+        if self._has_input_vocabulary or not self.token_counts.total:
             self._record_vocabulary_size()
             return
 
         # Remove special tokens from our counts.
         if self.mask_token is not None:
-            self.token_counts.remove(
-                tf.convert_to_tensor([self.mask_token], self.vocabulary_dtype)
-            )
+            self.token_counts.remove(self.mask_token)
         if self.oov_token is not None:
-            self.token_counts.remove(
-                tf.convert_to_tensor([self.oov_token], self.vocabulary_dtype)
-            )
+            self.token_counts.remove(self.oov_token)
 
-        tokens, counts = self.token_counts.export()
         # To keep vocabs deterministic, we sort our tokens by count and break
-        # ties by sorting the tokens themselves. Tensorflow has no ops for
-        # sorting strings, so we need to use numpy for the sort.
-        sorted_indices = np.lexsort((tokens.numpy(), counts.numpy()))[::-1]
+        # ties by sorting the tokens themselves.
         token_start = self._token_start_index()
+        max_learned_tokens = None
         if self.max_tokens:
             max_learned_tokens = self.max_tokens - token_start
-            sorted_indices = sorted_indices[:max_learned_tokens]
-        tokens = tf.gather(tokens, sorted_indices)
+        tokens, _ = self.token_counts.most_common(max_learned_tokens)
+        tokens = np.asarray(
+            tokens,
+            dtype="str" if self.vocabulary_dtype == "string" else "int64",
+        )
         self.lookup_table = self._lookup_table_from_tokens(tokens)
 
         if self.output_mode == "tf_idf":
             token_document_counts = self.token_document_counts.lookup(tokens)
             idf_weights = self._inverse_document_frequency(
                 token_document_counts, self.num_documents
-            )
-            idf_weights = tf.cast(idf_weights, backend.floatx())
+            ).astype(backend.floatx())
             # Pad the front of idf_weights with the average idf weight for OOV
             # tokens.  We cannot compute the real idf weight of OOV in a single
             # pass.
-            idf_weights = tf.pad(
+            idf_weights = np.pad(
                 idf_weights,
-                [[self._token_start_index(), 0]],
-                constant_values=tf.reduce_mean(idf_weights),
+                [[token_start, 0]],
+                constant_values=np.mean(idf_weights),
             )
             if self.pad_to_max_tokens and self.max_tokens is not None:
                 # Pad the back of idf_weights with zeros.
-                idf_weights = tf.pad(
+                idf_weights = np.pad(
                     idf_weights,
-                    [[0, self.max_tokens - tf.size(idf_weights)]],
+                    [[0, self.max_tokens - idf_weights.size]],
                     constant_values=0,
                 )
-            self.idf_weights = tf.Variable(
-                idf_weights,
-                dtype=backend.floatx(),
-                trainable=False,
-            )
-            self.idf_weights_const = self.idf_weights.value()
+            self.idf_weights = idf_weights
 
         # We call this here to save memory, now that we've built our vocabulary,
-        # we don't want to keep every token we've seen in separate lookup
-        # tables.
+        # we don't want to keep every token we've seen in memory.
         self.reset_state()
         self._record_vocabulary_size()
 
     def reset_state(self):
         if self._has_input_vocabulary:
             return
-
-        self.token_counts.remove(self.token_counts.export()[0])
-        if self.output_mode == "tf_idf":
-            self.token_document_counts.remove(
-                self.token_document_counts.export()[0]
-            )
-            self.num_documents.assign(0)
+        self._initialize_adapt_state()
 
     def call(self, inputs):
         self._ensure_known_vocab_size()
 
+        if not self._use_tf_lookup(inputs):
+            return self._call_numpy(inputs)
+
         inputs = tf_utils.ensure_tensor(inputs, dtype=self._key_dtype)
         original_shape = inputs.shape
         # Some ops will not handle scalar input, so uprank to rank 1.
@@ -729,7 +674,9 @@ class IndexLookup(Layer):
             else self._frozen_vocab_size
         )
         idf_weights = (
-            self.idf_weights_const if self.output_mode == "tf_idf" else None
+            tf.convert_to_tensor(self.idf_weights)
+            if self.output_mode == "tf_idf"
+            else None
         )
         return tf_utils.encode_categorical_inputs(
             lookups,
@@ -740,6 +687,86 @@ class IndexLookup(Layer):
             idf_weights=idf_weights,
         )
 
+    def _use_tf_lookup(self, inputs):
+        """Whether `inputs` must be looked up with `tf.lookup` ops.
+
+        `tf.lookup` is faster than the NumPy lookup, which is only used to
+        avoid importing TensorFlow. TensorFlow is always imported with the
+        TensorFlow backend.
+        """
+        return (
+            self.sparse
+            or tf_utils.is_tf_imported()
+            or tf_utils.is_tf_tensor(inputs)
+            or backend_utils.in_tf_graph()
+        )
+
+    def _call_numpy(self, inputs):
+        """Looks up and encodes inputs without TensorFlow."""
+        if isinstance(inputs, (list, tuple)):
+            inputs = np.array(inputs)
+        else:
+            inputs = backend.convert_to_numpy(inputs)
+        lookups = self._lookup_dense_numpy(inputs)
+        if self.output_mode == "int":
+            outputs = lookups
+        else:
+            depth = (
+                self.max_tokens
+                if self.pad_to_max_tokens
+                else self._frozen_vocab_size
+            )
+            outputs = lookup_utils.encode_categorical_inputs(
+                lookups,
+                output_mode=self.output_mode,
+                depth=depth,
+                dtype=self._value_dtype,
+                idf_weights=(
+                    self.idf_weights if self.output_mode == "tf_idf" else None
+                ),
+            )
+        # Strings can only be held by TensorFlow tensors, so string outputs
+        # of other backends are returned as NumPy arrays.
+        if outputs.dtype.kind == "U" and backend.backend() != "tensorflow":
+            return outputs
+        return backend.convert_to_tensor(outputs)
+
+    def _lookup_dense_numpy(self, inputs):
+        """Lookup table values for a NumPy array, handling masking and OOV."""
+        inputs = self.lookup_table.convert_keys(inputs)
+        lookups = self.lookup_table.lookup(inputs)
+
+        if self.mask_token is not None:
+            lookups = np.where(
+                inputs == self._mask_key, self._mask_value, lookups
+            )
+
+        if self.invert:
+            return lookups
+
+        if self.num_oov_indices == 0:
+            # If we have zero oov indices, we need to check for oov inputs.
+            oov_locations = lookups == -1
+            if np.any(oov_locations):
+                raise ValueError(
+                    "When `num_oov_indices=0` all inputs should be in "
+                    f"vocabulary, found OOV values {inputs[oov_locations]}, "
+                    "consider setting `num_oov_indices=1`."
+                )
+        elif self.num_oov_indices > 1:
+            # If we have multiple oov indices, we need a further hashing step.
+            oov_locations = lookups == self._default_value
+            if np.any(oov_locations):
+                oov_inputs = inputs[oov_locations]
+                if self.vocabulary_dtype == "string":
+                    oov_indices = lookup_utils.hash_bucket_fast(
+                        oov_inputs, self.num_oov_indices
+                    )
+                else:
+                    oov_indices = np.mod(oov_inputs, self.num_oov_indices)
+                lookups[oov_locations] = oov_indices + self._oov_start_index()
+        return lookups
+
     def _lookup_dense(self, inputs):
         """Lookup table values for a dense Tensor, handling masking and OOV."""
         # When executing eagerly and tracing keras.Input objects,
@@ -751,11 +778,17 @@ class IndexLookup(Layer):
         if tf.executing_eagerly() and backend.is_keras_tensor(inputs):
             lookups = tf.zeros_like(inputs, dtype=self._value_dtype)
         else:
-            lookups = self.lookup_table.lookup(inputs)
+            lookups = self._get_tf_lookup_table().lookup(inputs)
 
         if self.mask_token is not None:
-            mask_locations = tf.equal(inputs, self._mask_key)
-            lookups = tf.where(mask_locations, self._mask_value, lookups)
+            mask_locations = tf.equal(
+                inputs, tf.convert_to_tensor(self._mask_key, self._key_dtype)
+            )
+            lookups = tf.where(
+                mask_locations,
+                tf.convert_to_tensor(self._mask_value, self._value_dtype),
+                lookups,
+            )
 
         if self.invert:
             return lookups
@@ -790,12 +823,13 @@ class IndexLookup(Layer):
 
     def save_own_variables(self, store):
         if self.output_mode == "tf_idf":
-            store["idf_weights"] = self.idf_weights_const.numpy()
+            store["idf_weights"] = self.idf_weights
 
     def load_own_variables(self, store):
         if self.output_mode == "tf_idf":
-            self.idf_weights.assign(store["idf_weights"])
-            self.idf_weights_const = self.idf_weights.value()
+            self.idf_weights = np.array(
+                store["idf_weights"], dtype=backend.floatx()
+            )
 
     def save_assets(self, dir_path):
         if self.input_vocabulary is not None:
@@ -803,7 +837,7 @@ class IndexLookup(Layer):
             # TODO: consider unifying both paths.
             return
         vocabulary = self.get_vocabulary(include_special_tokens=True)
-        vocabulary_filepath = tf.io.gfile.join(dir_path, "vocabulary.txt")
+        vocabulary_filepath = file_utils.join(dir_path, "vocabulary.txt")
         with open(vocabulary_filepath, "w") as f:
             f.write("\n".join([str(w) for w in vocabulary]))
 
@@ -812,11 +846,11 @@ class IndexLookup(Layer):
             # Vocab saved in config.
             # TODO: consider unifying both paths.
             return
-        vocabulary_filepath = tf.io.gfile.join(dir_path, "vocabulary.txt")
+        vocabulary_filepath = file_utils.join(dir_path, "vocabulary.txt")
         # TODO: fix bug with include_special_tokens and set reload from file.
         with open(vocabulary_filepath, "r") as f:
             lines = f.read().split("\n")
-            if tf.as_dtype(self.vocabulary_dtype) == tf.string:
+            if self.vocabulary_dtype == "string":
                 values = [str(line) for line in lines]
             else:
                 values = [int(line) for line in lines]
@@ -825,46 +859,219 @@ class IndexLookup(Layer):
             else:
                 self.set_vocabulary(values)
 
-    def _uninitialized_lookup_table(self):
-        with tf.init_scope():
-            initializer = get_null_initializer(
-                self._key_dtype, self._value_dtype
+    def _initialize_adapt_state(self):
+        counter_config = {"max_tokens": self._max_counted_tokens}
+        self.token_counts = lookup_utils.TokenCounter(**counter_config)
+        if self.output_mode == "tf_idf":
+            self.token_document_counts = lookup_utils.TokenCounter(
+                **counter_config
+            )
+            self.num_documents = 0
+        # Without a bound on the number of counted tokens, tokens counted in
+        # this process go to `tf.lookup` tables, which is much faster than
+        # counting them in Python. The tables are moved to the counters in
+        # `finalize_state()`.
+        self._set_tf_resource("_pending_token_counts", None)
+        self._set_tf_resource("_pending_document_counts", None)
+        if self._max_counted_tokens is None:
+            self._set_tf_resource(
+                "_pending_token_counts", self._make_count_table()
             )
-            return tf.lookup.StaticHashTable(initializer, self._default_value)
+            if self.output_mode == "tf_idf":
+                self._set_tf_resource(
+                    "_pending_document_counts", self._make_count_table()
+                )
 
-    def _lookup_table_from_tokens(self, tokens):
-        with tf.init_scope():
-            token_start = self._token_start_index()
-            token_end = token_start + tf.size(tokens)
-            indices_dtype = (
-                self._key_dtype if self.invert else self._value_dtype
+    def _make_count_table(self):
+        return tf.lookup.experimental.MutableHashTable(
+            key_dtype=self.vocabulary_dtype,
+            value_dtype="int64",
+            default_value=0,
+        )
+
+    def _add_to_table_counts(self, table, tokens, counts):
+        table.insert(tokens, counts + table.lookup(tokens))
+
+    def _move_table_counts(self, table, counter):
+        tokens, counts = table.export()
+        if tokens.shape[0]:
+            counter.update(tokens.numpy(), counts.numpy(), self._adapt_encoding)
+            table.remove(tokens)
+
+    def _set_tf_resource(self, name, value):
+        # TensorFlow resources are created on demand and are not part of the
+        # saved state of the layer, so they bypass attribute tracking.
+        object.__setattr__(self, name, value)
+
+    def _adapt_batches(self, data, steps):
+        """Yields the batches of `adapt()` data."""
+        if isinstance(data, tf.data.Dataset):
+            if steps is not None:
+                data = data.take(steps)
+            yield from data
+        else:
+            data = tf_utils.ensure_tensor(data, dtype=self.vocabulary_dtype)
+            if data.shape.rank == 1:
+                # A plain list of strings
+                # is treated as as many documents
+                data = tf.expand_dims(data, -1)
+            yield data
+
+    def _adapt_vocabulary(self, batches, num_workers, max_counted_tokens):
+        """Counts the tokens of `batches` and builds the vocabulary."""
+        if (
+            max_counted_tokens is not None
+            and self.max_tokens is not None
+            and max_counted_tokens < self.max_tokens
+        ):
+            raise ValueError(
+                "`max_counted_tokens` must be at least `max_tokens`. Received: "
+                f"max_counted_tokens={max_counted_tokens}, "
+                f"max_tokens={self.max_tokens}"
             )
-            indices = tf.range(token_start, token_end, dtype=indices_dtype)
-            keys, values = (
-                (indices, tokens) if self.invert else (tokens, indices)
+        self._max_counted_tokens = max_counted_tokens
+        self.reset_state()
+        if num_workers is not None and num_workers > 1:
+            self._update_state_in_parallel(batches, num_workers)
+        else:
+            for batch in batches:
+                self.update_state(batch)
+        self.finalize_state()
+
+    def _update_state_in_parallel(self, batches, num_workers):
+        """Counts the tokens of `batches` in a pool of worker processes.
+
+        Batches are distributed across `num_workers` processes, which count
+        their shard of the data in their own `TokenCounter`s. The counters are
+        merged once all batches are counted.
+        """
+        self._ensure_adaptable()
+        # Forking a process that runs TensorFlow is unsafe.
+        context = multiprocessing.get_context("spawn")
+        tasks = context.Queue(maxsize=2 * num_workers)
+        results = context.Queue()
+        workers = [
+            context.Process(
+                target=_count_tokens_worker,
+                args=(
+                    tasks,
+                    results,
+                    {"max_tokens": self._max_counted_tokens},
+                    self.output_mode == "tf_idf",
+                    self._adapt_encoding,
+                ),
+                daemon=True,
             )
-            initializer = tf.lookup.KeyValueTensorInitializer(
-                keys, values, self._key_dtype, self._value_dtype
+            for _ in range(num_workers)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            for batch in batches:
+                values, row_ids, num_rows = self._flatten_adapt_batch(batch)
+                _put_while_alive(
+                    tasks, (values.numpy(), row_ids, num_rows), workers
+                )
+            for _ in workers:
+                _put_while_alive(tasks, None, workers)
+            for _ in workers:
+                result = _get_while_alive(results, workers)
+                if isinstance(result, BaseException):
+                    raise result
+                token_counts, document_counts, num_documents = result
+                self.token_counts.merge(token_counts)
+                if self.output_mode == "tf_idf":
+                    self.token_document_counts.merge(document_counts)
+                    self.num_documents += num_documents
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
+
+    def _flatten_adapt_batch(self, data):
+        """Returns the tokens, their row ids and the row count of a batch.
+
+        The tokens are returned as a flat TF tensor. The row ids are only
+        needed to count documents, and are `None` unless `output_mode` is
+        `"tf_idf"`.
+        """
+        data = tf_utils.ensure_tensor(data, dtype=self.vocabulary_dtype)
+        if data.shape.rank == 0:
+            data = tf.expand_dims(data, 0)
+        if data.shape.rank == 1:
+            # Expand dims on axis 0 for tf-idf. A 1-d tensor
+            # is a single document.
+            data = tf.expand_dims(data, 0)
+
+        count_documents = self.output_mode == "tf_idf"
+        row_ids = None
+        if isinstance(data, tf.SparseTensor):
+            if count_documents:
+                row_ids = data.indices[:, 0].numpy()
+            return data.values, row_ids, int(data.dense_shape[0])
+        if isinstance(data, tf.RaggedTensor):
+            if data.shape.rank > 2:
+                data = data.merge_dims(1, -1)
+            if count_documents:
+                row_ids = data.value_rowids().numpy()
+            return data.values, row_ids, int(data.nrows())
+        num_rows = int(data.shape[0])
+        values = tf.reshape(data, [-1])
+        if count_documents:
+            row_ids = np.repeat(
+                np.arange(num_rows), int(values.shape[0]) // max(num_rows, 1)
             )
-            return tf.lookup.StaticHashTable(initializer, self._default_value)
+        return values, row_ids, num_rows
+
+    def _get_tf_lookup_table(self):
+        """Returns a `tf.lookup` table holding the current vocabulary."""
+        if (
+            self._tf_lookup_table is None
+            or self._tf_lookup_table_source is not self.lookup_table
+        ):
+            keys, values = self.lookup_table.export()
+            with tf.init_scope():
+                # Assigned as an attribute, so that the table is tracked, and
+                # captured by SavedModel exports.
+                if len(keys):
+                    initializer = tf.lookup.KeyValueTensorInitializer(
+                        keys, values, self._key_dtype, self._value_dtype
+                    )
+                    self._tf_lookup_table = tf.lookup.StaticHashTable(
+                        initializer, self._default_value
+                    )
+                else:
+                    # A `StaticHashTable` cannot be empty.
+                    self._tf_lookup_table = (
+                        tf.lookup.experimental.MutableHashTable(
+                            self._key_dtype,
+                            self._value_dtype,
+                            self._default_value,
+                        )
+                    )
+            self._tf_lookup_table_source = self.lookup_table
+        return self._tf_lookup_table
+
+    def _lookup_table_from_tokens(self, tokens):
+        token_start = self._token_start_index()
+        indices = np.arange(
+            token_start, token_start + len(tokens), dtype="int64"
+        )
+        keys, values = (indices, tokens) if self.invert else (tokens, indices)
+        return lookup_utils.StaticLookupTable(keys, values, self._default_value)
 
     def _lookup_table_from_file(self, filename):
-        if self.invert:
-            key_index = tf.lookup.TextFileIndex.LINE_NUMBER
-            value_index = tf.lookup.TextFileIndex.WHOLE_LINE
+        with file_utils.File(filename, "r") as f:
+            lines = f.read().split("\n")
+        # A trailing newline does not start a new term.
+        if lines and not lines[-1]:
+            lines.pop()
+        if self.vocabulary_dtype == "string":
+            tokens = np.array(lines, dtype="str")
         else:
-            key_index = tf.lookup.TextFileIndex.WHOLE_LINE
-            value_index = tf.lookup.TextFileIndex.LINE_NUMBER
-        with tf.init_scope():
-            initializer = tf.lookup.TextFileInitializer(
-                filename=filename,
-                key_dtype=self._key_dtype,
-                key_index=key_index,
-                value_dtype=self._value_dtype,
-                value_index=value_index,
-                value_index_offset=self._token_start_index(),
-            )
-            return tf.lookup.StaticHashTable(initializer, self._default_value)
+            tokens = np.array([int(line) for line in lines], dtype="int64")
+        return self._lookup_table_from_tokens(tokens)
 
     def _convert_to_ndarray(self, x):
         return np.array(x) if isinstance(x, (list, tuple)) else x
@@ -885,6 +1092,14 @@ class IndexLookup(Layer):
     def _token_start_index(self):
         return self._oov_start_index() + self.num_oov_indices
 
+    def _ensure_adaptable(self):
+        if self._has_input_vocabulary:
+            raise ValueError(
+                f"Cannot adapt layer '{self.name}' after setting a static "
+                "vocabulary via `vocabulary` argument or "
+                "`set_vocabulary()` method."
+            )
+
     def _ensure_known_vocab_size(self):
         if self.output_mode == "int" or self.pad_to_max_tokens:
             return
@@ -901,8 +1116,7 @@ class IndexLookup(Layer):
         if self.output_mode == "int" or self.pad_to_max_tokens:
             return
 
-        with tf.init_scope():
-            new_vocab_size = self.vocabulary_size()
+        new_vocab_size = self.vocabulary_size()
 
         if (
             self._frozen_vocab_size is not None
@@ -928,17 +1142,6 @@ class IndexLookup(Layer):
         else:
             return []
 
-    def _num_tokens(self, data):
-        """Count the number of tokens in a ragged, sparse or dense tensor."""
-        if isinstance(data, tf.SparseTensor):
-            flat_values = data.values
-        elif isinstance(data, tf.RaggedTensor):
-            flat_values = data.flat_values
-        else:
-            flat_values = tf.reshape(data, [-1])
-        tokens, _, counts = tf.unique_with_counts(flat_values, out_idx="int64")
-        return tokens, counts
-
     def _inverse_document_frequency(self, token_document_counts, num_documents):
         """Computes the inverse-document-frequency (IDF) component of "tf_idf".
         Args:
@@ -949,48 +1152,70 @@ class IndexLookup(Layer):
         Returns:
             An array of "inverse document frequency" weights.
         """
-        return tf.math.log(1 + num_documents / (1 + token_document_counts))
+        return np.log(1 + num_documents / (1 + token_document_counts))
 
     # Override points for IntegerLookup and StringLookup.
+    @property
+    def _adapt_encoding(self):
+        """The encoding of string tokens passed to `adapt()`."""
+        return "utf-8"
+
     def _tensor_vocab_to_numpy(self, vocabulary):
         """Converts a tensor vocabulary to a numpy vocabulary."""
         return vocabulary.numpy()
 
 
-def get_null_initializer(key_dtype, value_dtype):
-    class NullInitializer(tf.lookup.KeyValueTensorInitializer):
-        """A placeholder initializer for restoring from a SavedModel."""
+def _count_tokens_worker(
+    tasks, results, counter_config, count_documents, encoding
+):
+    """Counts the batches of the `tasks` queue until it yields `None`."""
+    try:
+        token_counts = lookup_utils.TokenCounter(**counter_config)
+        document_counts = None
+        if count_documents:
+            document_counts = lookup_utils.TokenCounter(**counter_config)
+        num_documents = 0
+        for values, row_ids, num_rows in iter(tasks.get, None):
+            lookup_utils.count_tokens(
+                token_counts, values, row_ids, document_counts, encoding
+            )
+            num_documents += num_rows
+        results.put((token_counts, document_counts, num_documents))
+    except Exception as e:
+        results.put(e)
 
-        def __init__(self, key_dtype, value_dtype):
-            """Construct a table initializer object.
 
-            Args:
-            key_dtype: Type of the table keys.
-            value_dtype: Type of the table values.
-            """
-            self._key_dtype = key_dtype
-            self._value_dtype = value_dtype
+def _put_while_alive(tasks, item, workers):
+    while True:
+        try:
+            return tasks.put(item, timeout=1)
+        except queue.Full:
+            _check_workers(workers)
 
-        @property
-        def key_dtype(self):
-            """The expected table key dtype."""
-            return self._key_dtype
 
-        @property
-        def value_dtype(self):
-            """The expected table value dtype."""
-            return self._value_dtype
+def _get_while_alive(results, workers):
+    while True:
+        try:
+            return results.get(timeout=1)
+        except queue.Empty:
+            _check_workers(workers)
 
-        def initialize(self, table):
-            """Returns the table initialization op."""
-            pass
 
-    return NullInitializer(key_dtype, value_dtype)
+def _check_workers(workers):
+    for worker in workers:
+        if worker.exitcode:
+            raise RuntimeError(
+                "A process counting tokens in `adapt()` exited unexpectedly "
+                f"with exit code {worker.exitcode}. When `num_workers` is "
+                "set, `adapt()` starts new Python processes, so the main "
+                "module of the program must be guarded by "
+                "`if __name__ == '__main__':`."
+            )
 
 
 def listify_tensors(x):
     """Convert any tensors or numpy arrays to lists for config serialization."""
-    if tf.is_tensor(x):
+    if tf_utils.is_tf_tensor(x):
         x = x.numpy()
     if isinstance(x, np.ndarray):
         x = x.tolist()
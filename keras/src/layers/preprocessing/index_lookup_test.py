@@ -1,7 +1,9 @@
 import os
+from unittest import mock
 
 import numpy as np
 import pytest
+import tensorflow as tf
 from absl.testing import parameterized
 from tensorflow import data as tf_data
 
@@ -10,11 +12,22 @@ from keras.src import layers
 from keras.src import models
 from keras.src import testing
 from keras.src.saving import saving_api
+from keras.src.utils import tf_utils
+
+
+def numpy_lookup():
+    # NumPy inputs are only looked up with NumPy when TensorFlow is not
+    # imported.
+    return mock.patch.object(tf_utils, "is_tf_imported", return_value=False)
+
+
+def decode(outputs):
+    outputs = np.array(outputs)
+    if outputs.dtype.kind in "OS":
+        outputs = np.char.decode(outputs.astype("S"), "utf-8")
+    return outputs.tolist()
 
 
-@pytest.mark.skipif(
-    backend.backend() == "numpy", reason="Failing for numpy backend."
-)
 class IndexLookupLayerTest(testing.TestCase, parameterized.TestCase):
     def test_basics_string_vocab(self):
         # Case: adapt + list inputs
@@ -345,14 +358,12 @@ class IndexLookupLayerTest(testing.TestCase, parameterized.TestCase):
         }
         layer = layers.IndexLookup(**kwargs)
         output = layer(single_sample_input_data)
-        self.assertEqual(
-            [w.decode("utf-8") for w in output.numpy()], ["one", "two", "[OOV]"]
-        )
+        self.assertEqual(decode(output), ["one", "two", "[OOV]"])
         output = layer(batch_input_data)
-        self.assertEqual(
-            [w.decode("utf-8") for w in output.numpy()[0]],
-            ["one", "two", "[OOV]", "two"],
-        )
+        self.assertEqual(decode(output), [["one", "two", "[OOV]", "two"]])
+        # Lookups of TensorFlow tensors return TensorFlow tensors.
+        output = layer(tf.constant(single_sample_input_data))
+        self.assertEqual(decode(output), ["one", "two", "[OOV]"])
 
     @pytest.mark.skipif(
         backend.backend() != "tensorflow", reason="Requires string input dtype"
@@ -428,6 +439,55 @@ class IndexLookupLayerTest(testing.TestCase, parameterized.TestCase):
         if backend.backend() != "torch":
             self.run_class_serialization_test(layer)
 
+    @parameterized.named_parameters(("int", "int"), ("tf_idf", "tf_idf"))
+    def test_adapt_in_parallel(self, output_mode):
+        rng = np.random.default_rng(0)
+        adapt_data = tf_data.Dataset.from_tensor_slices(
+            rng.choice([f"token{i}" for i in range(50)], size=(200, 4))
+        ).batch(16)
+        kwargs = {
+            "max_tokens": 20,
+            "num_oov_indices": 1,
+            "mask_token": "" if output_mode == "int" else None,
+            "oov_token": "[OOV]",
+            "vocabulary_dtype": "string",
+            "output_mode": output_mode,
+        }
+        layer = layers.IndexLookup(**kwargs)
+        layer.adapt(adapt_data)
+        parallel_layer = layers.IndexLookup(**kwargs)
+        parallel_layer.adapt(adapt_data, num_workers=2)
+        self.assertEqual(
+            parallel_layer.get_vocabulary(), layer.get_vocabulary()
+        )
+        if output_mode == "tf_idf":
+            self.assertAllClose(parallel_layer.idf_weights, layer.idf_weights)
+
+    def test_adapt_with_max_counted_tokens(self):
+        # Five frequent tokens, and many tokens that are seen once.
+        adapt_data = np.concatenate(
+            [np.repeat(f"frequent{i}", 100 - 10 * i) for i in range(5)]
+            + [np.array([f"rare{i}" for i in range(2000)])]
+        )
+        np.random.default_rng(0).shuffle(adapt_data)
+        layer = layers.IndexLookup(
+            max_tokens=7,
+            num_oov_indices=1,
+            mask_token="",
+            oov_token="[OOV]",
+            vocabulary_dtype="string",
+        )
+        layer.adapt(
+            tf_data.Dataset.from_tensor_slices(adapt_data).batch(64),
+            max_counted_tokens=50,
+        )
+        self.assertEqual(
+            layer.get_vocabulary(include_special_tokens=False),
+            [f"frequent{i}" for i in range(5)],
+        )
+        with self.assertRaisesRegex(ValueError, "at least `max_tokens`"):
+            layer.adapt(adapt_data, max_counted_tokens=5)
+
     def test_max_tokens_less_than_two(self):
         with self.assertRaisesRegex(
             ValueError,
@@ -617,3 +677,75 @@ class IndexLookupLayerTest(testing.TestCase, parameterized.TestCase):
         ):
             input_data = ["sample", "data"]
             layer(input_data)
+
+    @parameterized.product(
+        output_mode=["int", "one_hot", "multi_hot", "count", "tf_idf"],
+        num_oov_indices=[0, 1, 3],
+        mask_token=[None, ""],
+        pad_to_max_tokens=[False, True],
+    )
+    def test_numpy_lookup_matches_tf_lookup(
+        self, output_mode, num_oov_indices, mask_token, pad_to_max_tokens
+    ):
+        vocabulary = ["one", "two", "three", "four"]
+        layer = layers.IndexLookup(
+            max_tokens=12 if pad_to_max_tokens else None,
+            num_oov_indices=num_oov_indices,
+            mask_token=mask_token,
+            oov_token="[OOV]",
+            vocabulary_dtype="string",
+            vocabulary=vocabulary,
+            idf_weights=(
+                [0.1, 0.2, 0.3, 0.4] if output_mode == "tf_idf" else None
+            ),
+            output_mode=output_mode,
+            pad_to_max_tokens=pad_to_max_tokens,
+        )
+        input_data = np.array(
+            [["one", "five", "six", "four"], ["three", "", "seven", "one"]]
+        )
+        if num_oov_indices == 0:
+            known = vocabulary + ([] if mask_token is None else [""])
+            input_data = np.where(np.isin(input_data, known), input_data, "one")
+        if output_mode == "one_hot":
+            input_data = input_data[0]
+        with numpy_lookup():
+            self.assertFalse(layer._use_tf_lookup(input_data))
+            outputs = layer(input_data)
+        self.assertAllClose(outputs, layer(tf.constant(input_data)))
+        # `tf.lookup` is used once TensorFlow is imported.
+        self.assertTrue(layer._use_tf_lookup(input_data))
+
+    def test_numpy_lookup_invert(self):
+        layer = layers.IndexLookup(
+            max_tokens=None,
+            num_oov_indices=2,
+            mask_token="",
+            oov_token="[OOV]",
+            vocabulary_dtype="string",
+            vocabulary=["one", "two", "three"],
+            invert=True,
+        )
+        input_data = np.array([[0, 3, 1], [5, 4, 9]])
+        with numpy_lookup():
+            outputs = layer(input_data)
+        self.assertEqual(
+            decode(outputs),
+            [["", "one", "[OOV]"], ["three", "two", "[OOV]"]],
+        )
+        self.assertEqual(
+            decode(outputs), decode(layer(tf.constant(input_data)))
+        )
+
+    def test_numpy_lookup_oov_error(self):
+        layer = layers.IndexLookup(
+            max_tokens=None,
+            num_oov_indices=0,
+            mask_token=None,
+            oov_token=None,
+            vocabulary_dtype="string",
+            vocabulary=["one", "two"],
+        )
+        with numpy_lookup():
+            with self.assertRaisesRegex(ValueError, "found OOV values"):
+                layer(np.array(["one", "three"]))
@@ -40,9 +40,10 @@ class IntegerLookup(IndexLookup):
     `output_mode` is `"multi_hot"`, `"count"`, or `"tf_idf"` the vocabulary will
     begin with OOV indices and instances of the mask token will be dropped.
 
-    **Note:** This layer uses TensorFlow internally. It cannot
-    be used as part of the compiled computation graph of a model with
-    any backend other than TensorFlow.
+    **Note:** This layer uses TensorFlow internally to adapt its vocabulary
+    and to process TensorFlow tensors, while other inputs are looked up
+    with NumPy. It cannot be used as part of the compiled computation graph
+    of a model with any backend other than TensorFlow.
     It can however be used with any backend when running eagerly.
     It can also always be used as part of an input preprocessing pipeline
     with any backend (outside the model itself), which is how we recommend
@@ -310,11 +311,6 @@ class IntegerLookup(IndexLookup):
         name=None,
         **kwargs,
     ):
-        if not tf.available:
-            raise ImportError(
-                "Layer IntegerLookup requires TensorFlow. "
-                "Install it via `pip install tensorflow`."
-            )
         if max_tokens is not None and max_tokens <= 1:
             raise ValueError(
                 "If `max_tokens` is set for `IntegerLookup`, it must be "
@@ -355,7 +351,9 @@ class IntegerLookup(IndexLookup):
         self._allow_non_tensor_positional_args = True
         self.supports_jit = False
 
-    def adapt(self, data, steps=None):
+    def adapt(
+        self, data, steps=None, num_workers=None, max_counted_tokens=None
+    ):
         """Computes a vocabulary of integer terms from tokens in a dataset.
 
         Calling `adapt()` on an `IntegerLookup` layer is an alternative to
@@ -383,8 +381,33 @@ class IntegerLookup(IndexLookup):
                 When passing an infinitely
                 repeating dataset, you must specify the `steps` argument. This
                 argument is not supported with array inputs or list inputs.
+            num_workers: Integer or `None`. If greater than 1, tokens are
+                counted by this many worker processes, each of which counts
+                a shard of the batches of `data`. Batches are still read in
+                the calling process. Defaults to `None`, which counts tokens
+                in the calling process.
+                Workers are started with the `"spawn"` method, so the main
+                module of the program must be guarded by
+                `if __name__ == "__main__":`.
+            max_counted_tokens: Integer or `None`. The maximum number of
+                distinct tokens that are counted exactly, by each worker and
+                in the final counts. This bounds the memory used by `adapt()`.
+                Past this number, token counts are approximated with a
+                count-min sketch, and only the `max_counted_tokens` tokens
+                with the highest approximate counts are kept. The vocabulary
+                is then the most frequent tokens up to an error of
+                `e / 2**18` times the total number of tokens (with
+                probability at least `1 - exp(-4)` per token): a token left
+                out of the vocabulary occurs at most that many times more
+                often than any token in it. It must be at least `max_tokens`.
+                Defaults to `None`, which counts all tokens exactly.
         """
-        super().adapt(data, steps=steps)
+        super().adapt(
+            data,
+            steps=steps,
+            num_workers=num_workers,
+            max_counted_tokens=max_counted_tokens,
+        )
 
     def get_config(self):
         config = super().get_config()
@@ -397,6 +420,8 @@ class IntegerLookup(IndexLookup):
         return config
 
     def call(self, inputs):
+        if not self._use_tf_lookup(inputs):
+            return super().call(inputs)
         if not isinstance(
             inputs, (tf.Tensor, tf.RaggedTensor, np.ndarray, list, tuple)
         ):
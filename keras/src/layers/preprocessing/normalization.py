@@ -1,4 +1,7 @@
+import collections
+import itertools
 import math
+from concurrent import futures
 
 import numpy as np
 
@@ -6,6 +9,7 @@ from keras.src import backend
 from keras.src import ops
 from keras.src.api_export import keras_export
 from keras.src.layers.layer import Layer
+from keras.src.trainers.data_adapters.py_dataset_adapter import PyDataset
 from keras.src.utils.module_utils import tensorflow as tf
 
 
@@ -194,7 +198,7 @@ class Normalization(Layer):
             self.variance = ops.cast(variance, dtype=self.compute_dtype)
             self.built = True
 
-    def adapt(self, data):
+    def adapt(self, data, steps=None, batch_size=None, num_threads=None):
         """Computes the mean and variance of values in a dataset.
 
         Calling `adapt()` on a `Normalization` layer is an alternative to
@@ -207,79 +211,113 @@ class Normalization(Layer):
         argument. To calculate a single `mean` and `variance` over the input
         data, simply pass `axis=None` to the layer.
 
+        Except for backend-native tensors, the data is processed one batch
+        at a time, and the statistics of the batches are merged with the
+        parallel algorithm of Chan et al., in float64. NumPy arrays,
+        including memory-mapped `np.memmap` arrays, are split into batches
+        of `batch_size` samples, so that they are never loaded or copied as
+        a whole.
+
         Arg:
             data: The data to train on. It can be passed either as a
-                `tf.data.Dataset`, as a NumPy array, or as a backend-native
-                eager tensor.
-                If a dataset, *it must be batched*. Keras will assume that the
-                data is batched, and if that assumption doesn't hold, the mean
-                and variance may be incorrectly computed.
+                `tf.data.Dataset`, as a NumPy array, as a backend-native
+                eager tensor, as a `keras.utils.PyDataset` or as any other
+                iterable of batches, such as a Python generator.
+                If a dataset or an iterable, *it must be batched*. Keras will
+                assume that the data is batched, and if that assumption
+                doesn't hold, the mean and variance may be incorrectly
+                computed. Batches that are tuples are treated as
+                `(x, y)` or `(x, y, sample_weight)` tuples, and only `x` is
+                used.
+            steps: Integer or `None`. The number of batches to process
+                from a dataset or an iterable. If `None`, `adapt()` runs
+                until the data is exhausted. It must be set for infinite
+                datasets.
+            batch_size: Integer or `None`. The number of samples per batch
+                when `data` is a NumPy array. Defaults to batches of about
+                `2**20` values.
+            num_threads: Integer or `None`. The number of threads that
+                compute the statistics of batches in parallel. At most one
+                batch per thread is held in memory. Defaults to `None`, which
+                computes them in the calling thread.
         """
-        if isinstance(data, np.ndarray) or backend.is_tensor(data):
+        if isinstance(data, np.ndarray):
             input_shape = data.shape
-        elif isinstance(data, tf.data.Dataset):
-            input_shape = tuple(data.element_spec.shape)
-            if len(input_shape) == 1:
-                # Batch dataset if it isn't batched
-                data = data.batch(128)
-            input_shape = tuple(data.element_spec.shape)
+        elif backend.is_tensor(data):
+            input_shape = data.shape
+        else:
+            if isinstance(data, tf.data.Dataset):
+                if len(data.element_spec.shape) == 1:
+                    # Batch dataset if it isn't batched
+                    data = data.batch(128)
+            if isinstance(data, PyDataset):
+                batches = map(data.__getitem__, _count(data.num_batches))
+            else:
+                batches = iter(data)
+            if steps is not None:
+                batches = itertools.islice(batches, steps)
+            batches = (_unpack_x(batch) for batch in batches)
+            first_batch = next(batches, None)
+            if first_batch is None:
+                raise ValueError("Cannot adapt a layer on empty data.")
+            input_shape = (None,) + tuple(first_batch.shape[1:])
+            batches = itertools.chain([first_batch], batches)
 
         if not self.built:
             self.build(input_shape)
         else:
-            for d in self._keep_axis:
-                if input_shape[d] != self._build_input_shape[d]:
-                    raise ValueError(
-                        "The layer was built with "
-                        f"input_shape={self._build_input_shape}, "
-                        "but adapt() is being called with data with "
-                        f"an incompatible shape, data.shape={input_shape}"
-                    )
+            self._check_adapt_shape(input_shape)
 
         if isinstance(data, np.ndarray):
-            total_mean = np.mean(data, axis=self._reduce_axis)
-            total_var = np.var(data, axis=self._reduce_axis)
-        elif backend.is_tensor(data):
-            total_mean = ops.mean(data, axis=self._reduce_axis)
-            total_var = ops.var(data, axis=self._reduce_axis)
-        elif isinstance(data, tf.data.Dataset):
-            total_mean = ops.zeros(self._mean_and_var_shape)
-            total_var = ops.zeros(self._mean_and_var_shape)
-            total_count = 0
-            for batch in data:
-                batch = backend.convert_to_tensor(
-                    batch, dtype=self.compute_dtype
-                )
-                batch_mean = ops.mean(batch, axis=self._reduce_axis)
-                batch_var = ops.var(batch, axis=self._reduce_axis)
-                if self._reduce_axis:
-                    batch_reduce_shape = (
-                        batch.shape[d] for d in self._reduce_axis
-                    )
-                    batch_count = math.prod(batch_reduce_shape)
-                else:
-                    batch_count = 1
-
-                total_count += batch_count
-                batch_weight = float(batch_count) / total_count
-                existing_weight = 1.0 - batch_weight
-                new_total_mean = (
-                    total_mean * existing_weight + batch_mean * batch_weight
+            if 0 in self._keep_axis:
+                # Statistics are kept per sample, so the array can't be split.
+                batches = [data]
+            else:
+                if batch_size is None:
+                    sample_size = math.prod(data.shape[1:])
+                    batch_size = max(1, 2**20 // max(sample_size, 1))
+                batches = (
+                    data[i : i + batch_size]
+                    for i in range(0, len(data), batch_size)
                 )
-                # The variance is computed using the lack-of-fit sum of squares
-                # formula (see
-                # https://en.wikipedia.org/wiki/Lack-of-fit_sum_of_squares).
-                total_var = (
-                    total_var + (total_mean - new_total_mean) ** 2
-                ) * existing_weight + (
-                    batch_var + (batch_mean - new_total_mean) ** 2
-                ) * batch_weight
-                total_mean = new_total_mean
+        elif backend.is_tensor(data):
+            self.adapt_mean.assign(ops.mean(data, axis=self._reduce_axis))
+            self.adapt_variance.assign(ops.var(data, axis=self._reduce_axis))
+            self.finalize_state()
+            return
 
+        total_count, total_mean, total_m2 = 0, 0.0, 0.0
+        for batch_moments in _map_batches(
+            self._batch_moments, batches, num_threads
+        ):
+            total_count, total_mean, total_m2 = _merge_moments(
+                (total_count, total_mean, total_m2), batch_moments
+            )
         self.adapt_mean.assign(total_mean)
-        self.adapt_variance.assign(total_var)
+        self.adapt_variance.assign(total_m2 / max(total_count, 1))
         self.finalize_state()
 
+    def _batch_moments(self, batch):
+        """Returns the count, mean and sum of squared deviations of a batch."""
+        batch = backend.convert_to_numpy(batch).astype("float64", copy=False)
+        self._check_adapt_shape(batch.shape)
+        count = math.prod(batch.shape[d] for d in self._reduce_axis)
+        mean = np.mean(batch, axis=self._reduce_axis, keepdims=True)
+        deviations = batch - mean
+        np.square(deviations, out=deviations)
+        m2 = np.sum(deviations, axis=self._reduce_axis)
+        return count, np.reshape(mean, m2.shape), m2
+
+    def _check_adapt_shape(self, input_shape):
+        for d in self._keep_axis:
+            if input_shape[d] != self._build_input_shape[d]:
+                raise ValueError(
+                    "The layer was built with "
+                    f"input_shape={self._build_input_shape}, "
+                    "but adapt() is being called with data with "
+                    f"an incompatible shape, data.shape={input_shape}"
+                )
+
     def finalize_state(self):
         if self.input_mean is not None or not self.built:
             return
@@ -334,3 +372,39 @@ class Normalization(Layer):
     def build_from_config(self, config):
         if config:
             self.build(config["input_shape"])
+
+
+def _unpack_x(batch):
+    return batch[0] if isinstance(batch, tuple) else batch
+
+
+def _count(limit):
+    return itertools.count() if limit is None else range(limit)
+
+
+def _map_batches(fn, batches, num_threads):
+    """Maps `fn` over `batches` with at most `num_threads` batches in flight."""
+    if num_threads is None or num_threads <= 1:
+        yield from map(fn, batches)
+        return
+    with futures.ThreadPoolExecutor(num_threads) as executor:
+        pending = collections.deque()
+        for batch in batches:
+            if len(pending) == num_threads:
+                yield pending.popleft().result()
+            pending.append(executor.submit(fn, batch))
+        while pending:
+            yield pending.popleft().result()
+
+
+def _merge_moments(a, b):
+    """Merges `(count, mean, m2)` statistics (Chan et al.)."""
+    count_a, mean_a, m2_a = a
+    count_b, mean_b, m2_b = b
+    count = count_a + count_b
+    if count == 0:
+        return a
+    delta = mean_b - mean_a
+    mean = mean_a + delta * (count_b / count)
+    m2 = m2_a + m2_b + np.square(delta) * (count_a * count_b / count)
+    return count, mean, m2
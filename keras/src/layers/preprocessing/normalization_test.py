@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 import pytest
 from absl.testing import parameterized
@@ -6,6 +8,21 @@ from tensorflow import data as tf_data
 from keras.src import backend
 from keras.src import layers
 from keras.src import testing
+from keras.src.trainers.data_adapters.py_dataset_adapter import PyDataset
+
+
+class ArrayPyDataset(PyDataset):
+    def __init__(self, x, batch_size):
+        super().__init__()
+        self.x = x
+        self.batch_size = batch_size
+
+    def __len__(self):
+        return len(self.x) // self.batch_size
+
+    def __getitem__(self, idx):
+        batch = self.x[idx * self.batch_size : (idx + 1) * self.batch_size]
+        return batch, np.zeros((len(batch),))
 
 
 class NormalizationTest(testing.TestCase, parameterized.TestCase):
@@ -56,7 +73,9 @@ class NormalizationTest(testing.TestCase, parameterized.TestCase):
             supports_masking=True,
         )
 
-    @parameterized.parameters([("np",), ("tensor",), ("tf.data")])
+    @parameterized.parameters(
+        [("np",), ("tensor",), ("tf.data",), ("generator",), ("py_dataset",)]
+    )
     def test_normalization_adapt(self, input_type):
         x = np.random.random((32, 4))
         if input_type == "np":
@@ -65,6 +84,10 @@ class NormalizationTest(testing.TestCase, parameterized.TestCase):
             data = backend.convert_to_tensor(x)
         elif input_type == "tf.data":
             data = tf_data.Dataset.from_tensor_slices(x).batch(8)
+        elif input_type == "generator":
+            data = (x[i : i + 8] for i in range(0, 32, 8))
+        elif input_type == "py_dataset":
+            data = ArrayPyDataset(x, batch_size=8)
 
         layer = layers.Normalization()
         layer.adapt(data)
@@ -82,6 +105,10 @@ class NormalizationTest(testing.TestCase, parameterized.TestCase):
             data = backend.convert_to_tensor(x)
         elif input_type == "tf.data":
             data = tf_data.Dataset.from_tensor_slices(x).batch(8)
+        elif input_type == "generator":
+            data = (x[i : i + 8] for i in range(0, 32, 8))
+        elif input_type == "py_dataset":
+            data = ArrayPyDataset(x, batch_size=8)
 
         layer = layers.Normalization(axis=(1, 2))
         layer.adapt(data)
@@ -91,6 +118,24 @@ class NormalizationTest(testing.TestCase, parameterized.TestCase):
         self.assertAllClose(np.var(output, axis=(0, 3)), 1.0, atol=1e-5)
         self.assertAllClose(np.mean(output, axis=(0, 3)), 0.0, atol=1e-5)
 
+    def test_normalization_adapt_memmap(self):
+        # Large offsets would lose precision with a one-pass variance.
+        x = np.random.normal(1e6, 2.0, size=(1000, 3)).astype("float32")
+        path = os.path.join(self.get_temp_dir(), "data.npy")
+        np.save(path, x)
+        data = np.load(path, mmap_mode="r")
+
+        layer = layers.Normalization()
+        layer.adapt(data, batch_size=64, num_threads=2)
+        x = x.astype("float64")
+        self.assertAllClose(layer.adapt_mean, np.mean(x, axis=0))
+        self.assertAllClose(layer.adapt_variance, np.var(x, axis=0), rtol=1e-5)
+
+        # Only a given number of batches are used with `steps`.
+        layer = layers.Normalization()
+        layer.adapt((data[i : i + 100] for i in range(0, 1000, 100)), steps=2)
+        self.assertAllClose(layer.adapt_mean, np.mean(x[:200], axis=0))
+
     @pytest.mark.skipif(
         backend.backend() != "torch",
         reason="Test symbolic call for torch meta device.",
@@ -39,9 +39,10 @@ class StringLookup(IndexLookup):
     is `"multi_hot"`, `"count"`, or `"tf_idf"` the vocabulary will begin with
     OOV indices and instances of the mask token will be dropped.
 
-    **Note:** This layer uses TensorFlow internally. It cannot
-    be used as part of the compiled computation graph of a model with
-    any backend other than TensorFlow.
+    **Note:** This layer uses TensorFlow internally to adapt its vocabulary
+    and to process TensorFlow tensors, while other inputs are looked up
+    with NumPy. It cannot be used as part of the compiled computation graph
+    of a model with any backend other than TensorFlow.
     It can however be used with any backend when running eagerly.
     It can also always be used as part of an input preprocessing pipeline
     with any backend (outside the model itself), which is how we recommend
@@ -307,11 +308,6 @@ class StringLookup(IndexLookup):
         name=None,
         **kwargs,
     ):
-        if not tf.available:
-            raise ImportError(
-                "Layer StringLookup requires TensorFlow. "
-                "Install it via `pip install tensorflow`."
-            )
         if sparse and backend.backend() != "tensorflow":
             raise ValueError(
                 "`sparse=True` can only be used with the " "TensorFlow backend."
@@ -336,7 +332,9 @@ class StringLookup(IndexLookup):
         self._allow_non_tensor_positional_args = True
         self.supports_jit = False
 
-    def adapt(self, data, steps=None):
+    def adapt(
+        self, data, steps=None, num_workers=None, max_counted_tokens=None
+    ):
         """Computes a vocabulary of integer terms from tokens in a dataset.
 
         Calling `adapt()` on a `StringLookup` layer is an alternative to passing
@@ -364,10 +362,39 @@ class StringLookup(IndexLookup):
                 When passing an infinitely
                 repeating dataset, you must specify the `steps` argument. This
                 argument is not supported with array inputs or list inputs.
+            num_workers: Integer or `None`. If greater than 1, tokens are
+                counted by this many worker processes, each of which counts
+                a shard of the batches of `data`. Batches are still read in
+                the calling process. Defaults to `None`, which counts tokens
+                in the calling process.
+                Workers are started with the `"spawn"` method, so the main
+                module of the program must be guarded by
+                `if __name__ == "__main__":`.
+            max_counted_tokens: Integer or `None`. The maximum number of
+                distinct tokens that are counted exactly, by each worker and
+                in the final counts. This bounds the memory used by `adapt()`.
+                Past this number, token counts are approximated with a
+                count-min sketch, and only the `max_counted_tokens` tokens
+                with the highest approximate counts are kept. The vocabulary
+                is then the most frequent tokens up to an error of
+                `e / 2**18` times the total number of tokens (with
+                probability at least `1 - exp(-4)` per token): a token left
+                out of the vocabulary occurs at most that many times more
+                often than any token in it. It must be at least `max_tokens`.
+                Defaults to `None`, which counts all tokens exactly.
         """
-        super().adapt(data, steps=steps)
+        super().adapt(
+            data,
+            steps=steps,
+            num_workers=num_workers,
+            max_counted_tokens=max_counted_tokens,
+        )
 
     # Overridden methods from IndexLookup.
+    @property
+    def _adapt_encoding(self):
+        return self.encoding
+
     def _tensor_vocab_to_numpy(self, vocabulary):
         vocabulary = vocabulary.numpy()
         return np.array(
@@ -382,6 +409,8 @@ class StringLookup(IndexLookup):
         return {**base_config, **config}
 
     def call(self, inputs):
+        if not self._use_tf_lookup(inputs):
+            return super().call(inputs)
         if isinstance(inputs, (tf.Tensor, tf.RaggedTensor)):
             tf_inputs = True
         else:
@@ -1,3 +1,6 @@
+import re
+import string
+
 import numpy as np
 
 from keras.src import backend
@@ -8,9 +11,15 @@ from keras.src.layers.preprocessing.string_lookup import StringLookup
 from keras.src.saving import serialization_lib
 from keras.src.utils import argument_validation
 from keras.src.utils import backend_utils
+from keras.src.utils import lookup_utils
 from keras.src.utils import tf_utils
 from keras.src.utils.module_utils import tensorflow as tf
 
+PUNCTUATION_REGEX = r'[!"#$%&()\*\+,-\./:;<=>?@\[\\\]^_`{|}~\']'
+# `tf.strings.lower` and `tf.strings.split` only handle ASCII characters.
+_ASCII_LOWERCASE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+_ASCII_WHITESPACE = re.compile(r"[ \t\n\r\x0b\x0c]+")
+
 
 @keras_export("keras.layers.TextVectorization")
 class TextVectorization(Layer):
@@ -60,9 +69,11 @@ class TextVectorization(Layer):
        in this example, we should see something like `[["string", "to",
        "split"], ["another", "string", "to", "split"]]`.
 
-    **Note:** This layer uses TensorFlow internally. It cannot
-    be used as part of the compiled computation graph of a model with
-    any backend other than TensorFlow.
+    **Note:** This layer uses TensorFlow internally to adapt its vocabulary,
+    to process TensorFlow tensors and to apply callable `standardize` and
+    `split` functions, while other inputs are processed with NumPy.
+    It cannot be used as part of the compiled computation graph
+    of a model with any backend other than TensorFlow.
     It can however be used with any backend when running eagerly.
     It can also always be used as part of an input preprocessing pipeline
     with any backend (outside the model itself), which is how we recommend
@@ -219,11 +230,6 @@ class TextVectorization(Layer):
         name=None,
         **kwargs,
     ):
-        if not tf.available:
-            raise ImportError(
-                "Layer TextVectorization requires TensorFlow. "
-                "Install it via `pip install tensorflow`."
-            )
         if sparse and backend.backend() != "tensorflow":
             raise ValueError(
                 "`sparse=True` can only be used with the " "TensorFlow backend."
@@ -384,7 +390,14 @@ class TextVectorization(Layer):
             output_dtype = backend.floatx()
         return backend.KerasTensor(output_shape, dtype=output_dtype)
 
-    def adapt(self, data, batch_size=None, steps=None):
+    def adapt(
+        self,
+        data,
+        batch_size=None,
+        steps=None,
+        num_workers=None,
+        max_counted_tokens=None,
+    ):
         """Computes a vocabulary of string terms from tokens in a dataset.
 
         Calling `adapt()` on a `TextVectorization` layer is an alternative to
@@ -412,21 +425,43 @@ class TextVectorization(Layer):
                 When passing an infinitely
                 repeating dataset, you must specify the `steps` argument. This
                 argument is not supported with array inputs or list inputs.
+            num_workers: Integer or `None`. If greater than 1, tokens are
+                counted by this many worker processes, each of which counts
+                a shard of the batches of `data`. Batches are still read,
+                standardized and split in the calling process. Defaults to
+                `None`, which counts tokens in the calling process.
+                Workers are started with the `"spawn"` method, so the main
+                module of the program must be guarded by
+                `if __name__ == "__main__":`.
+            max_counted_tokens: Integer or `None`. The maximum number of
+                distinct tokens that are counted exactly, by each worker and
+                in the final counts. This bounds the memory used by `adapt()`.
+                Past this number, token counts are approximated with a
+                count-min sketch, and only the `max_counted_tokens` tokens
+                with the highest approximate counts are kept. The vocabulary
+                is then the most frequent tokens up to an error of
+                `e / 2**18` times the total number of tokens (with
+                probability at least `1 - exp(-4)` per token): a token left
+                out of the vocabulary occurs at most that many times more
+                often than any token in it. It must be at least `max_tokens`.
+                Defaults to `None`, which counts all tokens exactly.
         """
-        self.reset_state()
         if isinstance(data, tf.data.Dataset):
             if steps is not None:
                 data = data.take(steps)
-            for batch in data:
-                self.update_state(batch)
+            batches = data
         else:
             data = tf_utils.ensure_tensor(data, dtype="string")
             if data.shape.rank == 1:
                 # A plain list of strings
                 # is treated as as many documents
                 data = tf.expand_dims(data, -1)
-            self.update_state(data)
-        self.finalize_state()
+            batches = [data]
+        self._lookup_layer._adapt_vocabulary(
+            (self._preprocess(batch) for batch in batches),
+            num_workers,
+            max_counted_tokens,
+        )
 
     def update_state(self, data):
         self._lookup_layer.update_state(self._preprocess(data))
@@ -526,9 +561,7 @@ class TextVectorization(Layer):
             "strip_punctuation",
             "lower_and_strip_punctuation",
         ):
-            inputs = tf.strings.regex_replace(
-                inputs, r'[!"#$%&()\*\+,-\./:;<=>?@\[\\\]^_`{|}~\']', ""
-            )
+            inputs = tf.strings.regex_replace(inputs, PUNCTUATION_REGEX, "")
         if callable(self._standardize):
             inputs = self._standardize(inputs)
 
@@ -566,6 +599,9 @@ class TextVectorization(Layer):
         return inputs
 
     def call(self, inputs):
+        if self._use_numpy_preprocessing(inputs):
+            return self._call_numpy(inputs)
+
         if not isinstance(
             inputs, (tf.Tensor, tf.RaggedTensor, np.ndarray, list, tuple)
         ):
@@ -613,6 +649,77 @@ class TextVectorization(Layer):
 
         return backend_utils.convert_tf_tensor(outputs)
 
+    def _use_numpy_preprocessing(self, inputs):
+        return not (
+            self._lookup_layer._use_tf_lookup(inputs)
+            or self._ragged
+            or callable(self._standardize)
+            or callable(self._split)
+            or (self._ngrams is not None and self._split is None)
+        )
+
+    def _call_numpy(self, inputs):
+        """Standardizes, splits and looks up inputs without TensorFlow."""
+        if isinstance(inputs, (list, tuple)):
+            inputs = np.array(inputs)
+        else:
+            inputs = backend.convert_to_numpy(inputs)
+        inputs = lookup_utils.normalize_keys(inputs, self._encoding)
+
+        if self._standardize in ("lower", "lower_and_strip_punctuation"):
+            inputs = np.char.translate(inputs, _ASCII_LOWERCASE)
+        if self._standardize in (
+            "strip_punctuation",
+            "lower_and_strip_punctuation",
+        ):
+            pattern = re.compile(PUNCTUATION_REGEX)
+            inputs = _map_strings(lambda x: pattern.sub("", x), inputs)
+
+        if self._split is not None:
+            if inputs.ndim > 1:
+                if inputs.shape[-1] != 1:
+                    raise ValueError(
+                        "When using `TextVectorization` to tokenize strings, "
+                        "the input rank must be 1 or the last shape dimension "
+                        f"must be 1. Received: inputs.shape={inputs.shape} "
+                        f"with rank={inputs.ndim}"
+                    )
+                inputs = np.squeeze(inputs, axis=-1)
+            if self._split == "whitespace":
+                rows = [
+                    [token for token in _ASCII_WHITESPACE.split(x) if token]
+                    for x in inputs.ravel().tolist()
+                ]
+            else:
+                rows = [list(x) for x in inputs.ravel().tolist()]
+            if self._ngrams is not None:
+                rows = [
+                    [
+                        " ".join(row[i : i + width])
+                        for width in self._ngrams
+                        for i in range(len(row) - width + 1)
+                    ]
+                    for row in rows
+                ]
+            # Rows are padded with the mask token, which maps to 0 in "int"
+            # mode and is dropped in other modes, like the padding of ragged
+            # tensors.
+            length = self._output_sequence_length
+            if length is None:
+                length = max((len(row) for row in rows), default=0)
+            inputs = np.array(
+                [row[:length] + [""] * (length - len(row)) for row in rows],
+                dtype="str",
+            ).reshape(inputs.shape + (length,))
+        elif self._output_sequence_length is not None:
+            length = self._output_sequence_length
+            inputs = inputs[..., :length]
+            padding = [(0, 0)] * (inputs.ndim - 1)
+            padding.append((0, length - inputs.shape[-1]))
+            inputs = np.pad(inputs, padding, constant_values="")
+
+        return self._lookup_layer.call(inputs)
+
     def save_own_variables(self, store):
         self._lookup_layer.save_own_variables(store)
 
@@ -624,3 +731,8 @@ class TextVectorization(Layer):
 
     def load_assets(self, dir_path):
         self._lookup_layer.load_assets(dir_path)
+
+
+def _map_strings(fn, inputs):
+    outputs = [fn(x) for x in inputs.ravel().tolist()]
+    return np.array(outputs, dtype="str").reshape(inputs.shape)
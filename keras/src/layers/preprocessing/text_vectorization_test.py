@@ -1,8 +1,10 @@
 import os
+from unittest import mock
 
 import numpy as np
 import pytest
 import tensorflow as tf
+from absl.testing import parameterized
 from tensorflow import data as tf_data
 
 from keras.src import Sequential
@@ -11,9 +13,10 @@ from keras.src import layers
 from keras.src import models
 from keras.src import saving
 from keras.src import testing
+from keras.src.utils import tf_utils
 
 
-class TextVectorizationTest(testing.TestCase):
+class TextVectorizationTest(testing.TestCase, parameterized.TestCase):
     # TODO: increase coverage. Most features aren't being tested.
 
     def test_config(self):
@@ -38,6 +41,18 @@ class TextVectorizationTest(testing.TestCase):
         self.assertTrue(backend.is_tensor(output))
         self.assertAllClose(output, np.array([[4, 1, 3, 0], [1, 2, 0, 0]]))
 
+    def test_adapt_in_parallel(self):
+        adapt_data = tf_data.Dataset.from_tensor_slices(
+            ["foo bar", "bar baz", "baz bada boom", "Bar, baz!"]
+        ).batch(1)
+        layer = layers.TextVectorization(ngrams=2)
+        layer.adapt(adapt_data, num_workers=2)
+        expected_layer = layers.TextVectorization(ngrams=2)
+        expected_layer.adapt(adapt_data)
+        self.assertEqual(
+            layer.get_vocabulary(), expected_layer.get_vocabulary()
+        )
+
     def test_fixed_vocabulary(self):
         max_tokens = 5000
         max_len = 4
@@ -170,3 +185,38 @@ class TextVectorizationTest(testing.TestCase):
                 vocabulary=["baz", "bar", "foo"],
                 ragged=True,
             )
+
+    @parameterized.product(
+        standardize=[None, "lower", "lower_and_strip_punctuation"],
+        split=[None, "whitespace", "character"],
+        output_mode=["int", "multi_hot", "tf_idf"],
+    )
+    def test_numpy_preprocessing_matches_tf(
+        self, standardize, split, output_mode
+    ):
+        layer = layers.TextVectorization(
+            standardize=standardize,
+            split=split,
+            ngrams=None if split is None else (1, 2),
+            output_mode=output_mode,
+            output_sequence_length=8 if output_mode == "int" else None,
+            vocabulary=["the", "fox", "t", "e", "the fox", "over the"],
+            idf_weights=(
+                [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+                if output_mode == "tf_idf"
+                else None
+            ),
+        )
+        input_data = np.array(
+            [
+                ["The  quick, brown FOX!"],
+                ["\tjumped over the lazy dög."],
+                [""],
+            ]
+        )
+        # NumPy inputs are only preprocessed with NumPy when TensorFlow is
+        # not imported.
+        with mock.patch.object(tf_utils, "is_tf_imported", return_value=False):
+            self.assertTrue(layer._use_numpy_preprocessing(input_data))
+            outputs = layer(input_data)
+        self.assertAllClose(outputs, layer(tf.constant(input_data)))
@@ -4,6 +4,7 @@ import numpy as np
 
 from keras.src import backend
 from keras.src import ops
+from keras.src.backend.common import global_state
 from keras.src.losses.loss import squeeze_or_expand_to_same_rank
 from keras.src.utils.python_utils import to_list
 
@@ -100,6 +101,7 @@ def _update_confusion_matrix_variables_optimized(
     sample_weights=None,
     label_weights=None,
     thresholds_with_epsilon=False,
+    shared_key=None,
 ):
     """Update confusion matrix variables with memory efficient alternative.
 
@@ -127,7 +129,9 @@ def _update_confusion_matrix_variables_optimized(
       thresholds = [0.0, 1*width, 2*width, 3*width, ..., 1.0]
     Given a prediction value p, we can map it to its bucket by
       bucket_index(p) = floor( p * (num_thresholds - 1) )
-    so we can use ops.segment_sum() to update the buckets in one pass.
+    so we can use ops.segment_sum() to update the buckets in one pass. The
+    true and false labels are stacked and bucketized by the same segment sum,
+    see `_confusion_histograms()`.
 
     Consider following example:
     y_true = [0, 0, 1, 1]
@@ -188,9 +192,116 @@ def _update_confusion_matrix_variables_optimized(
             and tailing thresholds has any epsilon added for floating point
             imprecisions.  It will change how we handle the leading and tailing
             bucket.
+        shared_key: Optional tuple of the original inputs that the
+            histograms are computed from, and of the hashable options they
+            were preprocessed with (e.g. `class_id`). If set, the histograms
+            are shared with the other metrics updated with the same inputs and
+            options in a `SharedConfusionHistograms` scope.
     """
     num_thresholds = ops.shape(thresholds)[0]
+    scope = get_shared_confusion_histograms()
+    if scope is None or shared_key is None:
+        histograms = _confusion_histograms(
+            y_true,
+            y_pred,
+            num_thresholds,
+            multi_label=multi_label,
+            sample_weights=sample_weights,
+            label_weights=label_weights,
+        )
+    else:
+        inputs, options = shared_key
+        histograms = scope.get(
+            inputs,
+            options + (num_thresholds, multi_label, y_pred.dtype),
+            lambda: _confusion_histograms(
+                y_true,
+                y_pred,
+                num_thresholds,
+                multi_label=multi_label,
+                sample_weights=sample_weights,
+                label_weights=label_weights,
+            ),
+        )
+
+    # fn = sum(true_labels) - tp
+    # tn = sum(false_labels) - fp
+    total_true_labels, total_false_labels = ops.unstack(
+        ops.sum(histograms, axis=0), 2, axis=-1
+    )
+
+    # Bucket `i` of the histograms holds the predictions in
+    # `(t_{i-1}, t_i]`, and bucket 0 the predictions equal to `t_0`. Since
+    # the predict value has to be strictly greater than the thresholds, shift
+    # the buckets so that bucket `i` holds the predictions above `t_i`.
+    if thresholds_with_epsilon:
+        # In this case, any prediction between [0.0, 1.0] is larger than the
+        # first threshold, so the first two buckets are merged.
+        histograms = ops.concatenate(
+            [
+                histograms[:1] + histograms[1:2],
+                histograms[2:],
+                ops.zeros_like(histograms[:1]),
+            ],
+            axis=0,
+        )
+    else:
+        histograms = ops.concatenate(
+            [histograms[1:], ops.zeros_like(histograms[:1])], axis=0
+        )
+    histograms = ops.flip(ops.cumsum(ops.flip(histograms, 0), axis=0), 0)
+    tp, fp = ops.unstack(histograms, 2, axis=-1)
+
+    if ConfusionMatrix.TRUE_POSITIVES in variables_to_update:
+        variable = variables_to_update[ConfusionMatrix.TRUE_POSITIVES]
+        variable.assign(variable + tp)
+    if ConfusionMatrix.FALSE_POSITIVES in variables_to_update:
+        variable = variables_to_update[ConfusionMatrix.FALSE_POSITIVES]
+        variable.assign(variable + fp)
+    if ConfusionMatrix.TRUE_NEGATIVES in variables_to_update:
+        variable = variables_to_update[ConfusionMatrix.TRUE_NEGATIVES]
+        tn = total_false_labels - fp
+        variable.assign(variable + tn)
+    if ConfusionMatrix.FALSE_NEGATIVES in variables_to_update:
+        variable = variables_to_update[ConfusionMatrix.FALSE_NEGATIVES]
+        fn = total_true_labels - tp
+        variable.assign(variable + fn)
+
+
+def _confusion_histograms(
+    y_true,
+    y_pred,
+    num_thresholds,
+    multi_label=False,
+    sample_weights=None,
+    label_weights=None,
+):
+    """Computes the weighted histograms of true and false labels.
 
+    Predictions are bucketized with `ceil(y_pred * (num_thresholds - 1))`, so
+    that bucket `i > 0` holds the predictions in `(t_{i-1}, t_i]` of the evenly
+    distributed thresholds, and bucket 0 the predictions equal to 0. The
+    histograms of the true and false labels are computed in one pass with a
+    single `ops.segment_sum()` of the stacked labels. With `multi_label`, the
+    bucket indices of each label are offset by `label * num_thresholds`, so
+    that all labels are also bucketized at once.
+
+    Args:
+        y_true: A floating point `Tensor` whose shape matches `y_pred`.
+        y_pred: A floating point `Tensor` whose values are in `[0, 1]`.
+        num_thresholds: The number of evenly distributed thresholds.
+        multi_label: Whether to compute separate histograms for each label
+            (last dimension) of `y_pred`.
+        sample_weights: Optional `Tensor` broadcastable to `y_true`.
+        label_weights: Optional tensor of non-negative weights for multilabel
+            data, when the data is to be flattened.
+
+    Returns:
+        A `Tensor` of shape `(num_thresholds, 2)`, or
+        `(num_thresholds, num_labels, 2)` with `multi_label`, with the weighted
+        counts of true labels (`[..., 0]`) and false labels (`[..., 1]`) in
+        each bucket.
+    """
     if sample_weights is None:
         sample_weights = 1.0
     else:
@@ -219,96 +330,91 @@ def _update_confusion_matrix_variables_optimized(
         y_true = ops.reshape(y_true, [-1])
         y_pred = ops.reshape(y_pred, [-1])
 
-    true_labels = ops.multiply(y_true, weights)
-    false_labels = ops.multiply((1.0 - y_true), weights)
+    labels = ops.stack(
+        [
+            ops.multiply(y_true, weights),
+            ops.multiply((1.0 - y_true), weights),
+        ],
+        axis=-1,
+    )
+    bucket_indices = ops.cast(
+        ops.ceil(y_pred * ops.cast(num_thresholds - 1, dtype=y_pred.dtype)),
+        "int32",
+    )
 
-    # Compute the bucket indices for each prediction value.
-    # Since the predict value has to be strictly greater than the thresholds,
-    # eg, buckets like [0, 0.5], (0.5, 1], and 0.5 belongs to first bucket.
-    # We have to use math.ceil(val) - 1 for the bucket.
-    bucket_indices = (
-        ops.ceil(y_pred * (ops.cast(num_thresholds, dtype=y_pred.dtype) - 1))
-        - 1
+    if not multi_label:
+        return ops.segment_sum(
+            data=labels,
+            segment_ids=bucket_indices,
+            num_segments=num_thresholds,
+        )
+    num_labels = y_pred.shape[-1]
+    bucket_indices = bucket_indices + ops.multiply(
+        ops.arange(num_labels, dtype="int32"), num_thresholds
+    )
+    histograms = ops.segment_sum(
+        data=ops.reshape(labels, [-1, 2]),
+        segment_ids=ops.reshape(bucket_indices, [-1]),
+        num_segments=num_labels * num_thresholds,
     )
+    histograms = ops.reshape(histograms, [num_labels, num_thresholds, 2])
+    return ops.transpose(histograms, [1, 0, 2])
 
-    if thresholds_with_epsilon:
-        # In this case, the first bucket should actually take into account since
-        # the any prediction between [0.0, 1.0] should be larger than the first
-        # threshold. We change the bucket value from -1 to 0.
-        bucket_indices = ops.relu(bucket_indices)
 
-    bucket_indices = ops.cast(bucket_indices, "int32")
+class SharedConfusionHistograms:
+    """Scope in which threshold metrics share their confusion histograms.
 
-    if multi_label:
-        # We need to run bucket segment sum for each of the label class. In the
-        # multi_label case, the rank of the label is 2. We first transpose it so
-        # that the label dim becomes the first and we can parallel run though
-        # them.
-        true_labels = ops.transpose(true_labels)
-        false_labels = ops.transpose(false_labels)
-        bucket_indices = ops.transpose(bucket_indices)
-
-        def gather_bucket(label_and_bucket_index):
-            label, bucket_index = (
-                label_and_bucket_index[0],
-                label_and_bucket_index[1],
-            )
-            return ops.segment_sum(
-                data=label,
-                segment_ids=bucket_index,
-                num_segments=num_thresholds,
-            )
+    With evenly distributed thresholds, `update_confusion_matrix_variables()`
+    bucketizes the predictions into histograms of true and false labels. In
+    this scope, the histograms are cached by inputs, so that the metrics
+    updated with the same `y_true`, `y_pred` and `sample_weight` and the same
+    number of thresholds (e.g. `AUC`, `PrecisionAtRecall` and
+    `SensitivityAtSpecificity`) bucketize them only once. `CompileMetrics`
+    updates its metrics in this scope for each batch.
 
-        tp_bucket_v = backend.vectorized_map(
-            gather_bucket,
-            (true_labels, bucket_indices),
-        )
-        fp_bucket_v = backend.vectorized_map(
-            gather_bucket, (false_labels, bucket_indices)
-        )
-        tp = ops.transpose(ops.flip(ops.cumsum(ops.flip(tp_bucket_v), axis=1)))
-        fp = ops.transpose(ops.flip(ops.cumsum(ops.flip(fp_bucket_v), axis=1)))
-    else:
-        tp_bucket_v = ops.segment_sum(
-            data=true_labels,
-            segment_ids=bucket_indices,
-            num_segments=num_thresholds,
-        )
-        fp_bucket_v = ops.segment_sum(
-            data=false_labels,
-            segment_ids=bucket_indices,
-            num_segments=num_thresholds,
+    Example:
+
+    ```python
+    with SharedConfusionHistograms():
+        auc.update_state(y_true, y_pred)
+        # Reads the histograms computed by `auc`.
+        pr_auc.update_state(y_true, y_pred)
+    ```
+    """
+
+    def __init__(self):
+        self._histograms = {}
+
+    def get(self, inputs, config, compute_fn):
+        """Returns the cached histograms of `inputs`, or computes them.
+
+        Args:
+            inputs: The tuple of `y_true`, `y_pred` and the other objects
+                that the histograms are computed from. They are compared by
+                identity.
+            config: A hashable tuple of the other parameters of the
+                histograms, compared by value.
+            compute_fn: A function computing the histograms.
+        """
+        key = tuple(id(x) for x in inputs) + config
+        if key not in self._histograms:
+            # Keep references to the inputs so that their ids aren't reused.
+            self._histograms[key] = (inputs, compute_fn())
+        return self._histograms[key][1]
+
+    def __enter__(self):
+        self.original_scope = get_shared_confusion_histograms()
+        global_state.set_global_attribute("shared_confusion_histograms", self)
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        global_state.set_global_attribute(
+            "shared_confusion_histograms", self.original_scope
         )
-        tp = ops.flip(ops.cumsum(ops.flip(tp_bucket_v)))
-        fp = ops.flip(ops.cumsum(ops.flip(fp_bucket_v)))
 
-    # fn = sum(true_labels) - tp
-    # tn = sum(false_labels) - fp
-    if (
-        ConfusionMatrix.TRUE_NEGATIVES in variables_to_update
-        or ConfusionMatrix.FALSE_NEGATIVES in variables_to_update
-    ):
-        if multi_label:
-            total_true_labels = ops.sum(true_labels, axis=1)
-            total_false_labels = ops.sum(false_labels, axis=1)
-        else:
-            total_true_labels = ops.sum(true_labels)
-            total_false_labels = ops.sum(false_labels)
 
-    if ConfusionMatrix.TRUE_POSITIVES in variables_to_update:
-        variable = variables_to_update[ConfusionMatrix.TRUE_POSITIVES]
-        variable.assign(variable + tp)
-    if ConfusionMatrix.FALSE_POSITIVES in variables_to_update:
-        variable = variables_to_update[ConfusionMatrix.FALSE_POSITIVES]
-        variable.assign(variable + fp)
-    if ConfusionMatrix.TRUE_NEGATIVES in variables_to_update:
-        variable = variables_to_update[ConfusionMatrix.TRUE_NEGATIVES]
-        tn = total_false_labels - fp
-        variable.assign(variable + tn)
-    if ConfusionMatrix.FALSE_NEGATIVES in variables_to_update:
-        variable = variables_to_update[ConfusionMatrix.FALSE_NEGATIVES]
-        fn = total_true_labels - tp
-        variable.assign(variable + fn)
+def get_shared_confusion_histograms():
+    return global_state.get_global_attribute("shared_confusion_histograms")
 
 
 def is_evenly_distributed_thresholds(thresholds):
@@ -420,6 +526,10 @@ def update_confusion_matrix_variables(
         )
 
     variable_dtype = list(variables_to_update.values())[0].dtype
+    shared_key = (
+        (y_true, y_pred, sample_weight, label_weights),
+        (top_k, class_id),
+    )
 
     y_true = ops.cast(y_true, dtype=variable_dtype)
     y_pred = ops.cast(y_pred, dtype=variable_dtype)
@@ -487,6 +597,7 @@ def update_confusion_matrix_variables(
             sample_weights=sample_weight,
             label_weights=label_weights,
             thresholds_with_epsilon=thresholds_with_epsilon,
+            shared_key=shared_key,
         )
 
     if None in y_pred.shape:
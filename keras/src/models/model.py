@@ -276,6 +276,11 @@ class Model(Trainer, base_trainer.Trainer, Layer):
             save_format: The `save_format` argument is deprecated in Keras 3.
                 Format to use, as a string. Only the `"keras"` format is
                 supported at this time.
+            num_shards: Optional number of H5 files to split the weights of
+                the `.keras` archive into, which keeps each file small for
+                large models. The shards are written one after the other.
+                Sharded archives cannot be loaded by earlier versions of
+                Keras.
 
         Example:
 
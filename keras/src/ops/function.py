@@ -58,6 +58,7 @@ class Function(Operation):
         self._outputs_struct = tree.map_structure(lambda x: x, outputs)
         self._inputs = tree.flatten(inputs)
         self._outputs = tree.flatten(outputs)
+        self._outputs_spec = tree.structure_spec(self._outputs_struct)
         if not self._inputs:
             raise ValueError(
                 "`inputs` argument cannot be empty. Received:\n"
@@ -81,6 +82,9 @@ class Function(Operation):
         self._nodes_by_depth = nodes_by_depth
         self._operations = operations
         self._operations_by_depth = operations_by_depth
+        self._execution_plan = make_execution_plan(
+            self._inputs, self._outputs, self._nodes_by_depth
+        )
 
     @property
     def operations(self):
@@ -104,9 +108,11 @@ class Function(Operation):
                 shortcut = False
                 break
         if shortcut:
-            return tree.map_structure(
-                lambda x: KerasTensor(shape=x.shape, dtype=x.dtype),
-                self._outputs_struct,
+            return self._outputs_spec.unflatten(
+                [
+                    KerasTensor(shape=x.shape, dtype=x.dtype)
+                    for x in self._outputs
+                ]
             )
         # No luck; take the long road through the graph.
         # Original Keras used a cache to avoid recomputing all this
@@ -126,43 +132,44 @@ class Function(Operation):
 
         At each node we compute outputs via
         `operation_fn(node.operation)(*args, **kwargs)`.
-        """
-        inputs = tree.flatten(inputs)
-
-        # Dictionary mapping reference tensors to computed tensors.
-        tensor_dict = {}
-        for x, y in zip(self.inputs, inputs):
-            tensor_dict[id(x)] = y
-
-        nodes_by_depth = self._nodes_by_depth
-        depth_keys = list(nodes_by_depth.keys())
-        depth_keys.sort(reverse=True)
-
-        for depth in depth_keys:
-            nodes = nodes_by_depth[depth]
-            for node in nodes:
-                if not node.operation or node.is_input:
-                    continue  # Input tensors already exist.
-
-                if any(id(x) not in tensor_dict for x in node.input_tensors):
-                    continue  # Node is not computable, try skipping.
-
-                args, kwargs = node.arguments.fill_in(tensor_dict)
-                op = operation_fn(node.operation)
-                if call_fn is not None:
-                    outputs = call_fn(op, *args, **kwargs)
-                else:
-                    outputs = op(*args, **kwargs)
-
-                # Update tensor_dict.
-                for x, y in zip(node.outputs, tree.flatten(outputs)):
-                    tensor_dict[id(x)] = y
 
-        output_tensors = []
-        for x in self.outputs:
-            output_tensors.append(tensor_dict[id(x)])
-
-        return tree.pack_sequence_as(self._outputs_struct, output_tensors)
+        The nodes are run following the precomputed execution plan (see
+        `make_execution_plan()`), in which every tensor of the graph is
+        assigned an integer slot. Intermediate values are released as soon
+        as their last consumer has run.
+        """
+        plan = self._execution_plan
+        values = [None] * plan.num_slots
+        for slot, y in zip(plan.input_slots, tree.flatten(inputs)):
+            values[slot] = y
+
+        for step in plan.steps:
+            if step.single_arg_slot is not None:
+                # Performance optimization for the most common case.
+                args, kwargs = (values[step.single_arg_slot],), {}
+            else:
+                args, kwargs = step.arguments_spec.unflatten(
+                    [
+                        arg if slot is None else values[slot]
+                        for arg, slot in zip(step.flat_arguments, step.slots)
+                    ],
+                )
+            op = operation_fn(step.node.operation)
+            if call_fn is not None:
+                outputs = call_fn(op, *args, **kwargs)
+            else:
+                outputs = op(*args, **kwargs)
+
+            if len(step.output_slots) == 1 and not tree.is_nested(outputs):
+                values[step.output_slots[0]] = outputs
+            else:
+                for slot, y in zip(step.output_slots, tree.flatten(outputs)):
+                    values[slot] = y
+            for slot in step.free_slots:
+                values[slot] = None
+
+        output_tensors = [values[slot] for slot in plan.output_slots]
+        return self._outputs_spec.unflatten(output_tensors)
 
     def _assert_input_compatibility(self, inputs):
         try:
@@ -194,6 +201,133 @@ class Function(Operation):
                         )
 
 
+class ExecutionPlanStep:
+    """A single operation call of an `ExecutionPlan`.
+
+    Attributes:
+        node: The `Node` to run.
+        arguments_spec: The `tree.structure_spec()` of the `(args, kwargs)`
+            of the call.
+        flat_arguments: The flattened arguments of the call.
+        slots: For each flat argument, the slot holding its value, or `None`
+            for arguments that are constants.
+        single_arg_slot: Slot of the only argument, when the node is called
+            with a single positional tensor, else `None`.
+        output_slots: Slots receiving the flattened outputs of the call.
+        free_slots: Slots to release once the call is done, since this node
+            is the last consumer of their values.
+    """
+
+    __slots__ = (
+        "node",
+        "arguments_spec",
+        "flat_arguments",
+        "slots",
+        "single_arg_slot",
+        "output_slots",
+        "free_slots",
+    )
+
+    def __init__(self, node, slots, output_slots):
+        arguments = node.arguments
+        self.node = node
+        self.arguments_spec = tree.structure_spec(
+            (arguments.args, arguments.kwargs)
+        )
+        self.flat_arguments = arguments._flat_arguments
+        self.slots = slots
+        if arguments._single_positional_tensor is not None:
+            self.single_arg_slot = slots[0]
+        else:
+            self.single_arg_slot = None
+        self.output_slots = output_slots
+        self.free_slots = ()
+
+
+class ExecutionPlan(
+    collections.namedtuple(
+        "ExecutionPlan", ["steps", "num_slots", "input_slots", "output_slots"]
+    )
+):
+    """A flat, topologically ordered schedule of a graph of operations.
+
+    Attributes:
+        steps: List of `ExecutionPlanStep`, in execution order.
+        num_slots: Number of tensor slots needed to run the plan.
+        input_slots: Slots of the flattened graph inputs.
+        output_slots: Slots of the flattened graph outputs.
+    """
+
+    __slots__ = ()
+
+
+def make_execution_plan(inputs, outputs, nodes_by_depth):
+    """Compiles a graph into an `ExecutionPlan`.
+
+    The nodes are visited in the same order as a depth-by-depth walk of the
+    graph, and every tensor is mapped to an integer slot so that running the
+    plan requires no sorting and no dictionary lookups. Nodes that cannot be
+    computed from `inputs` are left out of the plan.
+
+    Args:
+        inputs: List of input tensors.
+        outputs: List of output tensors.
+        nodes_by_depth: Dict mapping depths to lists of nodes, as returned by
+            `map_graph()`.
+
+    Returns:
+        An `ExecutionPlan`.
+    """
+    slots = {}
+
+    def get_slot(x):
+        slot = slots.get(id(x))
+        if slot is None:
+            slot = slots[id(x)] = len(slots)
+        return slot
+
+    input_slots = [get_slot(x) for x in inputs]
+    available = set(input_slots)
+    steps = []
+    for depth in sorted(nodes_by_depth.keys(), reverse=True):
+        for node in nodes_by_depth[depth]:
+            if not node.operation or node.is_input:
+                continue  # Input tensors already exist.
+            if any(
+                slots.get(id(x)) not in available for x in node.input_tensors
+            ):
+                continue  # Node is not computable, skip it.
+            arg_slots = [
+                slots[id(x)] if isinstance(x, KerasTensor) else None
+                for x in node.arguments._flat_arguments
+            ]
+            output_slots = [get_slot(x) for x in node.outputs]
+            available.update(output_slots)
+            steps.append(ExecutionPlanStep(node, arg_slots, output_slots))
+    output_slots = [get_slot(x) for x in outputs]
+
+    # Release every value after its last use, except for the outputs.
+    last_use = {}
+    for i, step in enumerate(steps):
+        for slot in step.slots:
+            if slot is not None:
+                last_use[slot] = i
+    keep = set(output_slots)
+    free_slots = collections.defaultdict(list)
+    for slot, i in last_use.items():
+        if slot not in keep:
+            free_slots[i].append(slot)
+    for i, step in enumerate(steps):
+        step.free_slots = tuple(free_slots[i])
+
+    return ExecutionPlan(
+        steps=steps,
+        num_slots=len(slots),
+        input_slots=input_slots,
+        output_slots=output_slots,
+    )
+
+
 def make_node_key(op, node_index):
     return str(id(op)) + "_ib-" + str(node_index)
 
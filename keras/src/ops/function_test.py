@@ -85,6 +85,33 @@ class FunctionTest(testing.TestCase):
         self.assertIsInstance(y_val["y2"], keras_tensor.KerasTensor)
         self.assertEqual(y_val["y2"].shape, (2, 3))
 
+    def test_execution_plan(self):
+        x1 = keras_tensor.KerasTensor((2, 3))
+        x2 = keras_tensor.KerasTensor((2, 3))
+        x = knp.add(x1, x2)
+        y = knp.concatenate([x * 3, x**2], axis=-1)
+        z = knp.sum(y, axis=1, keepdims=True)
+        fn = function.Function(inputs=[x1, x2], outputs=[y, z])
+
+        plan = fn._execution_plan
+        self.assertLen(plan.steps, 5)
+        self.assertEqual(plan.num_slots, 7)
+        self.assertLen(plan.input_slots, 2)
+        self.assertLen(plan.output_slots, 2)
+        # Intermediate values are released after their last consumer, the
+        # outputs are kept.
+        freed = [slot for step in plan.steps for slot in step.free_slots]
+        self.assertEqual(len(freed), len(set(freed)))
+        self.assertEqual(len(freed), 5)
+        self.assertFalse(set(freed) & set(plan.output_slots))
+
+        y_val, z_val = fn([np.ones((2, 3)), np.ones((2, 3))])
+        expected = np.concatenate(
+            [np.ones((2, 3)) * 6, np.ones((2, 3)) * 4], axis=-1
+        )
+        self.assertAllClose(y_val, expected)
+        self.assertAllClose(z_val, np.sum(expected, axis=1, keepdims=True))
+
     def test_invalid_inputs_error(self):
         x1 = keras_tensor.KerasTensor((2, 3))
         x2 = keras_tensor.KerasTensor((2, 3))
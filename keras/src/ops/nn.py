@@ -2115,3 +2115,111 @@ def psnr(
         x2,
         max_val,
     )
+
+
+class DotProductAttention(Operation):
+    def __init__(self, is_causal=False):
+        super().__init__()
+        self.is_causal = is_causal
+
+    def call(self, query, key, value, bias=None, mask=None, scale=None):
+        return backend.nn.dot_product_attention(
+            query,
+            key,
+            value,
+            bias=bias,
+            mask=mask,
+            scale=scale,
+            is_causal=self.is_causal,
+        )
+
+    def compute_output_spec(
+        self, query, key, value, bias=None, mask=None, scale=None
+    ):
+        return KerasTensor(
+            query.shape[:-1] + value.shape[-1:], dtype=query.dtype
+        )
+
+
+@keras_export(
+    [
+        "keras.ops.dot_product_attention",
+        "keras.ops.nn.dot_product_attention",
+    ]
+)
+def dot_product_attention(
+    query, key, value, bias=None, mask=None, scale=None, is_causal=False
+):
+    """Scaled dot product attention function.
+
+    Computes the attention function on Q (`query`), K (`key`), and V
+    (`value`): `attention(Q, K, V) = softmax(Q * K / sqrt(H)) * V`, for each
+    attention head.
+
+    The shapes of the arrays use the following notation:
+    - B: batch size
+    - S: length of the key/value
+    - T: length of the query
+    - N: number of attention heads
+    - H: dimensions of each attention head
+    - K: number of key/value heads, `N` must be a multiple of `K`.
+
+    The attention is computed without materializing the full `(B, N, T, S)`
+    scores when possible: with the fused kernel of the backend for torch
+    (`scaled_dot_product_attention`) and JAX (`jax.nn.dot_product_attention`,
+    with `jax>=0.4.31`), and otherwise over blocks of keys, with an online
+    softmax.
+
+    Args:
+        query: The query array with the shape of `(B, T, N, H)`.
+        key: The key array with the shape of `(B, S, K, H)`.
+        value: The value array with the same shape of `key`, except for the
+            last dimension.
+        bias: Optional bias array to be added to logits. The shape must be
+            broadcastable to `(B, N, T, S)`.
+        mask: Optional mask array used to filter out logits. It is a boolean
+            mask where `True` indicates the element should take part in
+            attention. The shape must be broadcastable to `(B, N, T, S)`.
+        scale: Optional scale for the logits. If `None`, the scale will be set
+            to `1.0 / sqrt(H)`.
+        is_causal: Whether to apply causal mask, where the query at position
+            `i` only attends to the keys at positions `j <= i`.
+
+    Returns:
+        An array of the attention output with the shape of `(B, T, N, H)`,
+        where `H` is the last dimension of `value`.
+
+    Example:
+
+    >>> query = keras.random.normal((2, 4, 8, 16))
+    >>> key = keras.random.normal((2, 6, 8, 16))
+    >>> value = keras.random.normal((2, 6, 8, 16))
+    >>> keras.ops.nn.dot_product_attention(query, key, value).shape
+    (2, 4, 8, 16)
+    """
+    for name, x in (("query", query), ("key", key), ("value", value)):
+        if len(x.shape) != 4:
+            raise ValueError(
+                "`dot_product_attention` only supports 4D inputs of shape "
+                f"`(B, T, N, H)`. Received: {name}.shape={x.shape}"
+            )
+    if query.shape[2] is not None and key.shape[2] is not None:
+        if query.shape[2] % key.shape[2] != 0:
+            raise ValueError(
+                "The number of heads of `query` must be a multiple of the "
+                "number of heads of `key` and `value`. Received: "
+                f"query.shape={query.shape}, key.shape={key.shape}"
+            )
+    if any_symbolic_tensors((query, key, value, bias, mask)):
+        return DotProductAttention(is_causal=is_causal).symbolic_call(
+            query, key, value, bias=bias, mask=mask, scale=scale
+        )
+    return backend.nn.dot_product_attention(
+        query,
+        key,
+        value,
+        bias=bias,
+        mask=mask,
+        scale=scale,
+        is_causal=is_causal,
+    )
@@ -660,6 +660,13 @@ class NNOpsDynamicShapeTest(testing.TestCase, parameterized.TestCase):
         out = knn.psnr(x1, x2, max_val=224)
         self.assertEqual(out.shape, ())
 
+    def test_dot_product_attention(self):
+        query = KerasTensor([None, None, 8, 16])
+        key = KerasTensor([None, None, 2, 16])
+        value = KerasTensor([None, None, 2, 4])
+        out = knn.dot_product_attention(query, key, value, is_causal=True)
+        self.assertEqual(out.shape, (None, None, 8, 4))
+
 
 class NNOpsStaticShapeTest(testing.TestCase):
     def test_relu(self):
@@ -1126,6 +1133,14 @@ class NNOpsStaticShapeTest(testing.TestCase):
         out = knn.psnr(x1, x2, max_val=224)
         self.assertEqual(out.shape, ())
 
+    def test_dot_product_attention(self):
+        query = KerasTensor([2, 3, 8, 16])
+        key = KerasTensor([2, 5, 2, 16])
+        value = KerasTensor([2, 5, 2, 4])
+        mask = KerasTensor([2, 1, 3, 5], dtype="bool")
+        out = knn.dot_product_attention(query, key, value, mask=mask)
+        self.assertEqual(out.shape, (2, 3, 8, 4))
+
 
 class NNOpsCorrectnessTest(testing.TestCase, parameterized.TestCase):
     def test_relu(self):
@@ -2073,6 +2088,64 @@ class NNOpsCorrectnessTest(testing.TestCase, parameterized.TestCase):
         psnr_2 = knn.psnr(x3, x4, max_val)
         self.assertAlmostEqual(psnr_2, expected_psnr_2)
 
+    @parameterized.named_parameters(
+        named_product(
+            use_bias=[True, False],
+            use_mask=[True, False],
+            is_causal=[True, False],
+            num_key_value_heads=[4, 2],
+        )
+    )
+    def test_dot_product_attention(
+        self, use_bias, use_mask, is_causal, num_key_value_heads
+    ):
+        def reference(query, key, value, bias, mask, scale, is_causal):
+            num_groups = query.shape[2] // key.shape[2]
+            key = np.repeat(key, num_groups, axis=2)
+            value = np.repeat(value, num_groups, axis=2)
+            logits = np.einsum("btnh,bsnh->bnts", query, key) * scale
+            if bias is not None:
+                logits = logits + bias
+            if mask is not None:
+                logits = np.where(mask, logits, -1e9)
+            if is_causal:
+                causal_mask = np.tril(np.ones(logits.shape[-2:], "bool"))
+                logits = np.where(causal_mask, logits, -1e9)
+            logits = logits - np.max(logits, axis=-1, keepdims=True)
+            probs = np.exp(logits)
+            probs = probs / np.sum(probs, axis=-1, keepdims=True)
+            return np.einsum("bnts,bsnh->btnh", probs, value)
+
+        # The keys span several blocks of the blockwise implementation.
+        batch_size, query_length, key_length, num_heads = 2, 5, 1100, 4
+        rng = np.random.default_rng(0)
+        query = rng.normal(size=(batch_size, query_length, num_heads, 8))
+        key = rng.normal(size=(batch_size, key_length, num_key_value_heads, 8))
+        value = rng.normal(
+            size=(batch_size, key_length, num_key_value_heads, 6)
+        )
+        query, key, value = (x.astype("float32") for x in (query, key, value))
+        bias = mask = None
+        if use_bias:
+            bias = rng.normal(size=(1, num_heads, query_length, key_length))
+            bias = bias.astype("float32")
+        if use_mask:
+            mask = rng.random((batch_size, 1, query_length, key_length)) > 0.5
+            # A fully masked row attends to all the keys uniformly.
+            mask[0, 0, 1] = False
+
+        outputs = knn.dot_product_attention(
+            query,
+            key,
+            value,
+            bias=bias,
+            mask=mask,
+            scale=0.5,
+            is_causal=is_causal,
+        )
+        expected = reference(query, key, value, bias, mask, 0.5, is_causal)
+        self.assertAllClose(outputs, expected, atol=1e-5, rtol=1e-5)
+
 
 class NNOpsDtypeTest(testing.TestCase, parameterized.TestCase):
     """Test the dtype to verify that the behavior matches JAX."""
@@ -2469,6 +2542,14 @@ class NNOpsBehaviorTest(testing.TestCase, parameterized.TestCase):
         with self.assertWarnsRegex(UserWarning, expected_warning_regex):
             knn.softmax(x, axis)
 
+    def test_dot_product_attention_invalid_inputs(self):
+        query = np.ones((2, 3, 4, 8))
+        with self.assertRaisesRegex(ValueError, "only supports 4D inputs"):
+            knn.dot_product_attention(query[0], query[0], query[0])
+        key = np.ones((2, 3, 3, 8))
+        with self.assertRaisesRegex(ValueError, "must be a multiple"):
+            knn.dot_product_attention(query, key, key)
+
     def test_normalize_order_validation(self):
         # Test with a non-integer order
         with self.assertRaisesRegex(
@@ -74,11 +74,10 @@ class Adagrad(optimizer.Optimizer):
         initializer = initializers.Constant(self.initial_accumulator_value)
         for var in var_list:
             self._accumulators.append(
-                self.add_variable(
-                    shape=var.shape,
-                    initializer=initializer,
-                    dtype=var.dtype,
+                self.add_variable_from_reference(
+                    reference_variable=var,
                     name="accumulator",
+                    initializer=initializer,
                 )
             )
 
@@ -98,6 +97,29 @@ class Adagrad(optimizer.Optimizer):
             ),
         )
 
+    def sparse_update_step(self, gradient, indices, variable, learning_rate):
+        """Update step of the rows `indices` of the model variable."""
+        lr = ops.cast(learning_rate, variable.dtype)
+        gradient = ops.cast(gradient, variable.dtype)
+
+        accumulator = self._accumulators[self._get_variable_index(variable)]
+
+        accumulator_rows = ops.add(
+            self._gather_rows(accumulator, indices), ops.square(gradient)
+        )
+        self._scatter_rows(accumulator, indices, accumulator_rows)
+        self._scatter_rows(
+            variable,
+            indices,
+            ops.subtract(
+                self._gather_rows(variable, indices),
+                ops.divide(
+                    ops.multiply(lr, gradient),
+                    ops.sqrt(ops.add(accumulator_rows, self.epsilon)),
+                ),
+            ),
+        )
+
     def get_config(self):
         config = super().get_config()
 
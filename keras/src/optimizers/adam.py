@@ -149,6 +149,51 @@ class Adam(optimizer.Optimizer):
             ),
         )
 
+    def sparse_update_step(self, gradient, indices, variable, learning_rate):
+        """Lazy update step of the rows `indices` of the model variable.
+
+        The moments of the other rows are not decayed.
+        """
+        lr = ops.cast(learning_rate, variable.dtype)
+        gradient = ops.cast(gradient, variable.dtype)
+        local_step = ops.cast(self.iterations + 1, variable.dtype)
+        beta_1_power = ops.power(
+            ops.cast(self.beta_1, variable.dtype), local_step
+        )
+        beta_2_power = ops.power(
+            ops.cast(self.beta_2, variable.dtype), local_step
+        )
+
+        index = self._get_variable_index(variable)
+        m = self._gather_rows(self._momentums[index], indices)
+        v = self._gather_rows(self._velocities[index], indices)
+
+        alpha = lr * ops.sqrt(1 - beta_2_power) / (1 - beta_1_power)
+
+        m = ops.add(m, ops.multiply(ops.subtract(gradient, m), 1 - self.beta_1))
+        v = ops.add(
+            v,
+            ops.multiply(
+                ops.subtract(ops.square(gradient), v), 1 - self.beta_2
+            ),
+        )
+        self._scatter_rows(self._momentums[index], indices, m)
+        self._scatter_rows(self._velocities[index], indices, v)
+        if self.amsgrad:
+            v_hat = self._velocity_hats[index]
+            v = ops.maximum(self._gather_rows(v_hat, indices), v)
+            self._scatter_rows(v_hat, indices, v)
+        self._scatter_rows(
+            variable,
+            indices,
+            ops.subtract(
+                self._gather_rows(variable, indices),
+                ops.divide(
+                    ops.multiply(m, alpha), ops.add(ops.sqrt(v), self.epsilon)
+                ),
+            ),
+        )
+
     def get_config(self):
         config = super().get_config()
         config.update(
@@ -1,15 +1,22 @@
+import math
 import re
 import warnings
 
 from keras.src import backend
 from keras.src import initializers
 from keras.src import ops
+from keras.src import random
 from keras.src.optimizers.schedules import learning_rate_schedule
 from keras.src.saving import serialization_lib
 from keras.src.saving.keras_saveable import KerasSaveable
 from keras.src.utils import tracking
 from keras.src.utils.naming import auto_name
 
+# The number of explicit mantissa bits and the minimum exponent of the normal
+# numbers of the dtypes of flat gradient accumulators that are updated with
+# stochastic rounding.
+STOCHASTIC_ROUNDING_DTYPES = {"bfloat16": (7, -126), "float16": (10, -14)}
+
 
 class BaseOptimizer(KerasSaveable):
     def __init__(
@@ -24,6 +31,9 @@ class BaseOptimizer(KerasSaveable):
         ema_overwrite_frequency=None,
         loss_scale_factor=None,
         gradient_accumulation_steps=None,
+        flat_gradient_accumulators=False,
+        gradient_accumulators_dtype=None,
+        offload_state=None,
         name=None,
         **kwargs,
     ):
@@ -54,6 +64,44 @@ class BaseOptimizer(KerasSaveable):
                     "Received: gradient_accumulation_steps="
                     f"{gradient_accumulation_steps}"
                 )
+        self.flat_gradient_accumulators = flat_gradient_accumulators
+        if gradient_accumulators_dtype is not None:
+            if not flat_gradient_accumulators:
+                raise ValueError(
+                    "`gradient_accumulators_dtype` can only be set with "
+                    "`flat_gradient_accumulators=True`. Received: "
+                    f"gradient_accumulators_dtype={gradient_accumulators_dtype}"
+                )
+            gradient_accumulators_dtype = backend.standardize_dtype(
+                gradient_accumulators_dtype
+            )
+            if not backend.is_float_dtype(gradient_accumulators_dtype):
+                raise ValueError(
+                    "`gradient_accumulators_dtype` must be a floating dtype. "
+                    "Received: gradient_accumulators_dtype="
+                    f"{gradient_accumulators_dtype}"
+                )
+        self.gradient_accumulators_dtype = gradient_accumulators_dtype
+        if offload_state is not None:
+            if offload_state != "host":
+                raise ValueError(
+                    "`offload_state` must be `None` or `'host'`. "
+                    f"Received: offload_state={offload_state}"
+                )
+            if backend.backend() not in ("jax", "torch"):
+                raise ValueError(
+                    "`offload_state` is only supported with the JAX and torch "
+                    f"backends. Received: offload_state={offload_state} with "
+                    f"backend {backend.backend()}"
+                )
+            if backend.backend() == "jax" and gradient_accumulation_steps:
+                raise ValueError(
+                    "`offload_state` is not supported with "
+                    "`gradient_accumulation_steps` with the JAX backend. "
+                    f"Received: offload_state={offload_state}, "
+                    f"gradient_accumulation_steps={gradient_accumulation_steps}"
+                )
+        self.offload_state = offload_state
 
         if use_ema:
             # Verify the arguments related to EMA.
@@ -158,15 +206,77 @@ class BaseOptimizer(KerasSaveable):
                     )
                 )
             if self.gradient_accumulation_steps:
+                if self.flat_gradient_accumulators and not getattr(
+                    variable, "overwrite_with_gradient", False
+                ):
+                    # Packed in a flat buffer by
+                    # `_build_flat_gradient_accumulators()`.
+                    self._accumulated_gradients.append(None)
+                    continue
                 self._accumulated_gradients.append(
                     self.add_variable_from_reference(
                         variable,
                         name="gradient_accumulator",
                     )
                 )
+        if self.gradient_accumulation_steps:
+            self._gradient_accumulators = [
+                v for v in self._accumulated_gradients if v is not None
+            ]
+            if self.flat_gradient_accumulators:
+                self._build_flat_gradient_accumulators(variables)
         self._trainable_variables = variables[:]
         self.built = True
 
+    def _build_flat_gradient_accumulators(self, variables):
+        """Creates one flat gradient accumulator per variable dtype.
+
+        The accumulated gradient of each variable is a slice of the buffer of
+        its dtype, recorded in `self._gradient_accumulator_slices` as a tuple
+        `(buffer_index, start, stop)`.
+        """
+        indices_by_dtype = {}
+        for i, variable in enumerate(variables):
+            if self._accumulated_gradients[i] is None:
+                dtype = backend.standardize_dtype(variable.dtype)
+                indices_by_dtype.setdefault(dtype, []).append(i)
+
+        self._gradient_accumulator_buffers = []
+        self._gradient_accumulator_indices = []
+        self._gradient_accumulator_slices = [None] * len(variables)
+        for dtype, indices in indices_by_dtype.items():
+            buffer_index = len(self._gradient_accumulator_buffers)
+            size = 0
+            for i in indices:
+                start, size = size, size + math.prod(variables[i].shape)
+                self._gradient_accumulator_slices[i] = (
+                    buffer_index,
+                    start,
+                    size,
+                )
+            self._gradient_accumulator_buffers.append(
+                self.add_variable(
+                    (size,),
+                    dtype=self.gradient_accumulators_dtype or dtype,
+                    name=f"gradient_accumulator_{dtype}",
+                )
+            )
+            self._gradient_accumulator_indices.append(indices)
+        self._gradient_accumulators.extend(self._gradient_accumulator_buffers)
+        # Filled by `_get_flat_gradient_layout()`.
+        self._flat_gradient_layouts = {}
+
+        if self.gradient_accumulators_dtype in STOCHASTIC_ROUNDING_DTYPES:
+            with backend.name_scope(self.name, caller=self):
+                self._gradient_accumulator_seed_generator = (
+                    random.SeedGenerator(
+                        name="gradient_accumulator_seed_generator"
+                    )
+                )
+            self._track_variable(
+                self._gradient_accumulator_seed_generator.state
+            )
+
     def _var_key(self, variable):
         # Helper function to get a stable ID and the variable instance mapping.
         return id(variable)
@@ -277,6 +387,28 @@ class BaseOptimizer(KerasSaveable):
     def update_step(self, gradient, variable, learning_rate):
         raise NotImplementedError
 
+    def sparse_update_step(self, gradient, indices, variable, learning_rate):
+        """Updates the rows `indices` of `variable`, given their gradient.
+
+        Called instead of `update_step()` for the variables with
+        `sparse_updates=True`, e.g. the embeddings of
+        `Embedding(sparse_updates=True)`. Implementations update the rows of
+        the variable and of its slot variables with `_gather_rows()` and
+        `_scatter_rows()`, and leave the other rows untouched ("lazy"
+        updates).
+
+        Args:
+            gradient: The rows of the gradient, of shape
+                `(num_indices,) + variable.shape[1:]`.
+            indices: 1D integer tensor. The unique indices of the rows to
+                update. Indices out of range are ignored. With JAX, it can
+                also be a boolean mask of the rows, with `gradient` of the
+                shape of the variable.
+            variable: The variable to update.
+            learning_rate: The learning rate.
+        """
+        raise NotImplementedError
+
     def apply_gradients(self, grads_and_vars):
         grads, trainable_variables = zip(*grads_and_vars)
         self.apply(grads, trainable_variables)
@@ -338,6 +470,19 @@ class BaseOptimizer(KerasSaveable):
             if len(list(grads)) == 0:
                 return
 
+            # Gather the rows of the gradients of the variables updated
+            # sparsely, so that the gradient transformations below only
+            # process the rows of the gradients.
+            sparse_positions = [
+                i
+                for i, v in enumerate(trainable_variables)
+                if self._use_sparse_updates(v)
+            ]
+            sparse_indices = []
+            for i in sparse_positions:
+                indices, grads[i] = self._row_sparse_gradient(grads[i])
+                sparse_indices.append(indices)
+
             # Unscale gradients.
             scale = self.loss_scale_factor
             if scale is not None:
@@ -348,7 +493,24 @@ class BaseOptimizer(KerasSaveable):
             self._apply_weight_decay(trainable_variables)
 
             # Apply gradient updates.
-            self._backend_apply_gradients(grads, trainable_variables)
+            dense_grads, dense_variables = grads, trainable_variables
+            if sparse_positions:
+                self._backend_sparse_update_step(
+                    [grads[i] for i in sparse_positions],
+                    sparse_indices,
+                    [trainable_variables[i] for i in sparse_positions],
+                    self.learning_rate,
+                )
+                dense_positions = sorted(
+                    set(range(len(grads))) - set(sparse_positions)
+                )
+                dense_grads = [grads[i] for i in dense_positions]
+                dense_variables = [
+                    trainable_variables[i] for i in dense_positions
+                ]
+            # Also updates the EMA and the iteration counter when all the
+            # variables are updated sparsely.
+            self._backend_apply_gradients(dense_grads, dense_variables)
             # Apply variable constraints after applying gradients.
             for variable in trainable_variables:
                 if variable.constraint is not None:
@@ -374,13 +536,7 @@ class BaseOptimizer(KerasSaveable):
             is_update_step = (
                 self.iterations + 1
             ) % self.gradient_accumulation_steps == 0
-            # `trainable_variables` might have been filtered in previous
-            # processing steps, so we need to ensure the correct mapping between
-            # `self._accumulated_gradients` and `trainable_variables`
-            acc_grads = [
-                self._accumulated_gradients[self._get_variable_index(v)]
-                for v in trainable_variables
-            ]
+            acc_grads = self._get_accumulated_gradients(trainable_variables)
 
             def _update_step_fn(grads, trainable_variables):
                 # Run update step with accumulated grads + reset accumulators
@@ -393,12 +549,20 @@ class BaseOptimizer(KerasSaveable):
                 )
                 self._backend_reset_gradient_accumulators()
 
+            def _increment_fn(grads, trainable_variables):
+                if self.flat_gradient_accumulators:
+                    self._backend_increment_flat_gradient_accumulators(
+                        grads, trainable_variables
+                    )
+                else:
+                    self._backend_increment_gradient_accumulators(
+                        grads, acc_grads
+                    )
+
             ops.cond(
                 is_update_step,
                 lambda: _update_step_fn(grads, trainable_variables),
-                lambda: self._backend_increment_gradient_accumulators(
-                    grads, acc_grads
-                ),
+                lambda: _increment_fn(grads, trainable_variables),
             )
         else:
             # Run udpate step.
@@ -435,8 +599,54 @@ class BaseOptimizer(KerasSaveable):
         for grad, var in zip(grads, trainable_variables):
             self.update_step(grad, var, learning_rate)
 
+    def _backend_sparse_update_step(
+        self, grads, indices, trainable_variables, learning_rate
+    ):
+        """Collective sparse_update_step that can be overridden by the backend.
+
+        It is overridden by TF to support tf.distribute.
+        """
+        for grad, var_indices, var in zip(grads, indices, trainable_variables):
+            self.sparse_update_step(grad, var_indices, var, learning_rate)
+
+    def _use_sparse_updates(self, variable):
+        """Whether the rows of `variable` are updated by `sparse_update_step`.
+
+        Sparse updates are not used with gradient accumulation.
+        """
+        return (
+            getattr(variable, "sparse_updates", False)
+            and not self.gradient_accumulation_steps
+            and type(self).sparse_update_step
+            is not BaseOptimizer.sparse_update_step
+        )
+
+    def _row_sparse_gradient(self, gradient):
+        """Returns the unique `(indices, values)` of the rows of a gradient.
+
+        Backends override it to support their sparse gradients. Rows of dense
+        gradients are selected if they have a non-zero value.
+        """
+        axes = tuple(range(1, len(gradient.shape)))
+        nonzero = ops.any(ops.not_equal(gradient, 0), axis=axes)
+        indices = ops.nonzero(nonzero)[0]
+        return indices, ops.take(gradient, indices, axis=0)
+
+    def _gather_rows(self, variable, indices):
+        """Returns the rows `indices` of `variable`."""
+        return ops.take(variable, indices, axis=0)
+
+    def _scatter_rows(self, variable, indices, values):
+        """Assigns `values` to the rows `indices` of `variable`."""
+        self.assign(
+            variable,
+            ops.scatter_update(
+                variable, ops.expand_dims(indices, axis=-1), values
+            ),
+        )
+
     def _backend_reset_gradient_accumulators(self):
-        for g_acc in self._accumulated_gradients:
+        for g_acc in self._gradient_accumulators:
             g_acc.assign(ops.zeros(g_acc.shape, dtype=g_acc.dtype))
 
     def _backend_increment_gradient_accumulators(self, grads, acc_grads):
@@ -444,6 +654,156 @@ class BaseOptimizer(KerasSaveable):
         for n_g_acc, g_acc in zip(new_g_accs, acc_grads):
             g_acc.assign(n_g_acc)
 
+    def _backend_increment_flat_gradient_accumulators(
+        self, grads, trainable_variables
+    ):
+        new_g_accs = self._accumulate_flat_gradients(grads, trainable_variables)
+        for n_g_acc, g_acc in zip(
+            new_g_accs, self._gradient_accumulator_buffers
+        ):
+            g_acc.assign(n_g_acc)
+
+    def _get_accumulated_gradients(self, trainable_variables):
+        """Returns the accumulated gradients of `trainable_variables`.
+
+        These are the accumulator variables, or with
+        `flat_gradient_accumulators`, tensors sliced from the flat buffers and
+        cast to the dtype of the variables.
+        """
+        # `trainable_variables` might have been filtered in previous
+        # processing steps, so we need to ensure the correct mapping between
+        # `self._accumulated_gradients` and `trainable_variables`
+        indices = [self._get_variable_index(v) for v in trainable_variables]
+        if not self.flat_gradient_accumulators:
+            return [self._accumulated_gradients[i] for i in indices]
+        buffers = [b.value for b in self._gradient_accumulator_buffers]
+        acc_grads = []
+        for i, variable in zip(indices, trainable_variables):
+            if self._accumulated_gradients[i] is not None:
+                acc_grads.append(self._accumulated_gradients[i])
+                continue
+            buffer_index, start, stop = self._gradient_accumulator_slices[i]
+            acc_grad = ops.reshape(
+                buffers[buffer_index][start:stop], variable.shape
+            )
+            acc_grads.append(ops.cast(acc_grad, variable.dtype))
+        return acc_grads
+
+    def _get_flat_gradient_layout(self, trainable_variables):
+        """Returns where the gradients go in the flat accumulators.
+
+        For each flat buffer, the layout is a list of `(start, stop,
+        positions)` runs: the gradients at `positions` in the list of
+        gradients are added, concatenated, to `buffer[start:stop]`. It is
+        cached per list of variables, which only changes when some gradients
+        are filtered out.
+        """
+        indices = tuple(
+            self._get_variable_index(v) for v in trainable_variables
+        )
+        layout = self._flat_gradient_layouts.get(indices, None)
+        if layout is not None:
+            return layout
+        positions = {i: position for position, i in enumerate(indices)}
+        layout = []
+        for buffer_indices in self._gradient_accumulator_indices:
+            runs = []
+            for i in buffer_indices:
+                if i not in positions:
+                    continue
+                _, start, stop = self._gradient_accumulator_slices[i]
+                if runs and runs[-1][1] == start:
+                    runs[-1] = (
+                        runs[-1][0],
+                        stop,
+                        runs[-1][2] + (positions[i],),
+                    )
+                else:
+                    runs.append((start, stop, (positions[i],)))
+            layout.append(runs)
+        self._flat_gradient_layouts[indices] = layout
+        return layout
+
+    def _accumulate_flat_gradients(self, grads, trainable_variables):
+        """Returns the values of the flat accumulators after adding `grads`.
+
+        Accumulators in `float16` or `bfloat16` are added in `float32` and
+        rounded stochastically, so that small gradients are not lost to
+        rounding.
+        """
+        layout = self._get_flat_gradient_layout(trainable_variables)
+        values = []
+        for buffer, runs in zip(self._gradient_accumulator_buffers, layout):
+            dtype = backend.standardize_dtype(buffer.dtype)
+            stochastic_rounding = dtype in STOCHASTIC_ROUNDING_DTYPES
+            if stochastic_rounding:
+                dtype = "float32"
+            slices, updates = [], []
+            for start, stop, positions in runs:
+                flat_grads = [
+                    ops.cast(ops.reshape(grads[p], (-1,)), dtype)
+                    for p in positions
+                ]
+                slices.append((start, stop))
+                updates.append(
+                    flat_grads[0]
+                    if len(flat_grads) == 1
+                    else ops.concatenate(flat_grads)
+                )
+            value = self._backend_add_to_slices(
+                ops.cast(buffer, dtype), slices, updates
+            )
+            if stochastic_rounding:
+                value = self._stochastic_round(value, buffer.dtype)
+            values.append(value)
+        return values
+
+    def _backend_add_to_slices(self, value, slices, updates):
+        """Adds `updates` to the `(start, stop)` slices of the 1D `value`.
+
+        The slices without updates are kept as they are, and the sums are
+        concatenated with them. It is overridden by JAX, where XLA updates
+        slices in place.
+        """
+        size = value.shape[0]
+        if len(slices) == 1 and slices[0] == (0, size):
+            return ops.add(value, updates[0])
+        pieces = []
+        position = 0
+        for (start, stop), update in zip(slices, updates):
+            if start > position:
+                pieces.append(value[position:start])
+            pieces.append(ops.add(value[start:stop], update))
+            position = stop
+        if position < size:
+            pieces.append(value[position:])
+        return ops.concatenate(pieces)
+
+    def _stochastic_round(self, x, dtype):
+        """Rounds the `float32` tensor `x` to the 16-bit float `dtype`.
+
+        Each value is rounded to one of the two nearest values of `dtype`,
+        with a probability proportional to its proximity to it, which keeps
+        sums of rounded values unbiased.
+        """
+        mantissa_bits, min_exponent = STOCHASTIC_ROUNDING_DTYPES[
+            backend.standardize_dtype(dtype)
+        ]
+        # The spacing of the values of `dtype` around `x`, a power of 2.
+        exponent = ops.maximum(
+            ops.floor(ops.log2(ops.abs(x))), float(min_exponent)
+        )
+        spacing = ops.power(2.0, exponent - mantissa_bits)
+        scaled = x / spacing
+        lower = ops.floor(scaled)
+        noise = random.uniform(
+            ops.shape(x),
+            dtype="float32",
+            seed=self._gradient_accumulator_seed_generator,
+        )
+        rounded = lower + ops.cast(ops.less(noise, scaled - lower), "float32")
+        return ops.cast(rounded * spacing, dtype)
+
     def stateless_apply(self, optimizer_variables, grads, trainable_variables):
         self._check_super_called()
 
@@ -860,6 +1220,9 @@ class BaseOptimizer(KerasSaveable):
             "ema_overwrite_frequency": self.ema_overwrite_frequency,
             "loss_scale_factor": self.loss_scale_factor,
             "gradient_accumulation_steps": self.gradient_accumulation_steps,
+            "flat_gradient_accumulators": self.flat_gradient_accumulators,
+            "gradient_accumulators_dtype": self.gradient_accumulators_dtype,
+            "offload_state": self.offload_state,
         }
         return config
 
@@ -965,6 +1328,31 @@ base_optimizer_keyword_args = """name: String. The name to use
             "gradient accumulation". This can be useful
             when your batch size is very small, in order to reduce gradient
             noise at each update step.
+        flat_gradient_accumulators: Boolean, defaults to `False`. Only used
+            if `gradient_accumulation_steps` is set. If `True`, the gradients
+            of all the variables with the same dtype are accumulated in a
+            single flat buffer, which is updated with one op per step instead
+            of one op per variable. This doesn't save memory by itself, and
+            on CPU it is as fast or slower than the default per-variable
+            accumulators: use it to set `gradient_accumulators_dtype`.
+        gradient_accumulators_dtype: String or `None`. Only used if
+            `flat_gradient_accumulators=True`. The dtype of the flat
+            accumulators, e.g. `"bfloat16"` to halve their memory. Defaults
+            to the dtype of the variables. `"bfloat16"` and `"float16"`
+            accumulators are updated with stochastic rounding, which draws
+            random numbers for every accumulated value: this only saves
+            memory, and can make each step an order of magnitude slower on
+            CPU.
+        offload_state: String or `None`. If `"host"`, the slot variables of
+            the optimizer (e.g. the momentums and velocities of `Adam`) and
+            the EMA copies of the model variables are kept in host memory,
+            and are copied to the device in chunks during each update step.
+            This reduces the device memory used by the optimizer, at the
+            cost of the transfers. Only supported with the JAX and torch
+            backends. With JAX, the offloaded state is held in NumPy arrays,
+            and `fit()` applies the gradients outside of its compiled train
+            step. It is not supported with `gradient_accumulation_steps` or
+            a custom `train_step()` with JAX.
 """
 
 
@@ -163,9 +163,8 @@ class Ftrl(optimizer.Optimizer):
         self._linears = []
         for var in var_list:
             self._accumulators.append(
-                self.add_variable(
-                    shape=var.shape,
-                    dtype=var.dtype,
+                self.add_variable_from_reference(
+                    reference_variable=var,
                     name="accumulator",
                     initializer=initializers.Constant(
                         self.initial_accumulator_value,
@@ -1,5 +1,6 @@
 from unittest import mock
 
+import numpy as np
 import pytest
 from absl.testing import parameterized
 
@@ -300,3 +301,161 @@ class OptimizerSparseTest(testing.TestCase, parameterized.TestCase):
                 optimizer_sparse.apply([grad_sparse], [var_sparse])
                 optimizer_dense.apply([grad_dense], [var_dense])
                 self.assertAllClose(var_sparse.value, var_dense.value)
+
+
+SPARSE_UPDATE_TEST_CASES = [
+    {
+        "testcase_name": "adagrad",
+        "optimizer_class": optimizers.Adagrad,
+    },
+    {
+        "testcase_name": "adam",
+        "optimizer_class": optimizers.Adam,
+    },
+    {
+        "testcase_name": "adam_amsgrad",
+        "optimizer_class": optimizers.Adam,
+        "init_kwargs": {"amsgrad": True},
+    },
+    {
+        "testcase_name": "adamw",
+        "optimizer_class": optimizers.AdamW,
+        "init_kwargs": {"weight_decay": 0.0},
+    },
+    {
+        "testcase_name": "sgd",
+        "optimizer_class": optimizers.SGD,
+    },
+    {
+        "testcase_name": "sgd_momentum_nesterov",
+        "optimizer_class": optimizers.SGD,
+        "init_kwargs": {"momentum": 0.05, "nesterov": True},
+    },
+]
+
+
+def _row_sparse_gradient(indices, values, shape):
+    """Returns a native sparse gradient, or a dense one for torch."""
+    if backend.backend() == "tensorflow":
+        import tensorflow as tf
+
+        return tf.IndexedSlices(ops.convert_to_tensor(values), indices, shape)
+    elif backend.backend() == "jax":
+        import jax.experimental.sparse as jax_sparse
+
+        return jax_sparse.BCOO(
+            (values, np.array(indices)[:, None]), shape=shape
+        )
+    elif backend.backend() == "torch":
+        import torch
+
+        return torch.sparse_coo_tensor(
+            np.array(indices)[None], values, shape
+        ).to(backend.core.get_device())
+    dense = np.zeros(shape, dtype=values.dtype)
+    np.add.at(dense, indices, values)
+    return dense
+
+
+@pytest.mark.requires_trainable_backend
+class OptimizerSparseUpdatesTest(testing.TestCase, parameterized.TestCase):
+    @parameterized.named_parameters(SPARSE_UPDATE_TEST_CASES)
+    @pytest.mark.skipif(
+        backend.backend() == "jax",
+        reason="JAX ignores `sparse_updates`.",
+    )
+    def test_sparse_updates_match_dense_updates_of_rows(
+        self, optimizer_class, init_kwargs={}
+    ):
+        # Updating the rows (0, 2, 4) of a variable with `sparse_updates` must
+        # give the same results as updating a variable with these rows only.
+        # The other rows, and their slots, must be untouched.
+        rng = np.random.default_rng(0)
+        initial_value = rng.random((6, 3, 2)).astype("float32")
+        variable = backend.Variable(initial_value)
+        variable.sparse_updates = True
+        rows_variable = backend.Variable(initial_value[[0, 2, 4]])
+        optimizer = optimizer_class(**init_kwargs)
+        rows_optimizer = optimizer_class(**init_kwargs)
+        optimizer.build([variable])
+        initial_slots = [ops.convert_to_numpy(v) for v in optimizer.variables]
+
+        for i in range(3):
+            values = rng.normal(size=(4, 3, 2)).astype("float32")
+            # The row 2 is looked up twice.
+            grad = _row_sparse_gradient([4, 2, 0, 2], values, (6, 3, 2))
+            optimizer.apply([grad], [variable])
+            rows_grad = np.stack([values[2], values[1] + values[3], values[0]])
+            rows_optimizer.apply(
+                [ops.convert_to_tensor(rows_grad)], [rows_variable]
+            )
+
+        self.assertAllClose(
+            ops.take(variable, [0, 2, 4], axis=0), rows_variable
+        )
+        self.assertAllClose(
+            ops.take(variable, [1, 3, 5], axis=0), initial_value[[1, 3, 5]]
+        )
+        for slot, initial_slot, rows_slot in zip(
+            optimizer.variables, initial_slots, rows_optimizer.variables
+        ):
+            if len(slot.shape) != 3:
+                # The iterations and the learning rate.
+                self.assertAllClose(slot, rows_slot)
+                continue
+            self.assertAllClose(ops.take(slot, [0, 2, 4], axis=0), rows_slot)
+            self.assertAllClose(
+                ops.take(slot, [1, 3, 5], axis=0), initial_slot[[1, 3, 5]]
+            )
+
+    @pytest.mark.skipif(
+        backend.backend() == "jax",
+        reason="JAX ignores `sparse_updates`.",
+    )
+    def test_sparse_updates_are_lazy(self):
+        variable = backend.Variable(np.ones((3, 2)))
+        variable.sparse_updates = True
+        dense_variable = backend.Variable(np.ones((3, 2)))
+        optimizer = optimizers.Adam(learning_rate=0.1)
+        dense_optimizer = optimizers.Adam(learning_rate=0.1)
+
+        grads = [np.array([[1.0, 1.0], [0.0, 0.0], [0.0, 0.0]])]
+        grads.append(grads[0][::-1])
+        for grad in grads:
+            optimizer.apply(
+                [_row_sparse_gradient(*self._rows(grad))], [variable]
+            )
+            dense_optimizer.apply(
+                [ops.convert_to_tensor(grad)], [dense_variable]
+            )
+        # The momentum of the first row is not decayed by the second step.
+        self.assertAllClose(variable[0], [0.9, 0.9])
+        self.assertAllClose(optimizer._momentums[0][0], [0.1, 0.1])
+        self.assertNotAllClose(dense_variable[0], [0.9, 0.9])
+
+    def _rows(self, grad):
+        indices = np.flatnonzero(np.any(grad != 0, axis=1))
+        return list(indices), grad[indices].astype("float32"), grad.shape
+
+    @pytest.mark.skipif(
+        backend.backend() != "jax",
+        reason="Only JAX ignores `sparse_updates`.",
+    )
+    def test_sparse_updates_are_dense_with_jax(self):
+        variable = backend.Variable(np.ones((3, 2)))
+        variable.sparse_updates = True
+        dense_variable = backend.Variable(np.ones((3, 2)))
+        optimizer = optimizers.Adam(learning_rate=0.1)
+        dense_optimizer = optimizers.Adam(learning_rate=0.1)
+        with self.assertWarnsRegex(UserWarning, "sparse_updates"):
+            optimizer.build([variable])
+        dense_optimizer.build([dense_variable])
+
+        grads = [np.array([[1.0, 1.0], [0.0, 0.0], [0.0, 0.0]])]
+        grads.append(grads[0][::-1])
+        for grad in grads:
+            optimizer.apply([ops.convert_to_tensor(grad)], [variable])
+            dense_optimizer.apply(
+                [ops.convert_to_tensor(grad)], [dense_variable]
+            )
+        self.assertAllClose(variable, dense_variable)
@@ -9,6 +9,7 @@ from keras.src import backend
 from keras.src import constraints
 from keras.src import layers
 from keras.src import models
+from keras.src import ops
 from keras.src import optimizers
 from keras.src import testing
 
@@ -220,6 +221,137 @@ class OptimizerTest(testing.TestCase, parameterized.TestCase):
         )
         self.assertAllClose(optimizer.iterations, 4)
 
+    def test_flat_gradient_accumulation(self):
+        v1 = backend.Variable([[1.0, 2.0], [3.0, 4.0]])
+        v2 = backend.Variable([1.0, 2.0, 3.0])
+        v3 = backend.Variable([1.0, 2.0], dtype="float64")
+        grads = [
+            backend.convert_to_tensor([[1.0, 1.0], [1.0, 1.0]]),
+            backend.convert_to_tensor([2.0, 2.0, 2.0]),
+            backend.convert_to_tensor([3.0, 3.0], dtype="float64"),
+        ]
+        optimizer = optimizers.SGD(
+            learning_rate=1.0,
+            gradient_accumulation_steps=3,
+            flat_gradient_accumulators=True,
+        )
+        optimizer.apply(grads, [v1, v2, v3])
+        # One accumulator per dtype.
+        buffers = optimizer._gradient_accumulator_buffers
+        self.assertLen(buffers, 2)
+        self.assertEqual(buffers[0].shape, (7,))
+        self.assertEqual(buffers[1].shape, (2,))
+        self.assertEqual(backend.standardize_dtype(buffers[1].dtype), "float64")
+        self.assertAllClose(buffers[0], [1.0, 1.0, 1.0, 1.0, 2.0, 2.0, 2.0])
+        self.assertAllClose(buffers[1], [3.0, 3.0])
+
+        # Variables without gradients are not accumulated.
+        optimizer.apply(grads[1:], [v2, v3])
+        self.assertAllClose(buffers[0], [1.0, 1.0, 1.0, 1.0, 4.0, 4.0, 4.0])
+        self.assertAllClose(v2, [1.0, 2.0, 3.0])
+        optimizer.apply(grads, [v1, v2, v3])
+        self.assertAllClose(v1, np.array([[1.0, 4.0], [7.0, 10.0]]) / 3)
+        self.assertAllClose(v2, [-1.0, 0.0, 1.0])
+        self.assertAllClose(v3, [-2.0, -1.0])
+        self.assertAllClose(buffers[0], np.zeros((7,)))
+        self.assertAllClose(buffers[1], np.zeros((2,)))
+        self.assertAllClose(optimizer.iterations, 3)
+        # The layout of the gradients is computed once per list of variables.
+        self.assertLen(optimizer._flat_gradient_layouts, 2)
+
+    @parameterized.named_parameters(
+        ("bfloat16", "bfloat16", 256.0), ("float16", "float16", 2048.0)
+    )
+    def test_flat_gradient_accumulation_stochastic_rounding(self, dtype, start):
+        v = backend.Variable(np.zeros((1000,)))
+        optimizer = optimizers.SGD(
+            learning_rate=1.0,
+            gradient_accumulation_steps=10,
+            flat_gradient_accumulators=True,
+            gradient_accumulators_dtype=dtype,
+        )
+        optimizer.apply([ops.full((1000,), start)], [v])
+        (buffer,) = optimizer._gradient_accumulator_buffers
+        self.assertEqual(backend.standardize_dtype(buffer.dtype), dtype)
+        # The spacing of the values of `dtype` around `start` is 2, so
+        # rounding to nearest would lose increments of 0.5, but stochastic
+        # rounding accumulates them on average.
+        for _ in range(8):
+            optimizer.apply([ops.full((1000,), 0.5)], [v])
+        values = backend.convert_to_numpy(ops.cast(buffer, "float32"))
+        self.assertAllClose(np.mean(values), start + 4.0, atol=0.5)
+        self.assertAllClose(np.mod(values, 2.0), np.zeros((1000,)))
+        optimizer.apply([ops.full((1000,), 0.5)], [v])
+        self.assertAllClose(
+            np.mean(backend.convert_to_numpy(v)),
+            -(start + 4.5) / 10,
+            atol=0.05,
+        )
+
+    def test_flat_gradient_accumulators_dtype_requires_flat(self):
+        with self.assertRaisesRegex(ValueError, "flat_gradient_accumulators"):
+            optimizers.SGD(
+                gradient_accumulation_steps=2,
+                gradient_accumulators_dtype="bfloat16",
+            )
+
+    def test_offload_state_validation(self):
+        with self.assertRaisesRegex(ValueError, "must be `None` or `'host'`"):
+            optimizers.Adam(offload_state="disk")
+        if backend.backend() not in ("jax", "torch"):
+            with self.assertRaisesRegex(ValueError, "only supported"):
+                optimizers.Adam(offload_state="host")
+        if backend.backend() == "jax":
+            with self.assertRaisesRegex(ValueError, "not supported with"):
+                optimizers.Adam(
+                    offload_state="host", gradient_accumulation_steps=2
+                )
+
+    @parameterized.named_parameters(
+        ("adam", optimizers.Adam, {}),
+        ("adam_ema", optimizers.Adam, {"use_ema": True}),
+        ("sgd_momentum", optimizers.SGD, {"momentum": 0.9}),
+    )
+    @pytest.mark.skipif(
+        backend.backend() != "jax",
+        reason="The torch offloading is tested in torch_optimizer_test.py",
+    )
+    def test_offload_state_with_model_fit(self, cls, kwargs):
+        x = np.random.uniform(size=(32, 4))
+        y = np.random.uniform(size=(32, 1))
+
+        def fit(**offload_kwargs):
+            model = models.Sequential(
+                [layers.Input((4,)), layers.Dense(8), layers.Dense(1)]
+            )
+            model.set_weights([np.full(w.shape, 0.1) for w in model.weights])
+            optimizer = cls(**kwargs, **offload_kwargs)
+            if offload_kwargs:
+                # Stream one variable at a time.
+                optimizer.offload_chunk_size = 1
+            model.compile(optimizer, "mse", steps_per_execution=2)
+            model.fit(x, y, batch_size=8, epochs=2, shuffle=False, verbose=0)
+            return model, optimizer
+
+        expected_model, expected_optimizer = fit()
+        model, optimizer = fit(offload_state="host")
+        for value, expected_value in zip(
+            model.weights + optimizer.variables,
+            expected_model.weights + expected_optimizer.variables,
+        ):
+            self.assertAllClose(value, expected_value, atol=1e-5)
+        slots = [s for v in optimizer._offloaded_slots.values() for s in v]
+        if kwargs.get("use_ema"):
+            slots += optimizer._model_variables_moving_average
+        self.assertNotEmpty(slots)
+        for slot in slots:
+            self.assertIsInstance(slot.value, np.ndarray)
+
+        # The state stays in host memory when assigned.
+        optimizer.set_weights(expected_optimizer.variables)
+        for slot in slots:
+            self.assertIsInstance(slot.value, np.ndarray)
+
     @pytest.mark.skipif(backend.backend() != "tensorflow", reason="Requires TF")
     def test_tf_checkpointing(self):
         import tensorflow as tf
@@ -127,6 +127,38 @@ class SGD(optimizer.Optimizer):
         else:
             self.assign_sub(variable, ops.multiply(gradient, learning_rate))
 
+    def sparse_update_step(self, gradient, indices, variable, learning_rate):
+        """Lazy update step of the rows `indices` of the model variable.
+
+        The momentums of the other rows are not decayed.
+        """
+        learning_rate = ops.cast(learning_rate, variable.dtype)
+        gradient = ops.cast(gradient, variable.dtype)
+        rows = self._gather_rows(variable, indices)
+        if self.momentum == 0:
+            self._scatter_rows(
+                variable,
+                indices,
+                ops.subtract(rows, ops.multiply(gradient, learning_rate)),
+            )
+            return
+
+        m = self.momentums[self._get_variable_index(variable)]
+        momentum = ops.cast(self.momentum, variable.dtype)
+        m_rows = ops.subtract(
+            ops.multiply(self._gather_rows(m, indices), momentum),
+            ops.multiply(gradient, learning_rate),
+        )
+        self._scatter_rows(m, indices, m_rows)
+        if self.nesterov:
+            update = ops.subtract(
+                ops.multiply(m_rows, momentum),
+                ops.multiply(gradient, learning_rate),
+            )
+        else:
+            update = m_rows
+        self._scatter_rows(variable, indices, ops.add(rows, update))
+
     def get_config(self):
         config = super().get_config()
         config.update(
@@ -24,6 +24,10 @@ def save_model(model, filepath, overwrite=True, **kwargs):
         filepath: `str` or `pathlib.Path` object. Path where to save the model.
         overwrite: Whether we should overwrite any existing model at the target
             location, or instead ask the user via an interactive prompt.
+        num_shards: Optional number of H5 files to split the weights of the
+            `.keras` archive into, which keeps each file small for large
+            models. The shards are written one after the other. Sharded
+            archives cannot be loaded by earlier versions of Keras.
 
     Example:
 
@@ -52,6 +56,7 @@ def save_model(model, filepath, overwrite=True, **kwargs):
     """
     include_optimizer = kwargs.pop("include_optimizer", True)
     save_format = kwargs.pop("save_format", False)
+    num_shards = kwargs.pop("num_shards", None)
     if save_format:
         if str(filepath).endswith((".h5", ".hdf5")) or str(filepath).endswith(
             ".keras"
@@ -97,7 +102,7 @@ def save_model(model, filepath, overwrite=True, **kwargs):
             return
 
     if str(filepath).endswith(".keras"):
-        saving_lib.save_model(model, filepath)
+        saving_lib.save_model(model, filepath, num_shards=num_shards)
     elif str(filepath).endswith((".h5", ".hdf5")):
         legacy_h5_format.save_model_to_hdf5(
             model, filepath, overwrite, include_optimizer
@@ -31,6 +31,16 @@ class SaveModelTests(test_case.TestCase):
         x = np.random.uniform(size=(10, 3))
         self.assertTrue(np.allclose(model.predict(x), loaded_model.predict(x)))
 
+    def test_sharded_saving(self):
+        """Test saving the weights of a model in several shards."""
+        model = self.get_model()
+        filepath = os.path.join(self.get_temp_dir(), "test_model.keras")
+        saving_api.save_model(model, filepath, num_shards=2)
+
+        loaded_model = saving_api.load_model(filepath)
+        x = np.random.uniform(size=(10, 3))
+        self.assertTrue(np.allclose(model.predict(x), loaded_model.predict(x)))
+
     def test_invalid_save_format(self):
         """Test deprecated save_format argument."""
         model = self.get_model()
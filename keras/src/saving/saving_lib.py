@@ -3,9 +3,13 @@
 import datetime
 import io
 import json
+import mmap
+import re
+import struct
 import tempfile
 import warnings
 import zipfile
+from concurrent import futures
 
 import ml_dtypes
 import numpy as np
@@ -33,9 +37,19 @@ _CONFIG_FILENAME = "config.json"
 _METADATA_FILENAME = "metadata.json"
 _VARS_FNAME = "model.weights"  # Will become e.g. "model.weights.h5"
 _ASSETS_DIRNAME = "assets"
-
-
-def save_model(model, filepath, weights_format="h5"):
+# Sharded weights are stored as e.g. "model.weights-00001-of-00004.h5".
+_SHARD_FNAME_PATTERN = re.compile(
+    re.escape(_VARS_FNAME) + r"-(\d{5})-of-(\d{5})\.h5"
+)
+# Local file header of a zip member (section 4.3.7 of the zip APPNOTE):
+# signature, version needed to extract, flags, compression method, last
+# modification time and date, CRC-32, compressed and uncompressed sizes, and
+# lengths of the file name and extra field.
+_ZIP_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+_ZIP_LOCAL_HEADER_SIGNATURE = 0x04034B50
+
+
+def save_model(model, filepath, weights_format="h5", num_shards=None):
     """Save a zip-archive representing a Keras model to the given file or path.
 
     The zip-based archive contains the following structure:
@@ -58,6 +72,13 @@ def save_model(model, filepath, weights_format="h5"):
     they are either 1) referenced via layer attributes, or 2) referenced via a
     container (list, tuple, or dict), and the container is referenced via a
     layer attribute.
+
+    When `num_shards` is set, the weights are instead split by saveable
+    across `num_shards` H5 files (e.g. `model.weights-00000-of-00004.h5`).
+    The shards are written one after the other, since h5py serializes all
+    calls behind a global lock. Such archives can be loaded with
+    `load_model()` and `load_weights_only()` like regular ones, but not by
+    earlier versions of Keras, which only read `model.weights.h5`.
     """
     if weights_format == "h5" and h5py is None:
         raise ImportError("h5py must be installed in order to save a model.")
@@ -71,8 +92,21 @@ def save_model(model, filepath, weights_format="h5"):
             stacklevel=2,
         )
 
+    if num_shards is not None:
+        if not isinstance(num_shards, int) or num_shards < 1:
+            raise ValueError(
+                "Argument `num_shards` must be a positive integer. "
+                f"Received: num_shards={num_shards}"
+            )
+        if weights_format != "h5":
+            raise ValueError(
+                "Argument `num_shards` is only supported with "
+                f"`weights_format='h5'`. Received: num_shards={num_shards}, "
+                f"weights_format={weights_format}"
+            )
+
     if isinstance(filepath, io.IOBase):
-        _save_model_to_fileobj(model, filepath, weights_format)
+        _save_model_to_fileobj(model, filepath, weights_format, num_shards)
         return
 
     filepath = str(filepath)
@@ -84,32 +118,25 @@ def save_model(model, filepath, weights_format="h5"):
     if file_utils.is_remote_path(filepath):
         # Remote path. Zip to local memory byte io and copy to remote
         zip_filepath = io.BytesIO()
-        _save_model_to_fileobj(model, zip_filepath, weights_format)
+        _save_model_to_fileobj(model, zip_filepath, weights_format, num_shards)
         with file_utils.File(filepath, "wb") as f:
             f.write(zip_filepath.getvalue())
     else:
         with open(filepath, "wb") as f:
-            _save_model_to_fileobj(model, f, weights_format)
+            _save_model_to_fileobj(model, f, weights_format, num_shards)
 
 
-def _save_model_to_fileobj(model, fileobj, weights_format):
-    with ObjectSharingScope():
-        serialized_model_dict = serialize_keras_object(model)
-    config_json = json.dumps(serialized_model_dict)
-    metadata_json = json.dumps(
-        {
-            "keras_version": keras_version,
-            "date_saved": datetime.datetime.now().strftime("%Y-%m-%d@%H:%M:%S"),
-        }
-    )
+def _save_model_to_fileobj(model, fileobj, weights_format, num_shards=None):
+    config_json = _get_config_json(model)
 
     with zipfile.ZipFile(fileobj, "w") as zf:
-        with zf.open(_METADATA_FILENAME, "w") as f:
-            f.write(metadata_json.encode())
-        with zf.open(_CONFIG_FILENAME, "w") as f:
-            f.write(config_json.encode())
+        _write_config_and_metadata(zf, config_json)
 
-        if weights_format == "h5":
+        if num_shards is not None:
+            weights_store = ShardedH5IOStore(
+                _VARS_FNAME, archive=zf, mode="w", num_shards=num_shards
+            )
+        elif weights_format == "h5":
             weights_store = H5IOStore(_VARS_FNAME + ".h5", archive=zf, mode="w")
         elif weights_format == "npz":
             weights_store = NpzIOStore(
@@ -135,6 +162,93 @@ def _save_model_to_fileobj(model, fileobj, weights_format):
         asset_store.close()
 
 
+def _get_config_json(model):
+    with ObjectSharingScope():
+        serialized_model_dict = serialize_keras_object(model)
+    return json.dumps(serialized_model_dict)
+
+
+def _write_config_and_metadata(zf, config_json):
+    metadata_json = json.dumps(
+        {
+            "keras_version": keras_version,
+            "date_saved": datetime.datetime.now().strftime("%Y-%m-%d@%H:%M:%S"),
+        }
+    )
+    with zf.open(_METADATA_FILENAME, "w") as f:
+        f.write(metadata_json.encode())
+    with zf.open(_CONFIG_FILENAME, "w") as f:
+        f.write(config_json.encode())
+
+
+class ModelSnapshot:
+    """Copy of the state of a model in host memory, to be saved later.
+
+    Creating the snapshot serializes the model config, copies the values of
+    all variables to NumPy arrays and saves the assets to a temporary
+    directory. `save()` then writes the snapshot to a `.keras` (or, when
+    `weights_only=True`, a `.weights.h5`) file, without accessing the model.
+    This allows the snapshot to be written in a background thread while the
+    model keeps training.
+
+    Args:
+        model: The model to snapshot.
+        weights_only: Whether to only capture the weights of the model.
+    """
+
+    def __init__(self, model, weights_only=False):
+        self.weights_only = weights_only
+        self.weights_store = SnapshotIOStore()
+        if weights_only:
+            self.config_json = None
+            self.assets_store = None
+        else:
+            self.config_json = _get_config_json(model)
+            self.assets_store = DiskIOStore(_ASSETS_DIRNAME, mode="w")
+        _save_state(
+            model,
+            weights_store=self.weights_store,
+            assets_store=self.assets_store,
+            inner_path="",
+            visited_saveables=set(),
+        )
+
+    def save(self, filepath):
+        """Writes the snapshot to `filepath` and releases it."""
+        filepath = str(filepath)
+        try:
+            if self.weights_only:
+                weights_store = H5IOStore(filepath, mode="w")
+                self.weights_store.write(weights_store)
+                weights_store.close()
+            elif file_utils.is_remote_path(filepath):
+                zip_filepath = io.BytesIO()
+                self._save_to_fileobj(zip_filepath)
+                with file_utils.File(filepath, "wb") as f:
+                    f.write(zip_filepath.getvalue())
+            else:
+                with open(filepath, "wb") as f:
+                    self._save_to_fileobj(f)
+        finally:
+            self.close()
+
+    def close(self):
+        self.weights_store.close()
+        if self.assets_store:
+            self.assets_store.close()
+            self.assets_store = None
+
+    def _save_to_fileobj(self, fileobj):
+        with zipfile.ZipFile(fileobj, "w") as zf:
+            _write_config_and_metadata(zf, self.config_json)
+            weights_store = H5IOStore(_VARS_FNAME + ".h5", archive=zf, mode="w")
+            self.weights_store.write(weights_store)
+            weights_store.close()
+            _write_to_zip_recursively(
+                zf, self.assets_store.working_dir, _ASSETS_DIRNAME
+            )
+
+
 def load_model(filepath, custom_objects=None, compile=True, safe_mode=True):
     """Load a zip archive representing a Keras model."""
     if isinstance(filepath, io.IOBase):
@@ -172,18 +286,21 @@ def _load_model_from_fileobj(fileobj, custom_objects, compile, safe_mode):
             )
 
         all_filenames = zf.namelist()
+        shard_filenames = _get_shard_filenames(all_filenames)
         if _VARS_FNAME + ".h5" in all_filenames:
             weights_store = H5IOStore(_VARS_FNAME + ".h5", archive=zf, mode="r")
         elif _VARS_FNAME + ".npz" in all_filenames:
             weights_store = NpzIOStore(
                 _VARS_FNAME + ".npz", archive=zf, mode="r"
             )
+        elif shard_filenames:
+            weights_store = ShardedH5IOStore(_VARS_FNAME, archive=zf, mode="r")
         else:
             raise ValueError(
                 f"Expected a {_VARS_FNAME}.h5 or {_VARS_FNAME}.npz file."
             )
 
-        if len(all_filenames) > 3:
+        if len(all_filenames) > 2 + max(len(shard_filenames), 1):
             asset_store = DiskIOStore(_ASSETS_DIRNAME, archive=zf, mode="r")
         else:
             asset_store = None
@@ -250,9 +367,14 @@ def load_weights_only(
         weights_store = H5IOStore(filepath, mode="r")
     elif filepath.endswith(".keras"):
         archive = zipfile.ZipFile(filepath, "r")
-        weights_store = H5IOStore(
-            _VARS_FNAME + ".h5", archive=archive, mode="r"
-        )
+        if _get_shard_filenames(archive.namelist()):
+            weights_store = ShardedH5IOStore(
+                _VARS_FNAME, archive=archive, mode="r"
+            )
+        else:
+            weights_store = H5IOStore(
+                _VARS_FNAME + ".h5", archive=archive, mode="r"
+            )
 
     failed_saveables = set()
     if objects_to_skip is not None:
@@ -621,7 +743,9 @@ class H5IOStore:
             if self.mode == "w":
                 self.io_file = io.BytesIO()
             else:
-                self.io_file = self.archive.open(self.root_path, "r")
+                self.io_file = _map_archive_member(self.archive, self.root_path)
+                if self.io_file is None:
+                    self.io_file = self.archive.open(self.root_path, "r")
             self.h5_file = h5py.File(self.io_file, mode=self.mode)
         else:
             self.h5_file = h5py.File(root_path, mode=self.mode)
@@ -630,12 +754,22 @@ class H5IOStore:
         return H5Entry(self.h5_file, path, mode="w")
 
     def get(self, path):
+        if isinstance(self.io_file, MappedFile):
+            return H5Entry(
+                self.h5_file, path, mode="r", buffer=self.io_file.buffer
+            )
         return H5Entry(self.h5_file, path, mode="r")
 
     def close(self):
         self.h5_file.close()
         if self.mode == "w" and self.archive:
-            self.archive.writestr(self.root_path, self.io_file.getvalue())
+            # Weights are stored uncompressed so that they can be
+            # memory-mapped when loading.
+            self.archive.writestr(
+                self.root_path,
+                self.io_file.getvalue(),
+                compress_type=zipfile.ZIP_STORED,
+            )
         if self.io_file:
             self.io_file.close()
 
@@ -643,10 +777,11 @@ class H5IOStore:
 class H5Entry:
     """Leaf entry in a H5IOStore."""
 
-    def __init__(self, h5_file, path, mode):
+    def __init__(self, h5_file, path, mode, buffer=None):
         self.h5_file = h5_file
         self.path = path
         self.mode = mode
+        self.buffer = buffer
 
         if mode == "w":
             if not path:
@@ -703,9 +838,144 @@ class H5Entry:
         value = self.group[name]
         if "dtype" in value.attrs and value.attrs["dtype"] == "bfloat16":
             value = np.array(value, dtype=ml_dtypes.bfloat16)
+        elif self.buffer is not None:
+            value = _map_h5_dataset(value, self.buffer)
         return value
 
 
+class ShardedH5IOStore:
+    def __init__(self, root_path, archive, mode="r", num_shards=None):
+        """Numerical variable store split across several HDF5 files.
+
+        `root_path` is the prefix of the shard filenames inside the archive,
+        e.g. `"model.weights"` for `"model.weights-00000-of-00004.h5"`.
+
+        In write mode, the variables are only collected by `make()`. They
+        are converted to NumPy and written to `num_shards` files when the
+        store is closed. Each saveable is assigned as a whole to a shard, so
+        as to balance the number of bytes across shards.
+
+        In read mode, `get()` returns the entry from the shard that
+        contains `path`.
+        """
+        self.root_path = root_path
+        self.archive = archive
+        self.mode = mode
+        self.num_shards = num_shards
+        if self.mode == "w":
+            self.entries = {}
+        else:
+            self.stores = [
+                H5IOStore(filename, archive=self.archive, mode="r")
+                for filename in _get_shard_filenames(self.archive.namelist())
+            ]
+
+    def make(self, path):
+        self.entries[path] = {}
+        return self.entries[path]
+
+    def get(self, path):
+        key = f"{path}/vars" if path else "vars"
+        for store in self.stores:
+            if key in store.h5_file:
+                return store.get(path)
+        return self.stores[0].get(path)
+
+    def close(self):
+        if self.mode == "w":
+            self._write_shards()
+        else:
+            for store in self.stores:
+                store.close()
+
+    def _write_shards(self):
+        paths = list(self.entries.keys())
+        with futures.ThreadPoolExecutor(self.num_shards) as executor:
+            # Device to host transfers release the GIL, so the variables of
+            # different saveables can be fetched concurrently.
+            values = list(executor.map(self._convert_entry, paths))
+        nbytes = [sum(v.nbytes for v in entry.values()) for entry in values]
+        shards = [[] for _ in range(self.num_shards)]
+        shard_nbytes = [0] * self.num_shards
+        for i in sorted(range(len(paths)), key=lambda i: -nbytes[i]):
+            shard = shard_nbytes.index(min(shard_nbytes))
+            shards[shard].append(i)
+            shard_nbytes[shard] += nbytes[i]
+        # h5py serializes all calls behind a global lock, so the shards are
+        # written one after the other.
+        for i, shard in enumerate(shards):
+            self.archive.writestr(
+                _shard_filename(self.root_path, i, self.num_shards),
+                _write_h5_shard([(paths[j], values[j]) for j in sorted(shard)]),
+                compress_type=zipfile.ZIP_STORED,
+            )
+
+    def _convert_entry(self, path):
+        return {
+            key: backend.convert_to_numpy(value)
+            for key, value in self.entries[path].items()
+        }
+
+
+def _write_h5_shard(entries):
+    io_file = io.BytesIO()
+    with h5py.File(io_file, mode="w") as h5_file:
+        for path, values in entries:
+            entry = H5Entry(h5_file, path, mode="w")
+            for key, value in values.items():
+                entry[key] = value
+    return io_file.getvalue()
+
+
+def _shard_filename(root_path, index, num_shards):
+    return f"{root_path}-{index:05d}-of-{num_shards:05d}.h5"
+
+
+def _get_shard_filenames(filenames):
+    return sorted(
+        filename
+        for filename in filenames
+        if _SHARD_FNAME_PATTERN.fullmatch(filename)
+    )
+
+
+class SnapshotIOStore:
+    """Numerical variable store holding host copies of the variables.
+
+    Values are copied as soon as they are set, so that the store is not
+    affected by later updates of the variables. `write()` then transfers the
+    contents to another store.
+    """
+
+    def __init__(self):
+        self.contents = {}
+
+    def make(self, path):
+        self.contents[path] = SnapshotEntry()
+        return self.contents[path]
+
+    def get(self, path):
+        return self.contents.get(path, {})
+
+    def write(self, weights_store):
+        for path, entry in self.contents.items():
+            target = weights_store.make(path)
+            for key, value in entry.items():
+                target[key] = value
+
+    def close(self):
+        self.contents = {}
+
+
+class SnapshotEntry(dict):
+    """Leaf entry in a SnapshotIOStore."""
+
+    def __setitem__(self, key, value):
+        # Copy, since the NumPy conversion of a CPU tensor may share its
+        # memory.
+        super().__setitem__(key, np.array(backend.convert_to_numpy(value)))
+
+
 class NpzIOStore:
     def __init__(self, root_path, archive=None, mode="r"):
         """Numerical variable store backed by NumPy.savez/load.
@@ -756,6 +1026,107 @@ class NpzIOStore:
         self.f.close()
 
 
+class MappedFile(io.RawIOBase):
+    """Read-only, seekable file object over a memory-mapped buffer.
+
+    Reading does not copy the underlying file in memory: the pages of the
+    buffer are loaded by the OS on access, and can be evicted at any time.
+
+    Args:
+        buffer: A `memoryview` holding the file contents.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = len(self.buffer) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        return self._position
+
+    def readinto(self, b):
+        data = self.buffer[self._position : self._position + len(b)]
+        b[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def close(self):
+        # Arrays returned by `_map_h5_dataset()` may still reference the
+        # buffer, so the mapping is released once they are garbage collected.
+        self.buffer = None
+        super().close()
+
+
+def _map_archive_member(archive, name):
+    """Memory-maps an uncompressed member of a zip archive.
+
+    Returns a `MappedFile` over the bytes of the member, or `None` when the
+    member cannot be mapped (e.g. it is compressed or encrypted, or the
+    archive is not backed by a file on disk).
+    """
+    info = archive.getinfo(name)
+    if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+        return None
+    try:
+        fileno = archive.fp.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+    try:
+        mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    buffer = memoryview(mapped)
+    # The member data follows its local file header, whose extra field may
+    # differ from the one of the central directory.
+    header_end = info.header_offset + _ZIP_LOCAL_HEADER.size
+    if header_end > len(buffer):
+        return None
+    fields = _ZIP_LOCAL_HEADER.unpack(buffer[info.header_offset : header_end])
+    if fields[0] != _ZIP_LOCAL_HEADER_SIGNATURE:
+        return None
+    filename_length, extra_field_length = fields[-2:]
+    start = header_end + filename_length + extra_field_length
+    return MappedFile(buffer[start : start + info.file_size])
+
+
+def _map_h5_dataset(dataset, buffer):
+    """Returns a read-only NumPy view of `dataset` within `buffer`.
+
+    Only contiguous, uncompressed datasets with a plain NumPy dtype can be
+    viewed in place. The dataset itself is returned otherwise, and will be
+    read by h5py.
+    """
+    if (
+        dataset.chunks is not None
+        or dataset.compression is not None
+        or dataset.dtype.kind not in "biufc"
+        or dataset.size == 0
+    ):
+        return dataset
+    offset = dataset.id.get_offset()
+    if offset is None:
+        return dataset
+    return np.frombuffer(
+        buffer, dtype=dataset.dtype, count=dataset.size, offset=offset
+    ).reshape(dataset.shape)
+
+
 def get_temp_dir():
     temp_dir = tempfile.mkdtemp()
     testfile = tempfile.TemporaryFile(dir=temp_dir)
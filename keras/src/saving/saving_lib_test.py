@@ -479,6 +479,134 @@ class SavingTest(testing.TestCase):
         model.load_weights(temp_filepath)
         self.assertAllClose(model.predict(ref_input), ref_output, atol=1e-6)
 
+    def test_load_model_memory_maps_weights(self):
+        temp_filepath = Path(os.path.join(self.get_temp_dir(), "mymodel.keras"))
+        model = _get_basic_functional_model()
+        ref_input = np.random.random((2, 4))
+        ref_output = model.predict(ref_input)
+        saving_lib.save_model(model, temp_filepath)
+        with zipfile.ZipFile(temp_filepath, "r") as z:
+            info = z.getinfo("model.weights.h5")
+            self.assertEqual(info.compress_type, zipfile.ZIP_STORED)
+
+        with zipfile.ZipFile(temp_filepath, "r") as z:
+            store = saving_lib.H5IOStore("model.weights.h5", archive=z)
+            self.assertIsInstance(store.io_file, saving_lib.MappedFile)
+            entry = store.get("layers/dense")
+            kernel = entry["0"]
+            self.assertIsInstance(kernel, np.ndarray)
+            self.assertFalse(kernel.flags.writeable)
+            self.assertAllClose(kernel, model.layers[1].kernel)
+            store.close()
+
+        new_model = saving_lib.load_model(temp_filepath)
+        self.assertAllClose(new_model.predict(ref_input), ref_output)
+
+    def test_map_archive_member_fallback(self):
+        out = BytesIO()
+        with zipfile.ZipFile(out, "w") as z:
+            z.writestr("stored.bin", b"0123456789")
+            z.writestr(
+                "deflated.bin",
+                b"0123456789",
+                compress_type=zipfile.ZIP_DEFLATED,
+            )
+        out.seek(0)
+        with zipfile.ZipFile(out, "r") as z:
+            # Not backed by a file on disk.
+            self.assertIsNone(saving_lib._map_archive_member(z, "stored.bin"))
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "archive.zip")
+        with open(temp_filepath, "wb") as f:
+            f.write(out.getvalue())
+        with zipfile.ZipFile(temp_filepath, "r") as z:
+            self.assertIsNone(saving_lib._map_archive_member(z, "deflated.bin"))
+            mapped = saving_lib._map_archive_member(z, "stored.bin")
+            self.assertEqual(mapped.read(), b"0123456789")
+            mapped.seek(-4, os.SEEK_END)
+            self.assertEqual(mapped.read(2), b"67")
+            mapped.close()
+
+    def test_save_model_sharded(self):
+        temp_filepath = os.path.join(self.get_temp_dir(), "mymodel.keras")
+        model = _get_basic_functional_model()
+        model.compile(optimizer="adam", loss="mse")
+        model.fit(np.random.random((4, 4)), np.random.random((4, 1)))
+        ref_input = np.random.random((2, 4))
+        ref_output = model.predict(ref_input)
+        saving_lib.save_model(model, temp_filepath, num_shards=3)
+
+        with zipfile.ZipFile(temp_filepath, "r") as z:
+            filenames = z.namelist()
+        self.assertNotIn("model.weights.h5", filenames)
+        self.assertEqual(
+            saving_lib._get_shard_filenames(filenames),
+            [
+                "model.weights-00000-of-00003.h5",
+                "model.weights-00001-of-00003.h5",
+                "model.weights-00002-of-00003.h5",
+            ],
+        )
+
+        new_model = saving_lib.load_model(temp_filepath)
+        self.assertAllClose(new_model.predict(ref_input), ref_output)
+        for v, new_v in zip(
+            model.optimizer.variables, new_model.optimizer.variables
+        ):
+            self.assertAllClose(v, new_v)
+
+        new_model = _get_basic_functional_model()
+        saving_lib.load_weights_only(new_model, temp_filepath)
+        self.assertAllClose(new_model.predict(ref_input), ref_output)
+
+    def test_save_model_sharded_with_assets(self):
+        temp_filepath = os.path.join(self.get_temp_dir(), "mymodel.keras")
+        model = ModelWithCustomSaving()
+        model(np.random.random((3, 32)))
+        saving_lib.save_model(model, temp_filepath, num_shards=2)
+
+        with zipfile.ZipFile(temp_filepath, "r") as z:
+            filenames = z.namelist()
+        self.assertIn("assets/custom_dense/assets.txt", filenames)
+
+        loaded_model = saving_lib.load_model(temp_filepath)
+        self.assertEqual(loaded_model.custom_dense.assets, ASSETS_DATA)
+        self.assertEqual(
+            loaded_model.custom_dense.stored_variables.tolist(),
+            VARIABLES_DATA.tolist(),
+        )
+
+    def test_save_model_invalid_num_shards(self):
+        temp_filepath = os.path.join(self.get_temp_dir(), "mymodel.keras")
+        model = _get_basic_functional_model()
+        with self.assertRaisesRegex(ValueError, "positive integer"):
+            saving_lib.save_model(model, temp_filepath, num_shards=0)
+        with self.assertRaisesRegex(ValueError, "only supported"):
+            saving_lib.save_model(
+                model, temp_filepath, weights_format="npz", num_shards=2
+            )
+
+    def test_model_snapshot(self):
+        temp_filepath = os.path.join(self.get_temp_dir(), "mymodel.keras")
+        model = _get_basic_functional_model()
+        ref_input = np.random.random((2, 4))
+        ref_output = model.predict(ref_input)
+        snapshot = saving_lib.ModelSnapshot(model)
+        # Later updates are not reflected in the snapshot.
+        for v in model.weights:
+            v.assign(ops.zeros_like(v))
+        snapshot.save(temp_filepath)
+        new_model = saving_lib.load_model(temp_filepath)
+        self.assertAllClose(new_model.predict(ref_input), ref_output)
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "mymodel.weights.h5")
+        snapshot = saving_lib.ModelSnapshot(model, weights_only=True)
+        snapshot.save(temp_filepath)
+        saving_lib.load_weights_only(new_model, temp_filepath)
+        self.assertAllClose(
+            new_model.predict(ref_input), model.predict(ref_input)
+        )
+
     def test_save_weights_subclassed_functional(self):
         # The subclassed and basic functional model should have the same
         # weights structure.
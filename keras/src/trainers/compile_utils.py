@@ -3,6 +3,7 @@ from keras.src import losses as losses_module
 from keras.src import metrics as metrics_module
 from keras.src import ops
 from keras.src import tree
+from keras.src.metrics import metrics_utils
 from keras.src.utils.naming import get_object_name
 
 
@@ -323,6 +324,12 @@ class CompileMetrics(metrics_module.Metric):
     def update_state(self, y_true, y_pred, sample_weight=None):
         if not self.built:
             self.build(y_true, y_pred)
+        # Threshold metrics of the same outputs (e.g. `AUC` and
+        # `PrecisionAtRecall`) bucketize the predictions once per batch.
+        with metrics_utils.SharedConfusionHistograms():
+            self._update_state(y_true, y_pred, sample_weight=sample_weight)
+
+    def _update_state(self, y_true, y_pred, sample_weight=None):
         y_true = self._flatten_y(y_true)
         y_pred = self._flatten_y(y_pred)
         for m, y_t, y_p in zip(self._flat_metrics, y_true, y_pred):
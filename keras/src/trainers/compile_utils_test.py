@@ -1,3 +1,5 @@
+from unittest import mock
+
 import numpy as np
 from absl.testing import parameterized
 
@@ -6,6 +8,7 @@ from keras.src import metrics as losses_module
 from keras.src import metrics as metrics_module
 from keras.src import ops
 from keras.src import testing
+from keras.src.metrics import metrics_utils
 from keras.src.trainers.compile_utils import CompileLoss
 from keras.src.trainers.compile_utils import CompileMetrics
 
@@ -233,6 +236,43 @@ class TestCompileMetrics(testing.TestCase):
         self.assertEqual(len(result), 1)
         self.assertTrue("my_custom_metric" in result)
 
+    def test_shared_confusion_histograms(self):
+        def make_metrics():
+            return [
+                metrics_module.AUC(name="auc"),
+                metrics_module.AUC(curve="PR", name="pr_auc"),
+                metrics_module.PrecisionAtRecall(0.5, name="p_at_r"),
+                metrics_module.SensitivityAtSpecificity(
+                    0.5, class_id=1, name="s_at_s"
+                ),
+            ]
+
+        compile_metrics = CompileMetrics(
+            metrics=make_metrics(), weighted_metrics=make_metrics()
+        )
+        y_true = np.random.randint(0, 2, (32, 2)).astype("float32")
+        y_pred = np.random.random((32, 2)).astype("float32")
+        sample_weight = np.random.random((32,)).astype("float32")
+        compile_metrics.build(y_true, y_pred)
+        with mock.patch.object(
+            metrics_utils,
+            "_confusion_histograms",
+            wraps=metrics_utils._confusion_histograms,
+        ) as confusion_histograms:
+            compile_metrics.update_state(y_true, y_pred, sample_weight)
+        # One histogram of all the predictions and one of `class_id=1`, for
+        # each of the weighted and unweighted metrics.
+        self.assertEqual(confusion_histograms.call_count, 4)
+
+        result = compile_metrics.result()
+        for metric, weighted_metric in zip(make_metrics(), make_metrics()):
+            metric.update_state(y_true, y_pred)
+            weighted_metric.update_state(y_true, y_pred, sample_weight)
+            self.assertAllClose(result[metric.name], metric.result())
+            self.assertAllClose(
+                result[f"weighted_{metric.name}"], weighted_metric.result()
+            )
+
 
 class TestCompileLoss(testing.TestCase, parameterized.TestCase):
     def test_single_output_case(self):
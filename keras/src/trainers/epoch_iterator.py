@@ -24,6 +24,10 @@ Trainer:
     - initial_epoch
     - any backend-specific concern such as distribution
 
+EpochIterator (optional):
+    - prefetch: background thread that keeps a bounded queue of
+      upcoming batches filled while the step function runs
+
 PyDataset:
     - num_workers
     - use_multiprocessing
@@ -39,6 +43,8 @@ or until there is no data
 
 """
 
+import queue
+import threading
 import warnings
 
 from keras.src.trainers import data_adapters
@@ -55,9 +61,18 @@ class EpochIterator:
         shuffle=False,
         class_weight=None,
         steps_per_execution=1,
+        prefetch=0,
     ):
+        if prefetch is None:
+            prefetch = 0
+        if not isinstance(prefetch, int) or prefetch < 0:
+            raise ValueError(
+                "Argument `prefetch` must be a non-negative integer. "
+                f"Received: prefetch={prefetch}"
+            )
         self.steps_per_epoch = steps_per_epoch
         self.steps_per_execution = steps_per_execution
+        self.prefetch = prefetch
         if steps_per_epoch:
             self._current_iterator = None
             self._insufficient_data = False
@@ -75,11 +90,21 @@ class EpochIterator:
     def _get_iterator(self):
         return self.data_adapter.get_numpy_iterator()
 
+    def _get_prefetched_iterator(self):
+        iterator = self._get_iterator()
+        if self.prefetch:
+            return PrefetchIterator(iterator, buffer_size=self.prefetch)
+        return iter(iterator)
+
+    def _close_iterator(self, iterator):
+        if isinstance(iterator, PrefetchIterator):
+            iterator.close()
+
     def enumerate_epoch(self):
         buffer = []
         if self.steps_per_epoch:
             if self._current_iterator is None:
-                self._current_iterator = iter(self._get_iterator())
+                self._current_iterator = self._get_prefetched_iterator()
                 self._insufficient_data = False
 
             for step in range(self.steps_per_epoch):
@@ -101,16 +126,23 @@ class EpochIterator:
                         "function when building your dataset.",
                         stacklevel=2,
                     )
+                    self._close_iterator(self._current_iterator)
                     self._current_iterator = None
                     self._insufficient_data = True
             if buffer:
                 yield step - len(buffer) + 1, buffer
         else:
-            for step, data in enumerate(self._get_iterator()):
-                buffer.append(data)
-                if len(buffer) == self.steps_per_execution:
-                    yield step - len(buffer) + 1, buffer
-                    buffer = []
+            iterator = self._get_prefetched_iterator()
+            try:
+                for step, data in enumerate(iterator):
+                    buffer.append(data)
+                    if len(buffer) == self.steps_per_execution:
+                        yield step - len(buffer) + 1, buffer
+                        buffer = []
+            finally:
+                # Also runs when the consumer stops early (e.g.
+                # `stop_training`), so the producer thread does not leak.
+                self._close_iterator(iterator)
             if buffer:
                 yield step - len(buffer) + 1, buffer
             if not self._num_batches:
@@ -119,6 +151,12 @@ class EpochIterator:
                 self._num_batches = step + 1
         self.data_adapter.on_epoch_end()
 
+    def __del__(self):
+        # With `steps_per_epoch`, the iterator is kept alive across epochs.
+        iterator = getattr(self, "_current_iterator", None)
+        if iterator is not None:
+            self._close_iterator(iterator)
+
     @property
     def num_batches(self):
         if self.steps_per_epoch:
@@ -126,3 +164,74 @@ class EpochIterator:
         # Either copied from the data_adapter, or
         # inferred at the end of an iteration.
         return self._num_batches
+
+
+class PrefetchIterator:
+    """Iterator that loads upcoming batches in a background thread.
+
+    A producer thread pulls batches from `iterator` and puts them into a
+    bounded queue of size `buffer_size`, so that slicing, conversion and
+    host-side preprocessing of the next batches overlaps with the execution
+    of the current step. Batches are returned in order. Exceptions raised
+    by the underlying iterator are re-raised in the consuming thread.
+
+    Args:
+        iterator: The iterable to prefetch from.
+        buffer_size: Maximum number of batches held in the queue.
+    """
+
+    _END = object()
+
+    def __init__(self, iterator, buffer_size=2):
+        self._iterator = iter(iterator)
+        self._queue = queue.Queue(maxsize=buffer_size)
+        self._stop_event = threading.Event()
+        self._exhausted = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _put(self, item):
+        # Use a timeout so that `close()` can interrupt a blocked producer.
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        try:
+            for data in self._iterator:
+                if not self._put((data, None)):
+                    return
+        except Exception as e:
+            self._put((None, e))
+            return
+        self._put(self._END)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._exhausted:
+            raise StopIteration
+        item = self._queue.get()
+        if item is self._END:
+            self._exhausted = True
+            raise StopIteration
+        data, error = item
+        if error is not None:
+            self._exhausted = True
+            raise error
+        return data
+
+    def close(self):
+        """Stops the producer thread and drops any buffered batches."""
+        self._exhausted = True
+        self._stop_event.set()
+        with self._queue.mutex:
+            self._queue.queue.clear()
+            self._queue.not_full.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
@@ -50,6 +50,61 @@ class TestEpochIterator(testing.TestCase):
         self.assertIsInstance(iterator, epoch_iterator.EpochIterator)
         self.assertTrue(iterator._insufficient_data)
 
+    def test_prefetch(self):
+        x = np.arange(100).reshape((100, 1))
+        iterator = epoch_iterator.EpochIterator(
+            x=x, batch_size=16, steps_per_execution=2
+        )
+        prefetched_iterator = epoch_iterator.EpochIterator(
+            x=x, batch_size=16, steps_per_execution=2, prefetch=3
+        )
+        for _ in range(2):
+            expected = list(iterator.enumerate_epoch())
+            result = list(prefetched_iterator.enumerate_epoch())
+            self.assertEqual(
+                [step for step, _ in result], [step for step, _ in expected]
+            )
+            for (_, batches), (_, expected_batches) in zip(result, expected):
+                self.assertEqual(len(batches), len(expected_batches))
+                for batch, expected_batch in zip(batches, expected_batches):
+                    self.assertAllClose(batch[0], expected_batch[0])
+
+    def test_prefetch_with_steps_per_epoch(self):
+        x = np.arange(64).reshape((64, 1))
+        iterator = epoch_iterator.EpochIterator(
+            x=x, y=x, batch_size=8, steps_per_epoch=4, prefetch=2
+        )
+        seen = []
+        for _ in range(2):
+            for step, batch in iterator.enumerate_epoch():
+                seen.append(int(batch[0][0][0][0]))
+        self.assertEqual(seen, list(range(0, 64, 8)))
+
+    def test_prefetch_early_stop_closes_thread(self):
+        x = np.arange(100).reshape((100, 1))
+        iterator = epoch_iterator.EpochIterator(x=x, batch_size=4, prefetch=2)
+        epoch = iterator.enumerate_epoch()
+        next(epoch)
+        prefetch_iterator = epoch.gi_frame.f_locals["iterator"]
+        epoch.close()
+        self.assertFalse(prefetch_iterator._thread.is_alive())
+
+    def test_prefetch_propagates_errors(self):
+        def generator():
+            yield np.zeros((2, 1))
+            raise ValueError("Bad batch")
+
+        iterator = epoch_iterator.PrefetchIterator(generator(), buffer_size=2)
+        self.assertAllClose(next(iterator), np.zeros((2, 1)))
+        with self.assertRaisesRegex(ValueError, "Bad batch"):
+            next(iterator)
+        with self.assertRaises(StopIteration):
+            next(iterator)
+
+    def test_invalid_prefetch(self):
+        with self.assertRaisesRegex(ValueError, "non-negative integer"):
+            epoch_iterator.EpochIterator(x=np.zeros((10, 1)), prefetch=-1)
+
     def test_unsupported_y_arg_tfdata(self):
         with self.assertRaisesRegex(ValueError, "`y` should not be passed"):
             x = tf.data.Dataset.from_tensor_slices(np.random.random((100, 16)))
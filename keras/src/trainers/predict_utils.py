@@ -0,0 +1,272 @@
+import math
+import os
+import struct
+
+import numpy as np
+
+from keras.src import tree
+
+
+def num_executions(num_batches, steps_per_execution=1):
+    """Returns the number of predict function calls for `num_batches`."""
+    if num_batches is None:
+        return None
+    return math.ceil(num_batches / steps_per_execution)
+
+
+class PredictOutputs:
+    """Assembles the per-batch outputs of `predict()` into NumPy arrays.
+
+    Instead of collecting every batch in Python lists and concatenating them
+    at the end (which temporarily holds two copies of the predictions), each
+    output is written in place into a buffer that is allocated once the first
+    batch reveals its dtype and per-sample shape. The buffer is sized from
+    `num_batches` when it is known, and grows geometrically otherwise.
+
+    When `output_path` is set, the buffers are memory-mapped `.npy` files
+    instead of in-memory arrays, so that predictions larger than the host
+    memory can be produced. A model with a single output is written to
+    `output_path` itself. For models with several outputs, `output_path` is
+    a directory and output `i` (in flattened order) is written to
+    `output_path/output_{i}.npy`.
+
+    Outputs that cannot be stored in a preallocated buffer (scalars,
+    non-NumPy values such as ragged tensors, or outputs whose per-sample
+    shape or dtype changes from batch to batch) are kept as a list of
+    batches and merged at the end with `concat_fn`.
+
+    Conversion of a batch to NumPy is deferred until the next batch is
+    appended, so that asynchronous backends can keep one step in flight.
+
+    Args:
+        num_batches: Number of calls to `append()` expected, if known.
+        output_path: Optional path to stream the outputs to.
+        convert_fn: Function used to convert one output of a batch to a
+            NumPy array. Defaults to `np.asarray`.
+        concat_fn: Function used to merge outputs that are kept as a list
+            of batches. Defaults to `np.concatenate`.
+    """
+
+    def __init__(
+        self,
+        num_batches=None,
+        output_path=None,
+        convert_fn=None,
+        concat_fn=None,
+    ):
+        self.num_batches = num_batches
+        self.output_path = output_path
+        self.convert_fn = convert_fn or np.asarray
+        self.concat_fn = concat_fn or np.concatenate
+        self._spec = None
+        self._buffers = None
+        self._pending = None
+
+    def append(self, batch_outputs):
+        if self._pending is not None:
+            self._write(self._pending)
+        self._pending = batch_outputs
+
+    def result(self):
+        """Returns the assembled outputs, with the batch structure."""
+        if self._pending is not None:
+            self._write(self._pending)
+            self._pending = None
+        if self._spec is None:
+            return None
+        return self._spec.unflatten(
+            [buffer.result() for buffer in self._buffers]
+        )
+
+    def _write(self, batch_outputs):
+        if self._spec is None:
+            self._spec = tree.structure_spec(batch_outputs)
+            flat_outputs = tree.flatten(batch_outputs)
+            self._buffers = []
+            for i, _ in enumerate(flat_outputs):
+                if self.output_path is None:
+                    path = None
+                elif len(flat_outputs) == 1:
+                    path = self.output_path
+                else:
+                    os.makedirs(self.output_path, exist_ok=True)
+                    path = os.path.join(self.output_path, f"output_{i}.npy")
+                self._buffers.append(
+                    _OutputBuffer(
+                        num_batches=self.num_batches,
+                        path=path,
+                        concat_fn=self.concat_fn,
+                    )
+                )
+        else:
+            try:
+                flat_outputs = self._spec.flatten(batch_outputs)
+            except ValueError:
+                flat_outputs = tree.flatten(batch_outputs)
+        if len(flat_outputs) != len(self._buffers):
+            raise ValueError(
+                "The structure of the model outputs changed between batches. "
+                f"Expected {len(self._buffers)} outputs, "
+                f"received {len(flat_outputs)}."
+            )
+        for buffer, output in zip(self._buffers, flat_outputs):
+            buffer.append(self.convert_fn(output))
+
+
+class _OutputBuffer:
+    """Storage for a single flattened output of `predict()`."""
+
+    def __init__(self, num_batches=None, path=None, concat_fn=None):
+        self.num_batches = num_batches
+        self.path = path
+        self.concat_fn = concat_fn
+        self.array = None
+        self.batches = None
+        self.batch_sizes = []
+        self.size = 0
+        self._dtype = None
+        self._sample_shape = None
+        self._header_size = None
+
+    @property
+    def capacity(self):
+        return 0 if self.array is None else self.array.shape[0]
+
+    def append(self, value):
+        if self.batches is not None:
+            self.batches.append(value)
+            return
+        if self.array is None:
+            if not _is_dense(value):
+                self._to_list_mode(value)
+                return
+            self._allocate(value)
+        elif (
+            not _is_dense(value)
+            or value.shape[1:] != self.array.shape[1:]
+            or value.dtype != self.array.dtype
+        ):
+            self._to_list_mode(value)
+            return
+        end = self.size + value.shape[0]
+        if end > self.capacity:
+            self._resize(max(end, 2 * self.capacity))
+        self.array[self.size : end] = value
+        self.batch_sizes.append(value.shape[0])
+        self.size = end
+
+    def result(self):
+        if self.batches is not None:
+            return self.concat_fn(self.batches)
+        if self.path is not None:
+            return self._finalize_file()
+        if self.size < self.capacity:
+            # Return an array of the right size rather than a view that
+            # would keep the whole buffer alive.
+            self._resize(self.size)
+        return self.array
+
+    def _allocate(self, value):
+        batch_size = max(value.shape[0], 1)
+        if self.num_batches:
+            capacity = self.num_batches * batch_size
+        else:
+            capacity = 16 * batch_size
+        if self.path is None:
+            self.array = np.empty(
+                (capacity,) + value.shape[1:], dtype=value.dtype
+            )
+        else:
+            self._open_file(value, capacity)
+
+    def _resize(self, capacity):
+        if self.path is None:
+            # The buffer is resized in place (with `realloc`), which does not
+            # hold the old and new buffers at the same time when the memory
+            # can be extended or shrunk. No other reference to the buffer
+            # exists at this point.
+            self.array.resize(
+                (capacity,) + self.array.shape[1:], refcheck=False
+            )
+        else:
+            self.array.flush()
+            self.array = self._memmap(capacity)
+
+    def _to_list_mode(self, value):
+        if self.path is not None:
+            raise ValueError(
+                "When using `output_path`, all model outputs must be "
+                "arrays with at least one dimension and the same dtype and "
+                "per-sample shape in every batch. Received a batch output "
+                f"of type {type(value)} with "
+                f"shape={getattr(value, 'shape', None)}."
+            )
+        self.batches = []
+        start = 0
+        for batch_size in self.batch_sizes:
+            self.batches.append(self.array[start : start + batch_size])
+            start += batch_size
+        self.batches.append(value)
+        self.array = None
+
+    def _open_file(self, value, capacity):
+        self._dtype = value.dtype
+        self._sample_shape = value.shape[1:]
+        # Reserve room for the largest possible header so that it can be
+        # rewritten in place with the final shape.
+        self._header_size = len(
+            _npy_header(self._dtype, (2**63 - 1,) + self._sample_shape)
+        )
+        with open(self.path, "wb") as f:
+            f.write(
+                _npy_header(
+                    self._dtype,
+                    (capacity,) + self._sample_shape,
+                    self._header_size,
+                )
+            )
+        self.array = self._memmap(capacity)
+
+    def _memmap(self, capacity):
+        return np.memmap(
+            self.path,
+            dtype=self._dtype,
+            mode="r+",
+            offset=self._header_size,
+            shape=(capacity,) + self._sample_shape,
+        )
+
+    def _finalize_file(self):
+        self.array.flush()
+        self.array = None
+        shape = (self.size,) + self._sample_shape
+        with open(self.path, "r+b") as f:
+            f.write(_npy_header(self._dtype, shape, self._header_size))
+            f.truncate(
+                self._header_size + self._dtype.itemsize * math.prod(shape)
+            )
+        return np.load(self.path, mmap_mode="r")
+
+
+def _is_dense(value):
+    return isinstance(value, np.ndarray) and value.ndim > 0
+
+
+def _npy_header(dtype, shape, size=None):
+    """Returns a version 1.0 `.npy` header, padded to `size` bytes."""
+    header = repr(
+        {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": tuple(shape),
+        }
+    )
+    magic = np.lib.format.magic(1, 0)
+    # The header is terminated by a newline and padded with spaces so that
+    # the data starts at an aligned offset.
+    prefix_size = len(magic) + 2
+    if size is None:
+        size = prefix_size + len(header) + 1
+        size = 64 * math.ceil(size / 64)
+    header = header.ljust(size - prefix_size - 1) + "\n"
+    return magic + struct.pack("<H", len(header)) + header.encode("latin1")
@@ -0,0 +1,102 @@
+import os
+
+import numpy as np
+
+from keras.src import testing
+from keras.src.trainers import predict_utils
+
+
+def _batches(num_samples, batch_size, feature_dim=3):
+    data = np.random.random((num_samples, feature_dim)).astype("float32")
+    return data, [
+        data[i : i + batch_size] for i in range(0, num_samples, batch_size)
+    ]
+
+
+class PredictOutputsTest(testing.TestCase):
+    def test_preallocated(self):
+        data, batches = _batches(100, 16)
+        outputs = predict_utils.PredictOutputs(num_batches=len(batches))
+        for batch in batches:
+            outputs.append(batch)
+        result = outputs.result()
+        self.assertEqual(result.shape, (100, 3))
+        self.assertEqual(result.dtype, np.float32)
+        self.assertAllClose(result, data)
+
+    def test_unknown_num_batches_grows(self):
+        data, batches = _batches(100, 2)
+        outputs = predict_utils.PredictOutputs()
+        for batch in batches:
+            outputs.append(batch)
+        result = outputs.result()
+        self.assertAllClose(result, data)
+        # The result does not keep the larger buffer alive.
+        self.assertIsNone(result.base)
+        self.assertEqual(result.nbytes, data.nbytes)
+
+    def test_underestimated_num_batches_grows(self):
+        data, batches = _batches(100, 10)
+        outputs = predict_utils.PredictOutputs(num_batches=2)
+        for batch in batches:
+            outputs.append(batch)
+        self.assertAllClose(outputs.result(), data)
+
+    def test_nested_outputs(self):
+        data, batches = _batches(50, 8)
+        outputs = predict_utils.PredictOutputs(num_batches=len(batches))
+        for batch in batches:
+            outputs.append({"a": batch, "b": (batch[:, :1], batch * 2)})
+        result = outputs.result()
+        self.assertAllClose(result["a"], data)
+        self.assertAllClose(result["b"][0], data[:, :1])
+        self.assertAllClose(result["b"][1], data * 2)
+
+    def test_fallback_to_concat(self):
+        outputs = predict_utils.PredictOutputs(num_batches=3)
+        outputs.append(np.ones((2, 3)))
+        outputs.append(np.ones((2, 3)))
+        outputs.append(np.ones((2, 4)))
+        with self.assertRaisesRegex(ValueError, "dimensions"):
+            outputs.result()
+
+        outputs = predict_utils.PredictOutputs(num_batches=2)
+        outputs.append(np.ones((2, 3), dtype="float32"))
+        outputs.append(np.ones((2, 3), dtype="float64"))
+        result = outputs.result()
+        self.assertEqual(result.dtype, np.float64)
+        self.assertEqual(result.shape, (4, 3))
+
+    def test_output_path(self):
+        data, batches = _batches(100, 16)
+        path = os.path.join(self.get_temp_dir(), "predictions.npy")
+        outputs = predict_utils.PredictOutputs(
+            num_batches=len(batches) + 3, output_path=path
+        )
+        for batch in batches:
+            outputs.append(batch)
+        result = outputs.result()
+        self.assertIsInstance(result, np.memmap)
+        self.assertAllClose(result, data)
+        self.assertAllClose(np.load(path), data)
+
+    def test_output_path_growth_and_multiple_outputs(self):
+        data, batches = _batches(100, 16)
+        path = os.path.join(self.get_temp_dir(), "predictions")
+        outputs = predict_utils.PredictOutputs(output_path=path)
+        for batch in batches:
+            outputs.append((batch, batch[:, 0]))
+        result = outputs.result()
+        self.assertAllClose(result[0], data)
+        self.assertAllClose(result[1], data[:, 0])
+        self.assertAllClose(
+            np.load(os.path.join(path, "output_1.npy")), data[:, 0]
+        )
+
+    def test_output_path_requires_dense_outputs(self):
+        path = os.path.join(self.get_temp_dir(), "predictions.npy")
+        outputs = predict_utils.PredictOutputs(output_path=path)
+        outputs.append(np.ones((2, 3)))
+        outputs.append(np.ones((2, 4)))
+        with self.assertRaisesRegex(ValueError, "output_path"):
+            outputs.result()
@@ -449,6 +449,7 @@ class Trainer:
         validation_steps=None,
         validation_batch_size=None,
         validation_freq=1,
+        prefetch=0,
     ):
         """Trains the model for a fixed number of epochs (dataset iterations).
 
@@ -592,6 +593,12 @@ class Trainer:
                 Specifies how many training epochs to run
                 before a new validation run is performed,
                 e.g. `validation_freq=2` runs validation every 2 epochs.
+            prefetch: Integer. Number of batches to load ahead of time in a
+                background thread, so that data loading overlaps with the
+                execution of the training step. Also applies to the
+                validation data. With the TensorFlow backend, this is
+                applied as a `tf.data` prefetch of the input dataset.
+                Defaults to `0`, which disables prefetching.
 
         Unpacking behavior for iterator-like inputs:
             A common pattern is to pass an iterator like object such as a
@@ -702,7 +709,13 @@ class Trainer:
         raise NotImplementedError
 
     def predict(
-        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+        self,
+        x,
+        batch_size=None,
+        verbose="auto",
+        steps=None,
+        callbacks=None,
+        output_path=None,
     ):
         """Generates output predictions for the input samples.
 
@@ -749,12 +762,76 @@ class Trainer:
                 `predict()` will run until the input dataset is exhausted.
             callbacks: List of `keras.callbacks.Callback` instances.
                 List of callbacks to apply during prediction.
+            output_path: Optional path of a `.npy` file to stream the
+                predictions to, for predictions that do not fit in memory.
+                If the model has several outputs, `output_path` is treated
+                as a directory and output `i` (in flattened order) is
+                written to `output_{i}.npy` inside of it. Whenever
+                `output_path` is set, every returned array is a read-only
+                memory-mapped array backed by its file. Defaults to `None`.
 
         Returns:
             NumPy array(s) of predictions.
         """
         raise NotImplementedError
 
+    def predict_iter(
+        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+    ):
+        """Generates output predictions batch by batch.
+
+        Unlike `predict()`, which gathers the outputs for the whole input
+        before returning them, this method returns an iterator that yields the
+        outputs of every batch as soon as they are computed. Memory usage thus
+        stays constant regardless of the size of the input, which makes it
+        suitable for scoring datasets that do not fit in memory, e.g. by
+        writing each batch to disk or sending it over the network as it is
+        produced.
+
+        When `steps_per_execution` is set in `compile()`, each yielded element
+        holds the concatenated outputs of up to `steps_per_execution` batches.
+        Callbacks are called the same way as in `predict()`;
+        `on_predict_end()` is called once the iterator is exhausted or
+        closed.
+
+        Example:
+
+        ```python
+        for batch_predictions in model.predict_iter(x, batch_size=1024):
+            writer.write(batch_predictions)
+        ```
+
+        Args:
+            x: Input samples. It could be:
+                - A NumPy array (or array-like), or a list of arrays
+                    (in case the model has multiple inputs).
+                - A tensor, or a list of tensors
+                    (in case the model has multiple inputs).
+                - A `tf.data.Dataset`.
+                - A `keras.utils.PyDataset` instance.
+            batch_size: Integer or `None`.
+                Number of samples per batch.
+                If unspecified, `batch_size` will default to 32.
+                Do not specify the `batch_size` if your data is in the
+                form of dataset, generators, or `keras.utils.PyDataset`
+                instances (since they generate batches).
+            verbose: `"auto"`, 0, 1, or 2. Verbosity mode.
+                0 = silent, 1 = progress bar, 2 = single line.
+                `"auto"` becomes 1 for most cases. Defaults to `"auto"`.
+            steps: Total number of steps (batches of samples)
+                before declaring the prediction round finished.
+                Ignored with the default value of `None`.
+                If `x` is a `tf.data.Dataset` and `steps` is `None`,
+                iteration will run until the input dataset is exhausted.
+            callbacks: List of `keras.callbacks.Callback` instances.
+                List of callbacks to apply during prediction.
+
+        Returns:
+            An iterator yielding the NumPy array(s) of predictions of each
+            batch.
+        """
+        raise NotImplementedError
+
     def train_on_batch(
         self,
         x,
@@ -1,3 +1,4 @@
+import os
 from unittest import mock
 
 import numpy as np
@@ -170,7 +171,6 @@ def sparse_generator(generator_type):
 
 
 class TestTrainer(testing.TestCase, parameterized.TestCase):
-    @pytest.mark.requires_trainable_backend
     def test_metric_tracking(self):
         class ModelWithMetric(Trainer, layers.Dense):
             def __init__(self, units):
@@ -248,7 +248,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
             ("steps_per_epoch_jit", False, True, True),
         ]
     )
-    @pytest.mark.requires_trainable_backend
     def test_fit_flow(self, run_eagerly, jit_compile, use_steps_per_epoch):
         if not run_eagerly and not jit_compile and use_steps_per_epoch:
             if backend.backend() == "tensorflow":
@@ -288,6 +287,44 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
             atol=0.6,  # TODO: abnormal results for certain configs.
         )
 
+    @parameterized.named_parameters(
+        [
+            ("default", False),
+            ("steps_per_epoch", True),
+        ]
+    )
+    def test_fit_with_prefetch(self, use_steps_per_epoch):
+        batch_size = 20
+        steps_per_epoch = 5
+        x = np.ones((batch_size * steps_per_epoch, 4))
+        y = np.zeros((batch_size * steps_per_epoch, 3))
+
+        def fit(prefetch):
+            model = ExampleModel(units=3)
+            model.compile(
+                optimizer=optimizers.SGD(),
+                loss=losses.MeanSquaredError(),
+                metrics=[metrics.MeanSquaredError()],
+            )
+            history = model.fit(
+                x,
+                y,
+                batch_size=batch_size,
+                steps_per_epoch=(
+                    steps_per_epoch if use_steps_per_epoch else None
+                ),
+                epochs=3,
+                validation_data=(x, y),
+                shuffle=False,
+                prefetch=prefetch,
+            )
+            return history.history
+
+        history = fit(prefetch=0)
+        prefetched_history = fit(prefetch=3)
+        self.assertAllClose(history["loss"], prefetched_history["loss"])
+        self.assertAllClose(history["val_loss"], prefetched_history["val_loss"])
+
     @parameterized.named_parameters(
         [
             ("eager", True, False, False),
@@ -298,7 +335,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
             ("steps_per_epoch_jit", False, True, True),
         ]
     )
-    @pytest.mark.requires_trainable_backend
     def test_fit_with_val_split(
         self, run_eagerly, jit_compile, use_steps_per_epoch
     ):
@@ -351,7 +387,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         self.assertIn("loss", history)
         self.assertIn("val_loss", history)
 
-    @pytest.mark.requires_trainable_backend
     def test_fit_with_custom_train_step(self):
         if backend.backend() == "jax":
             model = JaxCustomTrainTestStepModel(units=3)
@@ -440,7 +475,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         self.assertAllClose(output["mean_squared_error"], 16.0)
 
     @parameterized.named_parameters([("flat", False), ("dict", True)])
-    @pytest.mark.requires_trainable_backend
     def test_evaluate_with_custom_test_step(self, return_dict):
         if backend.backend() == "jax":
             model = JaxCustomTrainTestStepModel(units=3)
@@ -527,6 +561,93 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         self.assertAllClose(outputs["y_one"], 4 * np.ones((100, 3)))
         self.assertAllClose(outputs["y_two"], 4 * np.ones((100, 3)))
 
+    @parameterized.named_parameters(
+        [
+            ("eager", True, False),
+            ("graph_fn", False, False),
+            ("jit", False, True),
+        ]
+    )
+    def test_predict_iter(self, run_eagerly, jit_compile):
+        model = StructModel(units=3)
+        model.run_eagerly = run_eagerly
+        model.jit_compile = jit_compile
+
+        x = {
+            "x_one": np.random.random((100, 4)),
+            "x_two": np.random.random((100, 4)),
+        }
+        batches = list(model.predict_iter(x, batch_size=16))
+        self.assertLen(batches, 7)
+        for batch in batches:
+            self.assertIsInstance(batch["y_one"], np.ndarray)
+        self.assertEqual(batches[0]["y_one"].shape, (16, 3))
+        self.assertEqual(batches[-1]["y_one"].shape, (4, 3))
+        outputs = model.predict(x, batch_size=16)
+        for key in ("y_one", "y_two"):
+            self.assertAllClose(
+                np.concatenate([batch[key] for batch in batches]),
+                outputs[key],
+            )
+
+    @pytest.mark.skipif(
+        backend.backend() == "torch",
+        reason="`steps_per_execution` not implemented for torch yet",
+    )
+    def test_predict_iter_steps_per_execution(self):
+        model = ExampleModel(units=3)
+        model.compile(loss="mse", optimizer="sgd", steps_per_execution=3)
+        x = np.ones((100, 4))
+        batches = list(model.predict_iter(x, batch_size=16, verbose=0))
+        self.assertEqual([len(batch) for batch in batches], [48, 48, 4])
+        self.assertAllClose(np.concatenate(batches), 4 * np.ones((100, 3)))
+
+    def test_predict_iter_callbacks(self):
+        class CallbackCounter(Callback):
+            def __init__(self):
+                super().__init__()
+                self.batch_ends = 0
+                self.ended = False
+
+            def on_predict_batch_end(self, batch, logs=None):
+                self.batch_ends += 1
+
+            def on_predict_end(self, logs=None):
+                self.ended = True
+
+        model = ExampleModel(units=3)
+        counter = CallbackCounter()
+        iterator = model.predict_iter(
+            np.ones((100, 4)), batch_size=10, callbacks=[counter], verbose=0
+        )
+        self.assertAllClose(next(iterator), 4 * np.ones((10, 3)))
+        self.assertAllClose(next(iterator), 4 * np.ones((10, 3)))
+        self.assertEqual(counter.batch_ends, 2)
+        self.assertFalse(counter.ended)
+        iterator.close()
+        self.assertTrue(counter.ended)
+
+        # The model stays usable after stopping early.
+        self.assertAllClose(
+            model.predict(np.ones((2, 4)), verbose=0), 4 * np.ones((2, 3))
+        )
+
+    def test_predict_with_output_path(self):
+        model = StructModel(units=3)
+        x = {
+            "x_one": np.ones((100, 4)),
+            "x_two": np.ones((100, 4)),
+        }
+        output_path = os.path.join(self.get_temp_dir(), "predictions")
+        outputs = model.predict(x, batch_size=16, output_path=output_path)
+        self.assertIsInstance(outputs, dict)
+        self.assertIsInstance(outputs["y_one"], np.memmap)
+        self.assertAllClose(outputs["y_one"], 4 * np.ones((100, 3)))
+        self.assertAllClose(outputs["y_two"], 4 * np.ones((100, 3)))
+        self.assertEqual(
+            sorted(os.listdir(output_path)), ["output_0.npy", "output_1.npy"]
+        )
+
     @parameterized.named_parameters(
         named_product(
             generator_type=["tf", "jax", "scipy"], mode=["eager", "graph"]
@@ -605,7 +726,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
             callbacks=[ModelWeightCheck()],
         )
 
-    @pytest.mark.requires_trainable_backend
     @pytest.mark.skipif(
         backend.backend() == "torch",
         reason="`steps_per_execution` not implemented for torch yet",
@@ -677,7 +797,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         model.evaluate(x, y, batch_size=batch_size, callbacks=[step_count])
         self.assertEqual(step_count.test_count, 3)
 
-    @pytest.mark.requires_trainable_backend
     def test_fit_with_different_batch_size_same_loss(self):
         x = np.random.rand(100, 4)
         y = np.ones((100, 1))
@@ -697,7 +816,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         loss2 = model.evaluate(x, y, batch_size=100)
         self.assertAllClose(loss1, loss2)
 
-    @pytest.mark.requires_trainable_backend
     def test_adds_loss_scaling_optimizer(self):
         model = TrainingTestingLayer(dtype="mixed_float16")
         model.compile(optimizer="rmsprop", loss="mse")
@@ -720,7 +838,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         model.fit(x, y, batch_size=32)
         self.assertIsInstance(model.optimizer, RMSprop)
 
-    @pytest.mark.requires_trainable_backend
     @pytest.mark.skipif(
         backend.backend() == "torch",
         reason="half precision unsupported on torch CPU.",
@@ -767,7 +884,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         # With autoscaling, the first dense will update.
         self.assertNotEqual(first_kernel, np.ones_like(first_kernel))
 
-    @pytest.mark.requires_trainable_backend
     def test_training_arg(self):
         model = TrainingTestingLayer()
         model.compile(optimizer="rmsprop", loss="mse")
@@ -787,7 +903,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
             ("jit", False, True),
         ]
     )
-    @pytest.mark.requires_trainable_backend
     def test_on_batch_methods(self, run_eagerly, jit_compile):
         model = ExampleModel(units=3)
         x = np.ones((100, 4))
@@ -891,7 +1006,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         out = model.predict({"a": x1, "b": x2})
         self.assertEqual(out.shape, (3, 4))
 
-    @pytest.mark.requires_trainable_backend
     def test_for_eval_epoch_iterator(self):
         model = ExampleModel(units=3)
         model.compile(
@@ -934,7 +1048,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         )
         assert getattr(model, "_eval_epoch_iterator", None) is None
 
-    @pytest.mark.requires_trainable_backend
     def test_callback_methods_keys(self):
         class CustomCallback(Callback):
             def on_train_begin(self, logs=None):
@@ -1021,7 +1134,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         model.evaluate(x_test, y_test, batch_size=4)
         model.predict(x_test, batch_size=4)
 
-    @pytest.mark.requires_trainable_backend
     def test_internal_only_loss(self):
         class LossLayer(layers.Layer):
             def call(self, x):
@@ -1081,7 +1193,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
             },
         ]
     )
-    @pytest.mark.requires_trainable_backend
     @pytest.mark.skipif(
         keras.backend.backend() != "tensorflow",
         reason="Only tensorflow supports raggeds",
@@ -1127,7 +1238,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         out3 = model.predict_on_batch(np.ones((2, 20)))
         self.assertGreater(5, np.sum(np.abs(out2 - out3)))
 
-    @pytest.mark.requires_trainable_backend
     def test_recompile(self):
         model = ExampleModel(units=3)
         model.compile(
@@ -1181,7 +1291,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         self.assertEqual(eval_out[1], 1.0)
         self.assertEqual(eval_out[2], 0.0)
 
-    @pytest.mark.requires_trainable_backend
     def test_nested_inputs(self):
         model = ListInputModel(units=2)
         out = model([np.ones((3, 2)), np.ones((3, 3))])
@@ -1208,7 +1317,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         predict_out = model.predict_on_batch([np.ones((3, 2)), np.ones((3, 3))])
         self.assertEqual(predict_out.shape, (3, 2))
 
-    @pytest.mark.requires_trainable_backend
     def test_validation_data_infinite_generator(self):
         # Test that you can pass an infinite generator to `validation_data`
         # arg of fit() as well as a `validation_steps` argument and that
@@ -1252,7 +1360,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
             ("predict", "predict", "predicting", "predict"),
         ]
     )
-    @pytest.mark.requires_trainable_backend
     def test_stop_loop(self, method, method_gerund, on_end_name):
         model = ExampleModel(units=3)
         model.compile(optimizer="sgd", loss="mse", metrics=["mse"])
@@ -1283,7 +1390,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         )
         self.assertEqual(stopper.counter, stop_count)
 
-    @pytest.mark.requires_trainable_backend
     def test_constraints_are_applied(self):
         model = models.Sequential(
             [layers.Dense(2, kernel_constraint="non_neg")]
@@ -1296,7 +1402,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
             np.min(backend.convert_to_numpy(model.layers[0].kernel)), 0.0
         )
 
-    @pytest.mark.requires_trainable_backend
     def test_rng_updated_during_predict(self):
         class TestTimeDropout(layers.Layer):
             def __init__(self):
@@ -1318,7 +1423,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         out_2 = model.predict(x)
         self.assertGreater(np.mean(np.abs(out_1 - out_2)), 0.01)
 
-    @pytest.mark.requires_trainable_backend
     def test_callbacks_can_update_state_at_batch_boundary(self):
 
         class CounterModel(keras.Model):
@@ -1385,7 +1489,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         self.assertAlmostEqual(cbk.eager_call_counter_predict, 4)
         self.assertAlmostEqual(model.predict_counter.numpy(), 4)
 
-    @pytest.mark.requires_trainable_backend
     def test_metric_update_in_compute_loss(self):
 
         class MyModel(keras.Model):
@@ -1413,7 +1516,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
             history.history["custom"][0], history.history["loss"][0] * 4
         )
 
-    @pytest.mark.requires_trainable_backend
     def test_fwd_pass_loss_presence_in_compute_loss(self):
 
         class MyModel(keras.Model):
@@ -1439,7 +1541,6 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         history = model.fit(x, y)
         self.assertGreater(history.history["custom"][0], 0.0)
 
-    @pytest.mark.requires_trainable_backend
     def test_loss_weights(self):
         epochs = 3
         batch_size = 20
@@ -7,4 +7,5 @@ from keras.src.tree.tree_api import map_structure
 from keras.src.tree.tree_api import map_structure_up_to
 from keras.src.tree.tree_api import pack_sequence_as
 from keras.src.tree.tree_api import register_tree_node_class
+from keras.src.tree.tree_api import structure_spec
 from keras.src.tree.tree_api import traverse
@@ -133,6 +133,53 @@ def lists_to_tuples(structure):
     )
 
 
+class StructureSpec:
+    """The structure of a nested structure.
+
+    See `keras.src.tree.structure_spec()`.
+    """
+
+    __slots__ = ("structure", "num_leaves")
+
+    def __init__(self, structure):
+        self.structure = map_structure(lambda _: None, structure)
+        self.num_leaves = len(dmtree.flatten(structure))
+
+    def flatten(self, structure):
+        return dmtree.flatten_up_to(self.structure, structure)
+
+    def unflatten(self, leaves):
+        if len(leaves) != self.num_leaves:
+            raise ValueError(
+                f"Expected {self.num_leaves} leaves for {self.structure}. "
+                f"Received {len(leaves)} leaves: {leaves}"
+            )
+        return dmtree.unflatten_as(self.structure, leaves)
+
+    def map_structure(self, func, *structures):
+        return dmtree.map_structure_up_to(self.structure, func, *structures)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, StructureSpec)
+            and self.structure == other.structure
+        )
+
+    def __hash__(self):
+        # Dicts are unhashable: hash the paths of the leaves, which are the
+        # same for structures that compare equal.
+        return hash(
+            tuple(path for path, _ in dmtree.flatten_with_path(self.structure))
+        )
+
+    def __repr__(self):
+        return f"StructureSpec({self.structure})"
+
+
+def structure_spec(structure):
+    return StructureSpec(structure)
+
+
 def is_shape_tuple(x):
     if isinstance(x, (list, tuple)):
         if all(isinstance(e, (int, type(None))) for e in x):
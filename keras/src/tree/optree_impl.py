@@ -193,6 +193,59 @@ def map_shape_structure(func, structure):
     )
 
 
+class StructureSpec:
+    """The compiled treedef of a nested structure.
+
+    See `keras.src.tree.structure_spec()`.
+    """
+
+    __slots__ = ("treespec", "num_leaves")
+
+    def __init__(self, treespec):
+        self.treespec = treespec
+        self.num_leaves = treespec.num_leaves
+
+    def flatten(self, structure):
+        try:
+            return self.treespec.flatten_up_to(structure)
+        except ValueError as e:
+            raise ValueError(
+                f"Expected a structure matching {self.treespec}. "
+                f"Received: structure={structure}"
+            ) from e
+
+    def unflatten(self, leaves):
+        if len(leaves) != self.num_leaves:
+            raise ValueError(
+                f"Expected {self.num_leaves} leaves for {self.treespec}. "
+                f"Received {len(leaves)} leaves: {leaves}"
+            )
+        return self.treespec.unflatten(leaves)
+
+    def map_structure(self, func, *structures):
+        flat_structures = [self.flatten(s) for s in structures]
+        return self.treespec.unflatten(
+            [func(*leaves) for leaves in zip(*flat_structures)]
+        )
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, StructureSpec) and self.treespec == other.treespec
+        )
+
+    def __hash__(self):
+        return hash(self.treespec)
+
+    def __repr__(self):
+        return f"StructureSpec({self.treespec})"
+
+
+def structure_spec(structure):
+    return StructureSpec(
+        optree.tree_structure(structure, none_is_leaf=True, namespace="keras")
+    )
+
+
 class _MapToNone:
     """A special object used as a sentinel within `traverse`."""
 
@@ -264,6 +264,47 @@ def pack_sequence_as(structure, flat_sequence, sequence_fn=None):
     )
 
 
+def structure_spec(structure):
+    """Returns the `StructureSpec` of a nested structure.
+
+    A `StructureSpec` holds the compiled treedef of a structure, so that
+    values of the same structure can be flattened and packed again without
+    deriving the treedef from scratch at each call. It is meant for the
+    structures that are traversed at every step, e.g. the outputs of a model:
+    get the spec once, then call its methods:
+
+    - `spec.flatten(structure)`: Returns the leaves of a structure matching
+        the spec. Leaves of the spec match any value, as in
+        `map_structure_up_to()`. Raises a `ValueError` if the containers of
+        `structure` don't match the spec.
+    - `spec.unflatten(leaves)`: Packs a flat sequence into the structure, as
+        `pack_sequence_as()`.
+    - `spec.map_structure(func, *structures)`: As `map_structure()`, for
+        structures matching the spec.
+    - `spec.num_leaves`: The number of leaves of the structure.
+
+    Specs aren't cached: each call derives a new treedef from `structure`,
+    so keep the spec rather than calling `structure_spec()` at every step.
+    Specs of structures with the same containers compare equal and have the
+    same hash. Packing dicts follows the key order of `structure`.
+
+    Example:
+
+    >>> spec = structure_spec({"b": 1, "a": (2, 3)})
+    >>> spec.flatten({"b": 4, "a": (5, 6)})
+    [5, 6, 4]
+    >>> spec.unflatten([7, 8, 9])
+    {'b': 9, 'a': (7, 8)}
+
+    Args:
+        structure: A nested structure.
+
+    Returns:
+        A `StructureSpec`.
+    """
+    return tree_impl.structure_spec(structure)
+
+
 @keras_export("keras.tree.lists_to_tuples")
 def lists_to_tuples(structure):
     return tree_impl.lists_to_tuples(structure)
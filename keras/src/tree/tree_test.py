@@ -248,3 +248,39 @@ class TreeTest(testing.TestCase):
             ],
             visited,
         )
+
+    def test_structure_spec(self):
+        structure = {"b": (1, None), "a": [2, {"c": 3}]}
+        spec = tree.structure_spec(structure)
+        self.assertEqual(spec.num_leaves, 4)
+        self.assertEqual(spec.flatten(structure), tree.flatten(structure))
+        self.assertEqual(
+            spec.unflatten([4, 5, 6, 7]),
+            {"b": (6, 7), "a": [4, {"c": 5}]},
+        )
+        self.assertEqual(
+            spec.map_structure(lambda x, y: (x, y), structure, structure),
+            tree.map_structure(lambda x, y: (x, y), structure, structure),
+        )
+        # Leaves of the spec match any value.
+        self.assertEqual(
+            spec.flatten({"b": ((1, 2), 3), "a": [4, {"c": [5]}]}),
+            [4, [5], (1, 2), 3],
+        )
+        self.assertEqual(
+            tree.structure_spec({"a": [4, {"c": 5}], "b": (6, 7)}), spec
+        )
+        self.assertNotEqual(tree.structure_spec({"a": [4], "b": (6, 7)}), spec)
+        self.assertEqual(
+            hash(tree.structure_spec({"a": [4, {"c": 5}], "b": (6, 7)})),
+            hash(spec),
+        )
+        # Packing follows the key order of each structure.
+        self.assertEqual(list(spec.unflatten([4, 5, 6, 7])), ["b", "a"])
+        other_spec = tree.structure_spec({"a": [4, {"c": 5}], "b": (6, 7)})
+        self.assertEqual(list(other_spec.unflatten([4, 5, 6, 7])), ["a", "b"])
+
+        with self.assertRaisesRegex(ValueError, "Expected"):
+            spec.flatten({"b": (1, 2), "a": [3]})
+        with self.assertRaisesRegex(ValueError, "Expected 4 leaves"):
+            spec.unflatten([1, 2, 3])
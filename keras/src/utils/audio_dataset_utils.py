@@ -24,6 +24,7 @@ def audio_dataset_from_directory(
     subset=None,
     follow_links=False,
     verbose=True,
+    index_cache=None,
 ):
     """Generates a `tf.data.Dataset` from audio files in a directory.
 
@@ -93,6 +94,11 @@ def audio_dataset_from_directory(
             Defaults to `False`.
         verbose: Whether to display number information on classes and
             number of files found. Defaults to `True`.
+        index_cache: Optional path of a file in which to cache the list of
+            files of `directory`, to speed up later calls. Only the
+            subdirectories that were modified since the file was written are
+            listed again. The file should not be located in `directory`.
+            Defaults to `None`.
 
     Returns:
 
@@ -188,6 +194,7 @@ def audio_dataset_from_directory(
         seed=seed,
         follow_links=follow_links,
         verbose=verbose,
+        index_cache=index_cache,
     )
 
     if label_mode == "binary" and len(class_names) != 2:
@@ -1,7 +1,10 @@
+import io
+import json
 import os
 import random
 import time
 import warnings
+import zipfile
 from multiprocessing.pool import ThreadPool
 
 import numpy as np
@@ -498,6 +501,7 @@ def index_directory(
     seed=None,
     follow_links=False,
     verbose=True,
+    index_cache=None,
 ):
     """List all files in `directory`, with their labels.
 
@@ -526,6 +530,11 @@ def index_directory(
         follow_links: Whether to visits subdirectories pointed to by symlinks.
         verbose: Whether the function prints number of files found and classes.
             Defaults to `True`.
+        index_cache: Optional path of a file in which to cache the index of
+            `directory`. The cache records the modification time of each
+            walked directory, and the subdirectories whose directories have
+            not been modified since are not walked again. It should not be
+            located in `directory`.
 
     Returns:
         tuple (file_paths, labels, class_names).
@@ -567,34 +576,58 @@ def index_directory(
                     "will be the sorted list of labels)."
                 )
     class_names = subdirs
-    class_indices = dict(zip(class_names, range(len(class_names))))
 
     # Build an index of the files
     # in the different class subfolders.
+    if index_cache is not None:
+        cached_entries = _load_index_cache(
+            index_cache, directory, formats, follow_links
+        )
+    else:
+        cached_entries = {}
     pool = ThreadPool()
     results = []
-    filenames = []
-
-    for dirpath in (tf.io.gfile.join(directory, subdir) for subdir in subdirs):
+    for subdir in subdirs:
         results.append(
             pool.apply_async(
-                index_subdirectory,
-                (dirpath, class_indices, follow_links, formats),
+                _index_subdirectory_or_reuse,
+                (
+                    directory,
+                    subdir,
+                    follow_links,
+                    formats,
+                    cached_entries.get(subdir),
+                ),
             )
         )
-    labels_list = []
-    for res in results:
-        partial_filenames, partial_labels = res.get()
-        labels_list.append(partial_labels)
-        filenames += partial_filenames
+    entries = {}
+    filenames = []
+    num_files = []
+    for subdir, res in zip(subdirs, results):
+        entry = res.get()
+        entries[subdir] = entry
+        filenames += entry["filenames"]
+        num_files.append(len(entry["filenames"]))
+    pool.close()
+    pool.join()
+    if index_cache is not None and any(
+        entry is not cached_entries.get(subdir)
+        for subdir, entry in entries.items()
+    ):
+        # Keep the entries of the subdirectories not indexed by this call.
+        _save_index_cache(
+            index_cache,
+            directory,
+            formats,
+            follow_links,
+            {**cached_entries, **entries},
+        )
 
     if labels == "inferred":
         # Inferred labels.
-        i = 0
-        labels = np.zeros((len(filenames),), dtype="int32")
-        for partial_labels in labels_list:
-            labels[i : i + len(partial_labels)] = partial_labels
-            i += len(partial_labels)
+        labels = np.repeat(
+            np.arange(len(class_names), dtype="int32"), num_files
+        )
     elif labels is None:
         class_names = None
     else:
@@ -615,34 +648,39 @@ def index_directory(
                 f"Found {len(filenames)} files belonging "
                 f"to {len(class_names)} classes."
             )
-    pool.close()
-    pool.join()
-    file_paths = [tf.io.gfile.join(directory, fname) for fname in filenames]
 
     if shuffle:
-        # Shuffle globally to erase macro-structure
+        # Shuffle globally to erase macro-structure. The permutation is the
+        # one `RandomState(seed).shuffle()` applies to a list of this length.
         if seed is None:
             seed = np.random.randint(1e6)
-        rng = np.random.RandomState(seed)
-        rng.shuffle(file_paths)
+        order = np.random.RandomState(seed).permutation(len(filenames))
+        filenames = [filenames[i] for i in order]
         if labels is not None:
-            rng = np.random.RandomState(seed)
-            rng.shuffle(labels)
+            labels = np.asarray(labels)[order]
+    # `join(directory, fname) == join(directory, "") + fname` for relative
+    # `fname`, without the overhead of `join()` for each file.
+    prefix = tf.io.gfile.join(directory, "")
+    file_paths = [prefix + fname for fname in filenames]
     return file_paths, labels, class_names
 
 
-def iter_valid_files(directory, follow_links, formats):
+def iter_valid_files(directory, follow_links, formats, visited_dirs=None):
     if not follow_links:
         walk = tf.io.gfile.walk(directory)
     else:
         walk = os.walk(directory, followlinks=follow_links)
     for root, _, files in sorted(walk, key=lambda x: x[0]):
+        if visited_dirs is not None:
+            visited_dirs.append(root)
         for fname in sorted(files):
             if fname.lower().endswith(formats):
                 yield root, fname
 
 
-def index_subdirectory(directory, class_indices, follow_links, formats):
+def index_subdirectory(
+    directory, class_indices, follow_links, formats, visited_dirs=None
+):
     """Recursively walks directory and list image paths and their class index.
 
     Args:
@@ -651,6 +689,8 @@ def index_subdirectory(directory, class_indices, follow_links, formats):
         follow_links: boolean, whether to recursively follow subdirectories
             (if False, we only list top-level images in `directory`).
         formats: Allowlist of file extensions to index (e.g. ".jpg", ".txt").
+        visited_dirs: Optional list, to which the paths of the walked
+            directories are appended.
 
     Returns:
         tuple `(filenames, labels)`. `filenames` is a list of relative file
@@ -658,7 +698,9 @@ def index_subdirectory(directory, class_indices, follow_links, formats):
             to these files.
     """
     dirname = os.path.basename(directory)
-    valid_files = iter_valid_files(directory, follow_links, formats)
+    valid_files = iter_valid_files(
+        directory, follow_links, formats, visited_dirs=visited_dirs
+    )
     labels = []
     filenames = []
     for root, fname in valid_files:
@@ -671,6 +713,155 @@ def index_subdirectory(directory, class_indices, follow_links, formats):
     return filenames, labels
 
 
+# Version of the format of the files written by `_save_index_cache()`.
+_INDEX_CACHE_VERSION = 1
+# Directories modified less than this many seconds before they are walked
+# may be modified again within the same mtime tick, which would go unnoticed:
+# their mtime is not recorded, and they are walked again by the next call.
+_INDEX_CACHE_MTIME_MARGIN = 2
+
+
+def _directory_mtime(path):
+    """Returns the mtime of a directory in nanoseconds, or `None`."""
+    try:
+        if "://" not in path:
+            # `tf.io.gfile.stat()` truncates local mtimes to seconds.
+            mtime = os.stat(path).st_mtime_ns
+        else:
+            mtime = tf.io.gfile.stat(path).mtime_nsec
+    except (OSError, tf.errors.OpError):
+        return None
+    # Object stores report no mtime for directories.
+    return mtime or None
+
+
+def _index_subdirectory_or_reuse(
+    directory, subdir, follow_links, formats, cached_entry
+):
+    """Returns the index entry of a subdirectory of `directory`.
+
+    `cached_entry` is returned if none of the directories it was built from
+    have been modified since. Otherwise, the subdirectory is walked again.
+
+    Returns:
+        A dict with keys `"filenames"`, the list of paths of the files of
+        the subdirectory, relative to `directory`, and `"dirs"`, a list of
+        `(path, mtime)` tuples for the walked directories, with paths
+        relative to `directory`, and mtimes in nanoseconds, or `None` if
+        unknown.
+    """
+    if cached_entry is not None and all(
+        mtime is not None
+        and _directory_mtime(tf.io.gfile.join(directory, path)) == mtime
+        for path, mtime in cached_entry["dirs"]
+    ):
+        return cached_entry
+    dirpath = tf.io.gfile.join(directory, subdir)
+    start_time = time.time_ns()
+    visited_dirs = []
+    filenames, _ = index_subdirectory(
+        dirpath,
+        {os.path.basename(dirpath): 0},
+        follow_links,
+        formats,
+        visited_dirs=visited_dirs,
+    )
+    dirs = []
+    for root in visited_dirs:
+        mtime = _directory_mtime(root)
+        if mtime is not None and (
+            mtime > start_time - _INDEX_CACHE_MTIME_MARGIN * 10**9
+        ):
+            mtime = None
+        dirs.append((os.path.relpath(root, directory), mtime))
+    return {"filenames": filenames, "dirs": dirs}
+
+
+def _load_index_cache(path, directory, formats, follow_links):
+    """Loads the entries saved by `_save_index_cache()`.
+
+    Returns:
+        A dict mapping subdirectories to their entry, as returned by
+        `_index_subdirectory_or_reuse()`. The dict is empty if `path` does
+        not exist, or was saved for different arguments.
+    """
+    if not tf.io.gfile.exists(path):
+        return {}
+    try:
+        with tf.io.gfile.GFile(path, "rb") as f:
+            data = np.load(f, allow_pickle=False)
+            header = json.loads(data["header"].tobytes().decode("utf-8"))
+            filenames = data["filenames"].tobytes().decode("utf-8")
+    except (
+        EOFError,
+        KeyError,
+        OSError,
+        ValueError,
+        zipfile.BadZipFile,
+        tf.errors.OpError,
+    ):
+        warnings.warn(
+            f"Could not read the index cache {path}. "
+            "The directory will be indexed again.",
+            stacklevel=2,
+        )
+        return {}
+    if header["version"] != _INDEX_CACHE_VERSION or header["key"] != (
+        _index_cache_key(directory, formats, follow_links)
+    ):
+        return {}
+    filenames = filenames.split("\0") if filenames else []
+    entries = {}
+    start = 0
+    for subdir, dirs, num_files in header["entries"]:
+        entries[subdir] = {
+            "filenames": filenames[start : start + num_files],
+            "dirs": [tuple(d) for d in dirs],
+        }
+        start += num_files
+    return entries
+
+
+def _save_index_cache(path, directory, formats, follow_links, entries):
+    """Saves index entries to `path`.
+
+    The file is a `.npz` archive of two byte arrays: a JSON header with the
+    arguments of the index and the directories of each entry, and the
+    null-separated file names of all the entries.
+    """
+    header = {
+        "version": _INDEX_CACHE_VERSION,
+        "key": _index_cache_key(directory, formats, follow_links),
+        "entries": [
+            (subdir, entry["dirs"], len(entry["filenames"]))
+            for subdir, entry in entries.items()
+        ],
+    }
+    filenames = "\0".join(
+        fname for entry in entries.values() for fname in entry["filenames"]
+    )
+    # `GFile` is not seekable in write mode.
+    buffer = io.BytesIO()
+    np.savez(
+        buffer,
+        header=np.frombuffer(json.dumps(header).encode("utf-8"), dtype="uint8"),
+        filenames=np.frombuffer(filenames.encode("utf-8"), dtype="uint8"),
+    )
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with tf.io.gfile.GFile(tmp_path, "wb") as f:
+        f.write(buffer.getvalue())
+    # Replace the previous cache at once for concurrent readers.
+    tf.io.gfile.rename(tmp_path, path, overwrite=True)
+
+
+def _index_cache_key(directory, formats, follow_links):
+    return [
+        os.path.abspath(directory) if "://" not in directory else directory,
+        sorted(formats),
+        bool(follow_links),
+    ]
+
+
 def get_training_or_validation_split(samples, labels, validation_split, subset):
     """Potentially restict samples & labels to a training or validation split.
 
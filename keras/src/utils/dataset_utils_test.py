@@ -1,6 +1,10 @@
+import os
+from unittest import mock
+
 import numpy as np
 
 from keras.src.testing import test_case
+from keras.src.utils import dataset_utils
 from keras.src.utils.dataset_utils import split_dataset
 from keras.src.utils.module_utils import tensorflow as tf
 
@@ -332,3 +336,148 @@ class DatasetUtilsTest(test_case.TestCase):
             [sample for sample in dataset_right][0][0].shape,
             (100, 10, 30, n_cols),
         )
+
+    def _prepare_directory(self):
+        directory = self.get_temp_dir()
+        for class_name in ("class_a", "class_b"):
+            os.makedirs(os.path.join(directory, class_name, "nested"))
+            for i in range(3):
+                for path in (class_name, os.path.join(class_name, "nested")):
+                    filename = os.path.join(directory, path, f"{i}.txt")
+                    with open(filename, "w") as f:
+                        f.write("text")
+        self._set_old_mtimes(directory)
+        return directory
+
+    def _set_old_mtimes(self, directory, age=3600):
+        # Directories modified within the last seconds are not cached.
+        for root, _, _ in os.walk(directory):
+            mtime = os.stat(root).st_mtime - age
+            os.utime(root, (mtime, mtime))
+
+    def test_index_directory_shuffle(self):
+        directory = self._prepare_directory()
+        file_paths, labels, class_names = dataset_utils.index_directory(
+            directory, "inferred", formats=(".txt",), shuffle=False
+        )
+        self.assertEqual(class_names, ["class_a", "class_b"])
+        self.assertEqual(
+            file_paths[:4],
+            [
+                os.path.join(directory, "class_a", name)
+                for name in ("0.txt", "1.txt", "2.txt", "nested/0.txt")
+            ],
+        )
+        self.assertAllEqual(labels, [0] * 6 + [1] * 6)
+
+        # Same order as shuffling the lists with `RandomState.shuffle()`.
+        expected_paths = list(file_paths)
+        np.random.RandomState(1337).shuffle(expected_paths)
+        expected_labels = list(labels)
+        np.random.RandomState(1337).shuffle(expected_labels)
+        file_paths, labels, _ = dataset_utils.index_directory(
+            directory, "inferred", formats=(".txt",), seed=1337
+        )
+        self.assertEqual(file_paths, expected_paths)
+        self.assertAllEqual(labels, expected_labels)
+
+    def test_index_directory_cache(self):
+        directory = self._prepare_directory()
+        index_cache = os.path.join(self.get_temp_dir(), "index")
+        expected = dataset_utils.index_directory(
+            directory, "inferred", formats=(".txt",), seed=1
+        )
+        outputs = dataset_utils.index_directory(
+            directory,
+            "inferred",
+            formats=(".txt",),
+            seed=1,
+            index_cache=index_cache,
+        )
+        self.assertTrue(os.path.exists(index_cache))
+        self.assertEqual(outputs[0], expected[0])
+        self.assertAllEqual(outputs[1], expected[1])
+        self.assertEqual(outputs[2], expected[2])
+
+        # No subdirectory is walked again.
+        with mock.patch.object(
+            dataset_utils,
+            "index_subdirectory",
+            wraps=dataset_utils.index_subdirectory,
+        ) as index_subdirectory:
+            outputs = dataset_utils.index_directory(
+                directory,
+                "inferred",
+                formats=(".txt",),
+                seed=1,
+                index_cache=index_cache,
+            )
+            self.assertEqual(index_subdirectory.call_count, 0)
+        self.assertEqual(outputs[0], expected[0])
+        self.assertAllEqual(outputs[1], expected[1])
+
+        # Only the modified subdirectory is walked again.
+        nested_directory = os.path.join(directory, "class_b", "nested")
+        with open(os.path.join(nested_directory, "3.txt"), "w"):
+            pass
+        self._set_old_mtimes(nested_directory)
+        with mock.patch.object(
+            dataset_utils,
+            "index_subdirectory",
+            wraps=dataset_utils.index_subdirectory,
+        ) as index_subdirectory:
+            file_paths, labels, _ = dataset_utils.index_directory(
+                directory,
+                "inferred",
+                formats=(".txt",),
+                shuffle=False,
+                index_cache=index_cache,
+            )
+            self.assertEqual(index_subdirectory.call_count, 1)
+            self.assertEqual(
+                index_subdirectory.call_args.args[0],
+                os.path.join(directory, "class_b"),
+            )
+        self.assertLen(file_paths, 13)
+        self.assertEqual(
+            file_paths[-1], os.path.join(directory, "class_b", "nested/3.txt")
+        )
+        self.assertAllEqual(labels, [0] * 6 + [1] * 7)
+
+        # The cache is not used with different arguments.
+        file_paths, _, _ = dataset_utils.index_directory(
+            directory, "inferred", formats=(".md",), index_cache=index_cache
+        )
+        self.assertEqual(file_paths, [])
+
+    def test_index_directory_cache_recent_changes(self):
+        directory = self._prepare_directory()
+        index_cache = os.path.join(self.get_temp_dir(), "index")
+        dataset_utils.index_directory(
+            directory, None, formats=(".txt",), index_cache=index_cache
+        )
+        # Directories modified right before they are walked are not cached,
+        # since they could be modified again within the same mtime tick.
+        with open(os.path.join(directory, "class_a", "3.txt"), "w"):
+            pass
+        file_paths, _, _ = dataset_utils.index_directory(
+            directory, None, formats=(".txt",), index_cache=index_cache
+        )
+        self.assertLen(file_paths, 13)
+        with open(os.path.join(directory, "class_a", "4.txt"), "w"):
+            pass
+        file_paths, _, _ = dataset_utils.index_directory(
+            directory, None, formats=(".txt",), index_cache=index_cache
+        )
+        self.assertLen(file_paths, 14)
+
+    def test_index_directory_invalid_cache(self):
+        directory = self._prepare_directory()
+        index_cache = os.path.join(self.get_temp_dir(), "index")
+        with open(index_cache, "wb") as f:
+            f.write(b"invalid")
+        with self.assertWarnsRegex(UserWarning, "Could not read"):
+            file_paths, _, _ = dataset_utils.index_directory(
+                directory, None, formats=(".txt",), index_cache=index_cache
+            )
+        self.assertLen(file_paths, 12)
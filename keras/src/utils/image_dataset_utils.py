@@ -7,6 +7,15 @@ from keras.src.utils import image_utils
 from keras.src.utils.module_utils import tensorflow as tf
 
 ALLOWLIST_FORMATS = (".bmp", ".gif", ".jpeg", ".jpg", ".png")
+# PIL resampling filters of the interpolations supported with
+# `format="py_dataset"`.
+PIL_INTERPOLATIONS = {
+    "bilinear": "bilinear",
+    "nearest": "nearest",
+    "bicubic": "bicubic",
+    "area": "box",
+    "lanczos3": "lanczos",
+}
 
 
 @keras_export(
@@ -33,6 +42,9 @@ def image_dataset_from_directory(
     pad_to_aspect_ratio=False,
     data_format=None,
     verbose=True,
+    index_cache=None,
+    format="tf",
+    num_workers=None,
 ):
     """Generates a `tf.data.Dataset` from image files in a directory.
 
@@ -126,10 +138,36 @@ def image_dataset_from_directory(
             otherwise either 'channel_last' or 'channel_first'.
         verbose: Whether to display number information on classes and
             number of files found. Defaults to `True`.
+        index_cache: Optional path of a file in which to cache the list of
+            files of `directory`, to speed up later calls. Only the
+            subdirectories that were modified since the file was written are
+            listed again. The file should not be located in `directory`.
+            Defaults to `None`.
+        format: The format of the returned dataset. Either `"tf"`, to return
+            a `tf.data.Dataset` that decodes images with TensorFlow, or
+            `"py_dataset"`, to return a `keras.utils.PyDataset` of NumPy
+            batches decoded with PIL, without TensorFlow ops. With
+            `"py_dataset"`, the files must be local, and `interpolation`
+            must be one of `"bilinear"`, `"nearest"`, `"bicubic"`,
+            `"area"` and `"lanczos3"`. The batches have the same shapes and
+            dtypes as with `"tf"`, but not the same values: PIL resizes
+            images with antialiasing, unlike `tf.image.resize()`, and files
+            are shuffled in a different order. It is not faster than `"tf"`
+            on a single core. Defaults to `"tf"`.
+        num_workers: Only used with `format="py_dataset"`. Number of
+            processes decoding the images. The images are written to
+            shared memory, and are not copied back to the calling process.
+            If 0, images are decoded in the calling process. Defaults to
+            `None`, which uses `os.cpu_count()` processes. With
+            `subset="both"`, the two datasets share the processes.
+            Workers are started with the `"spawn"` method, so the main
+            module of the program must be guarded by
+            `if __name__ == "__main__":`.
 
     Returns:
 
-    A `tf.data.Dataset` object.
+    A `tf.data.Dataset` object, or a `keras.utils.PyDataset` object with
+    `format="py_dataset"`, which yields NumPy arrays.
 
     - If `label_mode` is `None`, it yields `float32` tensors of shape
         `(batch_size, image_size[0], image_size[1], num_channels)`,
@@ -213,6 +251,22 @@ def image_dataset_from_directory(
             f"{supported_interpolations}. "
             f"Received: interpolation={interpolation}"
         )
+    if format not in ("tf", "py_dataset"):
+        raise ValueError(
+            '`format` should be either "tf" or "py_dataset". '
+            f"Received: format={format}"
+        )
+    if format == "py_dataset" and interpolation not in PIL_INTERPOLATIONS:
+        raise ValueError(
+            'With `format="py_dataset"`, argument `interpolation` should be '
+            f"one of {tuple(PIL_INTERPOLATIONS)}. "
+            f"Received: interpolation={interpolation}"
+        )
+    if pad_to_aspect_ratio and crop_to_aspect_ratio:
+        raise ValueError(
+            "Only one of `pad_to_aspect_ratio`, `crop_to_aspect_ratio`"
+            " can be set to `True`."
+        )
 
     dataset_utils.check_validation_split_arg(
         validation_split, subset, shuffle, seed
@@ -229,6 +283,7 @@ def image_dataset_from_directory(
         seed=seed,
         follow_links=follow_links,
         verbose=verbose,
+        index_cache=index_cache,
     )
 
     if label_mode == "binary" and len(class_names) != 2:
@@ -266,42 +321,81 @@ def image_dataset_from_directory(
                 f"No validation images found in directory {directory}. "
                 f"Allowed formats: {ALLOWLIST_FORMATS}"
             )
-        train_dataset = paths_and_labels_to_dataset(
-            image_paths=image_paths_train,
-            image_size=image_size,
-            num_channels=num_channels,
-            labels=labels_train,
-            label_mode=label_mode,
-            num_classes=len(class_names) if class_names else 0,
-            interpolation=interpolation,
-            crop_to_aspect_ratio=crop_to_aspect_ratio,
-            pad_to_aspect_ratio=pad_to_aspect_ratio,
-            data_format=data_format,
-            shuffle=shuffle,
-            shuffle_buffer_size=shuffle_buffer_size,
-            seed=seed,
-        )
+        if format == "py_dataset":
+            from keras.src.utils.image_py_dataset import ImagePyDataset
+            from keras.src.utils.image_py_dataset import WorkerPool
+
+            # The subsets are iterated one after the other, and share their
+            # workers.
+            worker_pool = WorkerPool(num_workers)
+            train_dataset = ImagePyDataset(
+                image_paths=image_paths_train,
+                labels=labels_train,
+                label_mode=label_mode,
+                num_classes=len(class_names) if class_names else 0,
+                image_size=image_size,
+                num_channels=num_channels,
+                interpolation=interpolation,
+                data_format=data_format,
+                crop_to_aspect_ratio=crop_to_aspect_ratio,
+                pad_to_aspect_ratio=pad_to_aspect_ratio,
+                batch_size=batch_size,
+                shuffle=shuffle,
+                seed=seed,
+                worker_pool=worker_pool,
+            )
+            val_dataset = ImagePyDataset(
+                image_paths=image_paths_val,
+                labels=labels_val,
+                label_mode=label_mode,
+                num_classes=len(class_names) if class_names else 0,
+                image_size=image_size,
+                num_channels=num_channels,
+                interpolation=interpolation,
+                data_format=data_format,
+                crop_to_aspect_ratio=crop_to_aspect_ratio,
+                pad_to_aspect_ratio=pad_to_aspect_ratio,
+                batch_size=batch_size,
+                shuffle=False,
+                worker_pool=worker_pool,
+            )
+        else:
+            train_dataset = paths_and_labels_to_dataset(
+                image_paths=image_paths_train,
+                image_size=image_size,
+                num_channels=num_channels,
+                labels=labels_train,
+                label_mode=label_mode,
+                num_classes=len(class_names) if class_names else 0,
+                interpolation=interpolation,
+                crop_to_aspect_ratio=crop_to_aspect_ratio,
+                pad_to_aspect_ratio=pad_to_aspect_ratio,
+                data_format=data_format,
+                shuffle=shuffle,
+                shuffle_buffer_size=shuffle_buffer_size,
+                seed=seed,
+            )
 
-        val_dataset = paths_and_labels_to_dataset(
-            image_paths=image_paths_val,
-            image_size=image_size,
-            num_channels=num_channels,
-            labels=labels_val,
-            label_mode=label_mode,
-            num_classes=len(class_names) if class_names else 0,
-            interpolation=interpolation,
-            crop_to_aspect_ratio=crop_to_aspect_ratio,
-            pad_to_aspect_ratio=pad_to_aspect_ratio,
-            data_format=data_format,
-            shuffle=False,
-        )
+            val_dataset = paths_and_labels_to_dataset(
+                image_paths=image_paths_val,
+                image_size=image_size,
+                num_channels=num_channels,
+                labels=labels_val,
+                label_mode=label_mode,
+                num_classes=len(class_names) if class_names else 0,
+                interpolation=interpolation,
+                crop_to_aspect_ratio=crop_to_aspect_ratio,
+                pad_to_aspect_ratio=pad_to_aspect_ratio,
+                data_format=data_format,
+                shuffle=False,
+            )
 
-        if batch_size is not None:
-            train_dataset = train_dataset.batch(batch_size)
-            val_dataset = val_dataset.batch(batch_size)
+            if batch_size is not None:
+                train_dataset = train_dataset.batch(batch_size)
+                val_dataset = val_dataset.batch(batch_size)
 
-        train_dataset = train_dataset.prefetch(tf.data.AUTOTUNE)
-        val_dataset = val_dataset.prefetch(tf.data.AUTOTUNE)
+            train_dataset = train_dataset.prefetch(tf.data.AUTOTUNE)
+            val_dataset = val_dataset.prefetch(tf.data.AUTOTUNE)
 
         # Users may need to reference `class_names`.
         train_dataset.class_names = class_names
@@ -322,26 +416,47 @@ def image_dataset_from_directory(
                 f"Allowed formats: {ALLOWLIST_FORMATS}"
             )
 
-        dataset = paths_and_labels_to_dataset(
-            image_paths=image_paths,
-            image_size=image_size,
-            num_channels=num_channels,
-            labels=labels,
-            label_mode=label_mode,
-            num_classes=len(class_names) if class_names else 0,
-            interpolation=interpolation,
-            crop_to_aspect_ratio=crop_to_aspect_ratio,
-            pad_to_aspect_ratio=pad_to_aspect_ratio,
-            data_format=data_format,
-            shuffle=shuffle,
-            shuffle_buffer_size=shuffle_buffer_size,
-            seed=seed,
-        )
+        if format == "py_dataset":
+            from keras.src.utils.image_py_dataset import ImagePyDataset
+
+            dataset = ImagePyDataset(
+                image_paths=image_paths,
+                labels=labels,
+                label_mode=label_mode,
+                num_classes=len(class_names) if class_names else 0,
+                image_size=image_size,
+                num_channels=num_channels,
+                interpolation=interpolation,
+                data_format=data_format,
+                crop_to_aspect_ratio=crop_to_aspect_ratio,
+                pad_to_aspect_ratio=pad_to_aspect_ratio,
+                batch_size=batch_size,
+                shuffle=shuffle,
+                seed=seed,
+                num_workers=num_workers,
+            )
+        else:
+            dataset = paths_and_labels_to_dataset(
+                image_paths=image_paths,
+                image_size=image_size,
+                num_channels=num_channels,
+                labels=labels,
+                label_mode=label_mode,
+                num_classes=len(class_names) if class_names else 0,
+                interpolation=interpolation,
+                crop_to_aspect_ratio=crop_to_aspect_ratio,
+                pad_to_aspect_ratio=pad_to_aspect_ratio,
+                data_format=data_format,
+                shuffle=shuffle,
+                shuffle_buffer_size=shuffle_buffer_size,
+                seed=seed,
+            )
+
+            if batch_size is not None:
+                dataset = dataset.batch(batch_size)
 
-        if batch_size is not None:
-            dataset = dataset.batch(batch_size)
+            dataset = dataset.prefetch(tf.data.AUTOTUNE)
 
-        dataset = dataset.prefetch(tf.data.AUTOTUNE)
         # Users may need to reference `class_names`.
         dataset.class_names = class_names
 
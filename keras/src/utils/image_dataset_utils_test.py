@@ -4,6 +4,7 @@ import numpy as np
 
 from keras.src import backend
 from keras.src import testing
+from keras.src.trainers.data_adapters.py_dataset_adapter import PyDataset
 from keras.src.utils import image_dataset_utils
 from keras.src.utils import image_utils
 from keras.src.utils.module_utils import tensorflow as tf
@@ -531,3 +532,132 @@ class ImageDatasetFromDirectoryTest(testing.TestCase):
             batches_1_alt.append(b)
         batches_1_alt = np.concatenate(batches_1_alt, axis=0)
         self.assertAllClose(batches_1, batches_1_alt, atol=1e-6)
+
+    def test_image_dataset_from_directory_py_dataset(self):
+        directory = self._prepare_directory(
+            num_classes=3, color_mode="rgba", count=14
+        )
+        kwargs = dict(
+            batch_size=4,
+            image_size=(24, 24),
+            color_mode="rgba",
+            label_mode="categorical",
+            shuffle=False,
+        )
+        tf_dataset = image_dataset_utils.image_dataset_from_directory(
+            directory, **kwargs
+        )
+        for num_workers in (0, 2):
+            dataset = image_dataset_utils.image_dataset_from_directory(
+                directory,
+                format="py_dataset",
+                num_workers=num_workers,
+                **kwargs,
+            )
+            self.assertIsInstance(dataset, PyDataset)
+            self.assertEqual(dataset.class_names, tf_dataset.class_names)
+            self.assertEqual(dataset.file_paths, tf_dataset.file_paths)
+            self.assertLen(dataset, 4)
+            # PNG images are decoded identically, and are not resized.
+            for (x, y), (tf_x, tf_y) in zip(dataset, tf_dataset):
+                self.assertEqual(x.dtype, "float32")
+                self.assertAllClose(x, tf_x)
+                self.assertEqual(y.dtype, "float32")
+                self.assertAllClose(y, tf_y)
+            self.assertEqual(x.shape, tf_x.shape)
+            dataset.close()
+
+    def test_image_dataset_from_directory_py_dataset_buffers(self):
+        directory = self._prepare_directory(count=8)
+        dataset = image_dataset_utils.image_dataset_from_directory(
+            directory,
+            batch_size=4,
+            image_size=(18, 18),
+            label_mode=None,
+            shuffle=False,
+            format="py_dataset",
+            num_workers=0,
+        )
+        batch_0 = dataset[0]
+        expected_batch_0 = batch_0.copy()
+        # The buffer of `batch_0` is not reused while it is alive.
+        batch_1 = dataset[1]
+        self.assertLen(dataset._buffers._buffers, 2)
+        self.assertAllClose(batch_0, expected_batch_0)
+        self.assertNotAllClose(batch_0, batch_1)
+        del batch_0
+        batch_0 = dataset[0]
+        self.assertLen(dataset._buffers._buffers, 2)
+        self.assertAllClose(batch_0, expected_batch_0)
+        dataset.close()
+
+    def test_image_dataset_from_directory_py_dataset_resizing(self):
+        directory = self._prepare_directory(count=4, color_mode="grayscale")
+        for data_format in ("channels_last", "channels_first"):
+            for kwargs in (
+                {},
+                {"crop_to_aspect_ratio": True},
+                {"pad_to_aspect_ratio": True},
+            ):
+                dataset = image_dataset_utils.image_dataset_from_directory(
+                    directory,
+                    batch_size=None,
+                    image_size=(12, 18),
+                    color_mode="grayscale",
+                    interpolation="area",
+                    data_format=data_format,
+                    format="py_dataset",
+                    num_workers=0,
+                    **kwargs,
+                )
+                x, y = dataset[0]
+                if data_format == "channels_last":
+                    self.assertEqual(x.shape, (12, 18, 1))
+                else:
+                    self.assertEqual(x.shape, (1, 12, 18))
+                self.assertEqual(y.shape, ())
+                self.assertEqual(y.dtype, "int32")
+                if kwargs.get("pad_to_aspect_ratio"):
+                    # Square images are padded on the sides.
+                    x = x.reshape((12, 18))
+                    self.assertAllClose(x[:, :3], np.zeros((12, 3)))
+                    self.assertAllClose(x[:, -3:], np.zeros((12, 3)))
+                dataset.close()
+
+        with self.assertRaisesRegex(ValueError, "`interpolation`"):
+            image_dataset_utils.image_dataset_from_directory(
+                directory, interpolation="gaussian", format="py_dataset"
+            )
+        with self.assertRaisesRegex(ValueError, "`format`"):
+            image_dataset_utils.image_dataset_from_directory(
+                directory, format="numpy"
+            )
+
+    def test_image_dataset_from_directory_py_dataset_fit(self):
+        from keras.src import layers
+        from keras.src import models
+
+        directory = self._prepare_directory(count=10)
+        train_dataset, val_dataset = (
+            image_dataset_utils.image_dataset_from_directory(
+                directory,
+                batch_size=4,
+                image_size=(8, 8),
+                validation_split=0.2,
+                subset="both",
+                seed=1337,
+                format="py_dataset",
+                num_workers=0,
+            )
+        )
+        self.assertLen(train_dataset.file_paths, 8)
+        self.assertLen(val_dataset.file_paths, 2)
+        self.assertIs(train_dataset._worker_pool, val_dataset._worker_pool)
+        model = models.Sequential(
+            [layers.Flatten(), layers.Dense(2, activation="softmax")]
+        )
+        model.compile(loss="sparse_categorical_crossentropy")
+        history = model.fit(
+            train_dataset, validation_data=val_dataset, epochs=2, verbose=0
+        )
+        self.assertLen(history.history["val_loss"], 2)
@@ -0,0 +1,303 @@
+"""A `PyDataset` of images decoded with PIL in worker processes."""
+
+import collections
+import multiprocessing
+import os
+import threading
+import weakref
+from concurrent import futures
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from keras.src.trainers.data_adapters.py_dataset_adapter import PyDataset
+from keras.src.utils import image_utils
+from keras.src.utils.image_dataset_utils import PIL_INTERPOLATIONS
+
+
+class ImagePyDataset(PyDataset):
+    """A `PyDataset` of images decoded with PIL, and their labels.
+
+    Batches of images are decoded and resized by a pool of `num_workers`
+    processes, which write them to shared memory buffers of the size of a
+    batch. The batches are NumPy arrays backed by these buffers: a buffer is
+    reused once its batch, and the tensors converted from it without a copy,
+    are garbage collected.
+
+    The arguments are those of
+    `image_dataset_utils.paths_and_labels_to_dataset()`, along with
+    `batch_size` (if `None`, items are single images), and `num_workers`
+    (see `image_dataset_from_directory()`). `worker_pool` is an optional
+    `WorkerPool` shared with other datasets, which replaces `num_workers`.
+    """
+
+    def __init__(
+        self,
+        image_paths,
+        labels,
+        label_mode,
+        num_classes,
+        image_size,
+        num_channels,
+        interpolation,
+        data_format,
+        crop_to_aspect_ratio=False,
+        pad_to_aspect_ratio=False,
+        batch_size=32,
+        shuffle=False,
+        seed=None,
+        num_workers=None,
+        worker_pool=None,
+    ):
+        # The images of a batch are decoded in parallel by the workers, and
+        # two threads load batches ahead of the training loop.
+        super().__init__(workers=2, max_queue_size=4)
+        self.image_paths = list(image_paths)
+        self.labels = None if labels is None else np.asarray(labels)
+        self.label_mode = label_mode
+        self.num_classes = num_classes
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self._load_args = (
+            tuple(image_size),
+            num_channels,
+            PIL_INTERPOLATIONS[interpolation],
+            data_format,
+            crop_to_aspect_ratio,
+            pad_to_aspect_ratio,
+        )
+        if data_format == "channels_last":
+            image_shape = (image_size[0], image_size[1], num_channels)
+        else:
+            image_shape = (num_channels, image_size[0], image_size[1])
+        self._buffers = _SharedMemoryBuffers((batch_size or 1,) + image_shape)
+        if worker_pool is None:
+            worker_pool = WorkerPool(num_workers)
+        self.num_workers = worker_pool.num_workers
+        self._worker_pool = worker_pool
+        self._finalizer = weakref.finalize(self, self._buffers.close)
+        self._rng = np.random.RandomState(seed)
+        self._order = np.arange(len(self.image_paths))
+        if shuffle:
+            self._rng.shuffle(self._order)
+
+    def __len__(self):
+        if self.batch_size is None:
+            return len(self.image_paths)
+        return -(-len(self.image_paths) // self.batch_size)
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self):
+            # Ends iteration with the legacy `__getitem__()` protocol.
+            raise IndexError(
+                f"Index {index} is out of range for {len(self)} batches."
+            )
+        batch_size = self.batch_size or 1
+        indices = self._order[index * batch_size : (index + 1) * batch_size]
+        buffer, images = self._buffers.acquire()
+        paths = [self.image_paths[i] for i in indices]
+        if self.num_workers > 0:
+            # Split the batch in one contiguous chunk per worker.
+            bounds = np.linspace(
+                0, len(paths), min(self.num_workers, len(paths)) + 1
+            ).astype(int)
+            # Consume the results to raise the errors of the workers.
+            list(
+                self._worker_pool.map(
+                    _load_images_into_shared_memory,
+                    [buffer.name] * (len(bounds) - 1),
+                    [images.shape] * (len(bounds) - 1),
+                    [paths[i:j] for i, j in zip(bounds[:-1], bounds[1:])],
+                    bounds[:-1].tolist(),
+                    [self._load_args] * (len(bounds) - 1),
+                )
+            )
+        else:
+            _load_images(images, paths, 0, self._load_args)
+        images = images[: len(paths)]
+        if self.batch_size is None:
+            images = images[0]
+        if not self.label_mode:
+            return images
+        labels = _encode_labels(
+            self.labels[indices], self.label_mode, self.num_classes
+        )
+        if self.batch_size is None:
+            labels = labels[0]
+        return images, labels
+
+    def on_epoch_end(self):
+        if self.shuffle:
+            self._rng.shuffle(self._order)
+
+    def close(self):
+        """Stops the workers and frees the shared memory buffers.
+
+        A `worker_pool` shared with other datasets is started again when they
+        load a batch.
+        """
+        self._worker_pool.close()
+        self._finalizer()
+
+
+class WorkerPool:
+    """A pool of `num_workers` processes, started on first use.
+
+    It can be shared by datasets that are iterated one after the other, e.g.
+    the training and validation subsets, and is stopped once they are all
+    garbage collected. If `num_workers` is `None`, it uses `os.cpu_count()`
+    processes.
+    """
+
+    def __init__(self, num_workers=None):
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        self.num_workers = num_workers
+        self._executors = []
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(
+            self, _shutdown_executors, self._executors
+        )
+
+    def map(self, fn, *iterables):
+        with self._lock:
+            if not self._executors:
+                # Forking a process that runs TensorFlow is unsafe.
+                self._executors.append(
+                    futures.ProcessPoolExecutor(
+                        self.num_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                )
+            executor = self._executors[0]
+        return executor.map(fn, *iterables)
+
+    def close(self):
+        with self._lock:
+            _shutdown_executors(self._executors)
+
+
+def _shutdown_executors(executors):
+    while executors:
+        executors.pop().shutdown(cancel_futures=True)
+
+
+class _SharedMemoryBuffers:
+    """Shared memory buffers of `float32` arrays of a given shape.
+
+    `acquire()` returns a free buffer, or a new one, with an array backed by
+    it. The buffer is free again when the array is garbage collected.
+    """
+
+    def __init__(self, shape):
+        self.shape = shape
+        self.nbytes = int(np.prod(shape)) * 4
+        self._buffers = []
+        # Appended to by the finalizers of the arrays, in any thread.
+        self._free_buffers = collections.deque()
+        self._closed = False
+
+    def acquire(self):
+        try:
+            buffer = self._free_buffers.popleft()
+        except IndexError:
+            buffer = shared_memory.SharedMemory(
+                create=True, size=max(self.nbytes, 1)
+            )
+            self._buffers.append(buffer)
+        array = np.ndarray(self.shape, dtype="float32", buffer=buffer.buf)
+        # Views of `array` keep it alive.
+        weakref.finalize(array, self._release, buffer)
+        return buffer, array
+
+    def _release(self, buffer):
+        if self._closed:
+            buffer.close()
+        else:
+            self._free_buffers.append(buffer)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        for buffer in self._buffers:
+            # The buffers in use are closed when they are released.
+            buffer.unlink()
+        while self._free_buffers:
+            self._free_buffers.popleft().close()
+
+
+# Shared memory buffers attached by a worker process, by name.
+_ATTACHED_BUFFERS = {}
+
+
+def _load_images_into_shared_memory(name, shape, paths, start, load_args):
+    """Loads images into an array in a shared memory buffer.
+
+    Runs in the worker processes of `ImagePyDataset`.
+    """
+    if name not in _ATTACHED_BUFFERS:
+        _ATTACHED_BUFFERS[name] = shared_memory.SharedMemory(name=name)
+    images = np.ndarray(
+        shape, dtype="float32", buffer=_ATTACHED_BUFFERS[name].buf
+    )
+    _load_images(images, paths, start, load_args)
+
+
+def _load_images(images, paths, start, load_args):
+    """Loads the images of `paths` into `images[start:]`."""
+    for i, path in enumerate(paths, start):
+        _load_image_with_pil(images[i], path, *load_args)
+
+
+def _load_image_with_pil(
+    output,
+    path,
+    image_size,
+    num_channels,
+    interpolation,
+    data_format,
+    crop_to_aspect_ratio,
+    pad_to_aspect_ratio,
+):
+    """Loads an image into `output`, like `load_image()` with TF ops."""
+    color_mode = {1: "grayscale", 3: "rgb", 4: "rgba"}[num_channels]
+    if pad_to_aspect_ratio:
+        img = image_utils.load_img(path, color_mode=color_mode)
+        # Resize to fit `image_size`, as `tf.image.resize_with_pad()` does.
+        width, height = img.size
+        ratio = max(width / image_size[1], height / image_size[0])
+        resized_size = (int(width / ratio), int(height / ratio))
+        if img.size != resized_size:
+            img = img.resize(
+                resized_size,
+                image_utils.PIL_INTERPOLATION_METHODS[interpolation],
+            )
+        top = (image_size[0] - resized_size[1]) // 2
+        left = (image_size[1] - resized_size[0]) // 2
+    else:
+        img = image_utils.load_img(
+            path,
+            color_mode=color_mode,
+            target_size=image_size,
+            interpolation=interpolation,
+            keep_aspect_ratio=crop_to_aspect_ratio,
+        )
+        top = left = 0
+    array = np.asarray(img)
+    if array.ndim == 2:
+        array = array[..., None]
+    if data_format == "channels_first":
+        output = np.moveaxis(output, 0, -1)
+    if pad_to_aspect_ratio:
+        output[...] = 0
+    output[top : top + array.shape[0], left : left + array.shape[1]] = array
+
+
+def _encode_labels(labels, label_mode, num_classes):
+    """Encodes labels like `dataset_utils.labels_to_dataset()` does."""
+    if label_mode == "binary":
+        return labels.astype("float32")[:, None]
+    if label_mode == "categorical":
+        return np.eye(num_classes, dtype="float32")[labels]
+    return labels.astype("int32")
@@ -0,0 +1,679 @@
+"""NumPy implementation of vocabulary lookups.
+
+These utilities back the eager lookups of `IndexLookup` based layers
+(`StringLookup`, `IntegerLookup` and `TextVectorization`) when TensorFlow
+tensors are not involved, so that mapping tokens to indices does not require
+importing TensorFlow. They follow the semantics of the `tf.lookup` based
+implementation, including the hashing of out-of-vocabulary strings with
+`tf.strings.to_hash_bucket_fast`. They also count tokens in bounded memory
+to build vocabularies in `adapt()`.
+"""
+
+import numpy as np
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_K0 = 0xC3A5C85C97CB3127
+_K1 = 0xB492B66FBE98F273
+_K2 = 0x9AE16A3B2F90404F
+_COLUMN_MULTIPLIERS = np.zeros((0,), dtype="uint64")
+
+
+class StaticLookupTable:
+    """An immutable hash table mapping keys to values.
+
+    Keys are stored in an open addressing hash index with linear probing,
+    which is built and probed with vectorized NumPy operations, so that a
+    batch of inputs is looked up without a Python loop over its elements.
+
+    Args:
+        keys: 1D array of integer or string keys. Keys must be unique.
+        values: 1D array of values, with the same length as `keys`.
+        default_value: The value returned for keys missing from the table.
+    """
+
+    def __init__(self, keys, values, default_value):
+        keys = normalize_keys(np.asarray(keys))
+        values = np.asarray(values)
+        if values.dtype.kind in "SO":
+            values = normalize_keys(values)
+        if keys.ndim != 1 or keys.shape != values.shape:
+            raise ValueError(
+                "`keys` and `values` must be 1D arrays of the same length. "
+                f"Received: keys.shape={keys.shape}, "
+                f"values.shape={values.shape}"
+            )
+        self._keys = keys
+        self._values = values
+        self.default_value = default_value
+
+        # Keep the load factor of the index under 1/2.
+        capacity = 8
+        while capacity < 2 * len(keys):
+            capacity *= 2
+        self._mask = capacity - 1
+        self._hashes = _hash_keys(keys)
+        self._index = np.full((capacity,), -1, dtype="int64")
+        pending = np.arange(len(keys))
+        positions = (self._hashes & self._mask).astype("int64")
+        while len(pending):
+            free = pending[self._index[positions[pending]] < 0]
+            # When several keys probe the same free slot, the first one is
+            # inserted and the others keep probing.
+            _, first = np.unique(positions[free], return_index=True)
+            inserted = free[first]
+            self._index[positions[inserted]] = inserted
+            pending = pending[self._index[positions[pending]] != pending]
+            positions[pending] = (positions[pending] + 1) & self._mask
+
+    @property
+    def key_dtype(self):
+        return self._keys.dtype
+
+    @property
+    def value_dtype(self):
+        return self._values.dtype
+
+    def size(self):
+        return len(self._keys)
+
+    def export(self):
+        """Returns the keys and values, in insertion order."""
+        return self._keys, self._values
+
+    def lookup(self, inputs):
+        """Looks up the values of an array of keys of any shape."""
+        inputs = self.convert_keys(inputs)
+        flat_inputs = inputs.ravel()
+        hashes = _hash_keys(flat_inputs)
+        positions = (hashes & self._mask).astype("int64")
+        found = np.full(flat_inputs.shape, -1, dtype="int64")
+        pending = np.arange(len(flat_inputs))
+        while len(pending):
+            candidates = self._index[positions[pending]]
+            occupied = candidates >= 0
+            pending, candidates = pending[occupied], candidates[occupied]
+            # Keys are only compared when their hashes match.
+            matches = self._hashes[candidates] == hashes[pending]
+            matches[matches] = (
+                self._keys[candidates[matches]] == flat_inputs[pending[matches]]
+            )
+            found[pending[matches]] = candidates[matches]
+            pending = pending[~matches]
+            positions[pending] = (positions[pending] + 1) & self._mask
+
+        if not len(self._values):
+            outputs = np.full(
+                flat_inputs.shape,
+                self.default_value,
+                dtype=_default_dtype(self._values, self.default_value),
+            )
+        else:
+            outputs = np.where(
+                found >= 0, self._values[found], self.default_value
+            )
+        return outputs.reshape(inputs.shape)
+
+    def convert_keys(self, inputs):
+        """Converts `inputs` to the dtype of the keys of the table."""
+        inputs = np.asarray(inputs)
+        if self._keys.dtype.kind == "U":
+            return normalize_keys(inputs)
+        if inputs.dtype.kind not in "iub":
+            raise TypeError(
+                "Expected integer keys for this lookup table. "
+                f"Received keys with dtype {inputs.dtype}."
+            )
+        return inputs.astype(self._keys.dtype, copy=False)
+
+
+class TokenCounter:
+    """Counts the occurrences of tokens in bounded memory.
+
+    Tokens are counted exactly as long as the counter has seen at most
+    `max_tokens` distinct tokens. Past that, counts are accumulated in a
+    count-min sketch of `sketch_depth` rows of `sketch_width` counters, and
+    only the tokens with the highest estimated counts are kept as candidates
+    for `most_common()`, so that memory stays bounded by `max_tokens` tokens
+    and the size of the sketch.
+
+    Approximate counts never underestimate. With probability at least
+    `1 - exp(-sketch_depth)`, the estimate of a token exceeds its true count
+    by at most `e * total / sketch_width`, where `total` is the number of
+    occurrences counted. A candidate is only dropped when `max_tokens` other
+    candidates have a higher estimate, so the tokens returned by
+    `most_common(n)` for `n <= max_tokens` are the `n` most common tokens up
+    to that error: a token that is left out occurs at most
+    `e * total / sketch_width` times more often than any returned token.
+
+    Counters with the same configuration can be merged, which is exact if
+    the merged counts are.
+
+    Args:
+        max_tokens: The maximum number of distinct tokens to keep in memory.
+            If `None`, all tokens are counted exactly.
+        sketch_width: The number of counters of each row of the sketch,
+            rounded up to a power of 2.
+        sketch_depth: The number of rows of the sketch.
+    """
+
+    def __init__(self, max_tokens=None, sketch_width=2**18, sketch_depth=4):
+        self.max_tokens = max_tokens
+        self.sketch_width = 1 << max(int(sketch_width) - 1, 1).bit_length()
+        self.sketch_depth = sketch_depth
+        self.total = 0
+        self._counts = {}
+        self._sketch = None
+
+    @property
+    def exact(self):
+        """Whether the counts are exact."""
+        return self._sketch is None
+
+    def update(self, tokens, counts, encoding="utf-8"):
+        """Adds `counts` occurrences of the distinct `tokens`.
+
+        Byte string tokens are decoded with `encoding`.
+        """
+        tokens = np.asarray(tokens)
+        counts = np.asarray(counts, dtype="int64")
+        self.total += int(counts.sum())
+        if self._sketch is not None:
+            tokens = normalize_keys(tokens, encoding)
+            self._add_to_sketch(tokens, counts)
+            self._counts.update(dict.fromkeys(tokens.tolist(), 0))
+            self._maybe_prune()
+            return
+        if _is_bytes_array(tokens):
+            # Decoding the tokens one by one is faster than decoding an array.
+            tokens = [token.decode(encoding) for token in tokens.tolist()]
+        else:
+            tokens = normalize_keys(tokens, encoding).tolist()
+        get = self._counts.get
+        for token, count in zip(tokens, counts.tolist()):
+            self._counts[token] = get(token, 0) + count
+        if self.max_tokens is not None and len(self._counts) > self.max_tokens:
+            self._switch_to_sketch()
+
+    def merge(self, other):
+        """Adds the counts of another `TokenCounter` to this one."""
+        if (
+            other.max_tokens != self.max_tokens
+            or other.sketch_width != self.sketch_width
+            or other.sketch_depth != self.sketch_depth
+        ):
+            raise ValueError(
+                "Only counters with the same configuration can be merged."
+            )
+        if other.exact:
+            if other._counts:
+                tokens = np.array(list(other._counts))
+                counts = np.array(list(other._counts.values()), dtype="int64")
+                self.update(tokens, counts)
+            return
+        if self.exact:
+            self._switch_to_sketch(force=True)
+        self.total += other.total
+        self._sketch += other._sketch
+        self._counts.update(dict.fromkeys(other._counts, 0))
+        self._maybe_prune()
+
+    def remove(self, token):
+        """Stops counting `token`."""
+        self._counts.pop(token, None)
+
+    def lookup(self, tokens):
+        """Returns the (estimated) counts of an array of tokens."""
+        tokens = normalize_keys(np.asarray(tokens))
+        if self._sketch is None:
+            get = self._counts.get
+            return np.array(
+                [get(token, 0) for token in tokens.tolist()], dtype="int64"
+            )
+        return self._sketch[
+            self._sketch_rows, self._sketch_columns(tokens)
+        ].min(axis=0)
+
+    def most_common(self, n=None):
+        """Returns the `n` most common tokens and their (estimated) counts.
+
+        Tokens are sorted by decreasing count, and ties are broken by
+        decreasing token order.
+        """
+        if not self._counts:
+            return np.array([]), np.zeros((0,), dtype="int64")
+        tokens = np.array(list(self._counts))
+        counts = self.lookup(tokens)
+        order = np.lexsort((tokens, counts))[::-1][:n]
+        return tokens[order], counts[order]
+
+    @property
+    def _sketch_rows(self):
+        return np.arange(self.sketch_depth)[:, None]
+
+    def _sketch_columns(self, tokens):
+        hashes = _hash_keys(tokens)
+        seeds = _mix64(np.arange(1, self.sketch_depth + 1, dtype="uint64"))
+        columns = _mix64(hashes[None, :] ^ seeds[:, None])
+        return (columns & np.uint64(self.sketch_width - 1)).astype("int64")
+
+    def _add_to_sketch(self, tokens, counts):
+        columns = self._sketch_columns(tokens)
+        np.add.at(
+            self._sketch,
+            (np.broadcast_to(self._sketch_rows, columns.shape), columns),
+            counts,
+        )
+
+    def _switch_to_sketch(self, force=False):
+        self._sketch = np.zeros(
+            (self.sketch_depth, self.sketch_width), dtype="int64"
+        )
+        if self._counts:
+            tokens = np.array(list(self._counts))
+            counts = np.array(list(self._counts.values()), dtype="int64")
+            self._add_to_sketch(tokens, counts)
+        self._counts = dict.fromkeys(self._counts, 0)
+        self._maybe_prune(force=force)
+
+    def _maybe_prune(self, force=False):
+        # Candidates are pruned once they double, to amortize the cost of
+        # estimating their counts.
+        if self.max_tokens is None or len(self._counts) <= self.max_tokens:
+            return
+        if not force and len(self._counts) <= 2 * self.max_tokens:
+            return
+        tokens, _ = self.most_common(self.max_tokens)
+        self._counts = dict.fromkeys(tokens.tolist(), 0)
+
+
+def count_tokens(
+    token_counts, values, row_ids=None, document_counts=None, encoding="utf-8"
+):
+    """Counts a batch of tokens.
+
+    Args:
+        token_counts: The `TokenCounter` of the occurrences of tokens.
+        values: 1D array of tokens.
+        row_ids: 1D array with the index of the row (document) of each
+            token. Only required with `document_counts`.
+        document_counts: Optional `TokenCounter` of the number of documents
+            each token appears in.
+        encoding: The encoding of byte string tokens.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == "O" and _is_bytes_array(values):
+        values = values.astype("S")
+    # Byte strings are only decoded once per distinct token.
+    tokens, inverse, counts = np.unique(
+        values, return_inverse=True, return_counts=True
+    )
+    token_counts.update(tokens, counts, encoding)
+    if document_counts is not None and len(tokens):
+        # Each (row, token) pair is only counted once.
+        pairs = np.unique(np.asarray(row_ids) * len(tokens) + inverse)
+        counts = np.bincount(pairs % len(tokens), minlength=len(tokens))
+        document_counts.update(tokens[counts > 0], counts[counts > 0], encoding)
+
+
+def _is_bytes_array(keys):
+    return (
+        keys.dtype.kind in "OS"
+        and keys.size > 0
+        and isinstance(keys.flat[0], bytes)
+    )
+
+
+def normalize_keys(keys, encoding="utf-8"):
+    """Converts string arrays to a unicode dtype and integers to `int64`."""
+    if keys.dtype.kind in "iub":
+        return keys.astype("int64", copy=False)
+    if keys.dtype.kind == "U":
+        return keys
+    if keys.dtype.kind == "S":
+        return np.char.decode(keys, encoding)
+    if keys.dtype.kind == "O":
+        if keys.size and isinstance(keys.flat[0], bytes):
+            return np.char.decode(keys.astype("S"), encoding)
+        return keys.astype("U")
+    raise TypeError(f"Unsupported dtype for lookup keys: {keys.dtype}")
+
+
+def _hash_keys(keys):
+    """Hashes a 1D array of unicode strings or integers to `uint64`."""
+    keys = np.ascontiguousarray(keys)
+    if keys.dtype.kind == "U":
+        # Each row holds the code points of a string, padded with zeros.
+        width = keys.dtype.itemsize // 4
+        codes = keys.view("uint32").reshape((len(keys), width))
+        hashes = codes.astype("uint64") @ _column_multipliers(width)
+    else:
+        hashes = keys.view("uint64")
+    return _mix64(hashes)
+
+
+def _column_multipliers(width):
+    # Zero padding does not change the hash of a string, so that strings of
+    # arrays with different widths hash to the same value.
+    global _COLUMN_MULTIPLIERS
+    if len(_COLUMN_MULTIPLIERS) < width:
+        columns = np.arange(max(width, 2 * len(_COLUMN_MULTIPLIERS)))
+        _COLUMN_MULTIPLIERS = _mix64(columns.astype("uint64")) | np.uint64(1)
+    return _COLUMN_MULTIPLIERS[:width]
+
+
+def _mix64(x):
+    """The 64 bits finalizer of MurmurHash3."""
+    x = x ^ (x >> np.uint64(33))
+    x = x * np.uint64(0xFF51AFD7ED558CCD)
+    x = x ^ (x >> np.uint64(33))
+    x = x * np.uint64(0xC4CEB9FE1A85EC53)
+    return x ^ (x >> np.uint64(33))
+
+
+def _default_dtype(values, default_value):
+    if values.dtype.kind == "U":
+        return np.result_type(values.dtype, np.asarray(default_value).dtype)
+    return values.dtype
+
+
+def fingerprint64(data):
+    """Computes the 64 bits FarmHash fingerprint of a byte string.
+
+    This is the fingerprint used by `tf.strings.to_hash_bucket_fast`.
+    """
+    length = len(data)
+    if length <= 16:
+        return _hash_len_0_to_16(data, length)
+    if length <= 32:
+        return _hash_len_17_to_32(data, length)
+    if length <= 64:
+        return _hash_len_33_to_64(data, length)
+
+    seed = 81
+    x = seed
+    y = (seed * _K1 + 113) & _MASK64
+    z = (_shift_mix((y * _K2 + 113) & _MASK64) * _K2) & _MASK64
+    v0 = v1 = w0 = w1 = 0
+    x = (x * _K2 + _fetch64(data, 0)) & _MASK64
+
+    end = ((length - 1) // 64) * 64
+    last64 = end + ((length - 1) & 63) - 63
+    offset = 0
+    while offset != end:
+        x = (
+            _rotate((x + y + v0 + _fetch64(data, offset + 8)) & _MASK64, 37)
+            * _K1
+        ) & _MASK64
+        y = (
+            _rotate((y + v1 + _fetch64(data, offset + 48)) & _MASK64, 42) * _K1
+        ) & _MASK64
+        x ^= w1
+        y = (y + v0 + _fetch64(data, offset + 40)) & _MASK64
+        z = (_rotate((z + w0) & _MASK64, 33) * _K1) & _MASK64
+        v0, v1 = _weak_hash_len_32_with_seeds(
+            data, offset, (v1 * _K1) & _MASK64, (x + w0) & _MASK64
+        )
+        w0, w1 = _weak_hash_len_32_with_seeds(
+            data,
+            offset + 32,
+            (z + w1) & _MASK64,
+            (y + _fetch64(data, offset + 16)) & _MASK64,
+        )
+        z, x = x, z
+        offset += 64
+
+    mul = _K1 + ((z & 0xFF) << 1)
+    offset = last64
+    w0 = (w0 + ((length - 1) & 63)) & _MASK64
+    v0 = (v0 + w0) & _MASK64
+    w0 = (w0 + v0) & _MASK64
+    x = (
+        _rotate((x + y + v0 + _fetch64(data, offset + 8)) & _MASK64, 37) * mul
+    ) & _MASK64
+    y = (
+        _rotate((y + v1 + _fetch64(data, offset + 48)) & _MASK64, 42) * mul
+    ) & _MASK64
+    x ^= (w1 * 9) & _MASK64
+    y = (y + v0 * 9 + _fetch64(data, offset + 40)) & _MASK64
+    z = (_rotate((z + w0) & _MASK64, 33) * mul) & _MASK64
+    v0, v1 = _weak_hash_len_32_with_seeds(
+        data, offset, (v1 * mul) & _MASK64, (x + w0) & _MASK64
+    )
+    w0, w1 = _weak_hash_len_32_with_seeds(
+        data,
+        offset + 32,
+        (z + w1) & _MASK64,
+        (y + _fetch64(data, offset + 16)) & _MASK64,
+    )
+    z, x = x, z
+    return _hash_len_16(
+        (_hash_len_16(v0, w0, mul) + _shift_mix(y) * _K0 + z) & _MASK64,
+        (_hash_len_16(v1, w1, mul) + x) & _MASK64,
+        mul,
+    )
+
+
+def hash_bucket_fast(inputs, num_buckets):
+    """Hashes an array of strings into `num_buckets` buckets.
+
+    Matches `tf.strings.to_hash_bucket_fast`. Each distinct string is only
+    fingerprinted once.
+    """
+    inputs = np.asarray(inputs)
+    unique, inverse = np.unique(inputs, return_inverse=True)
+    if unique.dtype.kind == "U":
+        unique = np.char.encode(unique, "utf-8").astype("S")
+    # Strings of up to 16 bytes are fingerprinted with vectorized NumPy
+    # operations, longer ones one at a time.
+    lengths = np.char.str_len(unique)
+    short = lengths <= 16
+    fingerprints = np.zeros(unique.shape, dtype="uint64")
+    fingerprints[short] = _fingerprint64_short(unique[short], lengths[short])
+    for i in np.flatnonzero(~short):
+        fingerprints[i] = fingerprint64(unique[i])
+    buckets = (fingerprints % np.uint64(num_buckets)).astype("int64")
+    return buckets[inverse].reshape(inputs.shape)
+
+
+def _fingerprint64_short(strings, lengths):
+    """Vectorized `fingerprint64` of byte strings of at most 16 bytes."""
+    itemsize = strings.dtype.itemsize
+    data = np.zeros((len(strings), max(itemsize, 16)), dtype="uint8")
+    data[:, :itemsize] = (
+        np.ascontiguousarray(strings).view("uint8").reshape((-1, itemsize))
+    )
+    lengths = lengths.astype("int64")
+    k0, k2 = np.uint64(_K0), np.uint64(_K2)
+    fingerprints = np.full(lengths.shape, k2, dtype="uint64")
+
+    def fetch(rows, offsets, size):
+        columns = offsets[:, None] + np.arange(size)
+        values = data[rows[:, None], columns].astype("uint64")
+        shifts = np.arange(0, 8 * size, 8, dtype="uint64")
+        return np.bitwise_or.reduce(values << shifts, axis=1)
+
+    def rotate(value, shift):
+        return (value >> np.uint64(shift)) | (value << np.uint64(64 - shift))
+
+    def hash_len_16(u, v, mul):
+        a = (u ^ v) * mul
+        a ^= a >> np.uint64(47)
+        b = (v ^ a) * mul
+        b ^= b >> np.uint64(47)
+        return b * mul
+
+    with np.errstate(over="ignore"):
+        rows = np.flatnonzero(lengths >= 8)
+        length = lengths[rows]
+        mul = k2 + length.astype("uint64") * np.uint64(2)
+        a = fetch(rows, np.zeros_like(length), 8) + k2
+        b = fetch(rows, length - 8, 8)
+        c = rotate(b, 37) * mul + a
+        d = (rotate(a, 25) + b) * mul
+        fingerprints[rows] = hash_len_16(c, d, mul)
+
+        rows = np.flatnonzero((lengths >= 4) & (lengths < 8))
+        length = lengths[rows]
+        mul = k2 + length.astype("uint64") * np.uint64(2)
+        a = fetch(rows, np.zeros_like(length), 4)
+        u = length.astype("uint64") + (a << np.uint64(3))
+        fingerprints[rows] = hash_len_16(u, fetch(rows, length - 4, 4), mul)
+
+        rows = np.flatnonzero((lengths > 0) & (lengths < 4))
+        length = lengths[rows]
+        a = data[rows, 0].astype("uint64")
+        b = data[rows, length >> 1].astype("uint64")
+        c = data[rows, length - 1].astype("uint64")
+        y = a + (b << np.uint64(8))
+        z = length.astype("uint64") + (c << np.uint64(2))
+        h = (y * k2) ^ (z * k0)
+        fingerprints[rows] = (h ^ (h >> np.uint64(47))) * k2
+    return fingerprints
+
+
+def encode_categorical_inputs(
+    inputs, output_mode, depth, dtype="float32", idf_weights=None
+):
+    """Encodes an array of indices according to `output_mode`.
+
+    This is the NumPy counterpart of `tf_utils.encode_categorical_inputs`.
+    Indices outside of `[0, depth)` are dropped.
+    """
+    inputs = np.asarray(inputs)
+    if output_mode == "int":
+        return inputs.astype(dtype)
+
+    original_shape = inputs.shape
+    if inputs.ndim == 0:
+        inputs = np.expand_dims(inputs, -1)
+    if output_mode == "one_hot" and inputs.shape[-1] != 1:
+        inputs = np.expand_dims(inputs, -1)
+    if inputs.ndim > 2:
+        raise ValueError(
+            "When output_mode is not `'int'`, maximum supported output rank "
+            f"is 2. Received output_mode {output_mode} and input shape "
+            f"{original_shape}, "
+            f"which would result in output rank {inputs.ndim}."
+        )
+
+    rank = inputs.ndim
+    rows = 1 if rank == 1 else inputs.shape[0]
+    row_ids = np.broadcast_to(
+        np.arange(rows).reshape((rows,) + (1,) * (rank - 1)),
+        inputs.shape,
+    )
+    valid = (inputs >= 0) & (inputs < depth)
+    row_ids, inputs = row_ids[valid], inputs[valid]
+    if output_mode in ("multi_hot", "one_hot"):
+        # Write the ones in place instead of materializing int64 counts.
+        bincounts = np.zeros((rows, depth), dtype=dtype)
+        bincounts[row_ids, inputs] = 1
+    else:
+        bincounts = np.bincount(
+            row_ids * depth + inputs, minlength=rows * depth
+        )
+        bincounts = bincounts.reshape((rows, depth)).astype(dtype, copy=False)
+    if rank == 1:
+        bincounts = bincounts[0]
+    if output_mode != "tf_idf":
+        return bincounts
+    if idf_weights is None:
+        raise ValueError(
+            "When output mode is `'tf_idf'`, idf_weights must be provided. "
+            f"Received: output_mode={output_mode} and idf_weights={idf_weights}"
+        )
+    idf_weights = np.asarray(idf_weights)
+    return bincounts.astype(idf_weights.dtype) * idf_weights
+
+
+def _fetch64(data, offset):
+    return int.from_bytes(data[offset : offset + 8], "little")
+
+
+def _fetch32(data, offset):
+    return int.from_bytes(data[offset : offset + 4], "little")
+
+
+def _rotate(value, shift):
+    return ((value >> shift) | (value << (64 - shift))) & _MASK64
+
+
+def _shift_mix(value):
+    return value ^ (value >> 47)
+
+
+def _hash_len_16(u, v, mul):
+    a = ((u ^ v) * mul) & _MASK64
+    a ^= a >> 47
+    b = ((v ^ a) * mul) & _MASK64
+    b ^= b >> 47
+    return (b * mul) & _MASK64
+
+
+def _hash_len_0_to_16(data, length):
+    if length >= 8:
+        mul = _K2 + length * 2
+        a = (_fetch64(data, 0) + _K2) & _MASK64
+        b = _fetch64(data, length - 8)
+        c = (_rotate(b, 37) * mul + a) & _MASK64
+        d = ((_rotate(a, 25) + b) * mul) & _MASK64
+        return _hash_len_16(c, d, mul)
+    if length >= 4:
+        mul = _K2 + length * 2
+        a = _fetch32(data, 0)
+        return _hash_len_16(length + (a << 3), _fetch32(data, length - 4), mul)
+    if length > 0:
+        a = data[0]
+        b = data[length >> 1]
+        c = data[length - 1]
+        y = (a + (b << 8)) & 0xFFFFFFFF
+        z = (length + (c << 2)) & 0xFFFFFFFF
+        return (_shift_mix(((y * _K2) ^ (z * _K0)) & _MASK64) * _K2) & _MASK64
+    return _K2
+
+
+def _hash_len_17_to_32(data, length):
+    mul = _K2 + length * 2
+    a = (_fetch64(data, 0) * _K1) & _MASK64
+    b = _fetch64(data, 8)
+    c = (_fetch64(data, length - 8) * mul) & _MASK64
+    d = (_fetch64(data, length - 16) * _K2) & _MASK64
+    return _hash_len_16(
+        (_rotate((a + b) & _MASK64, 43) + _rotate(c, 30) + d) & _MASK64,
+        (a + _rotate((b + _K2) & _MASK64, 18) + c) & _MASK64,
+        mul,
+    )
+
+
+def _hash_len_33_to_64(data, length):
+    mul = _K2 + length * 2
+    a = (_fetch64(data, 0) * _K2) & _MASK64
+    b = _fetch64(data, 8)
+    c = (_fetch64(data, length - 8) * mul) & _MASK64
+    d = (_fetch64(data, length - 16) * _K2) & _MASK64
+    y = (_rotate((a + b) & _MASK64, 43) + _rotate(c, 30) + d) & _MASK64
+    z = _hash_len_16(
+        y, (a + _rotate((b + _K2) & _MASK64, 18) + c) & _MASK64, mul
+    )
+    e = (_fetch64(data, 16) * mul) & _MASK64
+    f = _fetch64(data, 24)
+    g = ((y + _fetch64(data, length - 32)) * mul) & _MASK64
+    h = ((z + _fetch64(data, length - 24)) * mul) & _MASK64
+    return _hash_len_16(
+        (_rotate((e + f) & _MASK64, 43) + _rotate(g, 30) + h) & _MASK64,
+        (e + _rotate((f + a) & _MASK64, 18) + g) & _MASK64,
+        mul,
+    )
+
+
+def _weak_hash_len_32_with_seeds(data, offset, a, b):
+    w = _fetch64(data, offset)
+    x = _fetch64(data, offset + 8)
+    y = _fetch64(data, offset + 16)
+    z = _fetch64(data, offset + 24)
+    a = (a + w) & _MASK64
+    b = _rotate((b + a + z) & _MASK64, 21)
+    c = a
+    a = (a + x + y) & _MASK64
+    b = (b + _rotate(a, 44)) & _MASK64
+    return (a + z) & _MASK64, (b + c) & _MASK64
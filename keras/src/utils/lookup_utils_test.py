@@ -0,0 +1,127 @@
+import numpy as np
+import tensorflow as tf
+
+from keras.src import testing
+from keras.src.utils import lookup_utils
+
+
+class LookupUtilsTest(testing.TestCase):
+    def test_static_lookup_table(self):
+        table = lookup_utils.StaticLookupTable(
+            ["b", "c", "a"], np.array([1, 2, 3]), default_value=-1
+        )
+        self.assertEqual(table.size(), 3)
+        self.assertAllEqual(
+            table.lookup(np.array([["a", "z"], ["c", "b"]])), [[3, -1], [2, 1]]
+        )
+        self.assertAllEqual(table.lookup([b"a", b""]), [3, -1])
+        keys, values = table.export()
+        self.assertEqual(keys.tolist(), ["b", "c", "a"])
+        self.assertEqual(values.tolist(), [1, 2, 3])
+
+        table = lookup_utils.StaticLookupTable(
+            [1, 2], ["one", "two"], default_value="[OOV]"
+        )
+        self.assertEqual(table.lookup([2, 5]).tolist(), ["two", "[OOV]"])
+
+        table = lookup_utils.StaticLookupTable(
+            np.array([], dtype="int64"), np.array([]), default_value=0
+        )
+        self.assertAllEqual(table.lookup([[1, 2]]), [[0, 0]])
+
+    def test_hash_bucket_fast(self):
+        rng = np.random.default_rng(0)
+        inputs = [
+            "".join(rng.choice(list("abcdé"), size=length))
+            for length in range(0, 200, 3)
+        ]
+        inputs = np.array(inputs + ["", "a", "a"]).reshape((-1, 2))
+        self.assertEqual(
+            lookup_utils.hash_bucket_fast(inputs, 7).tolist(),
+            tf.strings.to_hash_bucket_fast(inputs, 7).numpy().tolist(),
+        )
+
+    def test_encode_categorical_inputs(self):
+        inputs = np.array([[1, 2, 2, 9], [0, -1, 3, 3]])
+        self.assertAllEqual(
+            lookup_utils.encode_categorical_inputs(inputs, "count", 4),
+            [[0, 1, 2, 0], [1, 0, 0, 2]],
+        )
+        self.assertAllEqual(
+            lookup_utils.encode_categorical_inputs(inputs, "multi_hot", 4),
+            [[0, 1, 1, 0], [1, 0, 0, 1]],
+        )
+        self.assertAllClose(
+            lookup_utils.encode_categorical_inputs(
+                inputs, "tf_idf", 4, idf_weights=np.array([1.0, 2.0, 3.0, 4.0])
+            ),
+            [[0.0, 2.0, 6.0, 0.0], [1.0, 0.0, 0.0, 8.0]],
+        )
+        self.assertAllEqual(
+            lookup_utils.encode_categorical_inputs(
+                np.array([2, 0]), "one_hot", 3
+            ),
+            [[0, 0, 1], [1, 0, 0]],
+        )
+        with self.assertRaisesRegex(ValueError, "maximum supported output"):
+            lookup_utils.encode_categorical_inputs(
+                np.zeros((2, 2, 2)), "count", 3
+            )
+
+    def test_token_counter(self):
+        counter = lookup_utils.TokenCounter()
+        counter.update(np.array(["a", "b"]), [2, 1])
+        counter.update(np.array([b"b", b"c"]), [3, 2])
+        self.assertTrue(counter.exact)
+        self.assertEqual(counter.total, 8)
+        tokens, counts = counter.most_common()
+        self.assertEqual(tokens.tolist(), ["b", "c", "a"])
+        self.assertEqual(counts.tolist(), [4, 2, 2])
+        self.assertEqual(counter.lookup(["a", "z"]).tolist(), [2, 0])
+
+        other = lookup_utils.TokenCounter()
+        other.update(np.array(["a"]), [3])
+        counter.merge(other)
+        counter.remove("b")
+        tokens, counts = counter.most_common(1)
+        self.assertEqual(tokens.tolist(), ["a"])
+        self.assertEqual(counts.tolist(), [5])
+
+    def test_token_counter_bounded_memory(self):
+        # A few frequent tokens and many rare ones.
+        rng = np.random.default_rng(0)
+        frequent = rng.choice(10, size=20000, p=np.linspace(2, 1, 10) / 15)
+        values = np.concatenate([frequent, np.arange(100, 5100)])
+        rng.shuffle(values)
+        config = {"max_tokens": 100, "sketch_width": 1024, "sketch_depth": 4}
+        counters = [lookup_utils.TokenCounter(**config) for _ in range(2)]
+        for i, batch in enumerate(np.array_split(values, 50)):
+            lookup_utils.count_tokens(counters[i % 2], batch)
+        counter = counters[0]
+        counter.merge(counters[1])
+        self.assertFalse(counter.exact)
+        self.assertLessEqual(len(counter._counts), 2 * config["max_tokens"])
+        self.assertEqual(counter.total, len(values))
+
+        tokens, counts = counter.most_common(10)
+        self.assertEqual(sorted(tokens.tolist()), list(range(10)))
+        true_counts = np.bincount(frequent, minlength=10)[tokens]
+        self.assertTrue(np.all(counts >= true_counts))
+        error = np.e * counter.total / config["sketch_width"]
+        self.assertTrue(np.all(counts <= true_counts + error))
+
+    def test_count_tokens(self):
+        token_counts = lookup_utils.TokenCounter()
+        document_counts = lookup_utils.TokenCounter()
+        lookup_utils.count_tokens(
+            token_counts,
+            np.array([b"a", b"a", b"b", b"a", b"c"], dtype="object"),
+            row_ids=[0, 0, 0, 1, 1],
+            document_counts=document_counts,
+        )
+        self.assertEqual(
+            token_counts.lookup(["a", "b", "c"]).tolist(), [3, 1, 1]
+        )
+        self.assertEqual(
+            document_counts.lookup(["a", "b", "c"]).tolist(), [2, 1, 1]
+        )
@@ -1,6 +1,24 @@
+import sys
+
 from keras.src.utils.module_utils import tensorflow as tf
 
 
+def is_tf_imported():
+    """Whether TensorFlow has already been imported in this process."""
+    return "tensorflow" in sys.modules
+
+
+def is_tf_tensor(x):
+    """Whether `x` is a TensorFlow tensor, including ragged and sparse ones.
+
+    TensorFlow is not imported if it has not been imported already, since
+    `x` cannot be a TensorFlow tensor in that case.
+    """
+    if "tensorflow" not in sys.modules:
+        return False
+    return tf.is_tensor(x)
+
+
 def expand_dims(inputs, axis):
     """Expand dims on sparse, ragged, or dense tensors."""
     if isinstance(inputs, tf.SparseTensor):